@@ -4,7 +4,7 @@ import sys, json
 from pathlib import Path
 lib_path = Path(__file__).parent.parent.parent / "lib"
 sys.path.insert(0, str(lib_path))
-from project_database import ProjectDatabase
+from pm_db_client import open_database
 
 try:
     data = json.load(sys.stdin)
@@ -16,7 +16,7 @@ try:
         print(json.dumps({"error": "agent_type and (job_id or task_id) required", "status": "failed"}))
         sys.exit(0)
 
-    with ProjectDatabase() as db:
+    with open_database() as db:
         assignment_id = db.assign_agent(agent_type, job_id, task_id)
         print(json.dumps({"assignment_id": assignment_id, "status": "assigned"}))
 except Exception as e:
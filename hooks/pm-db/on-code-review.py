@@ -4,7 +4,7 @@ import sys, json
 from pathlib import Path
 lib_path = Path(__file__).parent.parent.parent / "lib"
 sys.path.insert(0, str(lib_path))
-from project_database import ProjectDatabase
+from pm_db_client import open_database
 
 try:
     data = json.load(sys.stdin)
@@ -19,7 +19,7 @@ try:
         print(json.dumps({"error": "phase_run_id, reviewer and summary required", "status": "failed"}))
         sys.exit(0)
 
-    with ProjectDatabase() as db:
+    with open_database() as db:
         review_id = db.add_code_review(phase_run_id, reviewer, summary, verdict, issues_found, files_reviewed)
         print(json.dumps({"review_id": review_id, "status": "created"}))
 except Exception as e:
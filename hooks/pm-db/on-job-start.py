@@ -28,7 +28,7 @@ from pathlib import Path
 lib_path = Path(__file__).parent.parent.parent / "lib"
 sys.path.insert(0, str(lib_path))
 
-from project_database import ProjectDatabase
+from pm_db_client import open_database
 
 
 def main():
@@ -53,7 +53,7 @@ def main():
             sys.exit(0)  # Don't fail execution, just log error
 
         # Create job record
-        with ProjectDatabase() as db:
+        with open_database() as db:
             job_id = db.create_job(
                 spec_id=spec_id,
                 name=job_name,
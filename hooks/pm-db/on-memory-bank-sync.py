@@ -41,7 +41,7 @@ import subprocess
 lib_path = Path(__file__).parent.parent.parent / "lib"
 sys.path.insert(0, str(lib_path))
 
-from project_database import ProjectDatabase
+from pm_db_client import open_database
 
 
 # Configuration
@@ -146,7 +146,7 @@ def run_export(project_id: int) -> tuple[bool, str]:
     """
     try:
         # Get project name for logging
-        with ProjectDatabase() as db:
+        with open_database() as db:
             project = db.get_project(project_id)
             if not project:
                 return False, f"Project ID {project_id} not found"
@@ -193,7 +193,7 @@ def main():
             sys.exit(0)
 
         # Get project name for logging
-        with ProjectDatabase() as db:
+        with open_database() as db:
             project = db.get_project(project_id)
             if not project:
                 print(json.dumps({
@@ -6,7 +6,7 @@ from pathlib import Path
 lib_path = Path.home() / ".claude" / "lib"
 sys.path.insert(0, str(lib_path))
 
-from project_database import ProjectDatabase
+from pm_db_client import open_database
 
 def main():
     payload = json.load(sys.stdin)
@@ -15,7 +15,7 @@ def main():
     exit_code = payload.get('exit_code', 0)
     summary = payload.get('summary', '')
 
-    db = ProjectDatabase()
+    db = open_database()
 
     try:
         # Complete phase run
@@ -7,7 +7,7 @@ from pathlib import Path
 lib_path = Path.home() / ".claude" / "lib"
 sys.path.insert(0, str(lib_path))
 
-from project_database import ProjectDatabase
+from pm_db_client import open_database
 
 def main():
     # Read JSON input from stdin
@@ -17,7 +17,7 @@ def main():
     project_name = payload.get('project_name')
     assigned_agent = payload.get('assigned_agent')
 
-    db = ProjectDatabase()
+    db = open_database()
 
     try:
         # Get project
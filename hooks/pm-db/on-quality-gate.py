@@ -6,7 +6,7 @@ from pathlib import Path
 lib_path = Path.home() / ".claude" / "lib"
 sys.path.insert(0, str(lib_path))
 
-from project_database import ProjectDatabase
+from pm_db_client import open_database
 
 def main():
     payload = json.load(sys.stdin)
@@ -17,7 +17,7 @@ def main():
     result_summary = payload.get('result_summary')
     checked_by = payload.get('checked_by')
 
-    db = ProjectDatabase()
+    db = open_database()
 
     try:
         # Add quality gate
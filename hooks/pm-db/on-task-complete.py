@@ -4,7 +4,7 @@ import sys, json
 from pathlib import Path
 lib_path = Path(__file__).parent.parent.parent / "lib"
 sys.path.insert(0, str(lib_path))
-from project_database import ProjectDatabase
+from pm_db_client import open_database
 
 try:
     data = json.load(sys.stdin)
@@ -16,7 +16,7 @@ try:
         print(json.dumps({"error": "job_id and task_name required", "status": "failed"}))
         sys.exit(0)
 
-    with ProjectDatabase() as db:
+    with open_database() as db:
         # Find task by name in this job
         tasks = db.get_tasks(job_id)
         task = next((t for t in tasks if t['name'] == task_name), None)
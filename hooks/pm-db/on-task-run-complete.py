@@ -6,7 +6,7 @@ from pathlib import Path
 lib_path = Path.home() / ".claude" / "lib"
 sys.path.insert(0, str(lib_path))
 
-from project_database import ProjectDatabase
+from pm_db_client import open_database
 
 def main():
     payload = json.load(sys.stdin)
@@ -14,7 +14,7 @@ def main():
     task_run_id = payload.get('task_run_id')
     exit_code = payload.get('exit_code', 0)
 
-    db = ProjectDatabase()
+    db = open_database()
 
     try:
         # Complete task run
@@ -6,7 +6,7 @@ from pathlib import Path
 lib_path = Path.home() / ".claude" / "lib"
 sys.path.insert(0, str(lib_path))
 
-from project_database import ProjectDatabase
+from pm_db_client import open_database
 
 def main():
     payload = json.load(sys.stdin)
@@ -15,7 +15,7 @@ def main():
     task_key = payload.get('task_key')  # e.g., "2.1a"
     assigned_agent = payload.get('assigned_agent')
 
-    db = ProjectDatabase()
+    db = open_database()
 
     try:
         # Get phase run to find plan_id
@@ -4,7 +4,7 @@ import sys, json
 from pathlib import Path
 lib_path = Path(__file__).parent.parent.parent / "lib"
 sys.path.insert(0, str(lib_path))
-from project_database import ProjectDatabase
+from pm_db_client import open_database
 
 try:
     data = json.load(sys.stdin)
@@ -17,7 +17,7 @@ try:
         print(json.dumps({"error": "job_id and task_name required", "status": "failed"}))
         sys.exit(0)
 
-    with ProjectDatabase() as db:
+    with open_database() as db:
         task_id = db.create_task(job_id, task_name, order, dependencies)
         db.start_task(task_id)
         print(json.dumps({"task_id": task_id, "status": "created"}))
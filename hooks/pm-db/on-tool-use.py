@@ -4,7 +4,7 @@ import sys, json
 from pathlib import Path
 lib_path = Path(__file__).parent.parent.parent / "lib"
 sys.path.insert(0, str(lib_path))
-from project_database import ProjectDatabase
+from pm_db_client import open_database
 
 try:
     data = json.load(sys.stdin)
@@ -27,7 +27,7 @@ try:
         duration_ms = int((end_time - start_time) * 1000)
 
     if command:
-        with ProjectDatabase() as db:
+        with open_database() as db:
             log_id = db.log_execution(job_id, task_id, command, output, exit_code, duration_ms)
             print(json.dumps({"log_id": log_id, "status": "logged"}))
 except Exception as e:
@@ -0,0 +1,178 @@
+"""
+pm_db_client - Thin client for the PM-DB daemon.
+
+Hooks call open_database() instead of ProjectDatabase(). When the daemon
+(lib/pm_db_daemon.py) is listening on its Unix socket, method calls are
+forwarded over the socket and served from the daemon's warm connection.
+When it is not running, open_database() falls back to a direct
+ProjectDatabase, so hooks behave the same with or without the daemon.
+
+The fast path imports only socket and json; project_database (and sqlite3)
+are imported only on fallback.
+
+Wire protocol (one JSON object per line, both directions):
+    -> {"method": "create_task_run", "args": [10, 4], "kwargs": {}}
+    <- {"ok": true, "result": 27}
+    <- {"ok": false, "error": "Status must be one of: [...]", "error_type": "ValueError"}
+
+Usage:
+    from pm_db_client import open_database
+
+    with open_database() as db:
+        task_run_id = db.create_task_run(phase_run_id, task_id, "backend-agent")
+"""
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Optional
+
+DEFAULT_SOCKET_PATH = Path.home() / ".claude" / "pm-db.sock"
+
+# Connecting to a live local socket takes microseconds; anything slower
+# means the daemon is wedged and the direct path is the better bet.
+CONNECT_TIMEOUT_SECONDS = 0.25
+REQUEST_TIMEOUT_SECONDS = 30.0
+
+
+def get_socket_path() -> str:
+    """Return the daemon socket path (PM_DB_SOCKET overrides the default)."""
+    return os.environ.get('PM_DB_SOCKET') or str(DEFAULT_SOCKET_PATH)
+
+
+class DaemonError(Exception):
+    """Error raised by the daemon while executing a forwarded call."""
+
+    def __init__(self, message: str, error_type: str):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+class DaemonClient:
+    """
+    Proxy that forwards ProjectDatabase method calls to the daemon.
+
+    Any public attribute resolves to a remote method, so hooks can use the
+    same calls they would make on ProjectDatabase. Direct access to
+    ``conn`` is not available through the daemon.
+    """
+
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+        self._reader = sock.makefile('rb')
+
+    def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Invoke a method on the daemon's ProjectDatabase.
+
+        Raises:
+            ValueError: If the daemon-side method raised ValueError
+            DaemonError: For any other daemon-side error
+            ConnectionError: If the daemon closed the connection
+        """
+        request = {'method': method, 'args': list(args), 'kwargs': kwargs}
+        self._sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("PM-DB daemon closed the connection")
+
+        response = json.loads(line)
+        if response.get('ok'):
+            return response.get('result')
+
+        message = response.get('error', 'Unknown daemon error')
+        error_type = response.get('error_type', 'Exception')
+        if error_type == 'ValueError':
+            raise ValueError(message)
+        raise DaemonError(message, error_type)
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def remote_method(*args: Any, **kwargs: Any) -> Any:
+            return self.call(name, *args, **kwargs)
+
+        remote_method.__name__ = name
+        return remote_method
+
+    def close(self):
+        """Close the connection to the daemon (the daemon keeps running)."""
+        try:
+            self._reader.close()
+        finally:
+            self._sock.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+        return False
+
+
+def connect(socket_path: Optional[str] = None) -> Optional[DaemonClient]:
+    """
+    Connect to the daemon if it is running.
+
+    Args:
+        socket_path: Socket path (defaults to get_socket_path())
+
+    Returns:
+        DaemonClient, or None if no daemon is listening
+    """
+    if socket_path is None:
+        socket_path = get_socket_path()
+
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(socket_path):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+
+    sock.settimeout(REQUEST_TIMEOUT_SECONDS)
+    return DaemonClient(sock)
+
+
+def serves_database(client: DaemonClient, db_path: str) -> bool:
+    """Whether the daemon behind client serves the database file at db_path."""
+    try:
+        served = client.ping()['db_path']
+    except (OSError, ValueError, DaemonError, KeyError, TypeError):
+        return False
+    return os.path.realpath(served) == os.path.realpath(db_path)
+
+
+def open_database(db_path: Optional[str] = None):
+    """
+    Open the PM-DB, preferring the daemon over a direct connection.
+
+    The daemon is skipped when an explicit db_path is given (it serves a
+    single database), when CLAUDE_DB_PATH names a database other than the
+    one the daemon serves, or when PM_DB_DAEMON=0.
+
+    Args:
+        db_path: Optional database path for direct access
+
+    Returns:
+        DaemonClient or ProjectDatabase (same method surface)
+    """
+    if db_path is None and os.environ.get('PM_DB_DAEMON', '1') != '0':
+        client = connect()
+        if client is not None:
+            env_path = os.environ.get('CLAUDE_DB_PATH')
+            if not env_path or serves_database(client, env_path):
+                return client
+            client.close()
+
+    from project_database import ProjectDatabase
+    return ProjectDatabase(db_path)
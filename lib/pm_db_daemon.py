@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+pm_db_daemon - Long-lived PM-DB server on a local Unix socket.
+
+Holds one warm ProjectDatabase connection (WAL and foreign keys configured
+once, write-behind batching enabled by default) and serves ProjectDatabase
+method calls from hooks via lib/pm_db_client.py. Hooks fall back to direct
+database access whenever the daemon is not running, so it is purely an
+optimization.
+
+Usage:
+    python3 ~/.claude/lib/pm_db_daemon.py serve            # foreground
+    nohup python3 ~/.claude/lib/pm_db_daemon.py serve &    # background
+    python3 ~/.claude/lib/pm_db_daemon.py status
+    python3 ~/.claude/lib/pm_db_daemon.py stop
+
+Environment:
+    PM_DB_SOCKET    Socket path (default: ~/.claude/pm-db.sock)
+    CLAUDE_DB_PATH  Database path (default: ~/.claude/projects.db)
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from project_database import ProjectDatabase
+from pm_db_client import connect, get_socket_path
+
+# Methods that manage the connection itself and must not be called remotely
+NON_RPC_METHODS = {'close', 'transaction'}
+
+# Daemon-level methods handled by the server rather than ProjectDatabase
+DAEMON_METHODS = {'ping', 'daemon_stats', 'shutdown'}
+
+
+def get_rpc_methods() -> set:
+    """Return the ProjectDatabase method names callable over the socket."""
+    return {
+        name for name in dir(ProjectDatabase)
+        if not name.startswith('_')
+        and callable(getattr(ProjectDatabase, name))
+        and name not in NON_RPC_METHODS
+    }
+
+
+class PMDBRequestHandler(socketserver.StreamRequestHandler):
+    """Serve newline-delimited JSON requests until the client disconnects."""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.dispatch(line)
+            self.wfile.write(json.dumps(response, default=str).encode('utf-8') + b'\n')
+
+
+class PMDBServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Threaded Unix-socket server sharing one ProjectDatabase.
+
+    Connections are handled on their own threads, but every database call
+    is serialized through a single lock, matching SQLite's single-writer
+    model. Queued write-behind events are flushed from the serve loop.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, db: ProjectDatabase):
+        """
+        Bind the server socket.
+
+        Args:
+            socket_path: Unix socket path (created with mode 600)
+            db: Database served to clients
+        """
+        self.socket_path = socket_path
+        self.db = db
+        self.db_lock = threading.Lock()
+        self.rpc_methods = get_rpc_methods()
+        self.started_at = time.time()
+        self.requests_served = 0
+        self.request_errors = 0
+
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, PMDBRequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def dispatch(self, raw: bytes) -> Dict[str, Any]:
+        """
+        Execute one request line.
+
+        Args:
+            raw: JSON-encoded request
+
+        Returns:
+            Response dict with 'ok' and 'result' or 'error'/'error_type'
+        """
+        try:
+            request = json.loads(raw)
+            method = request['method']
+            args = request.get('args', [])
+            kwargs = request.get('kwargs', {})
+        except (ValueError, KeyError, TypeError) as e:
+            self.request_errors += 1
+            return {'ok': False, 'error': f"Malformed request: {e}", 'error_type': 'ProtocolError'}
+
+        try:
+            if method in DAEMON_METHODS:
+                result = getattr(self, f"rpc_{method}")()
+            elif method in self.rpc_methods:
+                with self.db_lock:
+                    result = getattr(self.db, method)(*args, **kwargs)
+            else:
+                raise AttributeError(f"Unknown method: {method}")
+        except Exception as e:
+            self.request_errors += 1
+            return {'ok': False, 'error': str(e), 'error_type': type(e).__name__}
+
+        self.requests_served += 1
+        return {'ok': True, 'result': result}
+
+    def service_actions(self):
+        """Flush overdue write-behind batches between requests."""
+        with self.db_lock:
+            try:
+                self.db.flush_if_due()
+            except Exception as e:
+                print(f"pm-db daemon: flush failed: {e}", file=sys.stderr)
+
+    def rpc_ping(self) -> Dict[str, Any]:
+        """Report daemon identity."""
+        return {
+            'pid': os.getpid(),
+            'db_path': self.db.db_path,
+            'uptime_seconds': round(time.time() - self.started_at, 3)
+        }
+
+    def rpc_daemon_stats(self) -> Dict[str, Any]:
+        """Report request counters and write-behind metrics."""
+        with self.db_lock:
+            write_metrics = self.db.get_write_metrics()
+        return {
+            **self.rpc_ping(),
+            'requests_served': self.requests_served,
+            'request_errors': self.request_errors,
+            'write_behind': write_metrics
+        }
+
+    def rpc_shutdown(self) -> Dict[str, Any]:
+        """Stop serving after the current request."""
+        threading.Thread(target=self.shutdown, daemon=True).start()
+        return {'status': 'stopping'}
+
+    def server_close(self):
+        """Close the socket, flush queued writes and remove the socket file."""
+        super().server_close()
+        with self.db_lock:
+            self.db.close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def remove_stale_socket(socket_path: str) -> bool:
+    """
+    Remove a socket file left behind by a dead daemon.
+
+    Args:
+        socket_path: Unix socket path
+
+    Returns:
+        False if a live daemon already owns the socket, True otherwise
+    """
+    if not os.path.exists(socket_path):
+        return True
+
+    client = connect(socket_path)
+    if client is not None:
+        client.close()
+        return False
+
+    os.unlink(socket_path)
+    return True
+
+
+def serve(
+    socket_path: str,
+    db_path: Optional[str] = None,
+    write_behind: bool = True,
+    flush_batch_size: int = 100,
+    flush_interval_ms: int = 250
+) -> int:
+    """
+    Run the daemon in the foreground until stopped.
+
+    Args:
+        socket_path: Unix socket path
+        db_path: Database path (ProjectDatabase default if None)
+        write_behind: Batch event writes through the write-behind queue
+        flush_batch_size: Events per write-behind transaction
+        flush_interval_ms: Maximum age of a queued event
+
+    Returns:
+        Process exit code
+    """
+    if not remove_stale_socket(socket_path):
+        print(f"pm-db daemon already running on {socket_path}", file=sys.stderr)
+        return 1
+
+    db = ProjectDatabase(
+        db_path,
+        write_behind=write_behind,
+        flush_batch_size=flush_batch_size,
+        flush_interval_ms=flush_interval_ms
+    )
+    server = PMDBServer(socket_path, db)
+
+    def handle_signal(signum, frame):
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    print(f"pm-db daemon serving {db.db_path} on {socket_path} (pid {os.getpid()})", file=sys.stderr)
+
+    poll_interval = max(flush_interval_ms / 1000.0, 0.05)
+    try:
+        server.serve_forever(poll_interval=poll_interval)
+    finally:
+        server.server_close()
+
+    return 0
+
+
+def main():
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="PM-DB daemon")
+    parser.add_argument(
+        "command",
+        choices=["serve", "status", "stop"],
+        help="serve in the foreground, report status, or stop a running daemon"
+    )
+    parser.add_argument(
+        "--socket",
+        default=get_socket_path(),
+        help="Unix socket path (default: $PM_DB_SOCKET or ~/.claude/pm-db.sock)"
+    )
+    parser.add_argument(
+        "--db-path",
+        help="Path to database file (default: $CLAUDE_DB_PATH or ~/.claude/projects.db)"
+    )
+    parser.add_argument(
+        "--no-write-behind",
+        action="store_true",
+        help="Commit every event immediately instead of batching"
+    )
+    parser.add_argument("--flush-batch-size", type=int, default=100)
+    parser.add_argument("--flush-interval-ms", type=int, default=250)
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        sys.exit(serve(
+            args.socket,
+            db_path=args.db_path,
+            write_behind=not args.no_write_behind,
+            flush_batch_size=args.flush_batch_size,
+            flush_interval_ms=args.flush_interval_ms
+        ))
+
+    client = connect(args.socket)
+    if client is None:
+        print(json.dumps({"status": "not-running", "socket": args.socket}))
+        sys.exit(1 if args.command == "status" else 0)
+
+    with client:
+        if args.command == "status":
+            print(json.dumps({"status": "running", **client.daemon_stats()}, indent=2))
+        else:
+            print(json.dumps(client.shutdown()))
+
+
+if __name__ == "__main__":
+    main()
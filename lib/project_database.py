@@ -37,16 +37,379 @@ Usage:
     task_run_id = db.create_task_run(run_id, task_id, "backend-agent")
     db.complete_task_run(task_run_id, 0)
     db.complete_phase_run(run_id, 0, "All tasks completed successfully")
+
+Write-behind mode (opt-in):
+    # Buffer high-volume event writes (task updates, file reads, access stats)
+    # and apply them in one transaction per batch instead of one per event.
+    db = ProjectDatabase(write_behind=True, flush_batch_size=200, flush_interval_ms=500)
+    db.add_task_update(task_run_id, "progress", "Halfway there")  # queued
+    db.flush()                                                   # or db.close()
+    print(db.get_write_metrics())
+
+    # The queue is per process and flushed on close(), so it batches writes
+    # only for long-lived writers. Hooks get cross-invocation batching
+    # through the PM-DB daemon (lib/pm_db_daemon.py), which enables it.
 """
 
+import os
 import sqlite3
 import json
+import threading
+import time
+import zlib
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+from collections import OrderedDict
 from contextlib import contextmanager
 
 
+# A queued event is one or more (sql, params) statements applied atomically
+Statement = Tuple[str, Tuple[Any, ...]]
+
+
+class WriteBehindQueue:
+    """
+    In-memory write-behind buffer for append-only event writes.
+
+    Events are applied in a single transaction once ``max_batch`` events are
+    pending or the oldest pending event is older than ``max_delay_ms``.
+    Failed flushes (e.g. database locked by another writer) keep the events
+    queued; once ``max_pending`` events are waiting, producers must flush
+    synchronously before enqueueing more (backpressure), and a flush failure
+    at that point is raised to the caller instead of growing the queue.
+
+    The queue is held in process memory only. A short-lived process that
+    writes one event and closes (such as a hook run directly) gains
+    nothing from it; batching across hook invocations comes from the
+    PM-DB daemon, whose single long-lived connection queues for all hooks.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        max_batch: int = 100,
+        max_delay_ms: int = 250,
+        max_pending: int = 10000
+    ):
+        """
+        Initialize write-behind queue.
+
+        Args:
+            conn: SQLite connection the batches are written to
+            max_batch: Flush once this many events are pending
+            max_delay_ms: Flush once the oldest pending event is this old
+            max_pending: Queue capacity before producers are throttled
+
+        Raises:
+            ValueError: If any limit is not positive or max_pending < max_batch
+        """
+        if max_batch < 1 or max_delay_ms < 0 or max_pending < 1:
+            raise ValueError("Write-behind limits must be positive")
+        if max_pending < max_batch:
+            raise ValueError("max_pending must be >= max_batch")
+
+        self.conn = conn
+        self.max_batch = max_batch
+        self.max_delay_ms = max_delay_ms
+        self.max_pending = max_pending
+
+        self._pending: List[Tuple[Statement, ...]] = []
+        self._oldest_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+        self._enqueued = 0
+        self._flushed = 0
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._dropped = 0
+        self._backpressure_flushes = 0
+        self._high_water = 0
+        self._last_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def enqueue(self, statements: Tuple[Statement, ...]) -> None:
+        """
+        Queue one event and flush if the batch is full or overdue.
+
+        Args:
+            statements: (sql, params) pairs applied together as one event
+
+        Raises:
+            sqlite3.OperationalError: If the queue is full and cannot be flushed
+        """
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                self._backpressure_flushes += 1
+                self.flush()
+                if len(self._pending) >= self.max_pending:
+                    raise sqlite3.OperationalError(
+                        "Write-behind queue is full and cannot flush inside an open transaction"
+                    )
+
+            if not self._pending:
+                self._oldest_at = time.monotonic()
+            self._pending.append(statements)
+            self._enqueued += 1
+            self._high_water = max(self._high_water, len(self._pending))
+
+            if self.is_due():
+                try:
+                    self.flush()
+                except sqlite3.OperationalError:
+                    # Keep events queued; retried on the next enqueue or flush
+                    pass
+
+    def is_due(self) -> bool:
+        """Return True if the pending batch should be flushed now."""
+        if not self._pending:
+            return False
+        if len(self._pending) >= self.max_batch:
+            return True
+        age_ms = (time.monotonic() - self._oldest_at) * 1000
+        return age_ms >= self.max_delay_ms
+
+    def flush(self) -> int:
+        """
+        Apply all pending events in one transaction.
+
+        Events rejected by a constraint are retried individually and dropped
+        if they still fail, so one bad event cannot wedge the queue.
+
+        Nothing is flushed while the connection has an open transaction
+        (e.g. inside ProjectDatabase.transaction()), since committing or
+        rolling back here would end the caller's transaction too.
+
+        Returns:
+            Number of events written (0 if deferred by an open transaction)
+
+        Raises:
+            sqlite3.OperationalError: If the database is busy or locked
+                (events not yet committed are kept)
+        """
+        with self._lock:
+            if not self._pending or self.conn.in_transaction:
+                return 0
+
+            start = time.perf_counter()
+
+            try:
+                for event in self._pending:
+                    for sql, params in event:
+                        self.conn.execute(sql, params)
+                self.conn.commit()
+                written = len(self._pending)
+                self._pending = []
+            except sqlite3.IntegrityError:
+                self.conn.rollback()
+                written = self._apply_individually()
+            except sqlite3.OperationalError:
+                self.conn.rollback()
+                self._failed_flushes += 1
+                raise
+
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._oldest_at = None
+            self._flushes += 1
+            self._flushed += written
+            self._last_flush_ms = elapsed_ms
+            self._total_flush_ms += elapsed_ms
+            return written
+
+    def _apply_individually(self) -> int:
+        """
+        Apply pending events one transaction each, dropping those that fail.
+
+        Each event leaves the queue once it is committed or dropped, so an
+        OperationalError partway through keeps only the unwritten events
+        and a retry does not write any event twice.
+        """
+        written = 0
+        done = 0
+        try:
+            for event in self._pending:
+                try:
+                    for sql, params in event:
+                        self.conn.execute(sql, params)
+                    self.conn.commit()
+                    written += 1
+                except sqlite3.IntegrityError:
+                    self.conn.rollback()
+                    self._dropped += 1
+                done += 1
+        except sqlite3.OperationalError:
+            self.conn.rollback()
+            self._failed_flushes += 1
+            self._flushed += written
+            raise
+        finally:
+            del self._pending[:done]
+        return written
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get flush and backpressure metrics.
+
+        Returns:
+            Dict with pending, enqueued, flushed, flushes, failed_flushes,
+            dropped, backpressure_flushes, high_water_mark, last_flush_ms,
+            avg_flush_ms and avg_batch_size
+        """
+        with self._lock:
+            return {
+                'pending': len(self._pending),
+                'enqueued': self._enqueued,
+                'flushed': self._flushed,
+                'flushes': self._flushes,
+                'failed_flushes': self._failed_flushes,
+                'dropped': self._dropped,
+                'backpressure_flushes': self._backpressure_flushes,
+                'high_water_mark': self._high_water,
+                'last_flush_ms': self._last_flush_ms,
+                'avg_flush_ms': self._total_flush_ms / self._flushes if self._flushes else 0.0,
+                'avg_batch_size': self._flushed / self._flushes if self._flushes else 0.0
+            }
+
+
+class FileContentCache:
+    """
+    Size-bounded in-process cache of cached_files rows.
+
+    Entries are keyed by file_path and carry their content_hash, so a lookup
+    that already knows the file's current hash is answered without touching
+    the database. Two eviction policies are supported:
+
+    - 'lru': evict the least recently used entry
+    - 'priority': evict by cache_priority (low, then normal, then high),
+      least recently used first within a tier
+    """
+
+    POLICIES = ('lru', 'priority')
+
+    # Eviction order for the 'priority' policy
+    PRIORITY_TIERS = ('low', 'normal', 'high')
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+        policy: str = 'priority'
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached files
+            max_bytes: Maximum total content size in bytes
+            policy: Eviction policy ('lru' or 'priority')
+
+        Raises:
+            ValueError: If policy is unknown or a limit is not positive
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Policy must be one of: {list(self.POLICIES)}")
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("Cache limits must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+
+        self._tiers: Dict[str, OrderedDict] = {tier: OrderedDict() for tier in self.PRIORITY_TIERS}
+        self._tier_of: Dict[str, str] = {}
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._tier_of)
+
+    def _tier_for(self, row: Dict[str, Any]) -> str:
+        if self.policy == 'lru':
+            return 'normal'
+        priority = row.get('cache_priority') or 'normal'
+        return priority if priority in self._tiers else 'normal'
+
+    @staticmethod
+    def _size_of(row: Dict[str, Any]) -> int:
+        if row.get('file_size_bytes') is not None:
+            return row['file_size_bytes']
+        return len((row.get('content') or '').encode('utf-8'))
+
+    def get(self, file_path: str, content_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached row and mark it most recently used.
+
+        Args:
+            file_path: Cached file path
+            content_hash: If given, entries with a different hash are misses
+
+        Returns:
+            Cached row dict (shared, not a copy) or None
+        """
+        tier = self._tier_of.get(file_path)
+        if tier is None:
+            self.misses += 1
+            return None
+
+        row = self._tiers[tier][file_path]
+        if content_hash is not None and row['content_hash'] != content_hash:
+            self.misses += 1
+            return None
+
+        self._tiers[tier].move_to_end(file_path)
+        self.hits += 1
+        return row
+
+    def put(self, row: Dict[str, Any]) -> None:
+        """Insert or replace a row, evicting entries to stay within limits."""
+        file_path = row['file_path']
+        self.discard(file_path)
+
+        size = self._size_of(row)
+        if size > self.max_bytes:
+            return
+
+        tier = self._tier_for(row)
+        self._tiers[tier][file_path] = row
+        self._tier_of[file_path] = tier
+        self._bytes += size
+
+        while len(self._tier_of) > self.max_entries or self._bytes > self.max_bytes:
+            self._evict_one()
+
+    def discard(self, file_path: str) -> None:
+        """Remove a path from the cache if present."""
+        tier = self._tier_of.pop(file_path, None)
+        if tier is not None:
+            row = self._tiers[tier].pop(file_path)
+            self._bytes -= self._size_of(row)
+
+    def _evict_one(self) -> None:
+        for tier in self.PRIORITY_TIERS:
+            if self._tiers[tier]:
+                file_path = next(iter(self._tiers[tier]))
+                self.discard(file_path)
+                self.evictions += 1
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache occupancy and hit/miss/eviction counters."""
+        return {
+            'entries': len(self._tier_of),
+            'bytes': self._bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'policy': self.policy
+        }
+
+
 class ProjectDatabase:
     """
     SQLite database abstraction for PM-DB v2 phase-based execution tracking.
@@ -63,21 +426,68 @@ class ProjectDatabase:
 
     All methods use parameterized queries for security.
     Supports transactions via context manager.
+
+    In write-behind mode, append-only event writes (add_task_update,
+    log_file_read, update_file_access, add_run_artifact) are queued and
+    committed in batches; those methods return None instead of a row ID,
+    and their rows become visible to reads after flush() or close().
+
+    get_cached_file() is served from an in-process FileContentCache and
+    never writes on read: hit/miss counters accumulate in memory and are
+    flushed to cached_files and cache_statistics in periodic batches.
+
+    Once migration 006 is applied, cached file content is stored once per
+    content_hash in the content_blobs table (zlib-compressed when that
+    helps) and cached_files rows reference it. Databases without the
+    migration keep storing content inline.
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    # Pending cache access counters are flushed after this many lookups...
+    CACHE_STATS_FLUSH_EVERY = 100
+    # ...or once the oldest unflushed lookup is this old
+    CACHE_STATS_FLUSH_INTERVAL_MS = 5000
+
+    # Blob content smaller than this is stored uncompressed
+    BLOB_COMPRESSION_MIN_BYTES = 512
+    BLOB_COMPRESSION_LEVEL = 6
+    # gc_content_blobs() keeps orphans released more recently than this
+    BLOB_GC_GRACE_SECONDS = 300
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        write_behind: Optional[bool] = None,
+        flush_batch_size: int = 100,
+        flush_interval_ms: int = 250,
+        max_pending: int = 10000,
+        file_cache_entries: int = 256,
+        file_cache_bytes: int = 64 * 1024 * 1024,
+        file_cache_policy: str = 'priority'
+    ):
         """
         Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file.
-                    Defaults to ~/.claude/projects.db
+                    Defaults to $CLAUDE_DB_PATH, then ~/.claude/projects.db
+            write_behind: Queue event writes and commit them in batches.
+                    Defaults to the PM_DB_WRITE_BEHIND environment variable.
+            flush_batch_size: Events per write-behind transaction
+            flush_interval_ms: Maximum age of a queued event before flushing
+            max_pending: Queued events before writers are throttled
+            file_cache_entries: Files held in the get_cached_file LRU (0 disables)
+            file_cache_bytes: Maximum total content size held in the LRU
+            file_cache_policy: LRU eviction policy ('lru' or 'priority')
 
         Raises:
             sqlite3.Error: If database connection fails
+            ValueError: If the file cache configuration is invalid
         """
         if db_path is None:
-            db_path = str(Path.home() / ".claude" / "projects.db")
+            db_path = os.environ.get('CLAUDE_DB_PATH') or str(Path.home() / ".claude" / "projects.db")
+
+        if write_behind is None:
+            write_behind = os.environ.get('PM_DB_WRITE_BEHIND', '').lower() in ('1', 'true', 'yes')
 
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
@@ -87,10 +497,104 @@ class ProjectDatabase:
         self.conn.execute("PRAGMA journal_mode=WAL")
         self.conn.execute("PRAGMA foreign_keys=ON")  # Enforce foreign keys
 
+        self.write_queue: Optional[WriteBehindQueue] = None
+        if write_behind:
+            self.write_queue = WriteBehindQueue(
+                self.conn,
+                max_batch=flush_batch_size,
+                max_delay_ms=flush_interval_ms,
+                max_pending=max_pending
+            )
+
+        self.file_cache: Optional[FileContentCache] = None
+        if file_cache_entries > 0:
+            self.file_cache = FileContentCache(
+                max_entries=file_cache_entries,
+                max_bytes=file_cache_bytes,
+                policy=file_cache_policy
+            )
+
+        # file_path (None for global) -> [reads, hits, misses, tokens_saved, lookup_ms]
+        self._pending_cache_stats: Dict[Optional[str], List[float]] = {}
+        self._pending_cache_lookups = 0
+        self._pending_cache_since: Optional[float] = None
+
+        # Optional tables/columns from later migrations, checked on first use
+        self._schema_cache: Dict[str, bool] = {}
+
     def close(self):
-        """Close database connection."""
+        """Flush queued writes and cache statistics, then close the connection."""
         if self.conn:
-            self.conn.close()
+            try:
+                self.flush()
+                self.flush_cache_stats()
+            finally:
+                self.conn.close()
+
+    # ==================== WRITE-BEHIND QUEUE ====================
+
+    def _write_event(self, *statements: Statement) -> Optional[int]:
+        """
+        Apply an append-only event, or queue it in write-behind mode.
+
+        Args:
+            statements: (sql, params) pairs applied together
+
+        Returns:
+            Row ID from the first statement, or None if the event was queued
+        """
+        if self.write_queue is not None:
+            self.write_queue.enqueue(statements)
+            return None
+
+        first_cursor = None
+        for sql, params in statements:
+            cursor = self.conn.execute(sql, params)
+            if first_cursor is None:
+                first_cursor = cursor
+        self.conn.commit()
+        return first_cursor.lastrowid
+
+    def flush(self) -> int:
+        """
+        Commit all queued write-behind events.
+
+        Deferred while a transaction is open on the connection; the events
+        are flushed by a later flush() once it has committed.
+
+        Returns:
+            Number of events written (0 when write-behind is disabled)
+        """
+        if self.write_queue is None:
+            return 0
+        return self.write_queue.flush()
+
+    def flush_if_due(self) -> int:
+        """
+        Flush queued events if the batch is full or older than the interval.
+
+        Long-running callers should call this from their idle loop, since
+        queued events are otherwise only flushed when new events arrive.
+
+        Returns:
+            Number of events written
+        """
+        if self._cache_stats_due():
+            self.flush_cache_stats()
+        if self.write_queue is None or not self.write_queue.is_due():
+            return 0
+        return self.write_queue.flush()
+
+    def get_write_metrics(self) -> Dict[str, Any]:
+        """
+        Get write-behind flush and backpressure metrics.
+
+        Returns:
+            Dict from WriteBehindQueue.metrics() plus 'enabled'
+        """
+        if self.write_queue is None:
+            return {'enabled': False}
+        return {'enabled': True, **self.write_queue.metrics()}
 
     def __enter__(self):
         """Context manager entry."""
@@ -708,9 +1212,10 @@ class ProjectDatabase:
     def list_phase_runs(
         self,
         phase_id: Optional[int] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """List phase runs with optional filters."""
+        """List phase runs with optional filters, newest first."""
         query = "SELECT * FROM phase_runs WHERE 1=1"
         params = []
 
@@ -724,6 +1229,10 @@ class ProjectDatabase:
 
         query += " ORDER BY created_at DESC"
 
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
         cursor = self.conn.execute(query, params)
         return [dict(row) for row in cursor.fetchall()]
 
@@ -891,25 +1400,30 @@ class ProjectDatabase:
             file_path: Optional relative file path
 
         Returns:
-            Update ID (integer)
+            Update ID (integer), or None if queued in write-behind mode
         """
-        cursor = self.conn.execute(
+        return self._write_event((
             """
             INSERT INTO task_updates (task_run_id, update_type, content, file_path)
             VALUES (?, ?, ?, ?)
             """,
             (task_run_id, update_type, content, file_path)
-        )
-        self.conn.commit()
-        return cursor.lastrowid
+        ))
 
-    def get_task_updates(self, task_run_id: int) -> List[Dict[str, Any]]:
-        """Get all updates for a task run."""
-        cursor = self.conn.execute(
-            "SELECT * FROM task_updates WHERE task_run_id = ? ORDER BY created_at",
-            (task_run_id,)
-        )
-        return [dict(row) for row in cursor.fetchall()]
+    def get_task_updates(
+        self,
+        task_run_id: int,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all updates for a task run.
+
+        With a date range (YYYY-MM-DD, inclusive), only updates created in
+        it are returned, including ones moved to archive databases.
+        """
+        where, params = self._date_range_filter("task_run_id = ?", [task_run_id], 'created_at', start_date, end_date)
+        return self._select_with_archives('task_updates', where, params, 'created_at', start_date, end_date)
 
     # ==================== QUALITY GATE MANAGEMENT ====================
 
@@ -1039,9 +1553,9 @@ class ProjectDatabase:
             file_size_bytes: Optional file size
 
         Returns:
-            Artifact ID (integer)
+            Artifact ID (integer), or None if queued in write-behind mode
         """
-        cursor = self.conn.execute(
+        return self._write_event((
             """
             INSERT INTO run_artifacts (
                 phase_run_id, artifact_type, artifact_name, file_path, file_size_bytes
@@ -1049,9 +1563,7 @@ class ProjectDatabase:
             VALUES (?, ?, ?, ?, ?)
             """,
             (phase_run_id, artifact_type, artifact_name, file_path, file_size_bytes)
-        )
-        self.conn.commit()
-        return cursor.lastrowid
+        ))
 
     def get_run_artifacts(self, phase_run_id: int) -> List[Dict[str, Any]]:
         """Get all artifacts for a phase run."""
@@ -1067,90 +1579,130 @@ class ProjectDatabase:
         """
         Get aggregated metrics for a phase.
 
+        phase_metrics is kept current by triggers (migration 008), so this
+        is a single row lookup. Without the migration, or if the row is
+        missing, the row is rebuilt first.
+
         Returns:
             Dict with total_runs, successful_runs, avg_duration, etc.
         """
-        # Get or create metrics row
+        if not self._has_incremental_metrics():
+            self.rebuild_metrics(phase_id)
+
         cursor = self.conn.execute(
             "SELECT * FROM phase_metrics WHERE phase_id = ?",
             (phase_id,)
         )
         row = cursor.fetchone()
 
-        if not row:
-            # Create initial metrics
-            self.conn.execute(
-                "INSERT INTO phase_metrics (phase_id) VALUES (?)",
+        if not row and self.rebuild_metrics(phase_id):
+            row = self.conn.execute(
+                "SELECT * FROM phase_metrics WHERE phase_id = ?",
                 (phase_id,)
-            )
-            self.conn.commit()
-            return self.get_phase_metrics(phase_id)
+            ).fetchone()
 
-        # Recalculate metrics
-        cursor = self.conn.execute(
-            """
-            SELECT
-                COUNT(*) as total_runs,
-                SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as successful_runs,
-                SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed_runs,
-                AVG(CASE WHEN duration_seconds IS NOT NULL THEN duration_seconds ELSE NULL END) as avg_duration
-            FROM phase_runs
-            WHERE phase_id = ?
-            """,
-            (phase_id,)
-        )
-        run_metrics = dict(cursor.fetchone())
+        if not row:
+            return {
+                'total_runs': 0, 'successful_runs': 0, 'failed_runs': 0,
+                'avg_duration': None, 'total_tasks': 0, 'completed_tasks': 0,
+                'blocked_tasks': 0, 'total_gates': 0, 'passed_gates': 0
+            }
 
-        # Get task metrics
-        cursor = self.conn.execute(
-            """
-            SELECT
-                COUNT(DISTINCT t.id) as total_tasks,
-                SUM(CASE WHEN t.status = 'completed' THEN 1 ELSE 0 END) as completed_tasks,
-                SUM(CASE WHEN t.status = 'blocked' THEN 1 ELSE 0 END) as blocked_tasks
-            FROM tasks t
-            JOIN phase_plans pp ON t.phase_plan_id = pp.id
-            WHERE pp.phase_id = ?
-            """,
-            (phase_id,)
-        )
-        task_metrics = dict(cursor.fetchone())
+        return {
+            'total_runs': row['total_runs'],
+            'successful_runs': row['successful_runs'],
+            'failed_runs': row['failed_runs'],
+            'avg_duration': row['avg_duration_seconds'],
+            'total_tasks': row['total_tasks'],
+            'completed_tasks': row['completed_tasks'],
+            'blocked_tasks': row['blocked_tasks'],
+            'total_gates': row['total_quality_gates'],
+            'passed_gates': row['passed_quality_gates']
+        }
 
-        # Get quality gate metrics
-        cursor = self.conn.execute(
-            """
-            SELECT
-                COUNT(*) as total_gates,
-                SUM(CASE WHEN qg.status = 'passed' THEN 1 ELSE 0 END) as passed_gates
-            FROM quality_gates qg
-            JOIN phase_runs pr ON qg.phase_run_id = pr.id
-            WHERE pr.phase_id = ?
-            """,
-            (phase_id,)
-        )
-        gate_metrics = dict(cursor.fetchone())
+    def rebuild_metrics(self, phase_id: Optional[int] = None) -> int:
+        """
+        Recompute phase_metrics from phase_runs, tasks and quality_gates.
 
-        # Update metrics table
-        self.conn.execute(
-            """
-            UPDATE phase_metrics
-            SET total_runs = ?, successful_runs = ?, failed_runs = ?,
-                avg_duration_seconds = ?, total_tasks = ?, completed_tasks = ?,
-                blocked_tasks = ?, total_quality_gates = ?, passed_quality_gates = ?,
-                last_calculated_at = datetime('now')
-            WHERE phase_id = ?
-            """,
-            (
-                run_metrics['total_runs'], run_metrics['successful_runs'],
-                run_metrics['failed_runs'], run_metrics['avg_duration'],
-                task_metrics['total_tasks'], task_metrics['completed_tasks'],
-                task_metrics['blocked_tasks'], gate_metrics['total_gates'],
-                gate_metrics['passed_gates'], phase_id
+        Repairs rows that drifted (e.g. after manual edits or plans moved
+        between phases) and creates missing ones.
+
+        Args:
+            phase_id: Phase to rebuild (default: all phases)
+
+        Returns:
+            Number of phase_metrics rows rebuilt
+        """
+        incremental = self._has_incremental_metrics()
+        timed_columns = ", timed_runs, total_duration_seconds" if incremental else ""
+        timed_values = ", 0, 0" if incremental else ""
+        timed_set = """
+                timed_runs = (SELECT COUNT(pr.duration_seconds) FROM phase_runs pr
+                              WHERE pr.phase_id = phase_metrics.phase_id),
+                total_duration_seconds = (SELECT COALESCE(SUM(pr.duration_seconds), 0) FROM phase_runs pr
+                                          WHERE pr.phase_id = phase_metrics.phase_id),""" if incremental else ""
+
+        try:
+            self.conn.execute(
+                f"""
+                INSERT INTO phase_metrics (
+                    phase_id, total_runs, successful_runs, failed_runs, avg_duration_seconds,
+                    total_tasks, completed_tasks, blocked_tasks, total_quality_gates,
+                    passed_quality_gates{timed_columns}
+                )
+                SELECT ph.id, 0, 0, 0, NULL, 0, 0, 0, 0, 0{timed_values}
+                FROM phases ph
+                WHERE (? IS NULL OR ph.id = ?)
+                  AND NOT EXISTS (SELECT 1 FROM phase_metrics pm WHERE pm.phase_id = ph.id)
+                """,
+                (phase_id, phase_id)
             )
-        )
-        self.conn.commit()
+            cursor = self.conn.execute(
+                f"""
+                UPDATE phase_metrics SET
+                    total_runs = (SELECT COUNT(*) FROM phase_runs pr
+                                  WHERE pr.phase_id = phase_metrics.phase_id),
+                    successful_runs = (SELECT COUNT(*) FROM phase_runs pr
+                                       WHERE pr.phase_id = phase_metrics.phase_id
+                                         AND pr.status = 'completed'),
+                    failed_runs = (SELECT COUNT(*) FROM phase_runs pr
+                                   WHERE pr.phase_id = phase_metrics.phase_id
+                                     AND pr.status = 'failed'),{timed_set}
+                    avg_duration_seconds = (SELECT AVG(pr.duration_seconds) FROM phase_runs pr
+                                            WHERE pr.phase_id = phase_metrics.phase_id),
+                    total_tasks = (SELECT COUNT(*) FROM tasks t
+                                   JOIN phase_plans pp ON t.phase_plan_id = pp.id
+                                   WHERE pp.phase_id = phase_metrics.phase_id),
+                    completed_tasks = (SELECT COUNT(*) FROM tasks t
+                                       JOIN phase_plans pp ON t.phase_plan_id = pp.id
+                                       WHERE pp.phase_id = phase_metrics.phase_id
+                                         AND t.status = 'completed'),
+                    blocked_tasks = (SELECT COUNT(*) FROM tasks t
+                                     JOIN phase_plans pp ON t.phase_plan_id = pp.id
+                                     WHERE pp.phase_id = phase_metrics.phase_id
+                                       AND t.status = 'blocked'),
+                    total_quality_gates = (SELECT COUNT(*) FROM quality_gates qg
+                                           JOIN phase_runs pr ON qg.phase_run_id = pr.id
+                                           WHERE pr.phase_id = phase_metrics.phase_id),
+                    passed_quality_gates = (SELECT COUNT(*) FROM quality_gates qg
+                                            JOIN phase_runs pr ON qg.phase_run_id = pr.id
+                                            WHERE pr.phase_id = phase_metrics.phase_id
+                                              AND qg.status = 'passed'),
+                    last_calculated_at = datetime('now')
+                WHERE (? IS NULL OR phase_id = ?)
+                """,
+                (phase_id, phase_id)
+            )
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
 
-        return {**run_metrics, **task_metrics, **gate_metrics}
+        return cursor.rowcount
+
+    def _has_incremental_metrics(self) -> bool:
+        """Whether migration 008 (phase_metrics triggers) is applied."""
+        return self._has_schema('phase_metrics', 'timed_runs')
 
     def generate_phase_dashboard(self, phase_id: int) -> Dict[str, Any]:
         """
@@ -1161,7 +1713,7 @@ class ProjectDatabase:
         """
         phase = self.get_phase(phase_id)
         metrics = self.get_phase_metrics(phase_id)
-        recent_runs = self.list_phase_runs(phase_id)[:5]
+        recent_runs = self.list_phase_runs(phase_id, limit=5)
 
         # Get current approved plan
         approved_plan = None
@@ -1171,13 +1723,17 @@ class ProjectDatabase:
         # Get task progress
         task_progress = {}
         if approved_plan:
-            tasks = self.list_tasks(approved_plan['id'])
+            cursor = self.conn.execute(
+                "SELECT status, COUNT(*) AS count FROM tasks WHERE phase_plan_id = ? GROUP BY status",
+                (approved_plan['id'],)
+            )
+            counts = {row['status']: row['count'] for row in cursor.fetchall()}
             task_progress = {
-                'total': len(tasks),
-                'pending': sum(1 for t in tasks if t['status'] == 'pending'),
-                'in_progress': sum(1 for t in tasks if t['status'] == 'in-progress'),
-                'completed': sum(1 for t in tasks if t['status'] == 'completed'),
-                'blocked': sum(1 for t in tasks if t['status'] == 'blocked')
+                'total': sum(counts.values()),
+                'pending': counts.get('pending', 0),
+                'in_progress': counts.get('in-progress', 0),
+                'completed': counts.get('completed', 0),
+                'blocked': counts.get('blocked', 0)
             }
 
         return {
@@ -1188,59 +1744,83 @@ class ProjectDatabase:
             'approved_plan': approved_plan
         }
 
-    def get_phase_timeline(self, phase_id: int) -> List[Dict[str, Any]]:
-        """Get timeline of all events for a phase."""
-        timeline = []
+    def get_phase_timeline(
+        self,
+        phase_id: int,
+        after_ts: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get timeline of all events for a phase, oldest first.
 
-        # Phase creation
-        phase = self.get_phase(phase_id)
-        if phase:
-            timeline.append({
-                'type': 'phase_created',
-                'timestamp': phase['created_at'],
-                'data': phase
-            })
-
-        # Phase plans
-        plans = self.list_phase_plans(phase_id)
-        for plan in plans:
-            timeline.append({
-                'type': 'plan_created',
-                'timestamp': plan['created_at'],
-                'data': plan
-            })
-            if plan['approved_at']:
-                timeline.append({
-                    'type': 'plan_approved',
-                    'timestamp': plan['approved_at'],
-                    'data': plan
-                })
-
-        # Phase runs
-        runs = self.list_phase_runs(phase_id)
-        for run in runs:
-            timeline.append({
-                'type': 'run_created',
-                'timestamp': run['created_at'],
-                'data': run
-            })
-            if run['started_at']:
-                timeline.append({
-                    'type': 'run_started',
-                    'timestamp': run['started_at'],
-                    'data': run
-                })
-            if run['completed_at']:
-                timeline.append({
-                    'type': 'run_completed',
-                    'timestamp': run['completed_at'],
-                    'data': run
-                })
-
-        # Sort by timestamp
-        timeline.sort(key=lambda x: x['timestamp'])
-
-        return timeline
+        Events are merged and ordered by one UNION ALL query in SQLite;
+        only the rows on the requested page are then loaded for 'data'.
+
+        Args:
+            phase_id: Phase ID
+            after_ts: Only return events strictly after this timestamp
+                (keyset pagination: pass the last event's timestamp)
+            limit: Maximum events per page. Events sharing the page's last
+                timestamp are all included, so the page may run slightly
+                longer rather than split a tie across pages.
+
+        Returns:
+            List of {'type', 'timestamp', 'data'} dicts
+        """
+        cursor = self.conn.execute(
+            """
+            WITH events (event_type, timestamp, source, source_order, event_order, row_id) AS (
+                SELECT 'phase_created', created_at, 0, 0, 0, id
+                FROM phases WHERE id = :phase_id
+                UNION ALL
+                SELECT 'plan_created', created_at, 1, -revision, 0, id
+                FROM phase_plans WHERE phase_id = :phase_id
+                UNION ALL
+                SELECT 'plan_approved', approved_at, 1, -revision, 1, id
+                FROM phase_plans WHERE phase_id = :phase_id AND approved_at IS NOT NULL
+                UNION ALL
+                SELECT 'run_created', created_at, 2, id, 0, id
+                FROM phase_runs WHERE phase_id = :phase_id
+                UNION ALL
+                SELECT 'run_started', started_at, 2, id, 1, id
+                FROM phase_runs WHERE phase_id = :phase_id AND started_at IS NOT NULL
+                UNION ALL
+                SELECT 'run_completed', completed_at, 2, id, 2, id
+                FROM phase_runs WHERE phase_id = :phase_id AND completed_at IS NOT NULL
+            ),
+            page AS (
+                SELECT * FROM events
+                WHERE :after_ts IS NULL OR timestamp > :after_ts
+            )
+            SELECT event_type, timestamp, source, row_id FROM page
+            WHERE :limit IS NULL
+               OR timestamp <= COALESCE(
+                    (SELECT timestamp FROM page ORDER BY timestamp LIMIT 1 OFFSET :limit - 1),
+                    timestamp)
+            ORDER BY timestamp, source, source_order, event_order
+            """,
+            {'phase_id': phase_id, 'after_ts': after_ts, 'limit': limit}
+        )
+        events = cursor.fetchall()
+
+        # Load each referenced row once
+        rows: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        for source, table in ((0, 'phases'), (1, 'phase_plans'), (2, 'phase_runs')):
+            ids = sorted({e['row_id'] for e in events if e['source'] == source})
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                for row in self.conn.execute(f"SELECT * FROM {table} WHERE id IN ({placeholders})", chunk):
+                    rows[(source, row['id'])] = dict(row)
+
+        return [
+            {
+                'type': e['event_type'],
+                'timestamp': e['timestamp'],
+                'data': rows[(e['source'], e['row_id'])]
+            }
+            for e in events
+        ]
 
     # ==================== MIGRATION HELPERS ====================
 
@@ -1323,16 +1903,24 @@ class ProjectDatabase:
         file_path: str,
         content: str,
         file_type: str = 'markdown',
-        cache_priority: str = 'normal'
+        cache_priority: str = 'normal',
+        file_stat: Optional[Tuple[int, int, int]] = None
     ) -> int:
         """
         Cache a file with SHA-256 hash for invalidation.
 
+        With the blob store available, content is written once per
+        content_hash to content_blobs and the cached_files row only
+        references it; otherwise content is stored inline.
+
         Args:
             file_path: Relative path from project root
             content: File content (UTF-8 text)
             file_type: File type (markdown, text, json)
             cache_priority: Cache priority (high, normal, low)
+            file_stat: Optional (size, mtime_ns, inode) of the file the
+                content was read from, for get_cached_file_by_stat().
+                Cleared when content changes without one.
 
         Returns:
             Cached file ID (integer)
@@ -1340,93 +1928,360 @@ class ProjectDatabase:
         content_hash = self.calculate_file_hash(content)
         file_size_bytes = len(content.encode('utf-8'))
 
-        # Check if file already exists
-        cursor = self.conn.execute(
-            "SELECT id, content_hash FROM cached_files WHERE file_path = ?",
-            (file_path,)
-        )
-        row = cursor.fetchone()
-
-        if row:
-            # Update existing entry
-            if row['content_hash'] != content_hash:
-                # Content changed - update cache
-                self.conn.execute(
-                    """
-                    UPDATE cached_files
-                    SET content_hash = ?, content = ?, file_size_bytes = ?,
-                        file_type = ?, cache_priority = ?,
-                        miss_count = miss_count + 1, updated_at = datetime('now')
-                    WHERE file_path = ?
-                    """,
-                    (content_hash, content, file_size_bytes, file_type, cache_priority, file_path)
-                )
+        if self.file_cache is not None:
+            self.file_cache.discard(file_path)
+
+        # Columns added by later migrations, set only when present
+        extra: Dict[str, Any] = {}
+        stored_content = content
+        use_blob = self._has_blob_store()
+        if use_blob:
+            stored_content = ''
+            extra['storage'] = 'blob'
+        if self._has_stat_signature():
+            size, mtime_ns, inode = file_stat if file_stat else (None, None, None)
+            extra.update(source_size_bytes=size, source_mtime_ns=mtime_ns, source_inode=inode)
+
+        # The blob and the row referencing it are written under one write
+        # lock, so gc_content_blobs() cannot delete the blob in between
+        began = self._begin_immediate()
+        try:
+            # Check if file already exists
+            cursor = self.conn.execute(
+                "SELECT id, content_hash FROM cached_files WHERE file_path = ?",
+                (file_path,)
+            )
+            row = cursor.fetchone()
+
+            # Only new or changed content needs a blob; an unchanged inline row
+            # stays inline. Reference counts are maintained by triggers on
+            # cached_files
+            if use_blob and (not row or row['content_hash'] != content_hash):
+                self._store_blob(content_hash, content)
+
+            if row:
+                # Update existing entry
+                if row['content_hash'] != content_hash:
+                    # Content changed - update cache
+                    extra_set = "".join(f"{column} = ?, " for column in extra)
+                    self.conn.execute(
+                        f"""
+                        UPDATE cached_files
+                        SET content_hash = ?, content = ?, file_size_bytes = ?,
+                            file_type = ?, cache_priority = ?, {extra_set}
+                            miss_count = miss_count + 1, updated_at = datetime('now')
+                        WHERE file_path = ?
+                        """,
+                        (content_hash, stored_content, file_size_bytes, file_type,
+                         cache_priority, *extra.values(), file_path)
+                    )
+                else:
+                    # Content unchanged - update priority and refresh the stat signature
+                    stat_columns = {}
+                    if file_stat:
+                        stat_columns = {k: v for k, v in extra.items() if k.startswith('source_')}
+                    stat_set = "".join(f"{column} = ?, " for column in stat_columns)
+                    self.conn.execute(
+                        f"""
+                        UPDATE cached_files
+                        SET cache_priority = ?, {stat_set}updated_at = datetime('now')
+                        WHERE file_path = ?
+                        """,
+                        (cache_priority, *stat_columns.values(), file_path)
+                    )
+                self.conn.commit()
+                return row['id']
             else:
-                # Content unchanged - just update priority if needed
-                self.conn.execute(
-                    """
-                    UPDATE cached_files
-                    SET cache_priority = ?, updated_at = datetime('now')
-                    WHERE file_path = ?
-                    """,
-                    (cache_priority, file_path)
+                # Insert new entry
+                columns = ", ".join(
+                    ['file_path', 'content_hash', 'content', 'file_size_bytes',
+                     'file_type', 'cache_priority', *extra]
                 )
-            self.conn.commit()
-            return row['id']
-        else:
-            # Insert new entry
-            cursor = self.conn.execute(
-                """
-                INSERT INTO cached_files (
-                    file_path, content_hash, content, file_size_bytes,
-                    file_type, cache_priority
+                placeholders = ", ".join("?" * (6 + len(extra)))
+                cursor = self.conn.execute(
+                    f"INSERT INTO cached_files ({columns}) VALUES ({placeholders})",
+                    (file_path, content_hash, stored_content, file_size_bytes,
+                     file_type, cache_priority, *extra.values())
                 )
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (file_path, content_hash, content, file_size_bytes, file_type, cache_priority)
-            )
-            self.conn.commit()
-            return cursor.lastrowid
+                self.conn.commit()
+                return cursor.lastrowid
+        except Exception:
+            if began:
+                self.conn.rollback()
+            raise
+
+    def _begin_immediate(self) -> bool:
+        """
+        Take the database write lock now, unless a transaction is open.
 
-    def get_cached_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+        Returns:
+            True if this call began the transaction
+        """
+        if self.conn.in_transaction:
+            return False
+        self.conn.execute("BEGIN IMMEDIATE")
+        return True
+
+    def get_cached_file(
+        self,
+        file_path: str,
+        content_hash: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """
-        Get cached file by path and update access stats.
+        Get cached file by path and record the access.
+
+        Served from the in-process file cache when possible; otherwise one
+        SELECT. Access counters are accumulated in memory and written by
+        flush_cache_stats() (automatically every CACHE_STATS_FLUSH_EVERY
+        lookups or CACHE_STATS_FLUSH_INTERVAL_MS, and on close()).
 
         Args:
             file_path: Relative path from project root
+            content_hash: Optional SHA-256 of the caller's current content.
+                When given, a cached row with a different hash counts as a
+                miss (the stale row is still returned for comparison).
 
         Returns:
             Dict with file data or None if not cached
         """
-        cursor = self.conn.execute(
-            "SELECT * FROM cached_files WHERE file_path = ?",
-            (file_path,)
-        )
-        row = cursor.fetchone()
+        start = time.perf_counter()
 
-        if row:
-            # Update access stats (cache hit)
+        row = self._load_cached_row(file_path, content_hash)
+        hit = row is not None and (content_hash is None or row['content_hash'] == content_hash)
+        self._record_cached_row_access(file_path, row if hit else None, start)
+
+        return dict(row) if row is not None else None
+
+    def get_cached_file_by_stat(
+        self,
+        file_path: str,
+        file_stat: Tuple[int, int, int]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached file if the file on disk is known to be unchanged.
+
+        Compares the caller's (size, mtime_ns, inode) with the signature
+        recorded by cache_file(), so an unchanged file is served without
+        being read or hashed. A match is recorded as a cache hit; when the
+        signature is missing or differs nothing is recorded and None is
+        returned, and the caller should fall back to hashing the content
+        and calling get_cached_file().
+
+        Args:
+            file_path: Relative path from project root
+            file_stat: (st_size, st_mtime_ns, st_ino) from os.stat()
+
+        Returns:
+            Dict with file data, or None if the signature does not match
+        """
+        if not self._has_stat_signature():
+            return None
+
+        start = time.perf_counter()
+
+        row = self._load_cached_row(file_path)
+        if row is None or row.get('source_mtime_ns') is None:
+            return None
+        if (row['source_size_bytes'], row['source_mtime_ns'], row['source_inode']) != tuple(file_stat):
+            return None
+
+        self._record_cached_row_access(file_path, row, start)
+        return dict(row)
+
+    def _load_cached_row(
+        self,
+        file_path: str,
+        content_hash: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached_files row from the file cache or the database."""
+        row = None
+        if self.file_cache is not None:
+            row = self.file_cache.get(file_path, content_hash)
+
+        if row is None:
+            if self._has_blob_store():
+                cursor = self.conn.execute(
+                    """
+                    SELECT cf.*, b.compression AS blob_compression, b.data AS blob_data
+                    FROM cached_files cf
+                    LEFT JOIN content_blobs b
+                        ON cf.storage = 'blob' AND b.content_hash = cf.content_hash
+                    WHERE cf.file_path = ?
+                    """,
+                    (file_path,)
+                )
+            else:
+                cursor = self.conn.execute(
+                    "SELECT * FROM cached_files WHERE file_path = ?",
+                    (file_path,)
+                )
+            fetched = cursor.fetchone()
+            if fetched:
+                row = self._materialize_cached_row(dict(fetched))
+                if self.file_cache is not None:
+                    self.file_cache.put(row)
+
+        return row
+
+    def _record_cached_row_access(
+        self,
+        file_path: str,
+        hit_row: Optional[Dict[str, Any]],
+        start: float
+    ):
+        """Record a lookup started at start (perf_counter); hit_row is None on a miss."""
+        if hit_row is not None:
+            # Keep the cached row's counters current for callers
+            hit_row['access_count'] = (hit_row.get('access_count') or 0) + 1
+            hit_row['hit_count'] = (hit_row.get('hit_count') or 0) + 1
+            hit_row['last_accessed'] = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+        tokens_saved = (hit_row.get('file_size_bytes') or 0) // 4 if hit_row is not None else 0
+        self._record_cache_access(
+            file_path, hit_row is not None, tokens_saved, (time.perf_counter() - start) * 1000
+        )
+
+    def _record_cache_access(
+        self,
+        file_path: str,
+        hit: bool,
+        tokens_saved: int,
+        lookup_ms: float
+    ):
+        """Accumulate one lookup in the pending per-file and global counters."""
+        for key in (file_path, None):
+            stats = self._pending_cache_stats.setdefault(key, [0, 0, 0, 0, 0.0])
+            stats[0] += 1
+            stats[1 if hit else 2] += 1
+            stats[3] += tokens_saved
+            stats[4] += lookup_ms
+
+        if self._pending_cache_since is None:
+            self._pending_cache_since = time.monotonic()
+        self._pending_cache_lookups += 1
+
+        if self._cache_stats_due():
+            self.flush_cache_stats()
+
+    def _cache_stats_due(self) -> bool:
+        if not self._pending_cache_lookups:
+            return False
+        if self._pending_cache_lookups >= self.CACHE_STATS_FLUSH_EVERY:
+            return True
+        age_ms = (time.monotonic() - self._pending_cache_since) * 1000
+        return age_ms >= self.CACHE_STATS_FLUSH_INTERVAL_MS
+
+    def flush_cache_stats(self) -> int:
+        """
+        Write accumulated cache access counters in one transaction.
+
+        Hits are added to cached_files (access_count, hit_count,
+        last_accessed); reads, hits, misses, tokens saved and lookup time
+        are added to today's per-file and global cache_statistics rows.
+
+        Returns:
+            Number of lookups flushed
+        """
+        if not self._pending_cache_lookups:
+            return 0
+
+        pending = self._pending_cache_stats
+        lookups = self._pending_cache_lookups
+        stat_date = datetime.now().strftime('%Y-%m-%d')
+
+        try:
+            for file_path, (reads, hits, misses, tokens_saved, lookup_ms) in pending.items():
+                if file_path is not None and hits:
+                    self.conn.execute(
+                        """
+                        UPDATE cached_files
+                        SET access_count = access_count + ?,
+                            hit_count = hit_count + ?,
+                            last_accessed = datetime('now')
+                        WHERE file_path = ?
+                        """,
+                        (hits, hits, file_path)
+                    )
+                self._add_cache_statistics(
+                    stat_date, file_path, reads, hits, misses, tokens_saved, lookup_ms
+                )
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+
+        self._pending_cache_stats = {}
+        self._pending_cache_lookups = 0
+        self._pending_cache_since = None
+        return lookups
+
+    def _add_cache_statistics(
+        self,
+        stat_date: str,
+        file_path: Optional[str],
+        reads: int,
+        hits: int,
+        misses: int,
+        tokens_saved: int,
+        lookup_ms: float
+    ):
+        """Add counter deltas to a cache_statistics row (caller commits)."""
+        cursor = self.conn.execute(
+            """
+            SELECT total_reads, cache_hits, cache_misses, tokens_saved, avg_lookup_time_ms
+            FROM cache_statistics
+            WHERE stat_date = ? AND file_path IS ?
+            """,
+            (stat_date, file_path)
+        )
+        row = cursor.fetchone()
+
+        if row:
+            prev_reads = row['total_reads'] or 0
+            total_reads = prev_reads + reads
+            cache_hits = (row['cache_hits'] or 0) + hits
+            cache_misses = (row['cache_misses'] or 0) + misses
+            total_tokens = (row['tokens_saved'] or 0) + tokens_saved
+            avg_lookup_ms = ((row['avg_lookup_time_ms'] or 0.0) * prev_reads + lookup_ms) / total_reads
+            hit_rate_percent = cache_hits / total_reads * 100.0
             self.conn.execute(
                 """
-                UPDATE cached_files
-                SET access_count = access_count + 1,
-                    hit_count = hit_count + 1,
-                    last_accessed = datetime('now')
-                WHERE file_path = ?
+                UPDATE cache_statistics
+                SET total_reads = ?, cache_hits = ?, cache_misses = ?,
+                    hit_rate_percent = ?, tokens_saved = ?, avg_lookup_time_ms = ?
+                WHERE stat_date = ? AND file_path IS ?
                 """,
-                (file_path,)
+                (total_reads, cache_hits, cache_misses, hit_rate_percent,
+                 total_tokens, avg_lookup_ms, stat_date, file_path)
             )
-            self.conn.commit()
-
-            # Fetch updated row to return current values
-            cursor = self.conn.execute(
-                "SELECT * FROM cached_files WHERE file_path = ?",
-                (file_path,)
+        else:
+            self.conn.execute(
+                """
+                INSERT INTO cache_statistics (
+                    stat_date, file_path, total_reads, cache_hits, cache_misses,
+                    hit_rate_percent, tokens_saved, avg_lookup_time_ms
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (stat_date, file_path, reads, hits, misses,
+                 hits / reads * 100.0, tokens_saved, lookup_ms / reads)
             )
-            updated_row = cursor.fetchone()
-            return dict(updated_row) if updated_row else None
 
-        return None
+    def get_file_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get in-process file cache occupancy and counters.
+
+        Returns:
+            Dict from FileContentCache.stats() plus 'enabled' and
+            'pending_lookups' (accumulated but not yet flushed)
+        """
+        if self.file_cache is None:
+            return {'enabled': False, 'pending_lookups': self._pending_cache_lookups}
+        return {
+            'enabled': True,
+            'pending_lookups': self._pending_cache_lookups,
+            **self.file_cache.stats()
+        }
 
     def invalidate_cache(self, file_path: str):
         """
@@ -1435,6 +2290,9 @@ class ProjectDatabase:
         Args:
             file_path: Relative path from project root
         """
+        if self.file_cache is not None:
+            self.file_cache.discard(file_path)
+
         self.conn.execute(
             "DELETE FROM cached_files WHERE file_path = ?",
             (file_path,)
@@ -1449,8 +2307,11 @@ class ProjectDatabase:
             file_path: Relative path from project root
             cache_hit: True if cache hit, False if cache miss
         """
+        if self.file_cache is not None:
+            self.file_cache.discard(file_path)
+
         if cache_hit:
-            self.conn.execute(
+            self._write_event((
                 """
                 UPDATE cached_files
                 SET access_count = access_count + 1,
@@ -1459,9 +2320,9 @@ class ProjectDatabase:
                 WHERE file_path = ?
                 """,
                 (file_path,)
-            )
+            ))
         else:
-            self.conn.execute(
+            self._write_event((
                 """
                 UPDATE cached_files
                 SET access_count = access_count + 1,
@@ -1470,8 +2331,217 @@ class ProjectDatabase:
                 WHERE file_path = ?
                 """,
                 (file_path,)
+            ))
+
+    # ==================== CONTENT BLOB STORE ====================
+
+    def _has_schema(self, table: str, column: Optional[str] = None) -> bool:
+        """Check once whether a table (or a column of it) exists."""
+        key = f"{table}.{column}" if column else table
+        if key not in self._schema_cache:
+            if column is None:
+                cursor = self.conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                    (table,)
+                )
+                self._schema_cache[key] = cursor.fetchone() is not None
+            else:
+                columns = self.conn.execute(f"PRAGMA table_info({table})").fetchall()
+                self._schema_cache[key] = any(c['name'] == column for c in columns)
+        return self._schema_cache[key]
+
+    def _has_blob_store(self) -> bool:
+        """Whether migration 006 (content_blobs) is applied."""
+        return self._has_schema('content_blobs')
+
+    def _has_stat_signature(self) -> bool:
+        """Whether migration 007 (cached_files source stat columns) is applied."""
+        return self._has_schema('cached_files', 'source_mtime_ns')
+
+    def _encode_blob(self, content: str) -> Tuple[str, bytes, int]:
+        """
+        Encode content for content_blobs.
+
+        Returns:
+            Tuple of (compression, data, raw_size_bytes); compression is
+            'none' when content is small or zlib does not shrink it
+        """
+        raw = content.encode('utf-8')
+        if len(raw) >= self.BLOB_COMPRESSION_MIN_BYTES:
+            packed = zlib.compress(raw, self.BLOB_COMPRESSION_LEVEL)
+            if len(packed) < len(raw):
+                return 'zlib', packed, len(raw)
+        return 'none', raw, len(raw)
+
+    @staticmethod
+    def _decode_blob(compression: str, data: bytes) -> str:
+        """Decode a content_blobs payload back to text."""
+        if compression == 'zlib':
+            data = zlib.decompress(data)
+        elif compression != 'none':
+            raise ValueError(f"Unknown blob compression: {compression}")
+        return bytes(data).decode('utf-8')
+
+    def _store_blob(self, content_hash: str, content: str):
+        """
+        Insert a blob unless one with this hash exists.
+
+        Call inside the write transaction that adds the reference (the
+        caller commits), so the blob cannot be collected in between.
+        """
+        exists = self.conn.execute(
+            "SELECT 1 FROM content_blobs WHERE content_hash = ?",
+            (content_hash,)
+        ).fetchone()
+        if exists:
+            return
+
+        compression, data, raw_size = self._encode_blob(content)
+        self.conn.execute(
+            """
+            INSERT INTO content_blobs (
+                content_hash, compression, raw_size_bytes, stored_size_bytes, data
             )
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(content_hash) DO NOTHING
+            """,
+            (content_hash, compression, raw_size, len(data), data)
+        )
+
+    def _materialize_cached_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace a blob-backed row's empty content with the decoded blob."""
+        compression = row.pop('blob_compression', None)
+        data = row.pop('blob_data', None)
+        if row.get('storage') == 'blob':
+            if data is None:
+                raise sqlite3.IntegrityError(
+                    f"Missing content blob {row['content_hash']} for {row['file_path']}"
+                )
+            row['content'] = self._decode_blob(compression, data)
+        return row
+
+    def migrate_cached_content_to_blobs(self, batch_size: int = 500) -> int:
+        """
+        Move inline cached_files content (rows cached before migration 006)
+        into the blob store.
+
+        Args:
+            batch_size: Rows converted per transaction
+
+        Returns:
+            Number of rows converted (0 if the blob store is unavailable)
+        """
+        if not self._has_blob_store():
+            return 0
+
+        converted = 0
+        while True:
+            began = self._begin_immediate()
+            rows = self.conn.execute(
+                """
+                SELECT id, content FROM cached_files
+                WHERE storage = 'inline'
+                LIMIT ?
+                """,
+                (batch_size,)
+            ).fetchall()
+            if not rows:
+                if began:
+                    self.conn.rollback()
+                return converted
+
+            try:
+                for row in rows:
+                    content = row['content'] or ''
+                    content_hash = self.calculate_file_hash(content)
+                    self._store_blob(content_hash, content)
+                    self.conn.execute(
+                        """
+                        UPDATE cached_files
+                        SET content_hash = ?, content = '', storage = 'blob'
+                        WHERE id = ?
+                        """,
+                        (content_hash, row['id'])
+                    )
+                self.conn.commit()
+            except sqlite3.Error:
+                if began:
+                    self.conn.rollback()
+                raise
+            converted += len(rows)
+
+    def gc_content_blobs(self, grace_seconds: int = BLOB_GC_GRACE_SECONDS) -> int:
+        """
+        Delete blobs no cached_files row references.
+
+        Args:
+            grace_seconds: Keep orphans released less than this long ago,
+                so content re-cached shortly after invalidation is reused
+                (default BLOB_GC_GRACE_SECONDS)
+
+        Returns:
+            Number of blobs deleted
+        """
+        if not self._has_blob_store():
+            return 0
+
+        cursor = self.conn.execute(
+            """
+            DELETE FROM content_blobs
+            WHERE ref_count <= 0
+              AND (released_at IS NULL OR released_at <= datetime('now', ?))
+            """,
+            (f"-{int(grace_seconds)} seconds",)
+        )
         self.conn.commit()
+        return cursor.rowcount
+
+    def get_blob_store_stats(self) -> Dict[str, Any]:
+        """
+        Get blob store size and deduplication figures.
+
+        Returns:
+            Dict with blob/reference counts, raw and stored bytes, logical
+            bytes (sum over cached_files rows), orphan count and ratios;
+            {'enabled': False} if migration 006 is not applied
+        """
+        if not self._has_blob_store():
+            return {'enabled': False}
+
+        blobs = self.conn.execute(
+            """
+            SELECT COUNT(*) AS blobs,
+                   COALESCE(SUM(raw_size_bytes), 0) AS raw_bytes,
+                   COALESCE(SUM(stored_size_bytes), 0) AS stored_bytes,
+                   COALESCE(SUM(ref_count), 0) AS refs,
+                   COALESCE(SUM(ref_count <= 0), 0) AS orphans
+            FROM content_blobs
+            """
+        ).fetchone()
+        files = self.conn.execute(
+            """
+            SELECT COUNT(*) AS files,
+                   COALESCE(SUM(file_size_bytes), 0) AS logical_bytes,
+                   COALESCE(SUM(storage = 'inline'), 0) AS inline_files
+            FROM cached_files
+            """
+        ).fetchone()
+
+        return {
+            'enabled': True,
+            'blobs': blobs['blobs'],
+            'references': blobs['refs'],
+            'orphans': blobs['orphans'],
+            'files': files['files'],
+            'inline_files': files['inline_files'],
+            'logical_bytes': files['logical_bytes'],
+            'raw_bytes': blobs['raw_bytes'],
+            'stored_bytes': blobs['stored_bytes'],
+            'compression_ratio': round(blobs['raw_bytes'] / blobs['stored_bytes'], 2)
+                if blobs['stored_bytes'] else 0.0,
+            'dedup_ratio': round(files['logical_bytes'] / blobs['raw_bytes'], 2)
+                if blobs['raw_bytes'] else 0.0
+        }
 
     # ==================== AGENT INVOCATION TRACKING ====================
 
@@ -1556,28 +2626,35 @@ class ProjectDatabase:
         self,
         agent_name: Optional[str] = None,
         status: Optional[str] = None,
-        phase_run_id: Optional[int] = None
+        phase_run_id: Optional[int] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """List agent invocations with optional filters."""
-        query = "SELECT * FROM agent_invocations WHERE 1=1"
+        """
+        List agent invocations with optional filters.
+
+        With a date range (YYYY-MM-DD, inclusive), only invocations started
+        in it are returned, including ones moved to archive databases.
+        """
+        where = "1=1"
         params = []
 
         if agent_name is not None:
-            query += " AND agent_name = ?"
+            where += " AND agent_name = ?"
             params.append(agent_name)
 
         if status is not None:
-            query += " AND status = ?"
+            where += " AND status = ?"
             params.append(status)
 
         if phase_run_id is not None:
-            query += " AND phase_run_id = ?"
+            where += " AND phase_run_id = ?"
             params.append(phase_run_id)
 
-        query += " ORDER BY started_at DESC"
-
-        cursor = self.conn.execute(query, params)
-        return [dict(row) for row in cursor.fetchall()]
+        where, params = self._date_range_filter(where, params, 'started_at', start_date, end_date)
+        return self._select_with_archives(
+            'agent_invocations', where, params, 'started_at', start_date, end_date, descending=True
+        )
 
     def log_file_read(
         self,
@@ -1596,11 +2673,11 @@ class ProjectDatabase:
             file_size_bytes: File size in bytes
 
         Returns:
-            File read log ID (integer)
+            File read log ID (integer), or None if queued in write-behind mode
         """
         estimated_tokens = file_size_bytes // 4  # Rough estimate
 
-        cursor = self.conn.execute(
+        statements = [(
             """
             INSERT INTO agent_file_reads (
                 invocation_id, file_path, cache_status,
@@ -1609,11 +2686,11 @@ class ProjectDatabase:
             VALUES (?, ?, ?, ?, ?)
             """,
             (invocation_id, file_path, cache_status, file_size_bytes, estimated_tokens)
-        )
+        )]
 
         # Update invocation stats
         if cache_status == 'hit':
-            self.conn.execute(
+            statements.append((
                 """
                 UPDATE agent_invocations
                 SET total_files_read = total_files_read + 1,
@@ -1622,9 +2699,9 @@ class ProjectDatabase:
                 WHERE id = ?
                 """,
                 (estimated_tokens, invocation_id)
-            )
+            ))
         elif cache_status == 'miss':
-            self.conn.execute(
+            statements.append((
                 """
                 UPDATE agent_invocations
                 SET total_files_read = total_files_read + 1,
@@ -1633,18 +2710,24 @@ class ProjectDatabase:
                 WHERE id = ?
                 """,
                 (estimated_tokens, invocation_id)
-            )
+            ))
 
-        self.conn.commit()
-        return cursor.lastrowid
+        return self._write_event(*statements)
 
-    def get_agent_file_reads(self, invocation_id: int) -> List[Dict[str, Any]]:
-        """Get all file reads for an invocation."""
-        cursor = self.conn.execute(
-            "SELECT * FROM agent_file_reads WHERE invocation_id = ? ORDER BY read_at",
-            (invocation_id,)
-        )
-        return [dict(row) for row in cursor.fetchall()]
+    def get_agent_file_reads(
+        self,
+        invocation_id: int,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all file reads for an invocation.
+
+        With a date range (YYYY-MM-DD, inclusive), only reads made in it are
+        returned, including ones moved to archive databases.
+        """
+        where, params = self._date_range_filter("invocation_id = ?", [invocation_id], 'read_at', start_date, end_date)
+        return self._select_with_archives('agent_file_reads', where, params, 'read_at', start_date, end_date)
 
     # ==================== CHECKLIST MANAGEMENT ====================
 
@@ -2096,6 +3179,9 @@ class ProjectDatabase:
         """
         Get aggregated metrics for agent invocations.
 
+        Archived invocations are included: from archive_rollups when no date
+        range is given, or from the archives overlapping the range.
+
         Args:
             agent_name: Optional agent name filter
             start_date: Optional start date (YYYY-MM-DD)
@@ -2104,25 +3190,56 @@ class ProjectDatabase:
         Returns:
             Dict with metrics (total_invocations, avg_files_read, cache_hit_rate, etc.)
         """
-        query = "SELECT * FROM agent_invocations WHERE 1=1"
+        # Plain range predicates on started_at (not DATE(started_at)) so the
+        # idx_agent_invocations_* indexes can seek to the window. Durations
+        # are summed rather than averaged so archive totals can be added.
+        aggregate = """
+            SELECT
+                COUNT(*) AS total,
+                COALESCE(SUM(status = 'completed'), 0) AS completed,
+                COALESCE(SUM(status = 'failed'), 0) AS failed,
+                COALESCE(SUM(total_files_read), 0) AS total_files,
+                COALESCE(SUM(cache_hits), 0) AS cache_hits,
+                COALESCE(SUM(cache_misses), 0) AS cache_misses,
+                COALESCE(SUM(estimated_tokens_used), 0) AS total_tokens,
+                COALESCE(SUM(duration_seconds), 0) AS total_duration_seconds,
+                COUNT(duration_seconds) AS timed_count
+            FROM {source}
+            WHERE 1=1
+        """
+        filters = ""
         params = []
 
         if agent_name is not None:
-            query += " AND agent_name = ?"
+            filters += " AND agent_name = ?"
             params.append(agent_name)
 
         if start_date is not None:
-            query += " AND DATE(started_at) >= ?"
+            filters += " AND started_at >= date(?)"
             params.append(start_date)
 
         if end_date is not None:
-            query += " AND DATE(started_at) <= ?"
+            filters += " AND started_at < date(?, '+1 day')"
             params.append(end_date)
 
-        cursor = self.conn.execute(query, params)
-        invocations = [dict(row) for row in cursor.fetchall()]
+        row = dict(self.conn.execute(aggregate.format(source='agent_invocations') + filters, params).fetchone())
 
-        if not invocations:
+        archived = []
+        if start_date is None and end_date is None:
+            if self._has_archive_catalog():
+                archived.append(self._agent_invocation_rollup(agent_name))
+        else:
+            for _ in self._attached_archives('agent_invocations', start_date, end_date):
+                archived.append(self.conn.execute(
+                    aggregate.format(source='pm_archive.agent_invocations') + filters, params
+                ).fetchone())
+        for extra in archived:
+            for key in row:
+                row[key] += extra[key]
+
+        total = row['total']
+
+        if not total:
             return {
                 'total_invocations': 0,
                 'completed': 0,
@@ -2135,29 +3252,516 @@ class ProjectDatabase:
                 'avg_duration_seconds': 0.0
             }
 
-        total = len(invocations)
-        completed = sum(1 for i in invocations if i['status'] == 'completed')
-        failed = sum(1 for i in invocations if i['status'] == 'failed')
-
-        total_files = sum(i['total_files_read'] for i in invocations)
-        total_hits = sum(i['cache_hits'] for i in invocations)
-        total_misses = sum(i['cache_misses'] for i in invocations)
-        total_tokens = sum(i['estimated_tokens_used'] for i in invocations)
-
-        # Calculate average duration for completed invocations
-        completed_invs = [i for i in invocations if i['duration_seconds'] is not None]
-        avg_duration = sum(i['duration_seconds'] for i in completed_invs) / len(completed_invs) if completed_invs else 0.0
-
+        total_hits = row['cache_hits']
+        total_misses = row['cache_misses']
         cache_hit_rate = (total_hits / (total_hits + total_misses) * 100.0) if (total_hits + total_misses) > 0 else 0.0
 
         return {
             'total_invocations': total,
-            'completed': completed,
-            'failed': failed,
-            'avg_files_read': total_files / total,
+            'completed': row['completed'],
+            'failed': row['failed'],
+            'avg_files_read': row['total_files'] / total,
             'avg_cache_hits': total_hits / total,
             'avg_cache_misses': total_misses / total,
             'cache_hit_rate': cache_hit_rate,
-            'total_tokens_used': total_tokens,
-            'avg_duration_seconds': avg_duration
+            'total_tokens_used': row['total_tokens'],
+            'avg_duration_seconds': row['total_duration_seconds'] / row['timed_count'] if row['timed_count'] else 0.0
+        }
+
+    def _agent_invocation_rollup(self, agent_name: Optional[str]) -> sqlite3.Row:
+        """Totals of archived invocations, in get_agent_metrics' column names."""
+        query = """
+            SELECT
+                COALESCE(SUM(row_count), 0) AS total,
+                COALESCE(SUM(completed), 0) AS completed,
+                COALESCE(SUM(failed), 0) AS failed,
+                COALESCE(SUM(total_files), 0) AS total_files,
+                COALESCE(SUM(cache_hits), 0) AS cache_hits,
+                COALESCE(SUM(cache_misses), 0) AS cache_misses,
+                COALESCE(SUM(total_tokens), 0) AS total_tokens,
+                COALESCE(SUM(total_duration_seconds), 0) AS total_duration_seconds,
+                COALESCE(SUM(timed_count), 0) AS timed_count
+            FROM archive_rollups
+            WHERE source_table = 'agent_invocations'
+        """
+        params = []
+        if agent_name is not None:
+            query += " AND group_key = ?"
+            params.append(agent_name)
+        return self.conn.execute(query, params).fetchone()
+
+    # ==================== EVENT ARCHIVAL ====================
+
+    # Event tables archive_events() can move, in the order they are archived:
+    # agent_file_reads goes before the agent_invocations rows it cascades from.
+    # 'group' is the archive_rollups group_key column and 'rollup' maps other
+    # archive_rollups columns to aggregates over the archived rows.
+    ARCHIVE_TABLES: Dict[str, Dict[str, Any]] = {
+        'agent_file_reads': {
+            'timestamp': 'read_at',
+            'group': 'cache_status',
+            'indexes': (('invocation_id',), ('read_at',)),
+            'rollup': {
+                'failed': "SUM(cache_status = 'error')",
+                'total_files': "COUNT(*)",
+                'cache_hits': "SUM(cache_status = 'hit')",
+                'cache_misses': "SUM(cache_status = 'miss')",
+                'total_bytes': "SUM(file_size_bytes)",
+                'total_tokens': "SUM(estimated_tokens)",
+            },
+        },
+        'task_updates': {
+            'timestamp': 'created_at',
+            'group': 'update_type',
+            'indexes': (('task_run_id',), ('created_at',)),
+            'rollup': {},
+        },
+        'execution_logs': {
+            'timestamp': 'executed_at',
+            'group': None,
+            'indexes': (('task_run_id',), ('executed_at',)),
+            'rollup': {
+                'completed': "SUM(exit_code = 0)",
+                'failed': "SUM(exit_code <> 0)",
+                'total_duration_seconds': "SUM(duration_ms) / 1000.0",
+                'timed_count': "COUNT(duration_ms)",
+            },
+        },
+        'agent_invocations': {
+            'timestamp': 'started_at',
+            'group': 'agent_name',
+            'indexes': (('agent_name', 'started_at'), ('started_at',)),
+            'rollup': {
+                'completed': "SUM(status = 'completed')",
+                'failed': "SUM(status = 'failed')",
+                'total_files': "SUM(total_files_read)",
+                'cache_hits': "SUM(cache_hits)",
+                'cache_misses': "SUM(cache_misses)",
+                'total_tokens': "SUM(estimated_tokens_used)",
+                'total_duration_seconds': "SUM(duration_seconds)",
+                'timed_count': "COUNT(duration_seconds)",
+            },
+        },
+    }
+
+    def _has_archive_catalog(self) -> bool:
+        """Whether migration 010 (archive_partitions, archive_rollups) is applied."""
+        return self._has_schema('archive_partitions')
+
+    def _archive_path(self, period: str) -> Path:
+        """Archive database for a month: archive/<db name>-YYYY-MM.db beside the database."""
+        db_path = Path(self.db_path)
+        return db_path.parent / "archive" / f"{db_path.stem}-{period}.db"
+
+    def archive_events(
+        self,
+        older_than_days: int = 90,
+        tables: Optional[List[str]] = None,
+        dry_run: bool = False
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Move event rows older than a cutoff into per-month archive databases.
+
+        Rows are grouped by the month of their timestamp, copied into that
+        month's archive database (see _archive_path), summarized into
+        archive_rollups and deleted here, one transaction per table and
+        month. Rows are copied with INSERT OR IGNORE, so a run interrupted
+        after writing an archive is completed by running it again.
+
+        Agent invocations are archived once they completed before the
+        cutoff, unless a checklist or a not-yet-archivable child invocation
+        refers to them. Their file reads move with them, so archiving
+        agent_invocations always archives agent_file_reads too.
+
+        Args:
+            older_than_days: Archive rows older than this many days
+            tables: Tables to archive (default: every ARCHIVE_TABLES entry present)
+            dry_run: Only count the rows that would move
+
+        Returns:
+            {table: {period: rows moved}}; empty if migration 010 is not applied
+
+        Raises:
+            ValueError: If tables names a table archive_events does not handle
+        """
+        if tables is not None:
+            unknown = sorted(set(tables) - set(self.ARCHIVE_TABLES))
+            if unknown:
+                raise ValueError(f"Cannot archive: {', '.join(unknown)}")
+            tables = set(tables)
+            if 'agent_invocations' in tables:
+                tables.add('agent_file_reads')
+
+        if not self._has_archive_catalog():
+            return {}
+
+        self.flush()
+        cutoff = self.conn.execute(
+            "SELECT datetime('now', ?)", (f"-{int(older_than_days)} days",)
+        ).fetchone()[0]
+
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS pm_archive_invocations (id INTEGER PRIMARY KEY)")
+        self.conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS pm_archive_batch (id INTEGER PRIMARY KEY, period TEXT NOT NULL)"
+        )
+
+        archived = {}
+        try:
+            if tables is None or 'agent_invocations' in tables:
+                self._stage_archivable_invocations(cutoff)
+
+            for table, spec in self.ARCHIVE_TABLES.items():
+                if tables is not None and table not in tables:
+                    continue
+                if not self._has_schema(table, spec['timestamp']):
+                    continue
+
+                periods = self._stage_archive_batch(table, spec['timestamp'], cutoff)
+                if not dry_run:
+                    for period in periods:
+                        periods[period] = self._archive_period(table, spec, period)
+                if periods:
+                    archived[table] = periods
+        finally:
+            self.conn.execute("DELETE FROM temp.pm_archive_batch")
+            self.conn.execute("DELETE FROM temp.pm_archive_invocations")
+            self.conn.commit()
+
+        return archived
+
+    def _stage_archivable_invocations(self, cutoff: str):
+        """Fill temp.pm_archive_invocations with the invocations archive_events may move."""
+        self.conn.execute("DELETE FROM temp.pm_archive_invocations")
+        query = """
+            INSERT INTO temp.pm_archive_invocations (id)
+            SELECT id FROM agent_invocations
+            WHERE completed_at IS NOT NULL AND completed_at < ?
+        """
+        if self._has_schema('checklists', 'invocation_id'):
+            query += " AND id NOT IN (SELECT invocation_id FROM checklists WHERE invocation_id IS NOT NULL)"
+        self.conn.execute(query, (cutoff,))
+
+        # Keep parents of invocations that stay, repeating up the tree
+        while self.conn.execute(
+            """
+            DELETE FROM temp.pm_archive_invocations
+            WHERE id IN (
+                SELECT parent_invocation_id FROM agent_invocations
+                WHERE parent_invocation_id IS NOT NULL
+                  AND id NOT IN (SELECT id FROM temp.pm_archive_invocations)
+            )
+            """
+        ).rowcount:
+            pass
+
+    def _stage_archive_batch(self, table: str, timestamp: str, cutoff: str) -> Dict[str, int]:
+        """Fill temp.pm_archive_batch with a table's archivable rows; return rows per period."""
+        if table == 'agent_invocations':
+            eligible, params = "id IN (SELECT id FROM temp.pm_archive_invocations)", ()
+        elif table == 'agent_file_reads':
+            # Reads move with their invocation; only orphaned reads go by age
+            eligible = """
+                invocation_id IN (SELECT id FROM temp.pm_archive_invocations)
+                OR (read_at < ? AND NOT EXISTS (
+                    SELECT 1 FROM agent_invocations i WHERE i.id = agent_file_reads.invocation_id
+                ))
+            """
+            params = (cutoff,)
+        else:
+            eligible, params = f"{timestamp} < ?", (cutoff,)
+
+        self.conn.execute("DELETE FROM temp.pm_archive_batch")
+        self.conn.execute(
+            f"""
+            INSERT INTO temp.pm_archive_batch (id, period)
+            SELECT id, strftime('%Y-%m', {timestamp}) FROM main.{table}
+            WHERE {timestamp} IS NOT NULL AND ({eligible})
+            """,
+            params
+        )
+        cursor = self.conn.execute(
+            "SELECT period, COUNT(*) FROM temp.pm_archive_batch GROUP BY period ORDER BY period"
+        )
+        return {period: count for period, count in cursor.fetchall()}
+
+    def _archive_period(self, table: str, spec: Dict[str, Any], period: str) -> int:
+        """Move one month of staged rows into its archive database; return rows moved."""
+        archive_path = self._archive_path(period)
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        batch = "SELECT id FROM temp.pm_archive_batch WHERE period = ?"
+
+        self.conn.execute("ATTACH DATABASE ? AS pm_archive", (str(archive_path),))
+        try:
+            try:
+                column_list = ", ".join(self._ensure_archive_table(table, spec))
+                self.conn.execute(
+                    f"""
+                    INSERT OR IGNORE INTO pm_archive.{table} ({column_list})
+                    SELECT {column_list} FROM main.{table} WHERE id IN ({batch})
+                    """,
+                    (period,)
+                )
+                self._add_archive_rollup(table, spec, period, batch)
+                moved = self.conn.execute(
+                    f"DELETE FROM main.{table} WHERE id IN ({batch})", (period,)
+                ).rowcount
+                self.conn.execute(
+                    """
+                    INSERT INTO archive_partitions (source_table, period, archive_path, row_count)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT (source_table, period) DO UPDATE SET
+                        archive_path = excluded.archive_path,
+                        row_count = row_count + excluded.row_count,
+                        last_archived_at = datetime('now')
+                    """,
+                    (table, period, str(archive_path), moved)
+                )
+                self.conn.commit()
+            except sqlite3.Error:
+                self.conn.rollback()
+                raise
+        finally:
+            self.conn.execute("DETACH DATABASE pm_archive")
+        return moved
+
+    def _ensure_archive_table(self, table: str, spec: Dict[str, Any]) -> List[str]:
+        """Create or widen a table in the attached archive; return the columns to copy."""
+        # cursor.description includes generated columns (duration_seconds),
+        # which the archive stores as plain values
+        columns = [d[0] for d in self.conn.execute(f"SELECT * FROM main.{table} LIMIT 0").description]
+        existing = {
+            row['name'] for row in self.conn.execute(f"PRAGMA pm_archive.table_info({table})")
         }
+
+        if not existing:
+            self.conn.execute(f"CREATE TABLE pm_archive.{table} AS SELECT * FROM main.{table} WHERE 0")
+            self.conn.execute(f"CREATE UNIQUE INDEX pm_archive.idx_{table}_id ON {table} (id)")
+            for index_columns in spec['indexes']:
+                if all(column in columns for column in index_columns):
+                    self.conn.execute(
+                        f"CREATE INDEX pm_archive.idx_{table}_{'_'.join(index_columns)} "
+                        f"ON {table} ({', '.join(index_columns)})"
+                    )
+        else:
+            for column in columns:
+                if column not in existing:
+                    self.conn.execute(f"ALTER TABLE pm_archive.{table} ADD COLUMN {column}")
+
+        return columns
+
+    def _add_archive_rollup(self, table: str, spec: Dict[str, Any], period: str, batch: str):
+        """Add a month of staged rows to archive_rollups."""
+        group_key = f"COALESCE(CAST({spec['group']} AS TEXT), '')" if spec['group'] else "''"
+        names = ["row_count"] + list(spec['rollup'])
+        values = ["COUNT(*)"] + [f"COALESCE({expr}, 0)" for expr in spec['rollup'].values()]
+        self.conn.execute(
+            f"""
+            INSERT INTO archive_rollups (source_table, period, group_key, {', '.join(names)})
+            SELECT ?, ?, {group_key}, {', '.join(values)}
+            FROM main.{table}
+            WHERE id IN ({batch})
+            GROUP BY 3
+            ON CONFLICT (source_table, period, group_key) DO UPDATE SET
+                {', '.join(f"{name} = {name} + excluded.{name}" for name in names)}
+            """,
+            (table, period, period)
+        )
+
+    @staticmethod
+    def _date_range_filter(
+        where: str,
+        params: List[Any],
+        column: str,
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> Tuple[str, List[Any]]:
+        """Add an inclusive YYYY-MM-DD range on column to a WHERE clause."""
+        params = list(params)
+        if start_date is not None:
+            where += f" AND {column} >= date(?)"
+            params.append(start_date)
+        if end_date is not None:
+            where += f" AND {column} < date(?, '+1 day')"
+            params.append(end_date)
+        return where, params
+
+    def _attached_archives(
+        self,
+        table: str,
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> Iterator[set]:
+        """
+        Attach, one at a time as pm_archive, each archive holding rows of
+        table for the months a date range overlaps.
+
+        Yields the archived table's column names. Nothing is attached
+        without a date range or for archives that have been purged.
+        """
+        if (start_date is None and end_date is None) or not self._has_archive_catalog():
+            return
+
+        query = "SELECT archive_path FROM archive_partitions WHERE source_table = ?"
+        params = [table]
+        if start_date is not None:
+            query += " AND period >= strftime('%Y-%m', ?)"
+            params.append(start_date)
+        if end_date is not None:
+            query += " AND period <= strftime('%Y-%m', ?)"
+            params.append(end_date)
+        paths = [row['archive_path'] for row in self.conn.execute(query + " ORDER BY period", params)]
+
+        for path in paths:
+            if not Path(path).exists():
+                continue
+            self.conn.execute("ATTACH DATABASE ? AS pm_archive", (path,))
+            try:
+                columns = {
+                    row['name'] for row in self.conn.execute(f"PRAGMA pm_archive.table_info({table})")
+                }
+                if columns:
+                    yield columns
+            finally:
+                self.conn.execute("DETACH DATABASE pm_archive")
+
+    def _select_with_archives(
+        self,
+        table: str,
+        where: str,
+        params: List[Any],
+        order_by: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        descending: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        SELECT * FROM table WHERE where, plus matching rows from the
+        archives the date range overlaps, ordered by (order_by, id).
+        """
+        cursor = self.conn.execute(
+            f"SELECT * FROM {table} WHERE {where} ORDER BY {order_by}{' DESC' if descending else ''}",
+            params
+        )
+        columns = [d[0] for d in cursor.description]
+        rows = [dict(row) for row in cursor.fetchall()]
+
+        archived = []
+        for present in self._attached_archives(table, start_date, end_date):
+            select = ", ".join(c if c in present else f"NULL AS {c}" for c in columns)
+            archived.extend(
+                dict(row) for row in self.conn.execute(
+                    f"SELECT {select} FROM pm_archive.{table} WHERE {where}", params
+                ).fetchall()
+            )
+
+        if not archived:
+            return rows
+        rows.extend(archived)
+        rows.sort(key=lambda r: (r[order_by] or '', r['id']), reverse=descending)
+        return rows
+
+    def list_archives(self) -> List[Dict[str, Any]]:
+        """
+        List archived partitions.
+
+        Returns:
+            archive_partitions rows (source_table, period, archive_path,
+            row_count, timestamps) ordered by period, each with an 'exists'
+            flag for its archive file; empty if migration 010 is not applied
+        """
+        if not self._has_archive_catalog():
+            return []
+
+        cursor = self.conn.execute(
+            "SELECT * FROM archive_partitions ORDER BY period, source_table"
+        )
+        archives = []
+        for row in cursor.fetchall():
+            archive = dict(row)
+            archive['exists'] = Path(archive['archive_path']).exists()
+            archives.append(archive)
+        return archives
+
+    def get_archive_rollups(
+        self,
+        source_table: Optional[str] = None,
+        start_period: Optional[str] = None,
+        end_period: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get monthly summaries of archived rows.
+
+        Args:
+            source_table: Optional table filter
+            start_period: Optional first month (YYYY-MM)
+            end_period: Optional last month (YYYY-MM)
+
+        Returns:
+            archive_rollups rows ordered by source_table, period, group_key
+        """
+        if not self._has_archive_catalog():
+            return []
+
+        query = "SELECT * FROM archive_rollups WHERE 1=1"
+        params = []
+
+        if source_table is not None:
+            query += " AND source_table = ?"
+            params.append(source_table)
+
+        if start_period is not None:
+            query += " AND period >= ?"
+            params.append(start_period)
+
+        if end_period is not None:
+            query += " AND period <= ?"
+            params.append(end_period)
+
+        query += " ORDER BY source_table, period, group_key"
+
+        cursor = self.conn.execute(query, params)
+        return [dict(row) for row in cursor.fetchall()]
+
+    def purge_archives(self, before_period: str) -> int:
+        """
+        Delete archive databases for months before a period (retention).
+
+        Catalog entries for those months are removed; their archive_rollups
+        stay, so all-time metrics still count the purged rows.
+
+        Args:
+            before_period: First month to keep (YYYY-MM)
+
+        Returns:
+            Number of archive files deleted
+
+        Raises:
+            ValueError: If before_period is not YYYY-MM
+        """
+        try:
+            valid = datetime.strptime(before_period, '%Y-%m').strftime('%Y-%m') == before_period
+        except ValueError:
+            valid = False
+        if not valid:
+            raise ValueError(f"Period must be YYYY-MM, got {before_period!r}")
+        if not self._has_archive_catalog():
+            return 0
+
+        paths = [
+            row['archive_path'] for row in self.conn.execute(
+                "SELECT DISTINCT archive_path FROM archive_partitions WHERE period < ?",
+                (before_period,)
+            )
+        ]
+        self.conn.execute("DELETE FROM archive_partitions WHERE period < ?", (before_period,))
+        self.conn.commit()
+
+        deleted = 0
+        for path in paths:
+            archive_path = Path(path)
+            if archive_path.exists():
+                archive_path.unlink()
+                deleted += 1
+            for suffix in ('-journal', '-wal', '-shm'):
+                Path(path + suffix).unlink(missing_ok=True)
+        return deleted
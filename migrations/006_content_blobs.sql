@@ -0,0 +1,78 @@
+-- Migration 006: Content-addressed blob store for cached file content
+--
+-- cached_files used to hold the full UTF-8 content of every cached file
+-- inline, so identical documents under different paths were stored once
+-- per path and large memory-bank files bloated the main database and WAL.
+-- Content now lives once per SHA-256 content_hash in content_blobs,
+-- optionally zlib-compressed, and cached_files rows reference it.
+--
+-- Rows written before this migration keep their inline content
+-- (storage = 'inline') and stay readable; ProjectDatabase writes new rows
+-- as storage = 'blob' and migrate_cached_content_to_blobs() converts the
+-- rest. ref_count is maintained by the triggers below, so it stays correct
+-- for deletes issued outside ProjectDatabase too. Orphaned blobs
+-- (ref_count = 0) are removed by ProjectDatabase.gc_content_blobs().
+--
+-- ROLLBACK:
+-- (convert rows back to inline content first)
+-- DROP TRIGGER trg_cached_files_blob_ref_insert;
+-- DROP TRIGGER trg_cached_files_blob_ref_delete;
+-- DROP TRIGGER trg_cached_files_blob_ref_update;
+-- DROP TABLE content_blobs;
+-- ALTER TABLE cached_files DROP COLUMN storage;
+-- DELETE FROM schema_version WHERE version = 6;
+
+CREATE TABLE IF NOT EXISTS content_blobs (
+    content_hash TEXT PRIMARY KEY,              -- SHA-256 of the UTF-8 content
+    compression TEXT NOT NULL DEFAULT 'zlib'
+        CHECK (compression IN ('none', 'zlib')),
+    raw_size_bytes INTEGER NOT NULL,
+    stored_size_bytes INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    ref_count INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL DEFAULT (datetime('now')),
+    released_at TEXT                            -- when ref_count last dropped
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_content_blobs_orphans
+    ON content_blobs(released_at) WHERE ref_count <= 0;
+
+-- 'inline': content column holds the text (pre-006 rows)
+-- 'blob':   content column is empty, text lives in content_blobs
+ALTER TABLE cached_files ADD COLUMN storage TEXT NOT NULL DEFAULT 'inline';
+
+CREATE TRIGGER IF NOT EXISTS trg_cached_files_blob_ref_insert
+AFTER INSERT ON cached_files
+WHEN NEW.storage = 'blob'
+BEGIN
+    UPDATE content_blobs
+    SET ref_count = ref_count + 1
+    WHERE content_hash = NEW.content_hash;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_cached_files_blob_ref_delete
+AFTER DELETE ON cached_files
+WHEN OLD.storage = 'blob'
+BEGIN
+    UPDATE content_blobs
+    SET ref_count = ref_count - 1,
+        released_at = datetime('now')
+    WHERE content_hash = OLD.content_hash;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_cached_files_blob_ref_update
+AFTER UPDATE OF content_hash, storage ON cached_files
+WHEN OLD.content_hash IS NOT NEW.content_hash OR OLD.storage IS NOT NEW.storage
+BEGIN
+    UPDATE content_blobs
+    SET ref_count = ref_count - 1,
+        released_at = datetime('now')
+    WHERE OLD.storage = 'blob' AND content_hash = OLD.content_hash;
+
+    UPDATE content_blobs
+    SET ref_count = ref_count + 1
+    WHERE NEW.storage = 'blob' AND content_hash = NEW.content_hash;
+END;
+
+INSERT INTO schema_version (version, description, applied_at)
+VALUES (6, 'Content-addressed blob store for cached_files content', datetime('now'));
@@ -0,0 +1,21 @@
+-- Migration 007: Record source file stat signature on cached_files
+--
+-- cache_wrapper.py read used to read and SHA-256 hash every file just to
+-- decide hit or miss. The (size, mtime_ns, inode) of the file as last
+-- hashed is now stored next to content_hash; when a fresh os.stat()
+-- matches, the file is known unchanged and is served without reading it.
+-- NULL means no trusted signature (unknown, or recorded too close to the
+-- file's last modification to rule out a same-timestamp rewrite).
+--
+-- ROLLBACK:
+-- ALTER TABLE cached_files DROP COLUMN source_size_bytes;
+-- ALTER TABLE cached_files DROP COLUMN source_mtime_ns;
+-- ALTER TABLE cached_files DROP COLUMN source_inode;
+-- DELETE FROM schema_version WHERE version = 7;
+
+ALTER TABLE cached_files ADD COLUMN source_size_bytes INTEGER;
+ALTER TABLE cached_files ADD COLUMN source_mtime_ns INTEGER;
+ALTER TABLE cached_files ADD COLUMN source_inode INTEGER;
+
+INSERT INTO schema_version (version, description, applied_at)
+VALUES (7, 'Source file stat signature on cached_files', datetime('now'));
@@ -0,0 +1,256 @@
+-- Migration 008: Maintain phase_metrics incrementally with triggers
+--
+-- get_phase_metrics() used to re-aggregate phase_runs, tasks and
+-- quality_gates and then UPDATE and commit phase_metrics on every call,
+-- including every dashboard render. The triggers below apply each change
+-- as a delta when it happens, so reading metrics is a single row lookup.
+-- ProjectDatabase.rebuild_metrics() recomputes rows from scratch for repair.
+--
+-- Every phase gets its metrics row when it is created. Each trigger
+-- removes the old row's contribution and adds the new one. Deleting a
+-- phase run or plan subtracts its quality gates or tasks first, because
+-- by the time a cascaded child delete fires, its parent row is already gone.
+-- avg_duration_seconds is derived from total_duration_seconds / timed_runs.
+--
+-- ROLLBACK:
+-- DROP TRIGGER trg_phase_metrics_phase_insert;
+-- DROP TRIGGER trg_phase_metrics_run_insert;
+-- DROP TRIGGER trg_phase_metrics_run_update;
+-- DROP TRIGGER trg_phase_metrics_run_delete;
+-- DROP TRIGGER trg_phase_metrics_task_insert;
+-- DROP TRIGGER trg_phase_metrics_task_update;
+-- DROP TRIGGER trg_phase_metrics_task_delete;
+-- DROP TRIGGER trg_phase_metrics_plan_delete;
+-- DROP TRIGGER trg_phase_metrics_gate_insert;
+-- DROP TRIGGER trg_phase_metrics_gate_update;
+-- DROP TRIGGER trg_phase_metrics_gate_delete;
+-- ALTER TABLE phase_metrics DROP COLUMN timed_runs;
+-- ALTER TABLE phase_metrics DROP COLUMN total_duration_seconds;
+-- DELETE FROM schema_version WHERE version = 8;
+
+ALTER TABLE phase_metrics ADD COLUMN timed_runs INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE phase_metrics ADD COLUMN total_duration_seconds INTEGER NOT NULL DEFAULT 0;
+
+-- ==================== BACKFILL ====================
+
+INSERT INTO phase_metrics (
+    phase_id, total_runs, successful_runs, failed_runs, avg_duration_seconds,
+    total_tasks, completed_tasks, blocked_tasks, total_quality_gates,
+    passed_quality_gates, timed_runs, total_duration_seconds, last_calculated_at
+)
+SELECT ph.id, 0, 0, 0, NULL, 0, 0, 0, 0, 0, 0, 0, datetime('now')
+FROM phases ph
+WHERE NOT EXISTS (SELECT 1 FROM phase_metrics pm WHERE pm.phase_id = ph.id);
+
+UPDATE phase_metrics SET
+    total_runs = (SELECT COUNT(*) FROM phase_runs pr WHERE pr.phase_id = phase_metrics.phase_id),
+    successful_runs = (SELECT COUNT(*) FROM phase_runs pr
+                       WHERE pr.phase_id = phase_metrics.phase_id AND pr.status = 'completed'),
+    failed_runs = (SELECT COUNT(*) FROM phase_runs pr
+                   WHERE pr.phase_id = phase_metrics.phase_id AND pr.status = 'failed'),
+    timed_runs = (SELECT COUNT(pr.duration_seconds) FROM phase_runs pr
+                  WHERE pr.phase_id = phase_metrics.phase_id),
+    total_duration_seconds = (SELECT COALESCE(SUM(pr.duration_seconds), 0) FROM phase_runs pr
+                              WHERE pr.phase_id = phase_metrics.phase_id),
+    avg_duration_seconds = (SELECT AVG(pr.duration_seconds) FROM phase_runs pr
+                            WHERE pr.phase_id = phase_metrics.phase_id),
+    total_tasks = (SELECT COUNT(*) FROM tasks t JOIN phase_plans pp ON t.phase_plan_id = pp.id
+                   WHERE pp.phase_id = phase_metrics.phase_id),
+    completed_tasks = (SELECT COUNT(*) FROM tasks t JOIN phase_plans pp ON t.phase_plan_id = pp.id
+                       WHERE pp.phase_id = phase_metrics.phase_id AND t.status = 'completed'),
+    blocked_tasks = (SELECT COUNT(*) FROM tasks t JOIN phase_plans pp ON t.phase_plan_id = pp.id
+                     WHERE pp.phase_id = phase_metrics.phase_id AND t.status = 'blocked'),
+    total_quality_gates = (SELECT COUNT(*) FROM quality_gates qg JOIN phase_runs pr ON qg.phase_run_id = pr.id
+                           WHERE pr.phase_id = phase_metrics.phase_id),
+    passed_quality_gates = (SELECT COUNT(*) FROM quality_gates qg JOIN phase_runs pr ON qg.phase_run_id = pr.id
+                            WHERE pr.phase_id = phase_metrics.phase_id AND qg.status = 'passed'),
+    last_calculated_at = datetime('now');
+
+-- ==================== PHASES ====================
+
+CREATE TRIGGER IF NOT EXISTS trg_phase_metrics_phase_insert
+AFTER INSERT ON phases
+BEGIN
+    INSERT INTO phase_metrics (
+        phase_id, total_runs, successful_runs, failed_runs, avg_duration_seconds,
+        total_tasks, completed_tasks, blocked_tasks, total_quality_gates,
+        passed_quality_gates, timed_runs, total_duration_seconds, last_calculated_at
+    )
+    SELECT NEW.id, 0, 0, 0, NULL, 0, 0, 0, 0, 0, 0, 0, datetime('now')
+    WHERE NOT EXISTS (SELECT 1 FROM phase_metrics WHERE phase_id = NEW.id);
+END;
+
+-- ==================== PHASE RUNS ====================
+
+CREATE TRIGGER IF NOT EXISTS trg_phase_metrics_run_insert
+AFTER INSERT ON phase_runs
+BEGIN
+    UPDATE phase_metrics SET
+        total_runs = total_runs + 1,
+        successful_runs = successful_runs + (NEW.status IS 'completed'),
+        failed_runs = failed_runs + (NEW.status IS 'failed'),
+        timed_runs = timed_runs + (NEW.duration_seconds IS NOT NULL),
+        total_duration_seconds = total_duration_seconds + COALESCE(NEW.duration_seconds, 0),
+        avg_duration_seconds = (total_duration_seconds + COALESCE(NEW.duration_seconds, 0)) * 1.0
+            / NULLIF(timed_runs + (NEW.duration_seconds IS NOT NULL), 0),
+        last_calculated_at = datetime('now')
+    WHERE phase_id = NEW.phase_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_phase_metrics_run_update
+AFTER UPDATE OF phase_id, status, started_at, completed_at ON phase_runs
+BEGIN
+    UPDATE phase_metrics SET
+        total_runs = total_runs - 1,
+        successful_runs = successful_runs - (OLD.status IS 'completed'),
+        failed_runs = failed_runs - (OLD.status IS 'failed'),
+        timed_runs = timed_runs - (OLD.duration_seconds IS NOT NULL),
+        total_duration_seconds = total_duration_seconds - COALESCE(OLD.duration_seconds, 0),
+        avg_duration_seconds = (total_duration_seconds - COALESCE(OLD.duration_seconds, 0)) * 1.0
+            / NULLIF(timed_runs - (OLD.duration_seconds IS NOT NULL), 0)
+    WHERE phase_id = OLD.phase_id;
+
+    UPDATE phase_metrics SET
+        total_runs = total_runs + 1,
+        successful_runs = successful_runs + (NEW.status IS 'completed'),
+        failed_runs = failed_runs + (NEW.status IS 'failed'),
+        timed_runs = timed_runs + (NEW.duration_seconds IS NOT NULL),
+        total_duration_seconds = total_duration_seconds + COALESCE(NEW.duration_seconds, 0),
+        avg_duration_seconds = (total_duration_seconds + COALESCE(NEW.duration_seconds, 0)) * 1.0
+            / NULLIF(timed_runs + (NEW.duration_seconds IS NOT NULL), 0),
+        last_calculated_at = datetime('now')
+    WHERE phase_id = NEW.phase_id;
+
+    -- Gates follow their run if it moves to another phase
+    UPDATE phase_metrics SET
+        total_quality_gates = total_quality_gates
+            - (SELECT COUNT(*) FROM quality_gates WHERE phase_run_id = OLD.id),
+        passed_quality_gates = passed_quality_gates
+            - (SELECT COUNT(*) FROM quality_gates WHERE phase_run_id = OLD.id AND status = 'passed')
+    WHERE phase_id = OLD.phase_id AND OLD.phase_id IS NOT NEW.phase_id;
+
+    UPDATE phase_metrics SET
+        total_quality_gates = total_quality_gates
+            + (SELECT COUNT(*) FROM quality_gates WHERE phase_run_id = NEW.id),
+        passed_quality_gates = passed_quality_gates
+            + (SELECT COUNT(*) FROM quality_gates WHERE phase_run_id = NEW.id AND status = 'passed')
+    WHERE phase_id = NEW.phase_id AND OLD.phase_id IS NOT NEW.phase_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_phase_metrics_run_delete
+BEFORE DELETE ON phase_runs
+BEGIN
+    UPDATE phase_metrics SET
+        total_runs = total_runs - 1,
+        successful_runs = successful_runs - (OLD.status IS 'completed'),
+        failed_runs = failed_runs - (OLD.status IS 'failed'),
+        timed_runs = timed_runs - (OLD.duration_seconds IS NOT NULL),
+        total_duration_seconds = total_duration_seconds - COALESCE(OLD.duration_seconds, 0),
+        avg_duration_seconds = (total_duration_seconds - COALESCE(OLD.duration_seconds, 0)) * 1.0
+            / NULLIF(timed_runs - (OLD.duration_seconds IS NOT NULL), 0),
+        total_quality_gates = total_quality_gates
+            - (SELECT COUNT(*) FROM quality_gates WHERE phase_run_id = OLD.id),
+        passed_quality_gates = passed_quality_gates
+            - (SELECT COUNT(*) FROM quality_gates WHERE phase_run_id = OLD.id AND status = 'passed'),
+        last_calculated_at = datetime('now')
+    WHERE phase_id = OLD.phase_id;
+END;
+
+-- ==================== TASKS ====================
+
+CREATE TRIGGER IF NOT EXISTS trg_phase_metrics_task_insert
+AFTER INSERT ON tasks
+BEGIN
+    UPDATE phase_metrics SET
+        total_tasks = total_tasks + 1,
+        completed_tasks = completed_tasks + (NEW.status IS 'completed'),
+        blocked_tasks = blocked_tasks + (NEW.status IS 'blocked'),
+        last_calculated_at = datetime('now')
+    WHERE phase_id = (SELECT phase_id FROM phase_plans WHERE id = NEW.phase_plan_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_phase_metrics_task_update
+AFTER UPDATE OF phase_plan_id, status ON tasks
+BEGIN
+    UPDATE phase_metrics SET
+        total_tasks = total_tasks - 1,
+        completed_tasks = completed_tasks - (OLD.status IS 'completed'),
+        blocked_tasks = blocked_tasks - (OLD.status IS 'blocked')
+    WHERE phase_id = (SELECT phase_id FROM phase_plans WHERE id = OLD.phase_plan_id);
+
+    UPDATE phase_metrics SET
+        total_tasks = total_tasks + 1,
+        completed_tasks = completed_tasks + (NEW.status IS 'completed'),
+        blocked_tasks = blocked_tasks + (NEW.status IS 'blocked'),
+        last_calculated_at = datetime('now')
+    WHERE phase_id = (SELECT phase_id FROM phase_plans WHERE id = NEW.phase_plan_id);
+END;
+
+-- Only fires for direct deletes; a cascaded delete finds no plan and is
+-- covered by trg_phase_metrics_plan_delete
+CREATE TRIGGER IF NOT EXISTS trg_phase_metrics_task_delete
+AFTER DELETE ON tasks
+BEGIN
+    UPDATE phase_metrics SET
+        total_tasks = total_tasks - 1,
+        completed_tasks = completed_tasks - (OLD.status IS 'completed'),
+        blocked_tasks = blocked_tasks - (OLD.status IS 'blocked'),
+        last_calculated_at = datetime('now')
+    WHERE phase_id = (SELECT phase_id FROM phase_plans WHERE id = OLD.phase_plan_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_phase_metrics_plan_delete
+BEFORE DELETE ON phase_plans
+BEGIN
+    UPDATE phase_metrics SET
+        total_tasks = total_tasks
+            - (SELECT COUNT(*) FROM tasks WHERE phase_plan_id = OLD.id),
+        completed_tasks = completed_tasks
+            - (SELECT COUNT(*) FROM tasks WHERE phase_plan_id = OLD.id AND status = 'completed'),
+        blocked_tasks = blocked_tasks
+            - (SELECT COUNT(*) FROM tasks WHERE phase_plan_id = OLD.id AND status = 'blocked'),
+        last_calculated_at = datetime('now')
+    WHERE phase_id = OLD.phase_id;
+END;
+
+-- ==================== QUALITY GATES ====================
+
+CREATE TRIGGER IF NOT EXISTS trg_phase_metrics_gate_insert
+AFTER INSERT ON quality_gates
+BEGIN
+    UPDATE phase_metrics SET
+        total_quality_gates = total_quality_gates + 1,
+        passed_quality_gates = passed_quality_gates + (NEW.status IS 'passed'),
+        last_calculated_at = datetime('now')
+    WHERE phase_id = (SELECT phase_id FROM phase_runs WHERE id = NEW.phase_run_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_phase_metrics_gate_update
+AFTER UPDATE OF phase_run_id, status ON quality_gates
+BEGIN
+    UPDATE phase_metrics SET
+        total_quality_gates = total_quality_gates - 1,
+        passed_quality_gates = passed_quality_gates - (OLD.status IS 'passed')
+    WHERE phase_id = (SELECT phase_id FROM phase_runs WHERE id = OLD.phase_run_id);
+
+    UPDATE phase_metrics SET
+        total_quality_gates = total_quality_gates + 1,
+        passed_quality_gates = passed_quality_gates + (NEW.status IS 'passed'),
+        last_calculated_at = datetime('now')
+    WHERE phase_id = (SELECT phase_id FROM phase_runs WHERE id = NEW.phase_run_id);
+END;
+
+-- Only fires for direct deletes; a cascaded delete finds no run and is
+-- covered by trg_phase_metrics_run_delete
+CREATE TRIGGER IF NOT EXISTS trg_phase_metrics_gate_delete
+AFTER DELETE ON quality_gates
+BEGIN
+    UPDATE phase_metrics SET
+        total_quality_gates = total_quality_gates - 1,
+        passed_quality_gates = passed_quality_gates - (OLD.status IS 'passed'),
+        last_calculated_at = datetime('now')
+    WHERE phase_id = (SELECT phase_id FROM phase_runs WHERE id = OLD.phase_run_id);
+END;
+
+INSERT INTO schema_version (version, description, applied_at)
+VALUES (8, 'Incremental phase_metrics maintained by triggers', datetime('now'));
@@ -0,0 +1,29 @@
+-- Migration 009: Indexes for agent invocation reporting
+--
+-- get_agent_metrics() aggregates agent_invocations in one SQL statement
+-- filtered by agent_name and a started_at range (plain comparisons rather
+-- than DATE(started_at), so the range can use an index). These indexes
+-- lead with the filter columns and carry the aggregated counter columns,
+-- so counts and sums are read from the index alone. The average of
+-- duration_seconds (a generated column) still reads the matched table
+-- rows; the range seek keeps that to the rows in the window.
+--
+-- ROLLBACK:
+-- DROP INDEX idx_agent_invocations_agent_started;
+-- DROP INDEX idx_agent_invocations_started;
+-- DELETE FROM schema_version WHERE version = 9;
+
+CREATE INDEX IF NOT EXISTS idx_agent_invocations_agent_started
+    ON agent_invocations (
+        agent_name, started_at, status, total_files_read, cache_hits,
+        cache_misses, estimated_tokens_used, completed_at
+    );
+
+CREATE INDEX IF NOT EXISTS idx_agent_invocations_started
+    ON agent_invocations (
+        started_at, status, total_files_read, cache_hits,
+        cache_misses, estimated_tokens_used, completed_at
+    );
+
+INSERT INTO schema_version (version, description, applied_at)
+VALUES (9, 'Covering indexes for agent invocation metrics', datetime('now'));
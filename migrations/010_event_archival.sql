@@ -0,0 +1,48 @@
+-- Migration 010: Catalog and rollups for archived event rows
+--
+-- ProjectDatabase.archive_events() moves old rows from the high-volume
+-- event tables (task_updates, agent_file_reads, agent_invocations and
+-- execution_logs) into per-month archive databases next to projects.db
+-- (archive/projects-YYYY-MM.db). The main
+-- database keeps:
+--
+-- archive_partitions: which archive file holds which table's rows for a
+--                     month, so date-ranged reads know what to ATTACH
+-- archive_rollups:    per-month, per-group summaries of the archived rows
+--                     (group = agent_name, cache_status or update_type),
+--                     so long-range reports need not open archives at all
+--
+-- ROLLBACK:
+-- DROP TABLE archive_rollups;
+-- DROP TABLE archive_partitions;
+-- DELETE FROM schema_version WHERE version = 10;
+
+CREATE TABLE IF NOT EXISTS archive_partitions (
+    source_table TEXT NOT NULL,
+    period TEXT NOT NULL,                   -- YYYY-MM
+    archive_path TEXT NOT NULL,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    first_archived_at TEXT NOT NULL DEFAULT (datetime('now')),
+    last_archived_at TEXT NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (source_table, period)
+);
+
+CREATE TABLE IF NOT EXISTS archive_rollups (
+    source_table TEXT NOT NULL,
+    period TEXT NOT NULL,                   -- YYYY-MM
+    group_key TEXT NOT NULL DEFAULT '',
+    row_count INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    total_files INTEGER NOT NULL DEFAULT 0,
+    cache_hits INTEGER NOT NULL DEFAULT 0,
+    cache_misses INTEGER NOT NULL DEFAULT 0,
+    total_bytes INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    total_duration_seconds REAL NOT NULL DEFAULT 0,
+    timed_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (source_table, period, group_key)
+);
+
+INSERT INTO schema_version (version, description, applied_at)
+VALUES (10, 'Archive catalog and rollups for event tables', datetime('now'));
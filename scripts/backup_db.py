@@ -14,16 +14,40 @@ Examples:
     # Backup custom database to custom location
     python3 scripts/backup_db.py --db-path /path/to/projects.db --backup-dir /backups
 
+    # Incremental backup: only pages changed since the last run
+    python3 scripts/backup_db.py --incremental
+
+    # Incremental backup, folding the chain into a new base past 24 deltas
+    python3 scripts/backup_db.py --incremental --max-deltas 24
+
+    # Fold the incremental chain into a new base now
+    python3 scripts/backup_db.py --compact
+
+Incremental Backups:
+    The first --incremental run writes a full base image to
+    BACKUP_DIR/chain/. Later runs read a consistent snapshot of the
+    database (the database file plus committed WAL frames, under a read
+    transaction), compare every page against the page hashes of the
+    previous run and write only the changed pages as a compressed delta.
+    restore_db.py replays base + deltas to any recorded point in time.
+
 Default Locations:
     Database: ~/.claude/lib/projects.db
     Backups:  ~/.claude/backups/
 """
 
 import argparse
+import hashlib
+import json
+import os
 import shutil
 import sqlite3
+import struct
+import zlib
+from array import array
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
 import sys
 
 
@@ -127,6 +151,480 @@ def cleanup_old_backups(backup_dir: Path, keep_count: int = 10):
     print(f"✅ Cleanup complete: {len(to_delete)} backups removed")
 
 
+# ==================== INCREMENTAL (PAGE-LEVEL) BACKUPS ====================
+
+CHAIN_MANIFEST = "chain.json"
+PAGE_INDEX = "pages.idx"
+DELTA_MAGIC = b"PMDBDLT1"
+DELTA_HEADER = struct.Struct(">IIQ")  # page_size, page_count, seq
+PAGE_RECORD = struct.Struct(">I")     # page number, followed by the page
+PAGE_DIGEST_SIZE = 20                 # SHA-1: hardware-accelerated, faster than blake2b here
+
+WAL_HEADER = struct.Struct(">8I")     # magic, version, page_size, ckpt seq, salt1, salt2, cksum1, cksum2
+WAL_FRAME_HEADER = struct.Struct(">6I")  # pgno, db size after commit (0 if not a commit), salt1, salt2, cksum1, cksum2
+WAL_MAGIC = 0x377F0682                # low bit set: big-endian checksums
+
+
+def _wal_checksum(data: bytes, s1: int, s2: int, big_endian: bool) -> Tuple[int, int]:
+    """SQLite's WAL checksum, continued from (s1, s2) over data."""
+    words = array("I", data)
+    if big_endian == (sys.byteorder == "little"):
+        words.byteswap()
+    for i in range(0, len(words), 2):
+        s1 = (s1 + words[i] + s2) & 0xFFFFFFFF
+        s2 = (s2 + words[i + 1] + s1) & 0xFFFFFFFF
+    return s1, s2
+
+
+def read_wal_pages(wal_path: Path, page_size: int) -> Tuple[Dict[int, bytes], Optional[int]]:
+    """
+    Read the committed frames of a WAL file.
+
+    Frames are accepted while their salts and cumulative checksums are
+    valid; frames after the last commit frame are ignored.
+
+    Args:
+        wal_path: Path to the -wal file
+        page_size: Database page size
+
+    Returns:
+        (latest committed image of each page in the WAL,
+         database size in pages after the last commit, or None)
+    """
+    if not wal_path.exists():
+        return {}, None
+
+    committed: Dict[int, bytes] = {}
+    db_size = None
+
+    with open(wal_path, "rb") as f:
+        header = f.read(WAL_HEADER.size)
+        if len(header) < WAL_HEADER.size:
+            return {}, None
+        magic, _, wal_page_size, _, salt1, salt2, cksum1, cksum2 = WAL_HEADER.unpack(header)
+        if magic & 0xFFFFFFFE != WAL_MAGIC or wal_page_size != page_size:
+            return {}, None
+        big_endian = bool(magic & 1)
+        if _wal_checksum(header[:24], 0, 0, big_endian) != (cksum1, cksum2):
+            return {}, None
+
+        s1, s2 = cksum1, cksum2
+        pending: Dict[int, bytes] = {}
+        while True:
+            frame_header = f.read(WAL_FRAME_HEADER.size)
+            page = f.read(page_size)
+            if len(frame_header) < WAL_FRAME_HEADER.size or len(page) < page_size:
+                break
+            pgno, commit_size, f_salt1, f_salt2, f_cksum1, f_cksum2 = WAL_FRAME_HEADER.unpack(frame_header)
+            if (f_salt1, f_salt2) != (salt1, salt2):
+                break
+            s1, s2 = _wal_checksum(frame_header[:8], s1, s2, big_endian)
+            s1, s2 = _wal_checksum(page, s1, s2, big_endian)
+            if (s1, s2) != (f_cksum1, f_cksum2):
+                break
+
+            pending[pgno] = page
+            if commit_size:
+                committed.update(pending)
+                pending = {}
+                db_size = commit_size
+
+    return committed, db_size
+
+
+class DatabaseSnapshot:
+    """
+    Consistent page-level view of a live database.
+
+    Holds a read transaction for its lifetime: in WAL mode SQLite will not
+    checkpoint past an open reader, so the database file plus the
+    committed WAL frames form one consistent image (in rollback-journal
+    mode the reader's SHARED lock keeps writers out instead).
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute("BEGIN")
+        self.conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        self.file = open(db_path, "rb")
+
+        header = self.file.read(100)
+        if len(header) == 100:
+            self.page_size = struct.unpack(">H", header[16:18])[0]
+            if self.page_size == 1:
+                self.page_size = 65536
+        else:
+            # New database whose pages are all still in the WAL
+            wal_path = Path(str(db_path) + "-wal")
+            with open(wal_path, "rb") as f:
+                self.page_size = WAL_HEADER.unpack(f.read(WAL_HEADER.size))[2]
+
+        # If the file is unchanged at the next backup, only pages in this
+        # WAL or the next one can differ (see create_incremental_backup)
+        stat = os.fstat(self.file.fileno())
+        self.file_signature = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+        self.wal_pages, wal_db_size = read_wal_pages(Path(str(db_path) + "-wal"), self.page_size)
+        if wal_db_size is not None:
+            self.page_count = wal_db_size
+        else:
+            page1 = self.read_page(1)
+            change_counter, size_in_header = struct.unpack(">II", page1[24:32])
+            version_valid_for = struct.unpack(">I", page1[92:96])[0]
+            if size_in_header and change_counter == version_valid_for:
+                self.page_count = size_in_header
+            else:
+                self.page_count = os.fstat(self.file.fileno()).st_size // self.page_size
+
+    def read_page(self, pgno: int) -> bytes:
+        """Page pgno (1-based) as of the snapshot."""
+        page = self.wal_pages.get(pgno)
+        if page is None:
+            self.file.seek((pgno - 1) * self.page_size)
+            page = self.file.read(self.page_size).ljust(self.page_size, b"\0")
+        return page
+
+    def pages(self, chunk_pages: int = 256) -> Iterator[Tuple[int, bytes]]:
+        """Yield (page number, page) for every page in the snapshot."""
+        self.file.seek(0)
+        for first in range(1, self.page_count + 1, chunk_pages):
+            count = min(chunk_pages, self.page_count + 1 - first)
+            chunk = self.file.read(count * self.page_size).ljust(count * self.page_size, b"\0")
+            for i in range(count):
+                pgno = first + i
+                page = self.wal_pages.get(pgno)
+                if page is None:
+                    page = chunk[i * self.page_size:(i + 1) * self.page_size]
+                yield pgno, page
+
+    def close(self):
+        self.file.close()
+        self.conn.rollback()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def _page_digest(page: bytes) -> bytes:
+    return hashlib.sha1(page).digest()
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Replace path with data via a temporary file and rename."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_chain(chain_dir: Path) -> Optional[dict]:
+    """Load an incremental chain manifest, or None if there is no chain."""
+    manifest_path = chain_dir / CHAIN_MANIFEST
+    if not manifest_path.exists():
+        return None
+    return json.loads(manifest_path.read_text())
+
+
+def _save_chain(chain_dir: Path, manifest: dict):
+    _write_atomic(chain_dir / CHAIN_MANIFEST, json.dumps(manifest, indent=2).encode())
+
+
+def _load_page_index(chain_dir: Path, seq: int) -> Optional[List[bytes]]:
+    """Page digests of the chain head, or None if missing or not for seq."""
+    index_path = chain_dir / PAGE_INDEX
+    if not index_path.exists():
+        return None
+    data = index_path.read_bytes()
+    if len(data) < 8 or struct.unpack(">Q", data[:8])[0] != seq:
+        return None
+    return [data[i:i + PAGE_DIGEST_SIZE] for i in range(8, len(data), PAGE_DIGEST_SIZE)]
+
+
+def _save_page_index(chain_dir: Path, seq: int, digests: List[bytes]):
+    _write_atomic(chain_dir / PAGE_INDEX, struct.pack(">Q", seq) + b"".join(digests))
+
+
+def _verify_image(path: Path):
+    """Run an integrity check on a page image without modifying it."""
+    conn = sqlite3.connect(f"file:{path}?immutable=1", uri=True)
+    try:
+        result = conn.execute("PRAGMA integrity_check").fetchone()
+        if result[0] != "ok":
+            raise RuntimeError(f"Backup integrity check failed: {result}")
+    finally:
+        conn.close()
+
+
+def _write_base(snapshot: DatabaseSnapshot, chain_dir: Path, seq: int) -> Tuple[dict, List[bytes]]:
+    """Write every snapshot page to a new base image."""
+    timestamp = datetime.now()
+    base_path = chain_dir / f"base-{timestamp.strftime('%Y%m%d-%H%M%S-%f')}.db"
+    digests = []
+    with open(base_path, "wb") as f:
+        for _, page in snapshot.pages():
+            f.write(page)
+            digests.append(_page_digest(page))
+    _verify_image(base_path)
+
+    entry = {
+        "file": base_path.name,
+        "created_at": timestamp.isoformat(sep=" "),
+        "seq": seq,
+        "page_count": snapshot.page_count,
+        "pages": snapshot.page_count,
+        "bytes": base_path.stat().st_size,
+    }
+    return entry, digests
+
+
+def _write_delta(
+    snapshot: DatabaseSnapshot,
+    chain_dir: Path,
+    seq: int,
+    previous: List[bytes],
+    candidates: Optional[set] = None
+) -> Tuple[Optional[dict], List[bytes]]:
+    """
+    Write the pages that differ from previous as a compressed delta.
+
+    Only pages in candidates (plus any pages past the previous end) are
+    read and compared when given; otherwise every page is.
+    """
+    timestamp = datetime.now()
+    delta_path = chain_dir / f"delta-{timestamp.strftime('%Y%m%d-%H%M%S-%f')}.pmdelta"
+    tmp_path = delta_path.with_name(delta_path.name + ".tmp")
+    page_count = snapshot.page_count
+    changed = 0
+
+    if candidates is None:
+        digests = []
+        pages = snapshot.pages()
+    else:
+        digests = previous[:page_count] + [b""] * (page_count - len(previous))
+        candidates = {p for p in candidates if p <= page_count}
+        candidates.update(range(len(previous) + 1, page_count + 1))
+        pages = ((pgno, snapshot.read_page(pgno)) for pgno in sorted(candidates))
+
+    compressor = zlib.compressobj(6)
+    with open(tmp_path, "wb") as f:
+        f.write(DELTA_MAGIC + DELTA_HEADER.pack(snapshot.page_size, page_count, seq))
+        for pgno, page in pages:
+            digest = _page_digest(page)
+            if candidates is None:
+                digests.append(digest)
+            else:
+                digests[pgno - 1] = digest
+            if pgno > len(previous) or previous[pgno - 1] != digest:
+                f.write(compressor.compress(PAGE_RECORD.pack(pgno) + page))
+                changed += 1
+        f.write(compressor.flush())
+        f.flush()
+        os.fsync(f.fileno())
+
+    if not changed and page_count == len(previous):
+        tmp_path.unlink()
+        return None, digests
+
+    os.replace(tmp_path, delta_path)
+    entry = {
+        "file": delta_path.name,
+        "created_at": timestamp.isoformat(sep=" "),
+        "seq": seq,
+        "page_count": page_count,
+        "pages": changed,
+        "bytes": delta_path.stat().st_size,
+    }
+    return entry, digests
+
+
+def create_incremental_backup(db_path: Path, chain_dir: Path, max_deltas: Optional[int] = None) -> Optional[dict]:
+    """
+    Back up the pages changed since the previous incremental backup.
+
+    The first run (or a run whose page hashes do not match the chain head,
+    e.g. after an interrupted run) writes a full base image instead.
+
+    Args:
+        db_path: Path to the database to backup
+        chain_dir: Directory holding the base, deltas and manifest
+        max_deltas: Compact the chain into a new base once it has more deltas
+
+    Returns:
+        Manifest entry of the base or delta written, or None if no page changed
+
+    Raises:
+        FileNotFoundError: If database doesn't exist
+    """
+    if not db_path.exists():
+        raise FileNotFoundError(f"Database not found: {db_path}")
+    chain_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest = load_chain(chain_dir)
+    seq = manifest["seq"] + 1 if manifest else 1
+
+    with DatabaseSnapshot(db_path) as snapshot:
+        previous = None
+        if manifest and manifest["page_size"] == snapshot.page_size:
+            previous = _load_page_index(chain_dir, manifest["seq"])
+
+        if previous is None:
+            entry, digests = _write_base(snapshot, chain_dir, seq)
+            old_files = [manifest["base"]["file"]] + [d["file"] for d in manifest["deltas"]] if manifest else []
+            manifest = {
+                "version": 1,
+                "source": str(db_path),
+                "page_size": snapshot.page_size,
+                "seq": seq,
+                "base": entry,
+                "deltas": [],
+            }
+        else:
+            # Database file untouched since the last run (no checkpoint in
+            # between): only pages in the previous or current WAL can differ
+            candidates = None
+            head = manifest.get("head", {})
+            if head.get("file_signature") == snapshot.file_signature:
+                candidates = set(head["wal_pages"]) | set(snapshot.wal_pages)
+
+            entry, digests = _write_delta(snapshot, chain_dir, seq, previous, candidates)
+            old_files = []
+            if entry is not None:
+                manifest["seq"] = seq
+                manifest["deltas"].append(entry)
+
+        manifest["head"] = {
+            "file_signature": snapshot.file_signature,
+            "wal_pages": sorted(snapshot.wal_pages),
+        }
+
+    if entry is None:
+        _save_chain(chain_dir, manifest)
+        return None
+
+    _save_chain(chain_dir, manifest)
+    _save_page_index(chain_dir, seq, digests)
+    for name in old_files:
+        (chain_dir / name).unlink(missing_ok=True)
+
+    if max_deltas is not None and len(manifest["deltas"]) > max_deltas:
+        compact_chain(chain_dir)
+
+    return entry
+
+
+def _apply_delta(delta_path: Path, image) -> int:
+    """Write a delta's pages into an open image file; return its page count."""
+    with open(delta_path, "rb") as f:
+        if f.read(len(DELTA_MAGIC)) != DELTA_MAGIC:
+            raise RuntimeError(f"Not a PM-DB delta: {delta_path}")
+        page_size, page_count, _ = DELTA_HEADER.unpack(f.read(DELTA_HEADER.size))
+        record_size = PAGE_RECORD.size + page_size
+
+        decompressor = zlib.decompressobj()
+        buffer = b""
+        while True:
+            chunk = f.read(1024 * 1024)
+            if not chunk:
+                break
+            buffer += decompressor.decompress(chunk)
+            whole = len(buffer) - len(buffer) % record_size
+            for offset in range(0, whole, record_size):
+                pgno = PAGE_RECORD.unpack_from(buffer, offset)[0]
+                image.seek((pgno - 1) * page_size)
+                image.write(buffer[offset + PAGE_RECORD.size:offset + record_size])
+            buffer = buffer[whole:]
+        if buffer + decompressor.flush():
+            raise RuntimeError(f"Truncated delta: {delta_path}")
+
+    image.truncate(page_count * page_size)
+    return page_count
+
+
+def materialize_chain(chain_dir: Path, target_path: Path, until: Optional[datetime] = None) -> dict:
+    """
+    Rebuild the database image as of a point in time.
+
+    Args:
+        chain_dir: Incremental chain directory
+        target_path: File to write the image to (overwritten)
+        until: Latest backup time to include (default: the chain head)
+
+    Returns:
+        Manifest entry of the last base or delta applied
+
+    Raises:
+        FileNotFoundError: If chain_dir holds no chain
+        ValueError: If the chain has no backup at or before until
+    """
+    manifest = load_chain(chain_dir)
+    if manifest is None:
+        raise FileNotFoundError(f"No incremental backup chain in {chain_dir}")
+
+    entries = [manifest["base"]] + manifest["deltas"]
+    if until is not None:
+        entries = [e for e in entries if datetime.fromisoformat(e["created_at"]) <= until]
+        if not entries:
+            raise ValueError(f"No backup at or before {until} (chain starts {manifest['base']['created_at']})")
+
+    shutil.copyfile(chain_dir / entries[0]["file"], target_path)
+    with open(target_path, "r+b") as image:
+        for delta in entries[1:]:
+            _apply_delta(chain_dir / delta["file"], image)
+
+    return entries[-1]
+
+
+def compact_chain(chain_dir: Path) -> Optional[dict]:
+    """
+    Fold the base and all deltas into a new base image.
+
+    Point-in-time restores to moments before the chain head are no longer
+    possible afterwards.
+
+    Args:
+        chain_dir: Incremental chain directory
+
+    Returns:
+        The new base entry, or None if the chain has no deltas to fold
+    """
+    manifest = load_chain(chain_dir)
+    if manifest is None or not manifest["deltas"]:
+        return None
+
+    head = manifest["deltas"][-1]
+    timestamp = datetime.now()
+    base_path = chain_dir / f"base-{timestamp.strftime('%Y%m%d-%H%M%S-%f')}.db"
+    materialize_chain(chain_dir, base_path)
+    _verify_image(base_path)
+
+    old_files = [manifest["base"]["file"]] + [d["file"] for d in manifest["deltas"]]
+    # The head image is unchanged, so the page index stays valid; the base
+    # keeps the head's time so point-in-time lookups still resolve to it
+    manifest["base"] = {
+        "file": base_path.name,
+        "created_at": head["created_at"],
+        "seq": head["seq"],
+        "page_count": head["page_count"],
+        "pages": head["page_count"],
+        "bytes": base_path.stat().st_size,
+        "compacted_at": timestamp.isoformat(sep=" "),
+    }
+    manifest["deltas"] = []
+    _save_chain(chain_dir, manifest)
+
+    for name in old_files:
+        (chain_dir / name).unlink(missing_ok=True)
+    return manifest["base"]
+
+
 def main():
     """Main backup script entry point"""
     parser = argparse.ArgumentParser(
@@ -162,12 +660,32 @@ def main():
         help="List existing backups and exit"
     )
 
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Back up only pages changed since the last incremental run (into BACKUP_DIR/chain/)"
+    )
+
+    parser.add_argument(
+        "--max-deltas",
+        type=int,
+        help="With --incremental, fold the chain into a new base once it has more deltas"
+    )
+
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Fold the incremental chain into a new base and exit"
+    )
+
     args = parser.parse_args()
+    chain_dir = args.backup_dir / "chain"
 
     # List mode
     if args.list:
         backups = list_backups(args.backup_dir)
-        if not backups:
+        manifest = load_chain(chain_dir)
+        if not backups and manifest is None:
             print(f"No backups found in {args.backup_dir}")
             return 0
 
@@ -180,8 +698,53 @@ def main():
             print(f"    Size: {size:,} bytes")
             print()
 
+        if manifest is not None:
+            print(f"Incremental chain in {chain_dir} (restore points):\n")
+            for entry in [manifest["base"]] + manifest["deltas"]:
+                print(f"  {entry['created_at']}  {entry['file']}")
+                print(f"    Pages: {entry['pages']:,} of {entry['page_count']:,}, {entry['bytes']:,} bytes")
+            print()
+
         return 0
 
+    # Compaction mode
+    if args.compact:
+        try:
+            base = compact_chain(chain_dir)
+        except Exception as e:
+            print(f"❌ Compaction failed: {e}", file=sys.stderr)
+            return 1
+        if base is None:
+            print(f"Nothing to compact in {chain_dir}")
+        else:
+            print(f"✅ Chain compacted into {base['file']} ({base['bytes']:,} bytes)")
+        return 0
+
+    # Incremental mode
+    if args.incremental:
+        try:
+            print("PM-DB Incremental Backup")
+            print("=" * 60)
+            print(f"Database: {args.db_path}")
+            print(f"Chain directory: {chain_dir}")
+            print()
+
+            entry = create_incremental_backup(args.db_path, chain_dir, args.max_deltas)
+            if entry is None:
+                print("✅ No pages changed since the last backup")
+            else:
+                kind = "Base" if entry["file"].startswith("base-") else "Delta"
+                print(f"✅ {kind} written: {chain_dir / entry['file']}")
+                print(f"   Pages: {entry['pages']:,} of {entry['page_count']:,}")
+                print(f"   Size: {entry['bytes']:,} bytes")
+            print()
+            print(f"To restore: python3 scripts/restore_db.py {chain_dir} [--at 'YYYY-MM-DD HH:MM:SS']")
+            return 0
+
+        except Exception as e:
+            print(f"❌ Backup failed: {e}", file=sys.stderr)
+            return 1
+
     # Backup mode
     try:
         print("PM-DB Backup Script")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Backup Benchmark for PM-DB System
+
+Compares full backups (SQLite backup API + integrity check) with
+incremental page-level backups (backup_db.py --incremental) across
+database sizes. For each size a scratch database is filled with task
+updates, a base is taken, then a typical hour of activity (new task
+updates, file reads and status changes) is applied and both kinds of
+backup are timed, along with the bytes each writes.
+
+Runs against scratch databases only; the real projects.db is never touched.
+
+Usage:
+    python3 scripts/benchmark_backup.py
+    python3 scripts/benchmark_backup.py --sizes-mb 16 64 256 --changes 500
+    python3 scripts/benchmark_backup.py --format json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from backup_db import create_backup, create_incremental_backup
+
+# Add lib to path
+repo_root = Path(__file__).parent.parent
+sys.path.insert(0, str(repo_root / "lib"))
+
+from project_database import ProjectDatabase
+
+
+def build_database(db_path: Path, size_mb: int) -> dict:
+    """Create a database of roughly size_mb filled with task updates."""
+    db = ProjectDatabase(db_path=str(db_path))
+    for migration_file in sorted((repo_root / "migrations").glob("*.sql")):
+        db.conn.executescript(migration_file.read_text())
+
+    project_id = db.create_project("benchmark", "/tmp/benchmark")
+    phase_id = db.create_phase(project_id, "feature-benchmark")
+    plan_id = db.create_phase_plan(phase_id, "Benchmark plan")
+    task_ids = [db.create_task(plan_id, f"{i}.0", f"Task {i}", "", i) for i in range(1, 51)]
+    run_id = db.create_phase_run(phase_id, plan_id)
+    task_run_ids = [db.create_task_run(run_id, task_id) for task_id in task_ids]
+
+    content = "progress note " * 40
+    target = size_mb * 1024 * 1024
+    while db_path.stat().st_size + Path(str(db_path) + "-wal").stat().st_size < target:
+        db.conn.executemany(
+            "INSERT INTO task_updates (task_run_id, update_type, content) VALUES (?, 'progress', ?)",
+            [(task_run_ids[i % len(task_run_ids)], content) for i in range(2000)]
+        )
+        db.conn.commit()
+    db.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    db.close()
+
+    return {'task_run_ids': task_run_ids, 'task_ids': task_ids}
+
+
+def apply_activity(db_path: Path, fixture: dict, changes: int):
+    """An hour of typical writes: new events plus some status updates."""
+    db = ProjectDatabase(db_path=str(db_path))
+    try:
+        invocation_id = db.create_agent_invocation("backend-agent", "benchmark")
+        for i in range(changes):
+            db.add_task_update(fixture['task_run_ids'][i % 50], "progress", f"change {i}")
+            db.log_file_read(invocation_id, f"src/file_{i % 40}.py", "hit" if i % 3 else "miss", 2048)
+        for task_id in fixture['task_ids'][:10]:
+            db.update_task_status(task_id, 'in-progress')
+        db.complete_agent_invocation(invocation_id, 'completed')
+    finally:
+        db.close()
+
+
+def run_size(work_dir: Path, size_mb: int, changes: int) -> dict:
+    """Benchmark one database size."""
+    db_path = work_dir / "projects.db"
+    fixture = build_database(db_path, size_mb)
+    chain_dir = work_dir / "chain"
+
+    start = time.perf_counter()
+    base = create_incremental_backup(db_path, chain_dir)
+    base_seconds = time.perf_counter() - start
+
+    apply_activity(db_path, fixture, changes)
+    db_bytes = db_path.stat().st_size
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        full_path = create_backup(db_path, work_dir / "full")
+        full_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    delta = create_incremental_backup(db_path, chain_dir)
+    delta_seconds = time.perf_counter() - start
+
+    return {
+        'size_mb': size_mb,
+        'db_bytes': db_bytes,
+        'changes': changes,
+        'full_seconds': round(full_seconds, 3),
+        'full_bytes': full_path.stat().st_size,
+        'base_seconds': round(base_seconds, 3),
+        'base_bytes': base['bytes'],
+        'delta_seconds': round(delta_seconds, 3),
+        'delta_bytes': delta['bytes'] if delta else 0,
+        'delta_pages': delta['pages'] if delta else 0,
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Compare full and incremental backup cost by database size"
+    )
+    parser.add_argument(
+        "--sizes-mb",
+        type=int,
+        nargs="+",
+        default=[8, 32, 128],
+        help="Database sizes to test in MiB (default: 8 32 128)"
+    )
+    parser.add_argument(
+        "--changes",
+        type=int,
+        default=200,
+        help="Task updates and file reads written between backups (default: 200)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=['text', 'json'],
+        default='text',
+        help="Output format (default: text)"
+    )
+
+    args = parser.parse_args()
+
+    results = []
+    for size_mb in args.sizes_mb:
+        work_dir = Path(tempfile.mkdtemp(prefix="pmdb-backup-bench-"))
+        try:
+            results.append(run_size(work_dir, size_mb, args.changes))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.format == 'json':
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"\n{'db size':>10} {'full s':>8} {'full MiB':>9} {'delta s':>8} {'delta KiB':>10} {'pages':>7} {'bytes saved':>12}")
+    for r in results:
+        saved = 1 - r['delta_bytes'] / r['full_bytes'] if r['full_bytes'] else 0
+        print(f"{r['db_bytes'] / 1024 / 1024:>8.1f}MB {r['full_seconds']:>8.3f} "
+              f"{r['full_bytes'] / 1024 / 1024:>9.1f} {r['delta_seconds']:>8.3f} "
+              f"{r['delta_bytes'] / 1024:>10.1f} {r['delta_pages']:>7,} {saved:>11.1%}")
+    print(f"\n({args.changes} task updates and file reads between backups; "
+          f"base images took {', '.join(str(r['base_seconds']) for r in results)} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
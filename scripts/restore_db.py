@@ -17,6 +17,12 @@ Examples:
     # Restore to custom location
     python3 scripts/restore_db.py backup.db --db-path /path/to/projects.db
 
+    # Replay an incremental chain (backup_db.py --incremental) to its latest point
+    python3 scripts/restore_db.py ~/.claude/backups/chain
+
+    # ...or to the state of the last backup taken at or before a time
+    python3 scripts/restore_db.py ~/.claude/backups/chain --at "2026-01-17 14:00"
+
 Safety:
     - Current database is backed up before restore (unless --no-backup)
     - Backup integrity is verified before restore
@@ -24,12 +30,16 @@ Safety:
 """
 
 import argparse
+import os
 import shutil
 import sqlite3
+import tempfile
 from pathlib import Path
 from datetime import datetime
 import sys
 
+from backup_db import load_chain, materialize_chain
+
 
 def verify_backup_integrity(backup_path: Path) -> bool:
     """
@@ -149,7 +159,13 @@ def main():
     parser.add_argument(
         "backup_file",
         type=Path,
-        help="Path to backup file to restore"
+        help="Path to backup file (or incremental chain directory) to restore"
+    )
+
+    parser.add_argument(
+        "--at",
+        type=datetime.fromisoformat,
+        help="With a chain directory, restore the last backup at or before this time (YYYY-MM-DD[ HH:MM[:SS]])"
     )
 
     parser.add_argument(
@@ -178,6 +194,38 @@ def main():
         print(f"❌ Backup file not found: {args.backup_file}", file=sys.stderr)
         return 1
 
+    if args.backup_file.is_dir():
+        return restore_chain(args)
+
+    return restore_file(args)
+
+
+def restore_chain(args) -> int:
+    """Replay an incremental chain into a temporary image, then restore it."""
+    if load_chain(args.backup_file) is None:
+        print(f"❌ No incremental backup chain in {args.backup_file}", file=sys.stderr)
+        return 1
+
+    fd, image_name = tempfile.mkstemp(prefix="pmdb-restore-", suffix=".db", dir=args.backup_file)
+    image_path = Path(image_name)
+    os.close(fd)
+    try:
+        try:
+            entry = materialize_chain(args.backup_file, image_path, args.at)
+        except (ValueError, RuntimeError) as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+
+        print(f"Replayed chain to {entry['created_at']} ({entry['file']})")
+        args.backup_file = image_path
+        return restore_file(args)
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            Path(image_name + suffix).unlink(missing_ok=True)
+
+
+def restore_file(args) -> int:
+    """Verify a backup image and restore it over args.db_path."""
     print("PM-DB Restore Script")
     print("=" * 60)
     print(f"Backup file: {args.backup_file}")
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Exact Detection Benchmark for Code Duplication Analysis Skill
+
+Generates a synthetic Python tree (1M LOC by default) in which known
+functions are copy-pasted at arbitrary line offsets, then times the exact
+detection engines on it and reports how many of the pasted lines each
+engine covers.
+
+The window engine (extract_code_blocks) re-tokenizes every block and is
+run on a prefix of the tree only (--window-loc); the other engines run on
+that prefix and on the full tree, so throughput can be compared per LOC.
+--memory traces each engine's peak allocation.
+
+Usage:
+    python benchmark_exact.py
+    python benchmark_exact.py --loc 200000 --window-loc 20000
+    python benchmark_exact.py --engines suffix-array --memory
+    python benchmark_exact.py --format json
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+from exact_detector import find_exact_duplicates
+from rolling_hash_detector import find_exact_duplicates_rolling
+from suffix_array_detector import find_exact_duplicates_suffix_array
+
+
+ENGINES = {
+    'window': find_exact_duplicates,
+    'rolling': find_exact_duplicates_rolling,
+    'suffix-array': find_exact_duplicates_suffix_array,
+}
+
+
+def make_function(rng: random.Random, name: str) -> List[str]:
+    """A plausible Python function of 8-40 lines."""
+    lines = [f"def {name}(items, limit={rng.randint(1, 99)}):",
+             f'    """Process items for {name}."""',
+             "    result = []"]
+    for i in range(rng.randint(2, 12)):
+        var = f"value_{i}_{rng.randint(0, 999)}"
+        lines += [
+            "    for item in items:",
+            f"        {var} = item.get('{name}_{i}', {rng.randint(0, 9999)})",
+            f"        if {var} > limit:",
+            f"            result.append({var} * {rng.randint(2, 9)})",
+        ][:rng.randint(2, 4)]
+        if lines[-1].endswith(':'):
+            lines.append("            continue")
+    lines.append("    return result")
+    lines.append("")
+    return lines
+
+
+def generate_tree(root: Path, total_loc: int, seed: int = 7,
+                  file_loc: int = 500, clone_rate: float = 0.1
+                  ) -> Tuple[List[Path], Dict[Path, Set[int]]]:
+    """
+    Write a synthetic tree of Python files.
+
+    Returns:
+        (files, pasted) where pasted maps each file to the line numbers of
+        copy-pasted function bodies in it
+    """
+    rng = random.Random(seed)
+    library = [make_function(rng, f"shared_{i}") for i in range(200)]
+
+    files = []
+    pasted: Dict[Path, Set[int]] = {}
+    written = 0
+    counter = 0
+
+    while written < total_loc:
+        path = root / f"pkg_{len(files) // 100:03d}" / f"module_{len(files):05d}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = ["import os", "import sys", ""]
+        copied: Set[int] = set()
+
+        while len(lines) < file_loc:
+            if rng.random() < clone_rate:
+                body = library[rng.randrange(len(library))]
+                # Paste from an arbitrary line so clones do not align to any grid
+                skip = rng.randint(0, 3)
+                start = len(lines) + 1
+                lines.extend(body[skip:])
+                copied.update(range(start, start + len(body) - skip - 1))
+            else:
+                counter += 1
+                lines.extend(make_function(rng, f"local_{counter}"))
+
+        path.write_text('\n'.join(lines) + '\n')
+        files.append(path)
+        pasted[path] = copied
+        written += len(lines)
+
+    return files, pasted
+
+
+def coverage(duplicates, pasted: Dict[Path, Set[int]]) -> float:
+    """Fraction of pasted lines that lie inside a reported instance."""
+    covered = {path: set() for path in pasted}
+    for duplicate in duplicates:
+        for location in duplicate.instances:
+            lines = covered.get(Path(location.file_path))
+            if lines is not None:
+                lines.update(range(location.start_line, location.end_line + 1))
+
+    total = sum(len(lines) for lines in pasted.values())
+    hit = sum(len(pasted[path] & covered[path]) for path in pasted)
+    return hit / total if total else 0.0
+
+
+def run_engine(name: str, files: List[Path], pasted: Dict[Path, Set[int]],
+               min_lines: int, min_chars: int, memory: bool = False) -> dict:
+    """Time one engine over the given files, optionally tracing peak memory."""
+    files_content = [(path, path.read_text(), 'python') for path in files]
+    loc = sum(content.count('\n') for _, content, _ in files_content)
+
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    duplicates = ENGINES[name](files_content, min_lines=min_lines, min_chars=min_chars)
+    seconds = time.perf_counter() - start
+    peak = 0
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        'engine': name,
+        'files': len(files),
+        'loc': loc,
+        'seconds': round(seconds, 2),
+        'loc_per_second': round(loc / seconds) if seconds else 0,
+        'duplicates': len(duplicates),
+        'pasted_line_coverage': round(coverage(duplicates, {p: pasted[p] for p in files}), 3),
+        'peak_mib': round(peak / 1024 / 1024, 1),
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark exact duplicate engines on a synthetic tree"
+    )
+    parser.add_argument('--loc', type=int, default=1_000_000,
+                        help='Lines of code to generate (default: 1000000)')
+    parser.add_argument('--window-loc', type=int, default=50_000,
+                        help='Lines the window engine is run on (default: 50000)')
+    parser.add_argument('--min-lines', type=int, default=5,
+                        help='Minimum lines for duplicate detection (default: 5)')
+    parser.add_argument('--min-chars', type=int, default=50,
+                        help='Minimum characters for exact duplicates (default: 50)')
+    parser.add_argument('--seed', type=int, default=7,
+                        help='Random seed for the generated tree (default: 7)')
+    parser.add_argument('--engines', nargs='+', choices=['rolling', 'suffix-array'],
+                        default=['rolling', 'suffix-array'],
+                        help='Engines to run on the full tree (default: rolling suffix-array)')
+    parser.add_argument('--memory', action='store_true',
+                        help='Trace peak memory per engine (slower timings)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                        help='Output format (default: text)')
+
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="dup-bench-"))
+    try:
+        files, pasted = generate_tree(root, args.loc, seed=args.seed)
+
+        window_files = []
+        window_loc = 0
+        for path in files:
+            if window_loc >= args.window_loc:
+                break
+            window_files.append(path)
+            window_loc += path.read_text().count('\n')
+
+        options = (pasted, args.min_lines, args.min_chars, args.memory)
+        results = [run_engine('window', window_files, *options)]
+        results += [run_engine(name, window_files, *options) for name in args.engines]
+        results += [run_engine(name, files, *options) for name in args.engines]
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    if args.format == 'json':
+        print(json.dumps(results, indent=2))
+        return 0
+
+    memory_header = f" {'peak MiB':>9}" if args.memory else ""
+    print(f"\n{'engine':<13} {'files':>6} {'LOC':>10} {'seconds':>8} {'LOC/s':>10} "
+          f"{'blocks':>7} {'pasted lines found':>19}{memory_header}")
+    for r in results:
+        memory_column = f" {r['peak_mib']:>9.1f}" if args.memory else ""
+        print(f"{r['engine']:<13} {r['files']:>6,} {r['loc']:>10,} {r['seconds']:>8.2f} "
+              f"{r['loc_per_second']:>10,} {r['duplicates']:>7,} "
+              f"{r['pasted_line_coverage']:>18.1%}{memory_column}")
+
+    window = results[0]
+    print()
+    for r in results[1:1 + len(args.engines)]:
+        if r['seconds']:
+            print(f"{r['engine']} is {window['seconds'] / r['seconds']:.1f}x faster "
+                  f"than window on the same {window['loc']:,} LOC")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
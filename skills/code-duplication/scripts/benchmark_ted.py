@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tree Edit Distance Benchmark for Code Duplication Analysis Skill
+
+Collects the Python functions under a path, takes the candidate pairs
+that near-miss detection would verify (LSH candidates whose MinHash
+estimate is within ESTIMATE_SLACK of the threshold) and times
+Zhang-Shasha on them in three modes:
+
+    plain   - no subtree hash reuse (every subtree hash made unique)
+    hashed  - identical subtrees skip the forest-distance tables
+    pruned  - hashed, plus the lower-bound cutoff used for verification
+
+Distances from plain and hashed are checked to agree.
+
+Usage:
+    python benchmark_ted.py
+    python benchmark_ted.py /path/to/project --pairs 500
+    python benchmark_ted.py --threshold 0.9 --format json
+"""
+
+import argparse
+import ast
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from near_miss_detector import (
+    ESTIMATE_SLACK, choose_bands, estimate_similarity, function_signature, lsh_candidate_pairs,
+    signature_from_bytes,
+)
+from structural_detector import normalize_ast
+from tree_distance import NODE_LIMIT, OrderedTree, prepare_tree, tree_edit_distance, verified_similarity
+
+
+def collect_functions(root: Path, min_nodes: int, max_nodes: int
+                      ) -> List[Tuple[OrderedTree, bytes]]:
+    """Prepared tree and MinHash signature of every normalized function under root."""
+    functions = []
+    for path in sorted(root.rglob('*.py')):
+        try:
+            module = ast.parse(path.read_text(encoding='utf-8'))
+        except (SyntaxError, ValueError, UnicodeDecodeError, OSError):
+            continue
+        for node in ast.walk(module):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                normalized = normalize_ast(node)
+                tree = prepare_tree(normalized)
+                if min_nodes <= len(tree) <= max_nodes:
+                    functions.append((tree, function_signature(normalized)))
+    return functions
+
+
+def candidate_pairs(functions: List[Tuple[OrderedTree, bytes]], threshold: float,
+                    count: int, seed: int) -> List[Tuple[OrderedTree, OrderedTree]]:
+    """Up to count of the pairs near-miss detection would send to verification."""
+    signatures = [signature_from_bytes(signature) for _, signature in functions]
+    bands, rows = choose_bands(threshold)
+    pairs = [
+        (functions[i][0], functions[j][0])
+        for i, j in sorted(lsh_candidate_pairs(signatures, bands, rows))
+        if estimate_similarity(signatures[i], signatures[j]) >= threshold - ESTIMATE_SLACK
+    ]
+    if len(pairs) > count:
+        pairs = random.Random(seed).sample(pairs, count)
+    return pairs
+
+
+def unhashed(tree: OrderedTree, salt: int) -> OrderedTree:
+    """Copy of tree whose subtree hashes never match another tree's."""
+    hashes = [salt.to_bytes(4, 'big') + i.to_bytes(4, 'big') for i in range(len(tree))]
+    return OrderedTree(tree.labels, tree.leftmost, tree.sizes, hashes, tree.keyroots)
+
+
+def run_mode(name: str, pairs, threshold: float) -> dict:
+    """Time one mode over all pairs."""
+    start = time.perf_counter()
+    if name == 'pruned':
+        results = [verified_similarity(t1, t2, threshold) for t1, t2 in pairs]
+    else:
+        results = [tree_edit_distance(t1, t2) for t1, t2 in pairs]
+    seconds = time.perf_counter() - start
+    return {
+        'mode': name,
+        'pairs': len(pairs),
+        'seconds': round(seconds, 3),
+        'pairs_per_second': round(len(pairs) / seconds) if seconds else 0,
+        'results': results,
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark tree edit distance on real function pairs"
+    )
+    parser.add_argument('path', nargs='?', default=str(Path(__file__).resolve().parents[2]),
+                        help='Directory to collect functions from (default: the skills tree)')
+    parser.add_argument('--pairs', type=int, default=2000,
+                        help='Most candidate pairs to compare (default: 2000)')
+    parser.add_argument('--min-nodes', type=int, default=20,
+                        help='Smallest function tree to use (default: 20)')
+    parser.add_argument('--max-nodes', type=int, default=NODE_LIMIT,
+                        help=f'Largest function tree to use (default: {NODE_LIMIT})')
+    parser.add_argument('--threshold', type=float, default=0.85,
+                        help='Near-miss similarity threshold (default: 0.85)')
+    parser.add_argument('--seed', type=int, default=7,
+                        help='Random seed for sampling pairs (default: 7)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                        help='Output format (default: text)')
+
+    args = parser.parse_args()
+
+    functions = collect_functions(Path(args.path), args.min_nodes, args.max_nodes)
+    pairs = candidate_pairs(functions, args.threshold, args.pairs, args.seed)
+    if not pairs:
+        print(f"Error: no candidate pairs among functions under {args.path}", file=sys.stderr)
+        return 1
+
+    plain_pairs = [(unhashed(t1, 2 * k), unhashed(t2, 2 * k + 1)) for k, (t1, t2) in enumerate(pairs)]
+
+    plain = run_mode('plain', plain_pairs, args.threshold)
+    hashed = run_mode('hashed', pairs, args.threshold)
+    pruned = run_mode('pruned', pairs, args.threshold)
+    mismatches = sum(a != b for a, b in zip(plain['results'], hashed['results']))
+    results = [plain, hashed, pruned]
+    for r in results:
+        del r['results']
+
+    summary = {
+        'functions': len(functions),
+        'mean_nodes': round(sum(len(t1) + len(t2) for t1, t2 in pairs) / (2 * len(pairs)), 1),
+        'distance_mismatches': mismatches,
+        'modes': results,
+    }
+
+    if args.format == 'json':
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    print(f"\n{summary['functions']:,} functions, {len(pairs):,} pairs, "
+          f"{summary['mean_nodes']} nodes per tree on average")
+    print(f"\n{'mode':<8} {'seconds':>8} {'pairs/s':>9}")
+    for r in results:
+        print(f"{r['mode']:<8} {r['seconds']:>8.2f} {r['pairs_per_second']:>9,}")
+    print()
+    for r in results[1:]:
+        if r['seconds']:
+            print(f"{r['mode']} is {plain['seconds'] / r['seconds']:.1f}x faster than plain")
+    print(f"plain/hashed distance mismatches: {mismatches}")
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
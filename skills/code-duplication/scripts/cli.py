@@ -6,6 +6,8 @@ Main orchestration of duplicate detection, analysis, and reporting.
 """
 
 import argparse
+import os
+import sqlite3
 import sys
 import logging
 from pathlib import Path
@@ -13,18 +15,23 @@ from typing import List, Tuple, Optional
 import time
 
 # Import all detection engines
-from models import Config, AnalysisIssue, ErrorCategory
-from file_discovery import discover_files, LANGUAGE_EXTENSIONS
+from models import Config, AnalysisIssue, ErrorCategory, DuplicateBlock
+from file_discovery import DiscoveryCache, discover_files, discover_files_incremental, LANGUAGE_EXTENSIONS
+from git_integration import GitError
 from exact_detector import find_exact_duplicates
+from rolling_hash_detector import find_exact_duplicates_rolling
+from suffix_array_detector import find_exact_duplicates_suffix_array
 from structural_detector import find_structural_duplicates
 from pattern_detector import detect_pattern_duplicates
-from metrics_calculator import (
-    calculate_metrics,
-    rank_offenders,
-    analyze_duplication_trends
+from parallel_pipeline import PipelineOptions, PipelineResult, read_source, run_parallel_pipeline
+from fingerprint_index import FingerprintIndex, run_indexed_pipeline
+from metrics_calculator import DuplicationAggregates
+from report_generator import (
+    stream_report,
+    generate_csv_export,
+    generate_jsonl_export,
+    generate_sarif_export
 )
-from heatmap_renderer import generate_heatmap_data
-from report_generator import generate_report, generate_csv_export
 
 
 # Exit codes
@@ -176,6 +183,24 @@ Examples:
   # Run only exact duplicate detection
   python cli.py /path/to/code --exact-only
 
+  # Exact detection with the rolling-hash engine (maximal clone spans)
+  python cli.py /path/to/code --exact-only --exact-engine rolling
+
+  # Each maximal repeated region exactly once, via a corpus suffix array
+  python cli.py /path/to/code --exact-only --exact-engine suffix-array
+
+  # Also report near-miss structural clones at 80% similarity
+  python cli.py /path/to/code --structural-only --near-miss --similarity-threshold 0.8
+
+  # Fingerprint files on 8 worker processes
+  python cli.py /path/to/code --jobs 8
+
+  # Keep fingerprints on disk; later runs re-fingerprint only changed files
+  python cli.py /path/to/code --index .duplication-index.db
+
+  # PR scan: files changed since main, joined against the whole index
+  python cli.py /path/to/code --index .duplication-index.db --incremental --compare-to main
+
   # Limit report to top 20 duplicates
   python cli.py /path/to/code --max-duplicates 20
         """
@@ -205,6 +230,12 @@ Examples:
         help='Patterns to exclude (e.g., "**/test_*.py", "**/__pycache__/**")'
     )
 
+    parser.add_argument(
+        '--no-gitignore',
+        action='store_true',
+        help='Also analyze files ignored by .gitignore'
+    )
+
     # Detection options
     parser.add_argument(
         '--exact-only',
@@ -224,6 +255,57 @@ Examples:
         help='Run only pattern duplicate detection'
     )
 
+    parser.add_argument(
+        '--exact-engine',
+        choices=['window', 'rolling', 'suffix-array'],
+        default='window',
+        help='Exact detection engine: fixed-size windows, rolling hashes over '
+             'every position extended to maximal spans, or a suffix array that '
+             'reports each maximal repeat once (default: window)'
+    )
+
+    parser.add_argument(
+        '--near-miss',
+        action='store_true',
+        help='Also group near-miss structural clones (functions differing by a '
+             'few statements) via MinHash/LSH'
+    )
+
+    parser.add_argument(
+        '--similarity-threshold',
+        type=float,
+        default=0.85,
+        help='Minimum similarity for --near-miss clones, 0.0-1.0 (default: 0.85)'
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Worker processes for reading and fingerprinting files; '
+             'results are merged once at the end (0 = one per CPU, default: 1)'
+    )
+
+    parser.add_argument(
+        '--index',
+        type=Path,
+        help='SQLite fingerprint index to reuse across runs; only files whose '
+             'size or mtime changed are fingerprinted again (window exact engine)'
+    )
+
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Re-fingerprint only files git reports as changed and report the '
+             'duplicates touching them, across the whole index (requires --index)'
+    )
+
+    parser.add_argument(
+        '--compare-to',
+        type=str,
+        help='Git ref for --incremental (e.g. main); default: uncommitted changes'
+    )
+
     parser.add_argument(
         '--min-lines',
         type=int,
@@ -252,6 +334,18 @@ Examples:
         help='Optional path for CSV export'
     )
 
+    parser.add_argument(
+        '--jsonl',
+        type=Path,
+        help='Optional path for JSON Lines export (one duplicate per line)'
+    )
+
+    parser.add_argument(
+        '--sarif',
+        type=Path,
+        help='Optional path for SARIF 2.1.0 export (for code scanning tools)'
+    )
+
     parser.add_argument(
         '--max-duplicates',
         type=int,
@@ -274,87 +368,24 @@ Examples:
     return parser.parse_args()
 
 
-def run_analysis(args: argparse.Namespace) -> int:
+def read_files(
+    file_paths: List[Path],
+    args: argparse.Namespace,
+    logger: logging.Logger,
+    issues: List[AnalysisIssue]
+) -> Tuple[List[Tuple[Path, str, str]], int]:
     """
-    Main analysis orchestration.
+    Read discovered files into memory for the serial detectors.
 
     Args:
+        file_paths: Files to read
         args: Parsed command-line arguments
+        logger: Application logger
+        issues: Issue list to append read problems to
 
     Returns:
-        Exit code:
-        - 0 = success
-        - 1 = user error (invalid input)
-        - 2 = partial success (warnings but completed)
-        - 3 = failure (errors prevented completion)
-
-    Example:
-        >>> args = parse_arguments()
-        >>> exit_code = run_analysis(args)
+        (files_content, skipped_files)
     """
-    # Setup logging
-    logger = setup_logging(verbose=getattr(args, 'verbose', False), quiet=args.quiet)
-    logger.info("Code Duplication Analysis starting")
-
-    # Track issues encountered
-    issues: List[AnalysisIssue] = []
-
-    # Validate path
-    try:
-        if not args.path.exists():
-            logger.error(f"Path does not exist: {args.path}")
-            print(f"❌ Error: Path does not exist: {args.path}", file=sys.stderr)
-            return EXIT_USER_ERROR
-
-        if not args.path.is_dir():
-            logger.error(f"Path is not a directory: {args.path}")
-            print(f"❌ Error: Path is not a directory: {args.path}", file=sys.stderr)
-            return EXIT_USER_ERROR
-    except PermissionError as e:
-        logger.error(f"Permission denied accessing path: {args.path}")
-        print(f"❌ Error: Permission denied: {args.path}", file=sys.stderr)
-        return EXIT_USER_ERROR
-    except Exception as e:
-        logger.error(f"Unexpected error validating path: {e}")
-        print(f"❌ Error: Cannot access path: {e}", file=sys.stderr)
-        return EXIT_FAILURE
-
-    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    print("🔍 Code Duplication Analysis")
-    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    print(f"Path: {args.path.absolute()}")
-    print()
-
-    # Step 1: Create configuration
-    config = Config(
-        min_lines=args.min_lines,
-        languages=args.language if args.language else [
-            "python", "javascript", "typescript", "java", "go", "rust", "cpp"
-        ],
-        exclude_patterns=args.exclude if args.exclude else [
-            "**/node_modules/**",
-            "**/__pycache__/**",
-            "**/.git/**",
-            "**/venv/**",
-            "**/dist/**",
-            "**/build/**",
-        ]
-    )
-
-    # Step 2: File discovery
-    progress = ProgressIndicator("Scanning files")
-    if not args.quiet:
-        progress.start()
-
-    file_paths = discover_files(config, root_path=args.path)
-
-    if not args.quiet:
-        progress.complete(count=len(file_paths))
-
-    if len(file_paths) == 0:
-        print("⚠️  No files found to analyze")
-        return 0
-
     # Read file contents
     progress = ProgressIndicator("Reading files")
     if not args.quiet:
@@ -364,103 +395,51 @@ def run_analysis(args: argparse.Namespace) -> int:
     skipped_files = 0
 
     for idx, file_path in enumerate(file_paths):
-        try:
-            # Try UTF-8 first
-            try:
-                content = file_path.read_text(encoding='utf-8')
-            except UnicodeDecodeError:
-                # Fallback to latin-1
-                logger.warning(f"UTF-8 decode failed for {file_path}, trying latin-1")
-                try:
-                    content = file_path.read_text(encoding='latin-1')
-                    issues.append(AnalysisIssue(
-                        category=ErrorCategory.ENCODING_ERROR,
-                        severity="warning",
-                        file_path=str(file_path),
-                        message="UTF-8 decode failed, used latin-1 fallback"
-                    ))
-                except UnicodeDecodeError as e:
-                    logger.error(f"Cannot decode {file_path}: {e}")
-                    issues.append(AnalysisIssue(
-                        category=ErrorCategory.ENCODING_ERROR,
-                        severity="error",
-                        file_path=str(file_path),
-                        message=f"Cannot decode file: {str(e)}"
-                    ))
-                    skipped_files += 1
-                    continue
-
-            language = get_file_language(file_path)
-            files_content.append((file_path, content, language))
-
-            if not args.quiet:
-                progress.update(idx + 1, len(file_paths))
-
-        except PermissionError as e:
-            logger.warning(f"Permission denied: {file_path}")
-            issues.append(AnalysisIssue(
-                category=ErrorCategory.PERMISSION_ERROR,
-                severity="warning",
-                file_path=str(file_path),
-                message="Permission denied"
-            ))
+        content, issue = read_source(file_path)
+        if issue:
+            log = logger.warning if issue.severity == "warning" else logger.error
+            log(f"{issue.message}: {file_path}")
+            issues.append(issue)
+        if content is None:
             skipped_files += 1
             continue
 
-        except OSError as e:
-            # Handle disk full, file too large, etc.
-            logger.error(f"OS error reading {file_path}: {e}")
-            if "No space left on device" in str(e):
-                issues.append(AnalysisIssue(
-                    category=ErrorCategory.DISK_FULL,
-                    severity="error",
-                    file_path=str(file_path),
-                    message="No space left on device"
-                ))
-            else:
-                issues.append(AnalysisIssue(
-                    category=ErrorCategory.IO_ERROR,
-                    severity="error",
-                    file_path=str(file_path),
-                    message=f"OS error: {str(e)}"
-                ))
-            skipped_files += 1
-            continue
+        language = get_file_language(file_path)
+        files_content.append((file_path, content, language))
 
-        except MemoryError as e:
-            logger.error(f"Memory error reading {file_path} (file too large)")
-            issues.append(AnalysisIssue(
-                category=ErrorCategory.MEMORY_ERROR,
-                severity="error",
-                file_path=str(file_path),
-                message="File too large to fit in memory"
-            ))
-            skipped_files += 1
-            continue
-
-        except Exception as e:
-            logger.error(f"Unexpected error reading {file_path}: {e}")
-            issues.append(AnalysisIssue(
-                category=ErrorCategory.GENERAL_ERROR,
-                severity="error",
-                file_path=str(file_path),
-                message=f"Unexpected error: {str(e)}"
-            ))
-            skipped_files += 1
-            continue
+        if not args.quiet:
+            progress.update(idx + 1, len(file_paths))
 
     if not args.quiet:
         progress.complete(count=len(files_content))
 
     logger.info(f"Successfully read {len(files_content)} files, skipped {skipped_files}")
 
+    return files_content, skipped_files
+
+
+def run_detectors(
+    files_content: List[Tuple[Path, str, str]],
+    args: argparse.Namespace,
+    logger: logging.Logger,
+    issues: List[AnalysisIssue]
+) -> List[DuplicateBlock]:
+    """
+    Run the selected detection engines one after another in this process.
+
+    Args:
+        files_content: List of (file_path, content, language) tuples
+        args: Parsed command-line arguments
+        logger: Application logger
+        issues: Issue list to append detector failures to
+
+    Returns:
+        All duplicates found
+    """
     # Step 2: Duplicate detection
     all_duplicates = []
 
-    # Determine which detection engines to run
-    run_exact = args.exact_only or not (args.structural_only or args.pattern_only)
-    run_structural = args.structural_only or not (args.exact_only or args.pattern_only)
-    run_pattern = args.pattern_only or not (args.exact_only or args.structural_only)
+    run_exact, run_structural, run_pattern = selected_engines(args)
 
     # Run exact duplicate detection
     if run_exact:
@@ -469,7 +448,14 @@ def run_analysis(args: argparse.Namespace) -> int:
             progress.start()
 
         try:
-            exact_dups = find_exact_duplicates(
+            if args.exact_engine == 'rolling':
+                exact_engine = find_exact_duplicates_rolling
+            elif args.exact_engine == 'suffix-array':
+                exact_engine = find_exact_duplicates_suffix_array
+            else:
+                exact_engine = find_exact_duplicates
+
+            exact_dups = exact_engine(
                 files_content,
                 min_lines=args.min_lines,
                 min_chars=args.min_chars
@@ -500,8 +486,9 @@ def run_analysis(args: argparse.Namespace) -> int:
         try:
             structural_dups = find_structural_duplicates(
                 files_content,
-                similarity_threshold=0.85,
-                min_lines=args.min_lines
+                similarity_threshold=args.similarity_threshold,
+                min_lines=args.min_lines,
+                near_miss=args.near_miss
             )
             all_duplicates.extend(structural_dups)
             logger.info(f"Found {len(structural_dups)} structural duplicates")
@@ -549,20 +536,328 @@ def run_analysis(args: argparse.Namespace) -> int:
                 progress.complete(count=0)
                 print(f"\n⚠️  Pattern duplicate detection failed: {e}")
 
+    return all_duplicates
+
+
+def selected_engines(args: argparse.Namespace) -> Tuple[bool, bool, bool]:
+    """
+    Determine which detection engines to run.
+
+    Returns:
+        (run_exact, run_structural, run_pattern)
+    """
+    run_exact = args.exact_only or not (args.structural_only or args.pattern_only)
+    run_structural = args.structural_only or not (args.exact_only or args.pattern_only)
+    run_pattern = args.pattern_only or not (args.exact_only or args.structural_only)
+    return run_exact, run_structural, run_pattern
+
+
+def pipeline_options(args: argparse.Namespace) -> PipelineOptions:
+    """Detectors and thresholds for the process-pool and indexed pipelines."""
+    run_exact, run_structural, run_pattern = selected_engines(args)
+    return PipelineOptions(
+        min_lines=args.min_lines,
+        min_chars=args.min_chars,
+        exact_engine=args.exact_engine,
+        run_exact=run_exact,
+        run_structural=run_structural,
+        run_pattern=run_pattern,
+        near_miss=args.near_miss,
+        similarity_threshold=args.similarity_threshold
+    )
+
+
+def run_detectors_parallel(
+    file_paths: List[Path],
+    args: argparse.Namespace,
+    logger: logging.Logger,
+    issues: List[AnalysisIssue]
+) -> Tuple[List[Tuple[Path, str, str]], int, List[DuplicateBlock]]:
+    """
+    Read and fingerprint files across a process pool, then merge once.
+
+    File contents are never collected in this process: the returned
+    files_content carries empty contents (metrics re-read line counts
+    from disk).
+
+    Args:
+        file_paths: Files to analyze
+        args: Parsed command-line arguments
+        logger: Application logger
+        issues: Issue list to append read problems to
+
+    Returns:
+        (files_content, skipped_files, all_duplicates)
+    """
+    options = pipeline_options(args)
+    jobs = args.jobs or os.cpu_count() or 1
+
+    progress = ProgressIndicator(f"Fingerprinting files ({jobs} jobs)")
+    if not args.quiet:
+        progress.start()
+
+    result = run_parallel_pipeline(
+        [(file_path, get_file_language(file_path)) for file_path in file_paths],
+        options,
+        jobs=jobs,
+        on_progress=None if args.quiet else progress.update
+    )
+
+    if not args.quiet:
+        progress.complete(count=len(result.files_content))
+
+    logger.info(f"Fingerprinted {len(result.files_content)} files with {jobs} jobs, "
+                f"skipped {result.skipped_files}")
+    return collect_pipeline_result(result, args, logger, issues)
+
+
+def run_detectors_indexed(
+    file_paths: List[Path],
+    changed_files: Optional[List[Path]],
+    args: argparse.Namespace,
+    logger: logging.Logger,
+    issues: List[AnalysisIssue]
+) -> Tuple[List[Tuple[Path, str, str]], int, List[DuplicateBlock]]:
+    """
+    Refresh the fingerprint index for file_paths and report from the index.
+
+    Args:
+        file_paths: Files to refresh (the whole tree, or the changed files)
+        changed_files: Changed files for an incremental run, else None
+        args: Parsed command-line arguments
+        logger: Application logger
+        issues: Issue list to append read problems to
+
+    Returns:
+        (files_content, skipped_files, all_duplicates)
+
+    Raises:
+        sqlite3.Error: If the index cannot be read or written
+    """
+    jobs = args.jobs or os.cpu_count() or 1
+
+    progress = ProgressIndicator(f"Updating fingerprint index ({jobs} jobs)")
+    if not args.quiet:
+        progress.start()
+
+    with FingerprintIndex(args.index, pipeline_options(args)) as index:
+        result = run_indexed_pipeline(
+            index,
+            [(file_path, get_file_language(file_path)) for file_path in file_paths],
+            jobs=jobs,
+            changed=changed_files,
+            on_progress=None if args.quiet else progress.update
+        )
+        indexed_files = index.file_count()
+
+    if not args.quiet:
+        progress.complete(count=result.fingerprinted)
+
+    logger.info(f"Fingerprinted {result.fingerprinted} of {len(file_paths)} files "
+                f"({indexed_files} indexed), skipped {result.skipped_files}")
+    return collect_pipeline_result(result, args, logger, issues)
+
+
+def collect_pipeline_result(
+    result: PipelineResult,
+    args: argparse.Namespace,
+    logger: logging.Logger,
+    issues: List[AnalysisIssue]
+) -> Tuple[List[Tuple[Path, str, str]], int, List[DuplicateBlock]]:
+    """
+    Log a pipeline result's issues and duplicate counts.
+
+    Returns:
+        (files_content, skipped_files, all_duplicates)
+    """
+    for issue in result.issues:
+        log = logger.warning if issue.severity == "warning" else logger.error
+        log(f"{issue.message}: {issue.file_path}")
+    issues.extend(result.issues)
+
+    logger.info(f"Found {len(result.exact)} exact, {len(result.structural)} structural "
+                f"and {len(result.pattern)} pattern duplicates")
+
+    if not args.quiet:
+        for label, found in (("exact", result.exact), ("structural", result.structural),
+                             ("pattern", result.pattern)):
+            print(f"✅ Merged {label} duplicates ({len(found)} found)")
+
+    all_duplicates = result.exact + result.structural + result.pattern
+    return result.files_content, result.skipped_files, all_duplicates
+
+
+def index_is_populated(args: argparse.Namespace) -> bool:
+    """Whether --index holds files built with the current thresholds."""
+    with FingerprintIndex(args.index, pipeline_options(args)) as index:
+        return index.file_count() > 0
+
+
+def run_analysis(args: argparse.Namespace) -> int:
+    """
+    Main analysis orchestration.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit code:
+        - 0 = success
+        - 1 = user error (invalid input)
+        - 2 = partial success (warnings but completed)
+        - 3 = failure (errors prevented completion)
+
+    Example:
+        >>> args = parse_arguments()
+        >>> exit_code = run_analysis(args)
+    """
+    # Setup logging
+    logger = setup_logging(verbose=getattr(args, 'verbose', False), quiet=args.quiet)
+    logger.info("Code Duplication Analysis starting")
+
+    # Track issues encountered
+    issues: List[AnalysisIssue] = []
+
+    # Validate path
+    try:
+        if not args.path.exists():
+            logger.error(f"Path does not exist: {args.path}")
+            print(f"❌ Error: Path does not exist: {args.path}", file=sys.stderr)
+            return EXIT_USER_ERROR
+
+        if not args.path.is_dir():
+            logger.error(f"Path is not a directory: {args.path}")
+            print(f"❌ Error: Path is not a directory: {args.path}", file=sys.stderr)
+            return EXIT_USER_ERROR
+    except PermissionError as e:
+        logger.error(f"Permission denied accessing path: {args.path}")
+        print(f"❌ Error: Permission denied: {args.path}", file=sys.stderr)
+        return EXIT_USER_ERROR
+    except Exception as e:
+        logger.error(f"Unexpected error validating path: {e}")
+        print(f"❌ Error: Cannot access path: {e}", file=sys.stderr)
+        return EXIT_FAILURE
+
+    if args.jobs < 0:
+        print(f"❌ Error: --jobs must be 0 or more, got {args.jobs}", file=sys.stderr)
+        return EXIT_USER_ERROR
+
+    if not 0.0 < args.similarity_threshold <= 1.0:
+        print(f"❌ Error: --similarity-threshold must be in (0.0, 1.0], "
+              f"got {args.similarity_threshold}", file=sys.stderr)
+        return EXIT_USER_ERROR
+
+    if args.incremental and not args.index:
+        print("❌ Error: --incremental requires --index", file=sys.stderr)
+        return EXIT_USER_ERROR
+
+    if args.index and args.exact_engine != 'window' and selected_engines(args)[0]:
+        print(f"❌ Error: --index supports only the window exact engine, "
+              f"got {args.exact_engine}", file=sys.stderr)
+        return EXIT_USER_ERROR
+
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print("🔍 Code Duplication Analysis")
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print(f"Path: {args.path.absolute()}")
+    print()
+
+    # Step 1: Create configuration
+    config = Config(
+        min_lines=args.min_lines,
+        languages=args.language if args.language else [
+            "python", "javascript", "typescript", "java", "go", "rust", "cpp"
+        ],
+        exclude_patterns=args.exclude if args.exclude else [
+            "**/node_modules/**",
+            "**/__pycache__/**",
+            "**/.git/**",
+            "**/venv/**",
+            "**/dist/**",
+            "**/build/**",
+        ],
+        respect_gitignore=not args.no_gitignore
+    )
+
+    # Step 2: File discovery
+    changed_files = None
+    if args.incremental:
+        try:
+            changed_files = discover_files_incremental(
+                config, root_path=args.path, compare_to=args.compare_to
+            )
+        except (GitError, ImportError) as e:
+            logger.error(f"Incremental discovery failed: {e}")
+            print(f"❌ Error: {e}", file=sys.stderr)
+            return EXIT_USER_ERROR
+
+        if len(changed_files) == 0:
+            print("⚠️  No changed files to analyze")
+            return 0
+
+    progress = ProgressIndicator("Scanning files")
+    if not args.quiet:
+        progress.start()
+
+    try:
+        if changed_files is not None and index_is_populated(args):
+            file_paths = changed_files
+        else:
+            # Full scan; an incremental run with an empty index builds it first
+            # With --index, directory listings and file checks are reused too
+            cache = DiscoveryCache(args.index) if args.index else None
+            try:
+                file_paths = discover_files(config, root_path=args.path, cache=cache)
+            finally:
+                if cache is not None:
+                    cache.close()
+    except sqlite3.Error as e:
+        logger.error(f"Cannot open fingerprint index {args.index}: {e}")
+        print(f"❌ Error: Cannot open fingerprint index: {e}", file=sys.stderr)
+        return EXIT_FAILURE
+
+    if not args.quiet:
+        progress.complete(count=len(file_paths))
+
+    if len(file_paths) == 0:
+        print("⚠️  No files found to analyze")
+        return 0
+
+    if args.index:
+        try:
+            files_content, skipped_files, all_duplicates = run_detectors_indexed(
+                file_paths, changed_files, args, logger, issues
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Fingerprint index error: {e}")
+            print(f"❌ Error: Fingerprint index failed: {e}", file=sys.stderr)
+            return EXIT_FAILURE
+    elif args.jobs == 1:
+        files_content, skipped_files = read_files(file_paths, args, logger, issues)
+        all_duplicates = run_detectors(files_content, args, logger, issues)
+    else:
+        files_content, skipped_files, all_duplicates = run_detectors_parallel(
+            file_paths, args, logger, issues
+        )
+
     # Step 3: Metrics calculation
     progress = ProgressIndicator("Calculating metrics")
     if not args.quiet:
         progress.start()
 
     try:
-        summary = calculate_metrics(all_duplicates, files_content)
+        # One pass over the duplicates feeds every metric and report total
+        aggregates = DuplicationAggregates(files_content)
+        aggregates.add_all(all_duplicates)
+
+        summary = aggregates.summary()
         # Add issues and skipped files to summary
         summary.issues = issues
         summary.skipped_files = skipped_files
 
-        offenders = rank_offenders(all_duplicates, files_content, top_n=20)
-        heatmap = generate_heatmap_data(files_content, all_duplicates)
-        trends = analyze_duplication_trends(all_duplicates)
+        offenders = aggregates.offenders(top_n=20)
+        heatmap = aggregates.heatmap()
+        trends = aggregates.trends()
         logger.info("Metrics calculation completed")
 
         if not args.quiet:
@@ -578,13 +873,15 @@ def run_analysis(args: argparse.Namespace) -> int:
         progress.start()
 
     try:
-        report = generate_report(
+        stream_report(
             duplicates=all_duplicates,
             summary=summary,
             offenders=offenders,
-            heatmap=heatmap,
             output_path=args.output,
-            max_duplicates=args.max_duplicates
+            heatmap=heatmap,
+            max_duplicates=args.max_duplicates,
+            total_reduction=aggregates.loc_reduction,
+            difficulty_counts=aggregates.difficulty_counts
         )
         logger.info(f"Report generated: {args.output}")
 
@@ -602,22 +899,30 @@ def run_analysis(args: argparse.Namespace) -> int:
         print(f"\n❌ Error: Failed to generate report: {e}", file=sys.stderr)
         return EXIT_FAILURE
 
-    # CSV export (optional)
-    if args.csv:
-        progress = ProgressIndicator("Exporting CSV")
+    # CSV, JSON Lines and SARIF exports (optional)
+    exports = [
+        ('CSV', args.csv, generate_csv_export),
+        ('JSON Lines', args.jsonl, generate_jsonl_export),
+        ('SARIF', args.sarif, generate_sarif_export),
+    ]
+    for kind, export_path, export in exports:
+        if not export_path:
+            continue
+
+        progress = ProgressIndicator(f"Exporting {kind}")
         if not args.quiet:
             progress.start()
 
         try:
-            generate_csv_export(all_duplicates, args.csv)
-            logger.info(f"CSV exported: {args.csv}")
+            export(all_duplicates, export_path)
+            logger.info(f"{kind} exported: {export_path}")
 
             if not args.quiet:
                 progress.complete()
         except Exception as e:
-            logger.error(f"Error exporting CSV: {e}")
-            print(f"\n⚠️  Warning: Failed to export CSV: {e}")
-            # Continue anyway - CSV export is optional
+            logger.error(f"Error exporting {kind}: {e}")
+            print(f"\n⚠️  Warning: Failed to export {kind}: {e}")
+            # Continue anyway - exports are optional
 
     # Step 5: Display summary
     print()
@@ -650,6 +955,12 @@ def run_analysis(args: argparse.Namespace) -> int:
     if args.csv:
         print(f"📊 CSV Export: {args.csv.absolute()}")
 
+    if args.jsonl:
+        print(f"📊 JSON Lines Export: {args.jsonl.absolute()}")
+
+    if args.sarif:
+        print(f"📊 SARIF Export: {args.sarif.absolute()}")
+
     print()
 
     # Assessment
@@ -126,6 +126,10 @@ def validate_config_schema(config_data: Dict[str, Any]) -> None:
         if not all(isinstance(p, str) for p in config_data["include_patterns"]):
             raise ConfigurationError("include_patterns must contain only strings")
 
+    if "respect_gitignore" in config_data:
+        if not isinstance(config_data["respect_gitignore"], bool):
+            raise ConfigurationError("respect_gitignore must be a boolean")
+
     if "languages" in config_data:
         if not isinstance(config_data["languages"], list):
             raise ConfigurationError("languages must be a list")
@@ -260,6 +264,7 @@ def create_example_config() -> str:
             "**/*.spec.ts"
         ],
         "include_patterns": [],
+        "respect_gitignore": True,
         "languages": [
             "python",
             "javascript",
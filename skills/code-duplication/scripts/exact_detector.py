@@ -4,12 +4,16 @@ Exact Duplicate Detection for Code Duplication Analysis Skill
 
 Provides code normalization and exact duplicate detection using
 hash-based comparison. Supports multiple programming languages.
+
+While grouping, a block is only a (file index, start_line, end_line)
+triple; the text of a block is rebuilt from its file only when its hash
+turns out to be duplicated.
 """
 
 import io
 import tokenize
 import hashlib
-from typing import List, Set, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional, Union
 from pathlib import Path
 
 from models import DuplicateBlock, CodeLocation, DuplicateType
@@ -156,6 +160,27 @@ def compute_hash(content: str) -> str:
     return hashlib.md5(content.encode('utf-8')).hexdigest()
 
 
+def is_code_line(line: str) -> bool:
+    """Whether a line takes part in blocks (not blank, not a # or // comment)."""
+    stripped = line.strip()
+    return bool(stripped) and not stripped.startswith('#') and not stripped.startswith('//')
+
+
+def block_text(lines: List[str], start_line: int, end_line: int) -> str:
+    """
+    Text of the block spanning start_line..end_line, as extract_code_blocks builds it.
+
+    Args:
+        lines: Source split on '\\n'
+        start_line: First line of the block (1-based)
+        end_line: Last line of the block
+
+    Returns:
+        The block's code lines joined by newlines
+    """
+    return '\n'.join(line for line in lines[start_line - 1:end_line] if is_code_line(line))
+
+
 def extract_code_blocks(
     file_path: Path,
     source: str,
@@ -184,8 +209,7 @@ def extract_code_blocks(
     line_map = []  # Maps filtered line index to original line number
 
     for i, line in enumerate(lines, start=1):
-        stripped = line.strip()
-        if stripped and not stripped.startswith('#') and not stripped.startswith('//'):
+        if is_code_line(line):
             non_blank_lines.append(line)
             line_map.append(i)
 
@@ -255,10 +279,11 @@ def find_exact_duplicates(
     Returns:
         List of DuplicateBlock objects
     """
-    # Extract all blocks from all files
-    hash_to_blocks = {}  # hash -> list of (file, start, end, content)
+    # Block hash -> (file index, start_line, end_line) while seen once, then
+    # a list of them; no block text is kept
+    groups: Dict[str, Union[Tuple[int, int, int], List[Tuple[int, int, int]]]] = {}
 
-    for file_path, content, language in files_content:
+    for index, (file_path, content, language) in enumerate(files_content):
         blocks = extract_code_blocks(file_path, content, language, min_lines)
 
         for block_content, start_line, end_line, block_hash in blocks:
@@ -266,18 +291,50 @@ def find_exact_duplicates(
             if len(block_content) < min_chars:
                 continue
 
-            # Add to hash map
-            if block_hash not in hash_to_blocks:
-                hash_to_blocks[block_hash] = []
+            block = (index, start_line, end_line)
+            seen = groups.get(block_hash)
+            if seen is None:
+                groups[block_hash] = block
+            elif type(seen) is tuple:
+                groups[block_hash] = [seen, block]
+            else:
+                seen.append(block)
+
+    # Expand duplicated hashes only, rebuilding the sample of the first instance
+    hash_to_blocks = {}
+    file_lines: Dict[int, List[str]] = {}
+    for block_hash, ranges in groups.items():
+        if type(ranges) is tuple:
+            continue
+
+        instances = [{
+            'file': files_content[index][0],
+            'start_line': start_line,
+            'end_line': end_line,
+            'line_count': end_line - start_line + 1
+        } for index, start_line, end_line in ranges]
+
+        index, start_line, end_line = ranges[0]
+        if index not in file_lines:
+            file_lines[index] = files_content[index][1].split('\n')
+        instances[0]['content'] = block_text(file_lines[index], start_line, end_line)
+        hash_to_blocks[block_hash] = instances
+
+    return build_exact_duplicates(hash_to_blocks)
+
+
+def build_exact_duplicates(hash_to_blocks: Dict[str, List[Dict]]) -> List[DuplicateBlock]:
+    """
+    Turn hash-grouped blocks into exact DuplicateBlocks.
 
-            hash_to_blocks[block_hash].append({
-                'file': file_path,
-                'start_line': start_line,
-                'end_line': end_line,
-                'content': block_content,
-                'line_count': end_line - start_line + 1
-            })
+    Args:
+        hash_to_blocks: Block hash -> list of dicts with file, start_line,
+            end_line, line_count and content (only the first instance's
+            content is used, as the code sample)
 
+    Returns:
+        List of DuplicateBlock objects, most instances first
+    """
     # Find duplicates (hash appears more than once)
     duplicates = []
     duplicate_id = 1
@@ -383,7 +440,10 @@ __all__ = [
     'normalize_python_code',
     'normalize_javascript_code',
     'compute_hash',
+    'is_code_line',
+    'block_text',
     'extract_code_blocks',
     'find_exact_duplicates',
+    'build_exact_duplicates',
     'filter_overlapping_duplicates',
 ]
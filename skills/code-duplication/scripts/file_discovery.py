@@ -5,14 +5,26 @@ File Discovery Module for Code Duplication Analysis Skill
 Handles file traversal, filtering, and discovery of source code files
 for analysis. Supports .gitignore patterns, custom exclusions, and
 language-based filtering.
+
+Exclude and include globs are compiled into one regex each. Every
+.gitignore met during the walk is compiled (gitignore_parser) and applies
+below its directory; excluded directories are pruned before descending.
+A DiscoveryCache reuses directory listings while a directory's mtime is
+unchanged and per-file text/generated checks while a file's size and mtime
+are unchanged.
 """
 
+import json
 import os
+import re
+import sqlite3
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 import fnmatch
 
 from models import Config
+from gitignore_parser import GitignoreMatcher, load_gitignore_matcher
 from utils import is_text_file, is_generated_file, get_file_language
 
 
@@ -80,6 +92,38 @@ def get_supported_extensions(languages: List[str]) -> Set[str]:
     return extensions
 
 
+def compile_globs(patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    One regex that matches what fnmatch.fnmatch matches for any of patterns.
+
+    Match candidates after os.path.normcase, as fnmatch does.
+
+    Args:
+        patterns: Glob patterns
+
+    Returns:
+        Compiled alternation, or None if there are no patterns
+
+    Example:
+        >>> compile_globs(('*.py', 'docs/*')).match('setup.py') is not None
+        True
+    """
+    if not patterns:
+        return None
+    return re.compile('|'.join(
+        f"(?:{fnmatch.translate(os.path.normcase(pattern))})" for pattern in patterns
+    ))
+
+
+@lru_cache(maxsize=32)
+def _dir_globs(exclude_patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Directory exclude regex (trailing slashes dropped from patterns)."""
+    return compile_globs(tuple(p.rstrip('/') if p.endswith('/') else p for p in exclude_patterns))
+
+
+_file_globs = lru_cache(maxsize=32)(compile_globs)
+
+
 def should_exclude_dir(dir_name: str, exclude_patterns: List[str]) -> bool:
     """
     Check if directory should be excluded from traversal.
@@ -99,21 +143,16 @@ def should_exclude_dir(dir_name: str, exclude_patterns: List[str]) -> bool:
     if dir_name.startswith('.') and dir_name not in {'.', '..'}:
         return True
 
-    # Check custom patterns
-    for pattern in exclude_patterns:
-        # Handle directory-specific patterns
-        if pattern.endswith('/'):
-            pattern = pattern.rstrip('/')
-
-        # Match pattern
-        if fnmatch.fnmatch(dir_name, pattern):
-            return True
-        if fnmatch.fnmatch(f"**/{dir_name}", pattern):
-            return True
-        if fnmatch.fnmatch(f"{dir_name}/**", pattern):
-            return True
-
-    return False
+    # Check custom patterns: the name, or the name under or above "**"
+    regex = _dir_globs(tuple(exclude_patterns))
+    if regex is None:
+        return False
+    name = os.path.normcase(dir_name)
+    return bool(
+        regex.match(name)
+        or regex.match(f"**/{name}")
+        or regex.match(f"{name}/**")
+    )
 
 
 def should_exclude_file(file_path: Path, exclude_patterns: List[str]) -> bool:
@@ -127,27 +166,14 @@ def should_exclude_file(file_path: Path, exclude_patterns: List[str]) -> bool:
     Returns:
         True if file should be excluded
     """
-    # Get relative path string
-    file_str = str(file_path)
-    file_name = file_path.name
-
-    # Check custom patterns
-    for pattern in exclude_patterns:
-        # Direct file name match
-        if fnmatch.fnmatch(file_name, pattern):
-            return True
-
-        # Full path match
-        if fnmatch.fnmatch(file_str, pattern):
-            return True
-
-        # Wildcard path match
-        if '**' in pattern:
-            # Convert glob pattern to match
-            if fnmatch.fnmatch(file_str, pattern):
-                return True
-
-    return False
+    # Check custom patterns against the file name and the full path
+    regex = _file_globs(tuple(exclude_patterns))
+    if regex is None:
+        return False
+    return bool(
+        regex.match(os.path.normcase(file_path.name))
+        or regex.match(os.path.normcase(str(file_path)))
+    )
 
 
 def should_include_file(
@@ -168,14 +194,9 @@ def should_include_file(
     """
     # Check include patterns first (highest priority)
     if include_patterns:
-        file_str = str(file_path)
-        file_name = file_path.name
-
-        for pattern in include_patterns:
-            if fnmatch.fnmatch(file_name, pattern):
-                return True
-            if fnmatch.fnmatch(file_str, pattern):
-                return True
+        regex = _file_globs(tuple(include_patterns))
+        if regex.match(os.path.normcase(file_path.name)) or regex.match(os.path.normcase(str(file_path))):
+            return True
 
     # Check file extension
     if file_path.suffix.lower() in supported_extensions:
@@ -184,10 +205,210 @@ def should_include_file(
     return False
 
 
+DISCOVERY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS discovery_dirs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    subdirs TEXT NOT NULL,
+    files TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS discovery_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    is_text INTEGER NOT NULL,
+    is_generated INTEGER
+);
+"""
+
+
+class DiscoveryCache:
+    """
+    Directory listings and file checks remembered between discoveries.
+
+    A directory's listing is reused while its mtime is unchanged (adding,
+    removing or renaming an entry changes it). A file's is_text_file /
+    is_generated_file results are reused while its size and mtime are
+    unchanged. Filters are applied afresh each run, so one cache serves
+    any configuration. With db_path, entries are loaded from and saved to
+    SQLite (cli.py keeps them in the --index database); without it the
+    cache lives only as long as the object.
+
+    Example:
+        >>> cache = DiscoveryCache()
+        >>> files = discover_files(Config(), Path('.'), cache=cache)
+        >>> discover_files(Config(), Path('.'), cache=cache) == files
+        True
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Args:
+            db_path: SQLite database to persist entries in (optional)
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        self.dirs: Dict[str, Tuple[int, List[str], List[str]]] = {}
+        self.files: Dict[str, Tuple[int, int, bool, Optional[bool]]] = {}
+        self._dirty_dirs: Set[str] = set()
+        self._dirty_files: Set[str] = set()
+        self._seen: Set[str] = set()
+        self.conn = None
+
+        if db_path is not None:
+            self.conn = sqlite3.connect(str(db_path))
+            self.conn.executescript(DISCOVERY_SCHEMA)
+            for path, mtime_ns, subdirs, files in self.conn.execute(
+                "SELECT path, mtime_ns, subdirs, files FROM discovery_dirs"
+            ):
+                self.dirs[path] = (mtime_ns, json.loads(subdirs), json.loads(files))
+            for path, size, mtime_ns, is_text, is_generated in self.conn.execute(
+                "SELECT path, size, mtime_ns, is_text, is_generated FROM discovery_files"
+            ):
+                self.files[path] = (
+                    size, mtime_ns, bool(is_text), None if is_generated is None else bool(is_generated)
+                )
+
+    def listing(self, dir_path: str) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        (subdirectory names, file names) of a directory, in os.walk order.
+
+        Symlinked directories are left out, as os.walk does not descend
+        into them. Returns None if the directory cannot be read.
+        """
+        self._seen.add(dir_path)
+        try:
+            mtime_ns = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            return None
+
+        cached = self.dirs.get(dir_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+
+        subdirs, files = [], []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(entry.name)
+                    elif not entry.is_symlink():
+                        subdirs.append(entry.name)
+        except OSError:
+            return None
+
+        self.dirs[dir_path] = (mtime_ns, subdirs, files)
+        self._dirty_dirs.add(dir_path)
+        return subdirs, files
+
+    def file_checks(
+        self,
+        file_path: Path,
+        size: int,
+        mtime_ns: int,
+        need_generated: bool
+    ) -> Tuple[bool, Optional[bool]]:
+        """
+        (is text, is generated) for a file, from the cache when its size and
+        mtime match. is_generated is only computed for text files when
+        need_generated is set (it reads the file); otherwise it may be None.
+        """
+        key = str(file_path)
+        self._seen.add(key)
+        cached = self.files.get(key)
+        if cached is not None and cached[:2] == (size, mtime_ns):
+            is_text, is_generated = cached[2], cached[3]
+        else:
+            is_text, is_generated = is_text_file(file_path), None
+
+        if is_text and is_generated is None and need_generated:
+            is_generated = is_generated_file(file_path)
+
+        if cached != (size, mtime_ns, is_text, is_generated):
+            self.files[key] = (size, mtime_ns, is_text, is_generated)
+            self._dirty_files.add(key)
+        return is_text, is_generated
+
+    def save(self, root_path: Optional[Path] = None) -> None:
+        """
+        Write changed entries to the database.
+
+        Args:
+            root_path: Root of the discovery just run; entries below it that
+                were not visited (deleted or now pruned) are dropped
+        """
+        if root_path is not None:
+            prefix = str(root_path)
+            below = prefix.rstrip(os.sep) + os.sep
+            for table, entries in (('discovery_dirs', self.dirs), ('discovery_files', self.files)):
+                gone = [
+                    path for path in entries
+                    if (path == prefix or path.startswith(below)) and path not in self._seen
+                ]
+                for path in gone:
+                    del entries[path]
+                if self.conn is not None and gone:
+                    self.conn.executemany(f"DELETE FROM {table} WHERE path = ?", [(p,) for p in gone])
+
+        if self.conn is not None:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO discovery_dirs (path, mtime_ns, subdirs, files) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(path, self.dirs[path][0], json.dumps(self.dirs[path][1]), json.dumps(self.dirs[path][2]))
+                     for path in self._dirty_dirs if path in self.dirs]
+                )
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO discovery_files (path, size, mtime_ns, is_text, is_generated) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(path,) + self.files[path] for path in self._dirty_files if path in self.files]
+                )
+        self._dirty_dirs.clear()
+        self._dirty_files.clear()
+        self._seen.clear()
+
+    def close(self) -> None:
+        """Close the database, if any."""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def _gitignore_decision(
+    scopes: Tuple[Tuple[str, GitignoreMatcher], ...],
+    rel_path: str,
+    is_dir: bool
+) -> bool:
+    """
+    Whether the .gitignore files in scope exclude a path.
+
+    Args:
+        scopes: (directory relative to root, matcher) from root down
+        rel_path: Path relative to root, with / separators
+        is_dir: Whether the path is a directory
+
+    Returns:
+        True if the deepest .gitignore with a matching pattern excludes it
+    """
+    for base, matcher in reversed(scopes):
+        local = rel_path[len(base) + 1:] if base else rel_path
+        decision = matcher.matches(local, is_dir)
+        if decision is not None:
+            return decision
+    return False
+
+
 def discover_files(
     config: Config,
     root_path: Optional[Path] = None,
-    progress_callback: Optional[callable] = None
+    progress_callback: Optional[callable] = None,
+    cache: Optional[DiscoveryCache] = None
 ) -> List[Path]:
     """
     Discover source code files for analysis.
@@ -199,9 +420,10 @@ def discover_files(
         config: Configuration object with filtering rules
         root_path: Root directory to search (defaults to current directory)
         progress_callback: Optional callback function(current_file_count) for progress
+        cache: Listings and file checks from earlier runs; updated and saved
 
     Returns:
-        List of file paths to analyze
+        List of file paths to analyze, in os.walk order
 
     Raises:
         PermissionError: If root path is not accessible
@@ -219,19 +441,35 @@ def discover_files(
 
     # Get supported extensions from config
     supported_extensions = get_supported_extensions(config.languages)
+    include_globs = _file_globs(tuple(config.include_patterns))
+    walk_cache = cache if cache is not None else DiscoveryCache()
 
     discovered_files: List[Path] = []
     files_checked = 0
 
-    # Walk directory tree
-    for dir_path, dir_names, file_names in os.walk(root_path):
-        current_dir = Path(dir_path)
+    # Depth-first in os.walk order: (directory, path relative to root,
+    # .gitignore scopes from root down)
+    stack: List[Tuple[Path, str, Tuple[Tuple[str, GitignoreMatcher], ...]]] = [(root_path, '', ())]
+    while stack:
+        current_dir, rel_dir, scopes = stack.pop()
+        listing = walk_cache.listing(str(current_dir))
+        if listing is None:
+            continue
+        dir_names, file_names = listing
+
+        if config.respect_gitignore and '.gitignore' in file_names:
+            matcher = load_gitignore_matcher(current_dir / '.gitignore')
+            if matcher is not None:
+                scopes = scopes + ((rel_dir, matcher),)
+        prefix = f"{rel_dir}/" if rel_dir else ''
 
-        # Filter out excluded directories (modifies dir_names in-place)
-        dir_names[:] = [
+        # Filter out excluded directories before descending
+        kept = [
             d for d in dir_names
             if not should_exclude_dir(d, config.exclude_patterns)
+            and not (scopes and _gitignore_decision(scopes, prefix + d, True))
         ]
+        stack.extend((current_dir / d, prefix + d, scopes) for d in reversed(kept))
 
         # Process files in current directory
         for file_name in file_names:
@@ -246,39 +484,42 @@ def discover_files(
             if should_exclude_file(file_path, config.exclude_patterns):
                 continue
 
+            if scopes and _gitignore_decision(scopes, prefix + file_name, False):
+                continue
+
             # Check if file should be included
             if not should_include_file(file_path, supported_extensions, config.include_patterns):
                 continue
 
+            try:
+                st = file_path.stat()
+            except OSError:
+                continue
+
+            # Generated files are kept only when explicitly included
+            explicit = bool(include_globs and include_globs.match(os.path.normcase(str(file_path))))
+            is_text, is_generated = walk_cache.file_checks(
+                file_path, st.st_size, st.st_mtime_ns, need_generated=not explicit
+            )
+
             # Check if text file (skip binary)
-            if not is_text_file(file_path):
+            if not is_text:
                 continue
 
             # Check if generated file (skip if not explicitly included)
-            if is_generated_file(file_path):
-                # Only skip if not in include_patterns
-                if not config.include_patterns:
-                    continue
-                # Check if explicitly included
-                is_explicit = False
-                for pattern in config.include_patterns:
-                    if fnmatch.fnmatch(str(file_path), pattern):
-                        is_explicit = True
-                        break
-                if not is_explicit:
-                    continue
+            if is_generated and not explicit:
+                continue
 
             # Check file size
-            try:
-                file_size_kb = file_path.stat().st_size / 1024
-                if file_size_kb > config.max_file_size_kb:
-                    continue
-            except OSError:
+            if st.st_size / 1024 > config.max_file_size_kb:
                 continue
 
             # File passes all filters
             discovered_files.append(file_path)
 
+    if cache is not None:
+        cache.save(root_path)
+
     # Final progress callback
     if progress_callback:
         progress_callback(len(discovered_files))
@@ -450,6 +691,8 @@ def discover_files_incremental(
 
 # Export public API
 __all__ = [
+    "DiscoveryCache",
+    "compile_globs",
     "discover_files",
     "discover_files_from_list",
     "discover_files_incremental",
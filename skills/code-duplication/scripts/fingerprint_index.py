@@ -0,0 +1,546 @@
+#!/usr/bin/env python3
+"""
+Persistent Fingerprint Index for Code Duplication Analysis Skill
+
+Keeps every analyzed file's block hashes, AST fingerprints and pattern
+matches in a SQLite database keyed by (path, content hash) (cli.py
+--index PATH). A run re-fingerprints only the files whose size or mtime
+changed, then joins them against the whole index in SQL. Incremental runs
+(--incremental) check only the files git reports as changed and report
+only the duplicates touching them. Those duplicates still include their
+instances in unchanged files.
+"""
+
+import json
+import os
+import sqlite3
+from dataclasses import replace
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from models import AnalysisIssue, DuplicateBlock
+from exact_detector import build_exact_duplicates
+from structural_detector import build_structural_duplicates
+from near_miss_detector import build_near_miss_duplicates
+from pattern_detector import build_pattern_duplicates, load_patterns
+from parallel_pipeline import (
+    FileRecord,
+    PipelineOptions,
+    PipelineResult,
+    block_sample,
+    clear_sample_cache,
+    function_sample,
+    iter_records,
+    merge_ranges,
+    pattern_sample,
+)
+
+
+# Bump when the stored fingerprints change meaning; older indexes are rebuilt
+INDEX_VERSION = 5
+
+# Commit stored records in batches so an interrupted first build keeps progress
+COMMIT_EVERY = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    language TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS blocks (
+    digest BLOB NOT NULL,
+    path TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    start_line INTEGER NOT NULL,
+    end_line INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_blocks_digest ON blocks(digest);
+CREATE INDEX IF NOT EXISTS idx_blocks_path ON blocks(path);
+
+CREATE TABLE IF NOT EXISTS functions (
+    digest BLOB NOT NULL,
+    path TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    start_line INTEGER NOT NULL,
+    end_line INTEGER NOT NULL,
+    signature BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_functions_digest ON functions(digest);
+CREATE INDEX IF NOT EXISTS idx_functions_path ON functions(path);
+
+CREATE TABLE IF NOT EXISTS patterns (
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    start_line INTEGER NOT NULL,
+    end_line INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_patterns_name ON patterns(name);
+CREATE INDEX IF NOT EXISTS idx_patterns_path ON patterns(path);
+"""
+
+FINGERPRINT_TABLES = ('blocks', 'functions', 'patterns')
+
+# Rows keep their position in the file's FileRecord (seq). Ordered by
+# (file order, seq), they group into duplicates in the same order, with the
+# same instance order and IDs, as the serial detectors produce.
+
+
+class FingerprintIndex:
+    """
+    On-disk fingerprints of every analyzed file.
+
+    Every file is fingerprinted for all three detectors (exact blocks use
+    the window engine, functions also get MinHash signatures), so one index
+    serves any combination of --exact-only, --structural-only,
+    --pattern-only and --near-miss. An index built with different
+    min_lines / min_chars, or by an older INDEX_VERSION, is rebuilt on open.
+
+    Example:
+        >>> index = FingerprintIndex(Path(':memory:'), PipelineOptions())
+        >>> index.file_count()
+        0
+        >>> index.close()
+    """
+
+    def __init__(self, db_path: Path, options: PipelineOptions):
+        """
+        Open (creating if needed) the index.
+
+        Args:
+            db_path: SQLite database file
+            options: Thresholds and the detectors to report
+        """
+        self.db_path = Path(db_path)
+        self.options = options
+        self.fingerprint_options = replace(
+            options, exact_engine='window', run_exact=True, run_structural=True, run_pattern=True,
+            near_miss=True
+        )
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.executescript(SCHEMA)
+        self._check_settings()
+
+    def close(self) -> None:
+        """Commit pending records and close the database."""
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self) -> 'FingerprintIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _check_settings(self) -> None:
+        """Clear the index if it was built with other thresholds."""
+        settings = json.dumps({
+            'version': INDEX_VERSION,
+            'min_lines': self.options.min_lines,
+            'min_chars': self.options.min_chars,
+        }, sort_keys=True)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'settings'").fetchone()
+        if row and row[0] == settings:
+            return
+
+        # Drop rather than clear, so tables pick up schema changes
+        with self.conn:
+            for table in ('files',) + FINGERPRINT_TABLES:
+                self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+        self.conn.executescript(SCHEMA)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('settings', ?)", (settings,)
+            )
+
+    def file_count(self) -> int:
+        """Number of indexed files."""
+        return self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def stale_files(
+        self,
+        files: List[Tuple[Path, str]]
+    ) -> List[Tuple[Path, str, Tuple[int, int]]]:
+        """
+        Files whose size or mtime differ from the index.
+
+        Args:
+            files: (file_path, language) pairs to check
+
+        Returns:
+            (file_path, language, (size, mtime_ns)) for each file that must
+            be re-fingerprinted; (-1, -1) when the file cannot be stat'ed
+        """
+        indexed = {
+            path: (size, mtime_ns)
+            for path, size, mtime_ns in self.conn.execute("SELECT path, size, mtime_ns FROM files")
+        }
+        stale = []
+        for file_path, language in files:
+            try:
+                st = file_path.stat()
+                stat_key = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                stat_key = (-1, -1)
+            if indexed.get(str(file_path)) != stat_key or stat_key == (-1, -1):
+                stale.append((file_path, language, stat_key))
+        return stale
+
+    def prune(self, keep: Optional[List[Path]] = None) -> int:
+        """
+        Drop indexed files that are gone.
+
+        Args:
+            keep: Files to keep; when None, keeps every file still on disk
+
+        Returns:
+            Number of files removed
+        """
+        indexed = [path for (path,) in self.conn.execute("SELECT path FROM files")]
+        if keep is None:
+            removed = [path for path in indexed if not os.path.exists(path)]
+        else:
+            kept = {str(file_path) for file_path in keep}
+            removed = [path for path in indexed if path not in kept]
+
+        for path in removed:
+            self._remove(path)
+        self.conn.commit()
+        return len(removed)
+
+    def _remove(self, path: str) -> None:
+        """Delete a file and its fingerprints (no commit)."""
+        self.conn.execute("DELETE FROM files WHERE path = ?", (path,))
+        for table in FINGERPRINT_TABLES:
+            self.conn.execute(f"DELETE FROM {table} WHERE path = ?", (path,))
+
+    def store(self, file_path: Path, record: FileRecord, stat_key: Tuple[int, int]) -> None:
+        """
+        Save a freshly fingerprinted file (no commit).
+
+        Skipped files are removed. When the content hash is unchanged only
+        size and mtime are updated.
+
+        Args:
+            file_path: File the record belongs to
+            record: Worker output for the file
+            stat_key: (size, mtime_ns) taken before the file was read
+        """
+        path = str(file_path)
+        if record.skipped:
+            self._remove(path)
+            return
+
+        size, mtime_ns = stat_key
+        row = self.conn.execute("SELECT content_hash FROM files WHERE path = ?", (path,)).fetchone()
+        if row and row[0] == record.content_hash:
+            self.conn.execute(
+                "UPDATE files SET size = ?, mtime_ns = ?, language = ? WHERE path = ?",
+                (size, mtime_ns, record.language, path)
+            )
+            return
+
+        self._remove(path)
+        self.conn.execute(
+            "INSERT INTO files (path, content_hash, language, size, mtime_ns) VALUES (?, ?, ?, ?, ?)",
+            (path, record.content_hash, record.language, size, mtime_ns)
+        )
+        self.conn.executemany(
+            "INSERT INTO blocks (digest, path, seq, start_line, end_line) VALUES (?, ?, ?, ?, ?)",
+            [
+                (digest, path, seq, start_line, end_line)
+                for seq, (digest, start_line, end_line) in enumerate(record.blocks)
+            ]
+        )
+        self.conn.executemany(
+            "INSERT INTO functions (digest, path, seq, start_line, end_line, signature) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (digest, path, seq, start_line, end_line, signature)
+                for seq, (digest, start_line, end_line, signature) in enumerate(record.functions)
+            ]
+        )
+        self.conn.executemany(
+            "INSERT INTO patterns (name, path, seq, start_line, end_line) VALUES (?, ?, ?, ?, ?)",
+            [
+                (name, path, seq, start_line, end_line)
+                for seq, (name, start_line, end_line, _) in enumerate(record.patterns)
+            ]
+        )
+
+    def commit(self) -> None:
+        """Commit stored records."""
+        self.conn.commit()
+
+    def languages(self, paths: List[str]) -> Dict[str, str]:
+        """Indexed language of each path."""
+        languages = {}
+        for path in paths:
+            row = self.conn.execute("SELECT language FROM files WHERE path = ?", (path,)).fetchone()
+            if row:
+                languages[path] = row[0]
+        return languages
+
+    def _groups(
+        self,
+        table: str,
+        key: str,
+        min_count: int,
+        changed: bool,
+        file_order: Dict[str, int]
+    ) -> Dict[object, List[Tuple[str, int, int]]]:
+        """
+        Rows of a fingerprint table grouped by key.
+
+        Args:
+            table: blocks, functions or patterns
+            key: Grouping column (digest or name)
+            min_count: Minimum rows per key
+            changed: Only keys with at least one row in the temp changed table
+            file_order: Position of each path in the analyzed file list;
+                other paths follow in path order
+
+        Returns:
+            Key -> (path, start_line, end_line), keys and rows in file order
+            and then in the order the file's record listed them
+        """
+        if changed:
+            where = f"SELECT t.{key} FROM {table} t JOIN temp.changed c ON t.path = c.path"
+        else:
+            where = f"SELECT {key} FROM {table} GROUP BY {key} HAVING COUNT(*) >= ?"
+        rows = self.conn.execute(
+            f"SELECT {key}, path, seq, start_line, end_line FROM {table} WHERE {key} IN ({where})",
+            () if changed else (min_count,)
+        ).fetchall()
+        rows.sort(key=lambda row: (file_order.get(row[1], len(file_order)), row[1], row[2]))
+
+        groups: Dict[object, List[Tuple[str, int, int]]] = {}
+        for group_key, path, _, start_line, end_line in rows:
+            groups.setdefault(group_key, []).append((path, start_line, end_line))
+        return {k: v for k, v in groups.items() if len(v) >= min_count}
+
+    def _near_miss_duplicates(
+        self,
+        changed: bool,
+        first_id: int,
+        file_order: Dict[str, int]
+    ) -> List[DuplicateBlock]:
+        """
+        Near-miss clusters over every indexed function signature.
+
+        LSH needs the whole signature set, so signatures are loaded in full;
+        when changed, only clusters containing a changed file's function
+        are kept.
+        """
+        rows = self.conn.execute(
+            "SELECT digest, path, seq, start_line, end_line, signature FROM functions "
+            "WHERE signature IS NOT NULL"
+        ).fetchall()
+        rows.sort(key=lambda row: (file_order.get(row[1], len(file_order)), row[1], row[2]))
+        functions = [
+            {
+                'fingerprint': bytes(digest).hex(),
+                'file': Path(path),
+                'start_line': start_line,
+                'end_line': end_line,
+                'signature': signature,
+            }
+            for digest, path, _, start_line, end_line, signature in rows
+        ]
+
+        only_fingerprints = None
+        if changed:
+            only_fingerprints = {
+                bytes(digest).hex() for (digest,) in self.conn.execute(
+                    "SELECT f.digest FROM functions f JOIN temp.changed c ON f.path = c.path"
+                )
+            }
+
+        return build_near_miss_duplicates(
+            functions,
+            self.options.similarity_threshold,
+            read_code=lambda f: function_sample(
+                f['file'], f['start_line'], f['end_line'], self.options.min_lines
+            ),
+            only_fingerprints=only_fingerprints,
+            first_id=first_id
+        )
+
+    def find_duplicates(
+        self,
+        changed: Optional[List[Path]] = None,
+        order: Optional[List[Path]] = None
+    ) -> Tuple[List[DuplicateBlock], List[DuplicateBlock], List[DuplicateBlock]]:
+        """
+        Join fingerprints across the whole index.
+
+        Args:
+            changed: When given, only duplicates with an instance in one of
+                these files are returned
+            order: Files in discovery order; duplicates, their instances and
+                their IDs follow it as in a serial run (other indexed files
+                come after, in path order)
+
+        Returns:
+            (exact, structural, pattern) duplicates for the reported detectors
+        """
+        file_order = {str(file_path): n for n, file_path in enumerate(order or [])}
+        if changed is not None:
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS changed (path TEXT PRIMARY KEY)")
+            self.conn.execute("DELETE FROM temp.changed")
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO temp.changed (path) VALUES (?)",
+                [(str(file_path),) for file_path in changed]
+            )
+        restrict = changed is not None
+
+        exact: List[DuplicateBlock] = []
+        if self.options.run_exact:
+            groups, paths = _index_paths(self._groups('blocks', 'digest', 2, restrict, file_order))
+            exact = build_exact_duplicates(merge_ranges(groups, paths, block_sample))
+
+        structural: List[DuplicateBlock] = []
+        if self.options.run_structural:
+            groups, paths = _index_paths(self._groups('functions', 'digest', 2, restrict, file_order))
+            read_function = partial(function_sample, min_lines=self.options.min_lines)
+            structural = build_structural_duplicates(merge_ranges(groups, paths, read_function))
+            if self.options.near_miss:
+                structural += self._near_miss_duplicates(
+                    restrict, len(structural) + 1, file_order
+                )
+
+        pattern: List[DuplicateBlock] = []
+        if self.options.run_pattern:
+            pattern_matches: Dict[str, List[Dict]] = {}
+            groups = self._groups(
+                'patterns', 'name', self.options.min_occurrences, restrict, file_order
+            )
+            for name, rows in groups.items():
+                matches = [
+                    {'file': Path(path), 'start_line': start_line, 'end_line': end_line}
+                    for path, start_line, end_line in rows
+                ]
+                first = matches[0]
+                first['code'] = pattern_sample(
+                    first['file'], name, first['start_line'], first['end_line']
+                )
+                pattern_matches[name] = matches
+            pattern = build_pattern_duplicates(
+                pattern_matches, load_patterns(), self.options.min_occurrences
+            )
+
+        clear_sample_cache()
+        return exact, structural, pattern
+
+
+def _index_paths(
+    groups: Dict[bytes, List[Tuple[str, int, int]]]
+) -> Tuple[Dict[bytes, List[Tuple[int, int, int]]], List[Path]]:
+    """Swap the paths in digest groups for indexes into a path list, as merge_ranges expects."""
+    path_index: Dict[str, int] = {}
+    indexed = {
+        bytes(digest): [
+            (path_index.setdefault(path, len(path_index)), start_line, end_line)
+            for path, start_line, end_line in rows
+        ]
+        for digest, rows in groups.items()
+    }
+    return indexed, [Path(path) for path in path_index]
+
+
+def run_indexed_pipeline(
+    index: FingerprintIndex,
+    files: List[Tuple[Path, str]],
+    jobs: int = 1,
+    changed: Optional[List[Path]] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None
+) -> PipelineResult:
+    """
+    Refresh the index for the given files and report duplicates from it.
+
+    Without changed, files is the whole tree: indexed files missing from it
+    are dropped and every duplicate is reported. With changed, files are the
+    changed files only: deleted files are dropped and only duplicates
+    touching a changed file are reported.
+
+    Args:
+        index: Open fingerprint index
+        files: (file_path, language) pairs to refresh
+        jobs: Worker processes for re-fingerprinting
+        changed: Changed files, for incremental runs
+        on_progress: Called with (files done, total) as records arrive
+
+    Returns:
+        PipelineResult; files_content lists the analyzed files (the changed
+        files plus those sharing a duplicate with them, when incremental)
+    """
+    if changed is not None:
+        changed = [file_path.resolve() for file_path in changed]
+        files = [(file_path.resolve(), language) for file_path, language in files]
+        index.prune()
+    else:
+        index.prune(keep=[file_path for file_path, _ in files])
+
+    issues: List[AnalysisIssue] = []
+    skipped: Set[Path] = set()
+
+    stale = index.stale_files(files)
+    stale_files = [(file_path, language) for file_path, language, _ in stale]
+    for done, record in enumerate(iter_records(stale_files, index.fingerprint_options, jobs), start=1):
+        file_path, _, stat_key = stale[record.index]
+        if record.issue:
+            issues.append(record.issue)
+        if record.skipped:
+            skipped.add(file_path)
+        index.store(file_path, record, stat_key)
+
+        if done % COMMIT_EVERY == 0:
+            index.commit()
+        if on_progress:
+            on_progress(done, len(stale))
+    index.commit()
+
+    exact, structural, pattern = index.find_duplicates(
+        changed, order=[file_path for file_path, _ in files]
+    )
+
+    files_content = [
+        (file_path, '', language) for file_path, language in files if file_path not in skipped
+    ]
+    if changed is not None:
+        analyzed = {str(file_path) for file_path, _, _ in files_content}
+        others = sorted({
+            str(instance.file_path)
+            for duplicate in exact + structural + pattern
+            for instance in duplicate.instances
+        } - analyzed)
+        for path, language in index.languages(others).items():
+            files_content.append((Path(path), '', language))
+
+    return PipelineResult(
+        files_content=files_content,
+        exact=exact,
+        structural=structural,
+        pattern=pattern,
+        issues=issues,
+        skipped_files=len(skipped),
+        fingerprinted=len(stale)
+    )
+
+
+# Export public API
+__all__ = [
+    'INDEX_VERSION',
+    'FingerprintIndex',
+    'run_indexed_pipeline',
+]
@@ -5,11 +5,22 @@
 Parses .gitignore files and provides pattern matching functionality
 to exclude files from analysis. Supports standard .gitignore syntax
 including wildcards, negation, and directory-specific patterns.
+
+GitignoreMatcher merges a pattern list into one alternation regex per run
+of same-polarity patterns, so a path is tested with a few regex searches
+instead of one per pattern.
 """
 
 import re
+from itertools import groupby
 from pathlib import Path
-from typing import List, Set, Optional, Tuple
+from typing import Iterable, List, Set, Optional, Tuple
+
+
+# Placeholders for the ** forms while single wildcards are converted
+_ANY_DIRS = '\x00'   # **/ at the start or after a /
+_ANY_BELOW = '\x01'  # /** at the end
+_ANY_PATH = '\x02'   # ** as the whole pattern
 
 
 class GitignorePattern:
@@ -40,7 +51,7 @@ class GitignorePattern:
         - ? matches any single character except /
         - [abc] matches any character in the set
         - [!abc] matches any character not in the set
-        - / at start anchors to root
+        - / at start or in the middle anchors to the .gitignore directory
         - / at end means directory only
         """
         pattern = self.pattern
@@ -49,23 +60,25 @@ class GitignorePattern:
         if pattern.endswith('/'):
             pattern = pattern[:-1]
 
-        # Handle anchoring
-        anchored = pattern.startswith('/')
-        if anchored:
+        # Handle anchoring: a / anywhere but the end ties the pattern to
+        # the .gitignore directory
+        anchored = '/' in pattern
+        if pattern.startswith('/'):
             pattern = pattern[1:]  # Remove leading /
 
         # Escape special regex characters (except wildcards)
         # Escape: . + ^ $ ( ) { } | \
         pattern = re.sub(r'([\.\+\^\$\(\)\{\}\|\\])', r'\\\1', pattern)
 
-        # Convert gitignore wildcards to regex
-        # ** matches anything including /
-        pattern = pattern.replace('**/', '(.*/)?')  # Zero or more path components
-        pattern = pattern.replace('/**', '(/.*)?')  # Trailing path components
-        pattern = pattern.replace('**', '.*')  # Anything
+        # Set ** aside as placeholder tokens so the * and ? conversions
+        # below do not rewrite the regex they stand for
+        if pattern == '**':
+            pattern = _ANY_PATH
+        pattern = re.sub(r'(?<![^/\x00])\*\*/', _ANY_DIRS, pattern)  # Zero or more directories
+        pattern = re.sub(r'/\*\*$', _ANY_BELOW, pattern)  # Everything inside
 
-        # * matches anything except /
-        pattern = re.sub(r'(?<!\*)\*(?!\*)', r'[^/]*', pattern)
+        # * matches anything except / (any other ** is two plain *)
+        pattern = pattern.replace('*', '[^/]*')
 
         # ? matches any single character except /
         pattern = pattern.replace('?', '[^/]')
@@ -73,6 +86,12 @@ class GitignorePattern:
         # Handle character classes [abc] and [!abc]
         pattern = re.sub(r'\[!([^\]]+)\]', r'[^\1]', pattern)
 
+        pattern = (
+            pattern.replace(_ANY_DIRS, '(?:.*/)?')
+            .replace(_ANY_BELOW, '/.*')
+            .replace(_ANY_PATH, '.*')
+        )
+
         # Build final regex
         if anchored:
             # Pattern must match from start
@@ -107,6 +126,65 @@ class GitignorePattern:
         return f"GitignorePattern('{prefix}{self.original}{suffix}')"
 
 
+def _alternation(regexes: Iterable[re.Pattern]) -> Optional[re.Pattern]:
+    """One regex matching wherever any of regexes matches (None if there are none)."""
+    sources = [f"(?:{regex.pattern})" for regex in regexes]
+    return re.compile('|'.join(sources)) if sources else None
+
+
+class GitignoreMatcher:
+    """
+    A pattern list compiled into a few alternation regexes.
+
+    The last matching pattern decides, as in git. Consecutive patterns with
+    the same negation decide alike, so each such run becomes one regex (plus
+    one without its directory-only patterns, for files), and runs are tried
+    from last to first.
+
+    Example:
+        >>> parser = GitignoreParser()
+        >>> parser.patterns = [parser.parse_line(p) for p in ['*.log', '!keep.log', 'tmp/']]
+        >>> matcher = parser.compile()
+        >>> matcher.matches('a/debug.log'), matcher.matches('keep.log'), matcher.matches('x.py')
+        (True, False, None)
+        >>> matcher.matches('tmp', is_dir=True), matcher.matches('tmp')
+        (True, None)
+    """
+
+    def __init__(self, patterns: List[GitignorePattern]):
+        """
+        Args:
+            patterns: Patterns in file order
+        """
+        self._runs: List[Tuple[bool, Optional[re.Pattern], Optional[re.Pattern]]] = []
+        for negation, run in groupby(patterns, key=lambda p: p.negation):
+            run = list(run)
+            self._runs.append((
+                negation,
+                _alternation(p.regex for p in run),
+                _alternation(p.regex for p in run if not p.directory_only),
+            ))
+        self._runs.reverse()
+
+    def matches(self, path: str, is_dir: bool = False) -> Optional[bool]:
+        """
+        Decide a path.
+
+        Args:
+            path: Relative path with / separators
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if excluded, False if re-included by a negation, None if
+            no pattern matches
+        """
+        for negation, dir_regex, file_regex in self._runs:
+            regex = dir_regex if is_dir else file_regex
+            if regex is not None and regex.search(path):
+                return not negation
+        return None
+
+
 class GitignoreParser:
     """Parser for .gitignore files."""
 
@@ -114,6 +192,22 @@ class GitignoreParser:
         """Initialize parser with no patterns."""
         self.patterns: List[GitignorePattern] = []
         self.loaded_files: Set[Path] = set()
+        self._matcher: Optional[GitignoreMatcher] = None
+        self._matcher_key: Optional[Tuple[int, int]] = None
+
+    def compile(self) -> GitignoreMatcher:
+        """
+        Matcher for the current patterns, rebuilt only when they change.
+
+        Returns:
+            GitignoreMatcher over self.patterns
+        """
+        # Patterns are only ever appended (or the list replaced)
+        key = (id(self.patterns), len(self.patterns))
+        if self._matcher is None or self._matcher_key != key:
+            self._matcher = GitignoreMatcher(self.patterns)
+            self._matcher_key = key
+        return self._matcher
 
     def parse_line(self, line: str) -> Optional[GitignorePattern]:
         """
@@ -273,17 +367,8 @@ class GitignoreParser:
         # Check if it's a directory
         is_dir = path.is_dir() if path.exists() else path_str.endswith('/')
 
-        # Apply patterns in order (later patterns override earlier)
-        excluded = False
-
-        for pattern in self.patterns:
-            if pattern.matches(path_str, is_dir):
-                if pattern.negation:
-                    excluded = False  # Negation un-excludes
-                else:
-                    excluded = True  # Normal pattern excludes
-
-        return excluded
+        # Later patterns override earlier; negations un-exclude
+        return self.compile().matches(path_str, is_dir) is True
 
     def get_applicable_patterns(self, path: Path, base_path: Optional[Path] = None) -> List[GitignorePattern]:
         """
@@ -367,10 +452,32 @@ def load_gitignore_patterns(
     return parser
 
 
+def load_gitignore_matcher(gitignore_path: Path) -> Optional[GitignoreMatcher]:
+    """
+    Compile one .gitignore file on its own.
+
+    Args:
+        gitignore_path: Path to .gitignore file
+
+    Returns:
+        GitignoreMatcher for its patterns (paths relative to its directory),
+        or None if it cannot be read or has no patterns
+    """
+    parser = GitignoreParser()
+    try:
+        if parser.load_file(gitignore_path) == 0:
+            return None
+    except (IOError, FileNotFoundError):
+        return None
+    return parser.compile()
+
+
 # Export public API
 __all__ = [
     "GitignorePattern",
+    "GitignoreMatcher",
     "GitignoreParser",
+    "load_gitignore_matcher",
     "load_gitignore_patterns",
     "find_gitignore_files",
 ]
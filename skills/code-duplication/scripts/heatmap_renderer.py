@@ -6,7 +6,7 @@ Generates hierarchical heatmap data structure showing duplication
 distribution across the codebase directory tree.
 """
 
-from typing import List, Tuple, Dict, Optional
+from typing import Iterable, List, Tuple, Dict, Optional
 from pathlib import Path
 from collections import defaultdict
 
@@ -98,57 +98,35 @@ def build_directory_tree(
     return tree
 
 
-def generate_heatmap_data(
-    files_content: List[Tuple[Path, str, str]],
-    duplicates: List[DuplicateBlock]
+def build_heatmap(
+    file_totals: Iterable[Tuple[Path, int, int, int]]
 ) -> HeatmapData:
     """
-    Generate heatmap data structure.
+    Build heatmap data from per-file totals.
 
     Args:
-        files_content: List of (file_path, content, language) tuples
-        duplicates: List of duplicate blocks
+        file_totals: (file_path, total_loc, duplicate_loc, block_count) per
+            file, e.g. from metrics_calculator.DuplicationAggregates
 
     Returns:
-        HeatmapData object with file entries
-
-    Example:
-        >>> heatmap = generate_heatmap_data(files, duplicates)
-        >>> len(heatmap.entries) > 0
-        True
+        HeatmapData object with file entries, highest duplication first
     """
     entries = []
 
-    for file_path, content, language in files_content:
-        # Calculate totals for this file
-        total_loc = count_lines(file_path, language)
-
-        # Count duplicate LOC and blocks in this file
-        duplicate_loc = 0
-        block_count = 0
-
-        for dup in duplicates:
-            for instance in dup.instances:
-                if instance.file_path == file_path:
-                    duplicate_loc += instance.line_count
-                    block_count += 1
-
+    for file_path, total_loc, duplicate_loc, block_count in file_totals:
         # Calculate percentage
         if total_loc > 0:
             dup_percentage = (duplicate_loc / total_loc) * 100
         else:
             dup_percentage = 0.0
 
-        # Create entry
-        entry = HeatmapEntry(
+        entries.append(HeatmapEntry(
             file_path=file_path,
             duplication_percentage=round(dup_percentage, 2),
             duplicate_loc=duplicate_loc,
             total_loc=total_loc,
             block_count=block_count
-        )
-
-        entries.append(entry)
+        ))
 
     # Sort by duplication percentage (highest first)
     entries.sort(key=lambda e: e.duplication_percentage, reverse=True)
@@ -156,6 +134,40 @@ def generate_heatmap_data(
     return HeatmapData(entries=entries)
 
 
+def generate_heatmap_data(
+    files_content: List[Tuple[Path, str, str]],
+    duplicates: List[DuplicateBlock]
+) -> HeatmapData:
+    """
+    Generate heatmap data structure.
+
+    Args:
+        files_content: List of (file_path, content, language) tuples
+        duplicates: List of duplicate blocks
+
+    Returns:
+        HeatmapData object with file entries
+
+    Example:
+        >>> heatmap = generate_heatmap_data(files, duplicates)
+        >>> len(heatmap.entries) > 0
+        True
+    """
+    # Duplicate LOC and block count per file, in one pass over duplicates
+    duplicate_loc: Dict[Path, int] = defaultdict(int)
+    block_count: Dict[Path, int] = defaultdict(int)
+    for dup in duplicates:
+        for instance in dup.instances:
+            duplicate_loc[instance.file_path] += instance.line_count
+            block_count[instance.file_path] += 1
+
+    return build_heatmap(
+        (file_path, count_lines(file_path, language),
+         duplicate_loc.get(file_path, 0), block_count.get(file_path, 0))
+        for file_path, content, language in files_content
+    )
+
+
 def render_heatmap_text(heatmap: HeatmapData, max_width: int = 80) -> str:
     """
     Render heatmap as text for console display.
@@ -227,6 +239,7 @@ def generate_heatmap_summary(heatmap: HeatmapData) -> Dict[str, any]:
 
 # Export public API
 __all__ = [
+    'build_heatmap',
     'generate_heatmap_data',
     'render_heatmap_text',
     'calculate_file_duplication_percentage',
@@ -4,9 +4,13 @@ Metrics Calculator for Code Duplication Analysis Skill
 
 Calculates summary metrics, ranks top offenders, and generates
 analysis statistics from duplicate detection results.
+
+DuplicationAggregates keeps running totals as duplicates are added, so the
+summary, offenders, trends, heatmap and recommendation counts all come from
+one pass over the results (and one line count per file).
 """
 
-from typing import List, Tuple, Dict, Set
+from typing import Iterable, List, Tuple, Dict, Set
 from pathlib import Path
 from collections import defaultdict
 
@@ -14,11 +18,133 @@ from models import (
     DuplicateBlock,
     AnalysisSummary,
     FileOffender,
-    DuplicateType
+    DuplicateType,
+    HeatmapData
 )
+from heatmap_renderer import build_heatmap
 from utils import count_lines
 
 
+class DuplicationAggregates:
+    """
+    Running totals over a stream of duplicates.
+
+    Add each DuplicateBlock once (in report order); the blocks themselves
+    are not kept.
+
+    Example:
+        >>> aggregates = DuplicationAggregates(files)
+        >>> aggregates.add_all(duplicates)
+        >>> aggregates.summary().duplicate_blocks == len(duplicates)
+        True
+    """
+
+    def __init__(self, files_content: List[Tuple[Path, str, str]]):
+        """
+        Args:
+            files_content: List of (file_path, content, language) tuples
+        """
+        self.total_files = len(files_content)
+        self.total_loc = 0
+        # Per-file LOC, in files_content order
+        self.file_loc: Dict[Path, int] = {}
+        for file_path, content, language in files_content:
+            loc = count_lines(file_path, language)
+            self.total_loc += loc
+            self.file_loc[file_path] = loc
+
+        self.duplicate_blocks = 0
+        self.duplicate_loc = 0
+        self.type_blocks: Dict[DuplicateType, int] = defaultdict(int)
+        # Per-file duplicate LOC and ids of the blocks with an instance there
+        self.file_duplicate_loc: Dict[Path, int] = defaultdict(int)
+        self.file_blocks: Dict[Path, List[int]] = defaultdict(list)
+
+        self.total_instances = 0
+        self.largest_block = 0
+        self.loc_reduction = 0
+        self.difficulty_counts: Dict[str, int] = defaultdict(int)
+
+    def add(self, dup: DuplicateBlock) -> None:
+        """Fold one duplicate into the totals."""
+        self.duplicate_blocks += 1
+        self.type_blocks[dup.type] += 1
+        self.total_instances += len(dup.instances)
+
+        # Copies only: the first instance is the original
+        if len(dup.instances) > 1:
+            self.duplicate_loc += (len(dup.instances) - 1) * dup.instances[0].line_count
+
+        for instance in dup.instances:
+            if instance.line_count > self.largest_block:
+                self.largest_block = instance.line_count
+            if instance.file_path in self.file_loc:
+                self.file_duplicate_loc[instance.file_path] += instance.line_count
+                self.file_blocks[instance.file_path].append(dup.id)
+
+        if dup.suggestion:
+            self.loc_reduction += dup.suggestion.estimated_loc_reduction
+            self.difficulty_counts[dup.suggestion.difficulty] += 1
+
+    def add_all(self, duplicates: Iterable[DuplicateBlock]) -> None:
+        """Fold every duplicate into the totals."""
+        for dup in duplicates:
+            self.add(dup)
+
+    def summary(self) -> AnalysisSummary:
+        """AnalysisSummary of the duplicates added so far."""
+        return AnalysisSummary(
+            total_files=self.total_files,
+            total_loc=self.total_loc,
+            duplicate_loc=self.duplicate_loc,
+            duplicate_blocks=self.duplicate_blocks,
+            exact_blocks=self.type_blocks[DuplicateType.EXACT],
+            structural_blocks=self.type_blocks[DuplicateType.STRUCTURAL],
+            pattern_blocks=self.type_blocks[DuplicateType.PATTERN]
+        )
+
+    def offenders(self, top_n: int = 10) -> List[FileOffender]:
+        """Files with duplicate lines, most duplicate LOC first."""
+        offenders = [
+            FileOffender(
+                file_path=str(file_path),
+                total_loc=total_loc,
+                duplicate_loc=self.file_duplicate_loc[file_path],
+                duplicate_blocks=self.file_blocks[file_path]
+            )
+            for file_path, total_loc in self.file_loc.items()
+            if self.file_duplicate_loc.get(file_path)
+        ]
+        offenders.sort(key=lambda o: o.duplicate_loc, reverse=True)
+        return offenders[:top_n]
+
+    def heatmap(self) -> HeatmapData:
+        """Heatmap over every analyzed file."""
+        return build_heatmap(
+            (file_path, total_loc, self.file_duplicate_loc.get(file_path, 0),
+             len(self.file_blocks.get(file_path, ())))
+            for file_path, total_loc in self.file_loc.items()
+        )
+
+    def trends(self) -> Dict[str, any]:
+        """Same dictionary as analyze_duplication_trends."""
+        trends = {
+            'most_duplicated_type': None,
+            'avg_instances_per_duplicate': 0,
+            'largest_duplicate_block': 0,
+            'total_instance_count': 0
+        }
+        if not self.duplicate_blocks:
+            return trends
+
+        # type_blocks is in first-seen order, so ties go to the earliest type
+        trends['most_duplicated_type'] = max(self.type_blocks, key=self.type_blocks.get).value
+        trends['avg_instances_per_duplicate'] = round(self.total_instances / self.duplicate_blocks, 1)
+        trends['largest_duplicate_block'] = self.largest_block
+        trends['total_instance_count'] = self.total_instances
+        return trends
+
+
 def calculate_metrics(
     duplicates: List[DuplicateBlock],
     files_content: List[Tuple[Path, str, str]]
@@ -40,73 +166,9 @@ def calculate_metrics(
         >>> metrics.duplicate_lines <= metrics.total_lines
         True
     """
-    # Calculate total LOC analyzed
-    total_lines = 0
-    total_files = len(files_content)
-
-    for file_path, content, language in files_content:
-        loc = count_lines(file_path, language)
-        total_lines += loc
-
-    # Calculate duplicate LOC (excluding original, counting copies only)
-    duplicate_lines = 0
-    exact_blocks = 0
-    structural_blocks = 0
-    pattern_blocks = 0
-
-    for dup in duplicates:
-        # Count duplicate lines (instances - 1) * lines per instance
-        # The -1 excludes the original instance
-        if len(dup.instances) > 1:
-            copies = len(dup.instances) - 1
-            lines_per_instance = dup.instances[0].line_count
-            duplicate_lines += copies * lines_per_instance
-
-        # Count by type
-        if dup.type == DuplicateType.EXACT:
-            exact_blocks += 1
-        elif dup.type == DuplicateType.STRUCTURAL:
-            structural_blocks += 1
-        elif dup.type == DuplicateType.PATTERN:
-            pattern_blocks += 1
-
-    # Calculate duplication percentage
-    if total_lines > 0:
-        duplication_percentage = (duplicate_lines / total_lines) * 100
-    else:
-        duplication_percentage = 0.0
-
-    # Calculate block size statistics
-    block_sizes = [inst.line_count for dup in duplicates for inst in dup.instances]
-
-    if block_sizes:
-        avg_block_size = sum(block_sizes) / len(block_sizes)
-        min_block_size = min(block_sizes)
-        max_block_size = max(block_sizes)
-    else:
-        avg_block_size = 0
-        min_block_size = 0
-        max_block_size = 0
-
-    # Estimate cleanup potential
-    # Conservative: Remove all duplicates except largest blocks
-    conservative_cleanup = duplicate_lines
-
-    # Optimistic: Aggressive refactoring including structural patterns
-    optimistic_cleanup = int(duplicate_lines * 1.2)  # 20% bonus for structural improvements
-
-    # Create summary
-    summary = AnalysisSummary(
-        total_files=total_files,
-        total_loc=total_lines,
-        duplicate_loc=duplicate_lines,
-        duplicate_blocks=len(duplicates),
-        exact_blocks=exact_blocks,
-        structural_blocks=structural_blocks,
-        pattern_blocks=pattern_blocks
-    )
-
-    return summary
+    aggregates = DuplicationAggregates(files_content)
+    aggregates.add_all(duplicates)
+    return aggregates.summary()
 
 
 def get_files_with_duplicates(duplicates: List[DuplicateBlock]) -> Set[Path]:
@@ -152,79 +214,9 @@ def rank_offenders(
         >>> offenders[0].impact_score >= offenders[-1].impact_score
         True
     """
-    # Build file metadata
-    file_metadata: Dict[Path, Dict] = {}
-
-    for file_path, content, language in files_content:
-        file_metadata[file_path] = {
-            'total_lines': count_lines(file_path, language),
-            'duplicate_lines': 0,
-            'duplicate_blocks': [],
-            'language': language
-        }
-
-    # Calculate per-file duplicate LOC
-    for dup in duplicates:
-        for instance in dup.instances:
-            file_path = instance.file_path
-
-            if file_path not in file_metadata:
-                continue
-
-            # Add duplicate lines (only count each instance once)
-            file_metadata[file_path]['duplicate_lines'] += instance.line_count
-            file_metadata[file_path]['duplicate_blocks'].append(dup)
-
-    # Calculate impact scores and create FileOffender objects
-    offenders = []
-
-    for file_path, metadata in file_metadata.items():
-        duplicate_lines = metadata['duplicate_lines']
-        total_lines = metadata['total_lines']
-
-        if duplicate_lines == 0:
-            continue  # No duplicates in this file
-
-        # Calculate duplication percentage
-        if total_lines > 0:
-            dup_percentage = (duplicate_lines / total_lines) * 100
-        else:
-            dup_percentage = 0.0
-
-        # Calculate impact score
-        # Formula: (Duplicate LOC × 2) + (% × File LOC)
-        impact_score = (duplicate_lines * 2) + (dup_percentage * total_lines / 100)
-
-        # Find most common duplicate in this file
-        duplicate_counts = defaultdict(int)
-        for dup in metadata['duplicate_blocks']:
-            duplicate_counts[dup.id] += 1
-
-        if duplicate_counts:
-            most_common_id = max(duplicate_counts, key=duplicate_counts.get)
-            most_common_dup = next((d for d in duplicates if d.id == most_common_id), None)
-            most_common_duplicate = most_common_dup.hash if most_common_dup else ""
-        else:
-            most_common_duplicate = ""
-
-        # Get list of duplicate block IDs for this file
-        block_ids = [dup.id for dup in metadata['duplicate_blocks']]
-
-        # Create FileOffender
-        offender = FileOffender(
-            file_path=str(file_path),
-            total_loc=total_lines,
-            duplicate_loc=duplicate_lines,
-            duplicate_blocks=block_ids
-        )
-
-        offenders.append(offender)
-
-    # Sort by duplicate LOC descending (most duplicated first)
-    offenders.sort(key=lambda o: o.duplicate_loc, reverse=True)
-
-    # Return top N
-    return offenders[:top_n]
+    aggregates = DuplicationAggregates(files_content)
+    aggregates.add_all(duplicates)
+    return aggregates.offenders(top_n)
 
 
 def calculate_file_statistics(
@@ -269,44 +261,14 @@ def analyze_duplication_trends(
     Returns:
         Dictionary with trend analysis
     """
-    trends = {
-        'most_duplicated_type': None,
-        'avg_instances_per_duplicate': 0,
-        'largest_duplicate_block': 0,
-        'total_instance_count': 0
-    }
-
-    if not duplicates:
-        return trends
-
-    # Count by type
-    type_counts = defaultdict(int)
-    total_instances = 0
-    max_block_size = 0
-
-    for dup in duplicates:
-        type_counts[dup.type.value] += 1
-        total_instances += len(dup.instances)
-
-        # Find largest block
-        for instance in dup.instances:
-            if instance.line_count > max_block_size:
-                max_block_size = instance.line_count
-
-    # Most common type
-    if type_counts:
-        trends['most_duplicated_type'] = max(type_counts, key=type_counts.get)
-
-    # Average instances
-    trends['avg_instances_per_duplicate'] = round(total_instances / len(duplicates), 1)
-    trends['largest_duplicate_block'] = max_block_size
-    trends['total_instance_count'] = total_instances
-
-    return trends
+    aggregates = DuplicationAggregates([])
+    aggregates.add_all(duplicates)
+    return aggregates.trends()
 
 
 # Export public API
 __all__ = [
+    'DuplicationAggregates',
     'calculate_metrics',
     'rank_offenders',
     'get_files_with_duplicates',
@@ -3,15 +3,34 @@
 Data Models for Code Duplication Analysis Skill
 
 This module defines all core data structures used throughout the skill.
-Uses Python dataclasses for clean, type-safe data models.
+Uses Python dataclasses for clean, type-safe data models. The per-instance
+models (CodeLocation, CodeBlock, DuplicateBlock) are slotted, as a scan
+creates one per duplicate instance.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 from enum import Enum
 
 
+def slotted(cls):
+    """
+    Rebuild a dataclass with __slots__ for its fields.
+
+    Same as dataclass(slots=True), which needs Python 3.10. Instances have
+    no __dict__, so they are smaller and reject attributes that are not
+    fields.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in names and key not in ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
 class ErrorCategory(Enum):
     """Category of error encountered during analysis."""
     PARSE_ERROR = "parse_error"
@@ -59,9 +78,15 @@ class RefactoringTechnique(Enum):
     PARAMETERIZE_FUNCTION = "parameterize_function"
 
 
+@slotted
 @dataclass
 class CodeLocation:
-    """Represents a specific location in source code."""
+    """
+    Represents a specific location in source code.
+
+    Detectors pass the Path from files_content (or their path table), so
+    every location in a file shares one path object.
+    """
 
     file_path: str
     start_line: int
@@ -77,6 +102,7 @@ class CodeLocation:
         return self.location_string
 
 
+@slotted
 @dataclass
 class CodeBlock:
     """Represents a block of code content."""
@@ -114,6 +140,7 @@ class RefactoringSuggestion:
         return self.technique.value.replace('_', ' ').title()
 
 
+@slotted
 @dataclass
 class DuplicateBlock:
     """Represents a block of duplicated code found across multiple locations."""
@@ -406,6 +433,7 @@ class Config:
         "**/build/**",
     ])
     include_patterns: List[str] = field(default_factory=list)
+    respect_gitignore: bool = True  # Skip paths ignored by .gitignore files
 
     # Language support
     languages: List[str] = field(default_factory=lambda: [
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Near-Miss Structural Clone Detection for Code Duplication Analysis Skill
+
+Finds Type-3 clones: functions whose normalized ASTs differ by a few
+statements or expressions, which exact fingerprints miss. Each normalized
+function is shingled into depth-2 subtree and parent-path features and
+summarized by a MinHash signature (one-permutation hashing with
+densification, so the cost is linear in the number of features). LSH
+banding buckets signatures so only functions sharing a band are compared;
+no all-pairs pass is made. Candidate pairs are verified with the
+Zhang-Shasha tree edit distance (tree_distance), falling back to the
+MinHash estimate for very large functions, and linked pairs form clusters.
+"""
+
+import ast
+import copy
+import hashlib
+from array import array
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from models import DuplicateBlock, CodeLocation, DuplicateType
+from tree_distance import OrderedTree, node_children, node_label, prepare_tree, verified_similarity
+
+
+# MinHash bins per signature (a power of two)
+NUM_PERM = 128
+
+# LSH band choice: probability that a pair at the threshold becomes a candidate
+TARGET_RECALL = 0.95
+
+# Buckets larger than this are linked as a star around their first member
+MAX_BUCKET_PAIRS = 64
+
+# Candidates whose MinHash estimate falls this far below the threshold still
+# go to tree edit distance verification (the estimate is noisy)
+ESTIMATE_SLACK = 0.1
+
+_HASH_BITS = 32
+_EMPTY = (1 << 64) - 1
+
+
+def shingle_features(node: ast.AST) -> List[int]:
+    """
+    Shingle a normalized function into hashed structural features.
+
+    Every node contributes its depth-2 subtree (label and child labels) and
+    its grandparent/parent/node path. Repeated shingles are numbered so the
+    feature set keeps multiplicities.
+
+    Args:
+        node: Function node, normalized with ASTNormalizer
+
+    Returns:
+        64-bit feature hashes
+
+    Example:
+        >>> tree = ast.parse("def f(x):\\n    return x + 1")
+        >>> len(shingle_features(tree.body[0])) > 0
+        True
+    """
+    shingles: List[str] = []
+    stack: List[Tuple[ast.AST, str, str]] = [(node, '', '')]
+    while stack:
+        current, parent, grandparent = stack.pop()
+        label = node_label(current)
+        children = node_children(current)
+        shingles.append(f"{label}({','.join(node_label(child) for child in children)})")
+        shingles.append(f"{grandparent}/{parent}/{label}")
+        stack.extend((child, label, parent) for child in children)
+
+    seen: Counter = Counter()
+    features = []
+    for shingle in shingles:
+        seen[shingle] += 1
+        key = f"{shingle}#{seen[shingle]}".encode('utf-8')
+        features.append(int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'big'))
+    return features
+
+
+def minhash_signature(features: Sequence[int], num_perm: int = NUM_PERM) -> array:
+    """
+    One-permutation MinHash signature of a feature set.
+
+    Each feature hash picks a bin (low bits) and competes for that bin's
+    minimum (next 32 bits). Empty bins borrow the nearest non-empty bin to
+    their right, offset by the distance, so every bin stays comparable.
+
+    Args:
+        features: 64-bit feature hashes
+        num_perm: Number of bins (a power of two)
+
+    Returns:
+        array('Q') of num_perm values
+    """
+    shift = num_perm.bit_length() - 1
+    mask = (1 << _HASH_BITS) - 1
+    bins = [_EMPTY] * num_perm
+    for h in features:
+        b = h & (num_perm - 1)
+        v = (h >> shift) & mask
+        if v < bins[b]:
+            bins[b] = v
+
+    filled = [i for i, v in enumerate(bins) if v != _EMPTY]
+    if not filled:
+        return array('Q', [0] * num_perm)
+
+    # Rotation densification: walk right-to-left remembering the next filled bin
+    signature = list(bins)
+    next_filled = filled[0] + num_perm
+    for i in range(num_perm - 1, -1, -1):
+        if bins[i] != _EMPTY:
+            next_filled = i
+        else:
+            distance = next_filled - i
+            signature[i] = bins[next_filled % num_perm] + (distance << _HASH_BITS)
+    return array('Q', signature)
+
+
+def function_signature(node: ast.AST, num_perm: int = NUM_PERM) -> bytes:
+    """
+    MinHash signature of a normalized function, as bytes.
+
+    Args:
+        node: Function node, normalized with ASTNormalizer
+        num_perm: Number of bins
+
+    Returns:
+        Signature bytes (array('Q') layout), compact enough to ship from
+        workers and store in the fingerprint index
+    """
+    return minhash_signature(shingle_features(node), num_perm).tobytes()
+
+
+def signature_from_bytes(data: bytes) -> array:
+    """Decode a signature produced by function_signature."""
+    signature = array('Q')
+    signature.frombytes(data)
+    return signature
+
+
+def estimate_similarity(sig1: Sequence[int], sig2: Sequence[int]) -> float:
+    """
+    Estimated Jaccard similarity: the fraction of agreeing bins.
+
+    Example:
+        >>> estimate_similarity([1, 2, 3, 4], [1, 2, 3, 5])
+        0.75
+    """
+    if not sig1:
+        return 0.0
+    return sum(1 for a, b in zip(sig1, sig2) if a == b) / len(sig1)
+
+
+def choose_bands(threshold: float, num_perm: int = NUM_PERM) -> Tuple[int, int]:
+    """
+    Pick LSH (bands, rows) for a similarity threshold.
+
+    Chooses the most selective split (most rows per band) under which a
+    pair exactly at the threshold still becomes a candidate with
+    probability TARGET_RECALL.
+
+    Args:
+        threshold: Minimum similarity to report (0.0-1.0)
+        num_perm: Signature length
+
+    Returns:
+        (bands, rows) with bands * rows == num_perm
+
+    Example:
+        >>> choose_bands(0.85, 128)
+        (16, 8)
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        recall = 1.0 - (1.0 - threshold ** rows) ** bands
+        if recall >= TARGET_RECALL:
+            best = (bands, rows)
+    return best
+
+
+def lsh_candidate_pairs(
+    signatures: List[Sequence[int]],
+    bands: int,
+    rows: int
+) -> Set[Tuple[int, int]]:
+    """
+    Candidate pairs: signatures agreeing on every row of at least one band.
+
+    Args:
+        signatures: One signature per function
+        bands: Number of bands
+        rows: Rows per band
+
+    Returns:
+        Set of (i, j) index pairs with i < j
+    """
+    pairs: Set[Tuple[int, int]] = set()
+    for band in range(bands):
+        start = band * rows
+        buckets: Dict[Tuple[int, ...], List[int]] = {}
+        for index, signature in enumerate(signatures):
+            buckets.setdefault(tuple(signature[start:start + rows]), []).append(index)
+
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            if len(members) > MAX_BUCKET_PAIRS:
+                # Near-identical shapes crowd one bucket; avoid its quadratic pair set
+                pairs.update((members[0], other) for other in members[1:])
+                continue
+            for n, i in enumerate(members):
+                pairs.update((i, j) for j in members[n + 1:])
+    return pairs
+
+
+def find_near_miss_groups(
+    signatures: List[Sequence[int]],
+    similarity_threshold: float = 0.85,
+    verify: Optional[Callable[[int, int], Optional[float]]] = None
+) -> List[Tuple[List[int], float]]:
+    """
+    Cluster signatures whose similarity reaches the threshold.
+
+    Without verify, a candidate pair's similarity is its MinHash estimate.
+    With verify, pairs estimated within ESTIMATE_SLACK of the threshold are
+    passed to it, and its answer is used unless it returns None.
+
+    Args:
+        signatures: One signature per function
+        similarity_threshold: Minimum similarity (0.0-1.0)
+        verify: Exact similarity of two signature indexes, or None when
+            they cannot be compared
+
+    Returns:
+        (member indexes, lowest linking similarity) per cluster of two or
+        more, members in index order
+    """
+    bands, rows = choose_bands(similarity_threshold, len(signatures[0]) if signatures else NUM_PERM)
+
+    parent = list(range(len(signatures)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    links: List[Tuple[int, int, float]] = []
+    floor = similarity_threshold - ESTIMATE_SLACK if verify else similarity_threshold
+    for i, j in sorted(lsh_candidate_pairs(signatures, bands, rows)):
+        similarity = estimate_similarity(signatures[i], signatures[j])
+        if similarity < floor:
+            continue
+        if verify:
+            verified = verify(i, j)
+            if verified is not None:
+                similarity = verified
+        if similarity >= similarity_threshold:
+            links.append((i, j, similarity))
+            parent[find(i)] = find(j)
+
+    clusters: Dict[int, List[int]] = {}
+    for index in range(len(signatures)):
+        clusters.setdefault(find(index), []).append(index)
+
+    lowest: Dict[int, float] = {}
+    for i, _, similarity in links:
+        root = find(i)
+        lowest[root] = min(lowest.get(root, 1.0), similarity)
+
+    return [
+        (members, lowest[root])
+        for root, members in clusters.items()
+        if len(members) > 1
+    ]
+
+
+def parse_function_source(source: str) -> Optional[ast.AST]:
+    """
+    Parse the source lines of one (possibly indented) function.
+
+    Args:
+        source: Lines from the def line to the function's last line
+
+    Returns:
+        The FunctionDef / AsyncFunctionDef node, or None if it does not parse
+
+    Example:
+        >>> parse_function_source("    def f(self):\\n        return 1").name
+        'f'
+    """
+    first = source.split('\n', 1)[0]
+    indented = first[:1].isspace()
+    if indented:
+        # Nest under a block instead of dedenting, which multi-line strings break
+        source = 'if True:\n' + source
+    try:
+        module = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+    if not module.body:
+        return None
+    node = module.body[0].body[0] if indented else module.body[0]
+    return node if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) else None
+
+
+def build_near_miss_duplicates(
+    functions: List[Dict],
+    similarity_threshold: float = 0.85,
+    read_code: Optional[Callable[[Dict], str]] = None,
+    only_fingerprints: Optional[Set[str]] = None,
+    first_id: int = 1,
+    verify_trees: bool = True
+) -> List[DuplicateBlock]:
+    """
+    Turn fingerprinted functions into near-miss structural DuplicateBlocks.
+
+    Functions sharing an exact fingerprint are already reported as exact
+    structural duplicates, so each fingerprint takes part once, through its
+    first function in path order, and a cluster needs two distinct
+    fingerprints.
+
+    Args:
+        functions: Dicts with fingerprint, file, start_line, end_line,
+            signature (bytes) and optionally code
+        similarity_threshold: Minimum similarity (0.0-1.0)
+        read_code: Produces the code sample for a function without code
+        only_fingerprints: When given, only clusters containing one of
+            these fingerprints are returned
+        first_id: Id of the first block (continues the exact structural ids)
+        verify_trees: Verify candidates by tree edit distance, using each
+            function's tree (or its code, or read_code, re-parsed)
+
+    Returns:
+        List of DuplicateBlock objects with type=STRUCTURAL and
+        similarity_score below 1.0, most instances first
+    """
+    # Path order makes the representatives independent of discovery order
+    representatives: List[Dict] = []
+    seen: Set[str] = set()
+    for function in sorted(functions, key=lambda f: (str(f['file']), f['start_line'])):
+        if function['fingerprint'] not in seen and function.get('signature'):
+            seen.add(function['fingerprint'])
+            representatives.append(function)
+
+    signatures = [signature_from_bytes(function['signature']) for function in representatives]
+
+    trees: Dict[int, Optional[OrderedTree]] = {}
+
+    def tree(index: int) -> Optional[OrderedTree]:
+        if index not in trees:
+            function = representatives[index]
+            node = function.get('tree')
+            if node is None:
+                code = function.get('code')
+                if code is None and read_code:
+                    code = read_code(function)
+                node = parse_function_source(code) if code else None
+            if node is not None and node.decorator_list:
+                # Line ranges start at the def line, so re-parsed source has
+                # no decorators; compare bodies alike in every mode
+                node = copy.copy(node)
+                node.decorator_list = []
+            trees[index] = prepare_tree(node) if node is not None else None
+        return trees[index]
+
+    def verify(i: int, j: int) -> Optional[float]:
+        tree1, tree2 = tree(i), tree(j)
+        if tree1 is None or tree2 is None:
+            return None
+        return verified_similarity(tree1, tree2, similarity_threshold)
+
+    groups = find_near_miss_groups(
+        signatures, similarity_threshold, verify=verify if verify_trees else None
+    )
+
+    duplicates = []
+    for members, similarity in groups:
+        instances = [representatives[index] for index in members]
+        fingerprints = sorted(inst['fingerprint'] for inst in instances)
+        if only_fingerprints is not None and not only_fingerprints.intersection(fingerprints):
+            continue
+
+        locations = [
+            CodeLocation(
+                file_path=inst['file'],
+                start_line=inst['start_line'],
+                end_line=inst['end_line'],
+                line_count=inst['end_line'] - inst['start_line'] + 1
+            )
+            for inst in instances
+        ]
+
+        first = instances[0]
+        code_sample = first.get('code')
+        if code_sample is None:
+            code_sample = read_code(first) if read_code else ''
+
+        duplicates.append(DuplicateBlock(
+            id=0,
+            type=DuplicateType.STRUCTURAL,
+            hash=hashlib.md5(':'.join(fingerprints).encode('utf-8')).hexdigest(),
+            instances=locations,
+            code_sample=code_sample,
+            # Distinct fingerprints: never report an estimate as an exact match
+            similarity_score=min(similarity, 0.99),
+            suggestion=None
+        ))
+
+    duplicates.sort(key=lambda d: (len(d.instances), d.similarity_score), reverse=True)
+    for duplicate_id, duplicate in enumerate(duplicates, start=first_id):
+        duplicate.id = duplicate_id
+
+    return duplicates
+
+
+# Export public API
+__all__ = [
+    'NUM_PERM',
+    'shingle_features',
+    'minhash_signature',
+    'function_signature',
+    'signature_from_bytes',
+    'estimate_similarity',
+    'choose_bands',
+    'lsh_candidate_pairs',
+    'find_near_miss_groups',
+    'parse_function_source',
+    'build_near_miss_duplicates',
+]
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Parallel Analysis Pipeline for Code Duplication Analysis Skill
+
+Shards file reading, normalization, block hashing and AST fingerprinting
+across a process pool (cli.py --jobs N). Each worker reads one file and
+returns a compact FileRecord of hashes and line ranges; source text never
+leaves the worker. A single reducer in the parent merges the records into
+the same DuplicateBlocks the serial detectors produce, re-reading only the
+files its code samples come from and building each sample as the serial
+detector does. Peak memory therefore follows the number
+of hashes rather than the total bytes of source.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from models import AnalysisIssue, DuplicateBlock, ErrorCategory
+from exact_detector import block_text, build_exact_duplicates, compute_hash, extract_code_blocks
+from structural_detector import (
+    build_structural_duplicates,
+    fingerprint_functions,
+    function_samples,
+    parse_ast,
+)
+from near_miss_detector import build_near_miss_duplicates, function_signature
+from pattern_detector import build_pattern_duplicates, catalog_scanner, load_patterns
+from token_stream import TokenStream, build_token_stream, compact_token_stream
+from rolling_hash_detector import find_stream_duplicates_rolling
+from suffix_array_detector import find_stream_duplicates_suffix_array
+
+
+@dataclass
+class PipelineOptions:
+    """Which detectors to run and their thresholds."""
+
+    min_lines: int = 5
+    min_chars: int = 50
+    exact_engine: str = 'window'
+    run_exact: bool = True
+    run_structural: bool = True
+    run_pattern: bool = True
+    min_occurrences: int = 3
+    near_miss: bool = False
+    similarity_threshold: float = 0.85
+
+
+@dataclass
+class FileRecord:
+    """Compact result of fingerprinting one file in a worker."""
+
+    index: int
+    language: str = 'unknown'
+    content_hash: str = ''
+    issue: Optional[AnalysisIssue] = None
+    skipped: bool = False
+    blocks: List[Tuple[bytes, int, int]] = field(default_factory=list)      # (digest, start, end)
+    stream: Optional[TokenStream] = None                                    # compact token stream
+    functions: List[Tuple[bytes, int, int, Optional[bytes]]] = field(default_factory=list)  # (fingerprint, start, end, MinHash signature)
+    patterns: List[Tuple[str, int, int, Optional[str]]] = field(default_factory=list)  # (name, start, end, code)
+
+
+@dataclass
+class PipelineResult:
+    """Merged output of a parallel run."""
+
+    files_content: List[Tuple[Path, str, str]]  # (path, '', language): contents stay on disk
+    exact: List[DuplicateBlock]
+    structural: List[DuplicateBlock]
+    pattern: List[DuplicateBlock]
+    issues: List[AnalysisIssue]
+    skipped_files: int
+    fingerprinted: int = 0  # files read and fingerprinted in this run
+
+
+def read_source(file_path: Path) -> Tuple[Optional[str], Optional[AnalysisIssue]]:
+    """
+    Read a source file, falling back to latin-1 when UTF-8 fails.
+
+    Args:
+        file_path: File to read
+
+    Returns:
+        (content, issue): content is None when the file was skipped; issue
+        describes the fallback or the failure, if any
+    """
+    try:
+        try:
+            return file_path.read_text(encoding='utf-8'), None
+        except UnicodeDecodeError:
+            try:
+                content = file_path.read_text(encoding='latin-1')
+            except UnicodeDecodeError as e:
+                return None, AnalysisIssue(
+                    category=ErrorCategory.ENCODING_ERROR,
+                    severity="error",
+                    file_path=str(file_path),
+                    message=f"Cannot decode file: {str(e)}"
+                )
+            return content, AnalysisIssue(
+                category=ErrorCategory.ENCODING_ERROR,
+                severity="warning",
+                file_path=str(file_path),
+                message="UTF-8 decode failed, used latin-1 fallback"
+            )
+
+    except PermissionError:
+        return None, AnalysisIssue(
+            category=ErrorCategory.PERMISSION_ERROR,
+            severity="warning",
+            file_path=str(file_path),
+            message="Permission denied"
+        )
+
+    except OSError as e:
+        # Handle disk full, file too large, etc.
+        if "No space left on device" in str(e):
+            return None, AnalysisIssue(
+                category=ErrorCategory.DISK_FULL,
+                severity="error",
+                file_path=str(file_path),
+                message="No space left on device"
+            )
+        return None, AnalysisIssue(
+            category=ErrorCategory.IO_ERROR,
+            severity="error",
+            file_path=str(file_path),
+            message=f"OS error: {str(e)}"
+        )
+
+    except MemoryError:
+        return None, AnalysisIssue(
+            category=ErrorCategory.MEMORY_ERROR,
+            severity="error",
+            file_path=str(file_path),
+            message="File too large to fit in memory"
+        )
+
+    except Exception as e:
+        return None, AnalysisIssue(
+            category=ErrorCategory.GENERAL_ERROR,
+            severity="error",
+            file_path=str(file_path),
+            message=f"Unexpected error: {str(e)}"
+        )
+
+
+def fingerprint_file(options: PipelineOptions, task: Tuple[int, Path, str]) -> FileRecord:
+    """
+    Worker: read one file and reduce it to hashes and line ranges.
+
+    Args:
+        options: Detectors to run and thresholds
+        task: (index, file_path, language)
+
+    Returns:
+        FileRecord for the file
+    """
+    index, file_path, language = task
+    content, issue = read_source(file_path)
+    record = FileRecord(index=index, language=language, issue=issue, skipped=content is None)
+    if content is None:
+        return record
+    record.content_hash = compute_hash(content)
+
+    if options.run_exact:
+        if options.exact_engine == 'window':
+            record.blocks = [
+                (bytes.fromhex(block_hash), start_line, end_line)
+                for block_content, start_line, end_line, block_hash
+                in extract_code_blocks(file_path, content, language, options.min_lines)
+                if len(block_content) >= options.min_chars
+            ]
+        else:
+            record.stream = compact_token_stream(build_token_stream(file_path, content, language))
+
+    if language == 'python':
+        tree = None
+        if options.run_structural:
+            tree = parse_ast(content, language)
+            if tree is not None:
+                record.functions = [
+                    (bytes.fromhex(fp), start_line, end_line,
+                     function_signature(node) if options.near_miss else None)
+                    for fp, start_line, end_line, node in fingerprint_functions(tree, options.min_lines)
+                ]
+
+        if options.run_pattern:
+            for name, matches in catalog_scanner().scan(content, tree).items():
+                for n, match in enumerate(matches):
+                    # Only a pattern's first match can become its code sample
+                    code = match['code'] if n == 0 else None
+                    record.patterns.append((name, match['start_line'], match['end_line'], code))
+
+    return record
+
+
+@lru_cache(maxsize=64)
+def _source_lines(file_path: Path) -> Tuple[str, ...]:
+    """Lines of a file as the serial detectors split them, for code samples."""
+    content, _ = read_source(file_path)
+    return tuple((content or '').split('\n'))
+
+
+@lru_cache(maxsize=64)
+def _function_samples(file_path: Path, min_lines: int) -> Dict[Tuple[int, int], str]:
+    """Function code samples of a file, keyed by (start_line, end_line)."""
+    return function_samples('\n'.join(_source_lines(file_path)), min_lines)
+
+
+def read_sample(file_path: Path, start_line: int, end_line: int) -> str:
+    """Source lines start_line..end_line of a file, as a code sample."""
+    return '\n'.join(_source_lines(file_path)[start_line - 1:end_line])
+
+
+def block_sample(file_path: Path, start_line: int, end_line: int) -> str:
+    """Code sample of an exact block, as find_exact_duplicates builds it."""
+    return block_text(_source_lines(file_path), start_line, end_line)
+
+
+def function_sample(file_path: Path, start_line: int, end_line: int, min_lines: int) -> str:
+    """Code sample of a function, as find_structural_duplicates builds it."""
+    return _function_samples(file_path, min_lines).get((start_line, end_line), '')
+
+
+def pattern_sample(file_path: Path, name: str, start_line: int, end_line: int) -> str:
+    """
+    Code sample of a pattern match, as the scanner reported it.
+
+    For readers that kept only the match's line range (the fingerprint
+    index); falls back to the raw lines if the file no longer has the match.
+    """
+    matches = catalog_scanner().scan('\n'.join(_source_lines(file_path))).get(name, [])
+    for match in matches:
+        if (match['start_line'], match['end_line']) == (start_line, end_line):
+            return match['code']
+    return read_sample(file_path, start_line, end_line)
+
+
+def clear_sample_cache() -> None:
+    """Drop the files read for code samples."""
+    _source_lines.cache_clear()
+    _function_samples.cache_clear()
+
+
+def merge_ranges(
+    groups: Dict[bytes, List[Tuple[int, int, int]]],
+    file_paths: List[Path],
+    read_code: Callable[[Path, int, int], str] = read_sample
+) -> Dict[str, List[Dict]]:
+    """
+    Expand digest groups with two or more instances into detector dicts.
+
+    Args:
+        groups: Digest -> list of (file index, start_line, end_line)
+        file_paths: Paths indexed by file index
+        read_code: Builds the code sample from (file, start_line, end_line)
+
+    Returns:
+        Hex digest -> instance dicts; the first instance carries the code
+        sample as both content and code
+    """
+    merged = {}
+    for digest, ranges in groups.items():
+        if len(ranges) < 2:
+            continue
+        instances = [{
+            'file': file_paths[index],
+            'start_line': start_line,
+            'end_line': end_line,
+            'line_count': end_line - start_line + 1,
+        } for index, start_line, end_line in ranges]
+        first = instances[0]
+        sample = read_code(first['file'], first['start_line'], first['end_line'])
+        first['content'] = first['code'] = sample
+        merged[digest.hex()] = instances
+    return merged
+
+
+def iter_records(
+    files: List[Tuple[Path, str]],
+    options: PipelineOptions,
+    jobs: int
+) -> Iterator[FileRecord]:
+    """
+    Fingerprint files across a process pool, yielding records in file order.
+
+    Args:
+        files: (file_path, language) pairs to analyze
+        options: Detectors to run and thresholds
+        jobs: Worker processes (1 = fingerprint in this process)
+
+    Yields:
+        One FileRecord per file
+    """
+    tasks = ((index, file_path, language) for index, (file_path, language) in enumerate(files))
+    if jobs == 1:
+        yield from map(partial(fingerprint_file, options), tasks)
+        return
+    chunksize = max(1, len(files) // (jobs * 8))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(partial(fingerprint_file, options), tasks, chunksize=chunksize)
+
+
+def run_parallel_pipeline(
+    files: List[Tuple[Path, str]],
+    options: PipelineOptions,
+    jobs: Optional[int] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None
+) -> PipelineResult:
+    """
+    Run the selected detectors with a process pool and merge the results.
+
+    Reports the same duplicates, with the same hashes and code samples, as
+    the serial detectors.
+
+    Args:
+        files: (file_path, language) pairs to analyze
+        options: Detectors to run and thresholds
+        jobs: Worker processes (default: one per CPU)
+        on_progress: Called with (files done, total) as records arrive
+
+    Returns:
+        PipelineResult with merged duplicates, issues and skipped count
+    """
+    jobs = jobs or os.cpu_count() or 1
+    file_paths = [file_path for file_path, _ in files]
+
+    files_content: List[Tuple[Path, str, str]] = []
+    issues: List[AnalysisIssue] = []
+    skipped_files = 0
+
+    blocks: Dict[bytes, List[Tuple[int, int, int]]] = {}
+    functions: Dict[bytes, List[Tuple[int, int, int]]] = {}
+    near_miss_functions: List[Dict] = []
+    streams: List[TokenStream] = []
+    pattern_matches: Dict[str, List[Dict]] = {}
+
+    for done, record in enumerate(iter_records(files, options, jobs), start=1):
+        file_path = file_paths[record.index]
+        if record.issue:
+            issues.append(record.issue)
+        if record.skipped:
+            skipped_files += 1
+            continue
+
+        files_content.append((file_path, '', record.language))
+        for digest, start_line, end_line in record.blocks:
+            blocks.setdefault(digest, []).append((record.index, start_line, end_line))
+        for digest, start_line, end_line, signature in record.functions:
+            functions.setdefault(digest, []).append((record.index, start_line, end_line))
+            if signature is not None:
+                near_miss_functions.append({
+                    'fingerprint': digest.hex(),
+                    'file': file_path,
+                    'start_line': start_line,
+                    'end_line': end_line,
+                    'signature': signature,
+                })
+        if record.stream is not None:
+            streams.append(record.stream)
+        for name, start_line, end_line, code in record.patterns:
+            match = {'file': file_path, 'start_line': start_line, 'end_line': end_line}
+            if code is not None:
+                match['code'] = code
+            pattern_matches.setdefault(name, []).append(match)
+
+        if on_progress:
+            on_progress(done, len(file_paths))
+
+    exact: List[DuplicateBlock] = []
+    if options.run_exact:
+        if options.exact_engine == 'rolling':
+            exact = find_stream_duplicates_rolling(streams, options.min_lines, options.min_chars)
+        elif options.exact_engine == 'suffix-array':
+            exact = find_stream_duplicates_suffix_array(streams, options.min_lines, options.min_chars)
+        else:
+            exact = build_exact_duplicates(merge_ranges(blocks, file_paths, block_sample))
+
+    structural: List[DuplicateBlock] = []
+    if options.run_structural:
+        read_function = partial(function_sample, min_lines=options.min_lines)
+        structural = build_structural_duplicates(merge_ranges(functions, file_paths, read_function))
+        if options.near_miss:
+            structural += build_near_miss_duplicates(
+                near_miss_functions,
+                options.similarity_threshold,
+                read_code=lambda f: read_function(f['file'], f['start_line'], f['end_line']),
+                first_id=len(structural) + 1
+            )
+
+    pattern: List[DuplicateBlock] = []
+    if options.run_pattern:
+        # Records arrive in file order, so each pattern's first match carries its code
+        pattern = build_pattern_duplicates(pattern_matches, load_patterns(), options.min_occurrences)
+
+    clear_sample_cache()
+
+    return PipelineResult(
+        files_content=files_content,
+        exact=exact,
+        structural=structural,
+        pattern=pattern,
+        issues=issues,
+        skipped_files=skipped_files,
+        fingerprinted=len(files)
+    )
+
+
+# Export public API
+__all__ = [
+    'PipelineOptions',
+    'FileRecord',
+    'PipelineResult',
+    'read_source',
+    'fingerprint_file',
+    'iter_records',
+    'merge_ranges',
+    'read_sample',
+    'block_sample',
+    'function_sample',
+    'pattern_sample',
+    'clear_sample_cache',
+    'run_parallel_pipeline',
+]
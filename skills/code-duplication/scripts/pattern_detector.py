@@ -4,10 +4,17 @@ Pattern Duplicate Detection for Code Duplication Analysis Skill
 
 Detects common code patterns that appear repeatedly and suggests
 refactoring into shared utilities or design patterns.
+
+PatternScanner compiles a pattern list once and scans each file in one
+call: a single combined search over the patterns' literals decides which
+regexes can match at all, line numbers come from a newline offset table
+by bisection, and every AST pattern is matched during one shared walk.
 """
 
 import re
 import ast
+from bisect import bisect_left
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
@@ -24,10 +31,14 @@ class Pattern:
         name: Pattern name (e.g., "try-catch-logging")
         description: Human-readable description
         regex_pattern: Regex pattern to match (None if AST-based)
-        ast_pattern: AST pattern to match (None if regex-based)
+        ast_pattern: AST pattern to match (None if regex-based), as a path
+            of node type names joined by "/" where each node is a direct
+            child of the previous one (e.g. "ExceptHandler/Pass")
         min_occurrences: Minimum occurrences to report (default: 3)
         refactoring_suggestion: How to refactor this pattern
         estimated_loc_reduction: Lines saved per instance refactored
+        literal: Text every regex match contains; files without it are
+            not searched with regex_pattern (None to always search)
     """
     name: str
     description: str
@@ -36,6 +47,7 @@ class Pattern:
     min_occurrences: int = 3
     refactoring_suggestion: str = ""
     estimated_loc_reduction: int = 3
+    literal: Optional[str] = None
 
 
 # Pattern Catalog - Common duplicated patterns
@@ -45,7 +57,8 @@ PATTERN_CATALOG = [
         description="Try-catch blocks with logging",
         regex_pattern=r'try:\s+.*?\s+except\s+\w+\s+as\s+\w+:\s+.*?(?:logging|logger|log)\.',
         refactoring_suggestion="Extract into a @retry_with_logging decorator or error handling utility function",
-        estimated_loc_reduction=5
+        estimated_loc_reduction=5,
+        literal="except"
     ),
 
     Pattern(
@@ -53,7 +66,8 @@ PATTERN_CATALOG = [
         description="Null/None checking pattern",
         regex_pattern=r'if\s+\w+\s+is\s+not\s+None:\s+',
         refactoring_suggestion="Use Optional type hints and early returns, or extract validation into a helper",
-        estimated_loc_reduction=2
+        estimated_loc_reduction=2,
+        literal="None"
     ),
 
     Pattern(
@@ -61,7 +75,8 @@ PATTERN_CATALOG = [
         description="Environment variable access with default",
         regex_pattern=r'os\.getenv\(["\'][\w_]+["\']\s*,\s*["\'].*?["\']\)',
         refactoring_suggestion="Create a config class with typed environment variable accessors",
-        estimated_loc_reduction=3
+        estimated_loc_reduction=3,
+        literal="os.getenv("
     ),
 
     Pattern(
@@ -69,7 +84,8 @@ PATTERN_CATALOG = [
         description="Input validation pattern",
         regex_pattern=r'if\s+not\s+\w+:\s+raise\s+ValueError\(["\'].*?["\']\)',
         refactoring_suggestion="Create a validation decorator or use a validation library (pydantic, marshmallow)",
-        estimated_loc_reduction=4
+        estimated_loc_reduction=4,
+        literal="ValueError("
     ),
 
     Pattern(
@@ -77,7 +93,8 @@ PATTERN_CATALOG = [
         description="File open with explicit close",
         regex_pattern=r'(\w+)\s*=\s*open\([^)]+\).*?(?:\1\.close\(\)|finally:.*?\1\.close\(\))',
         refactoring_suggestion="Use context manager (with open() as f:) instead of explicit close",
-        estimated_loc_reduction=3
+        estimated_loc_reduction=3,
+        literal="open("
     ),
 
     Pattern(
@@ -85,7 +102,8 @@ PATTERN_CATALOG = [
         description="Dictionary get with default value",
         regex_pattern=r'\w+\.get\(["\'][\w_]+["\']\s*,\s*["\'].*?["\']\)',
         refactoring_suggestion="Consider using defaultdict or dataclass with default values",
-        estimated_loc_reduction=1
+        estimated_loc_reduction=1,
+        literal=".get("
     ),
 
     Pattern(
@@ -93,7 +111,8 @@ PATTERN_CATALOG = [
         description="List comprehension with filter",
         regex_pattern=r'\[\s*\w+\s+for\s+\w+\s+in\s+\w+\s+if\s+.+?\]',
         refactoring_suggestion="Extract complex list comprehensions into named functions for readability",
-        estimated_loc_reduction=2
+        estimated_loc_reduction=2,
+        literal="for"
     ),
 
     Pattern(
@@ -101,7 +120,8 @@ PATTERN_CATALOG = [
         description="String formatting pattern",
         regex_pattern=r'["\'].*?%[sdf].*?["\']\s*%\s*\(',
         refactoring_suggestion="Use f-strings for cleaner string formatting",
-        estimated_loc_reduction=1
+        estimated_loc_reduction=1,
+        literal="%"
     ),
 
     Pattern(
@@ -109,7 +129,8 @@ PATTERN_CATALOG = [
         description="API request with status code check",
         regex_pattern=r'response\s*=\s*requests\.\w+\(.*?\).*?if\s+response\.status_code\s*[!=]=\s*200:',
         refactoring_suggestion="Create an API client wrapper with automatic error handling and retries",
-        estimated_loc_reduction=6
+        estimated_loc_reduction=6,
+        literal="requests."
     ),
 
     Pattern(
@@ -117,7 +138,8 @@ PATTERN_CATALOG = [
         description="Database connection pattern",
         regex_pattern=r'connection\s*=\s*\w+\.connect\(.*?\).*?cursor\s*=\s*connection\.cursor\(\)',
         refactoring_suggestion="Use connection pooling or ORM (SQLAlchemy, Django ORM) for database access",
-        estimated_loc_reduction=5
+        estimated_loc_reduction=5,
+        literal="connection.cursor()"
     ),
 
     Pattern(
@@ -125,7 +147,8 @@ PATTERN_CATALOG = [
         description="Date/time parsing pattern",
         regex_pattern=r'datetime\.strptime\([^)]+,\s*["\']%[YmdHMS%-]+["\']\)',
         refactoring_suggestion="Create a date utility module with common date parsing functions",
-        estimated_loc_reduction=2
+        estimated_loc_reduction=2,
+        literal="strptime("
     ),
 
     Pattern(
@@ -133,7 +156,16 @@ PATTERN_CATALOG = [
         description="JSON parsing with exception handling",
         regex_pattern=r'try:\s+.*?json\.loads\(.*?\).*?except\s+(?:json\.)?JSONDecodeError:',
         refactoring_suggestion="Create a safe_json_loads() utility function",
-        estimated_loc_reduction=4
+        estimated_loc_reduction=4,
+        literal="JSONDecodeError:"
+    ),
+
+    Pattern(
+        name="silent-except",
+        description="Exception handler that silently passes",
+        ast_pattern="ExceptHandler/Pass",
+        refactoring_suggestion="Log or re-raise, or use contextlib.suppress() for exceptions that are truly expected",
+        estimated_loc_reduction=1
     ),
 ]
 
@@ -155,6 +187,161 @@ def load_patterns() -> List[Pattern]:
     return PATTERN_CATALOG.copy()
 
 
+def line_offsets(source: str) -> List[int]:
+    """
+    Positions of every newline in source, for line lookups by bisection.
+
+    Example:
+        >>> line_offsets("a\\nb\\nc")
+        [1, 3]
+    """
+    offsets = []
+    position = source.find('\n')
+    while position != -1:
+        offsets.append(position)
+        position = source.find('\n', position + 1)
+    return offsets
+
+
+def line_at(offsets: List[int], position: int) -> int:
+    """1-based line of a character position, given line_offsets(source)."""
+    return bisect_left(offsets, position) + 1
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """Whether occurrences of a and b can share characters in some text."""
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:k]) or b.endswith(a[:k]) for k in range(1, min(len(a), len(b))))
+
+
+class PatternScanner:
+    """
+    Matches a fixed list of patterns against whole files.
+
+    Regexes are compiled once. Each scan searches the source once for all
+    pattern literals (one combined regex), runs only the regexes whose
+    literal occurs, and resolves every match's lines from one newline
+    offset table. AST patterns are matched in a single walk of one parse.
+
+    Example:
+        >>> scanner = PatternScanner(load_patterns())
+        >>> found = scanner.scan("if not value: raise ValueError('Invalid')")
+        >>> [m['start_line'] for m in found['input-validation']]
+        [1]
+    """
+
+    def __init__(self, patterns: List[Pattern]):
+        self.patterns = list(patterns)
+        self._regexes: List[Tuple[Pattern, 're.Pattern']] = [
+            (pattern, re.compile(pattern.regex_pattern, re.MULTILINE | re.DOTALL))
+            for pattern in self.patterns if pattern.regex_pattern
+        ]
+        literals = sorted({p.literal for p, _ in self._regexes if p.literal}, key=len, reverse=True)
+        self._literals = re.compile('|'.join(map(re.escape, literals))) if literals else None
+        # The combined search reports non-overlapping hits, so a literal that
+        # can overlap another may be hidden and has to be checked directly
+        self._shadowed = {a for a in literals for b in literals if a != b and _overlaps(a, b)}
+
+        # Last path step -> (pattern, path) so each node is checked only
+        # against the patterns that can end at its type
+        self._ast_paths: Dict[str, List[Tuple[Pattern, List[str]]]] = {}
+        for pattern in self.patterns:
+            if pattern.ast_pattern and not pattern.regex_pattern:
+                path = pattern.ast_pattern.split('/')
+                self._ast_paths.setdefault(path[-1], []).append((pattern, path))
+        self._ast_depth = max((len(path) for entries in self._ast_paths.values()
+                               for _, path in entries), default=0)
+
+    def scan(self, source: str, tree: Optional[ast.AST] = None) -> Dict[str, List[Dict]]:
+        """
+        Match every pattern against one file.
+
+        Args:
+            source: Source code to search
+            tree: Parsed source, if the caller already has it (AST
+                patterns parse source otherwise)
+
+        Returns:
+            Pattern name -> match dicts (start_line, end_line, code,
+            pattern) in source order, for patterns with at least one match,
+            in pattern order
+        """
+        found: Dict[str, List[Dict]] = {}
+        offsets: Optional[List[int]] = None
+
+        present = None
+        if self._literals is not None:
+            present = set(self._literals.findall(source))
+
+        for pattern, regex in self._regexes:
+            literal = pattern.literal
+            if literal and literal not in present:
+                if literal not in self._shadowed or literal not in source:
+                    continue
+            matches = []
+            for match in regex.finditer(source):
+                if offsets is None:
+                    offsets = line_offsets(source)
+                matches.append({
+                    'start_line': line_at(offsets, match.start()),
+                    'end_line': line_at(offsets, match.end()),
+                    'code': match.group(0).strip(),
+                    'pattern': pattern
+                })
+            if matches:
+                found[pattern.name] = matches
+
+        if self._ast_paths:
+            found.update(self._scan_ast(source, tree))
+
+        # Keep pattern order regardless of engine
+        return {p.name: found[p.name] for p in self.patterns if p.name in found}
+
+    def _scan_ast(self, source: str, tree: Optional[ast.AST]) -> Dict[str, List[Dict]]:
+        """Match all AST patterns in one walk; each match is its path's top node."""
+        if tree is None:
+            try:
+                tree = ast.parse(source)
+            except (SyntaxError, ValueError):
+                return {}
+
+        tops: Dict[str, Dict[int, ast.AST]] = {}
+        keep = self._ast_depth - 1
+        # (node, nearest ancestors, innermost last, at most keep of them)
+        stack: List[Tuple[ast.AST, Tuple[ast.AST, ...]]] = [(tree, ())]
+        while stack:
+            node, ancestors = stack.pop()
+            for pattern, path in self._ast_paths.get(type(node).__name__, ()):
+                steps = len(path) - 1
+                if steps > len(ancestors):
+                    continue
+                chain = ancestors[len(ancestors) - steps:] if steps else ()
+                if all(type(a).__name__ == name for a, name in zip(chain, path)):
+                    top = chain[0] if chain else node
+                    tops.setdefault(pattern.name, {})[id(top)] = top
+            below = (ancestors + (node,))[-keep:] if keep else ()
+            stack.extend((child, below) for child in ast.iter_child_nodes(node))
+
+        patterns = {p.name: p for p in self.patterns}
+        found = {}
+        for name, nodes in tops.items():
+            ordered = sorted(nodes.values(), key=lambda n: (n.lineno, n.col_offset))
+            found[name] = [{
+                'start_line': node.lineno,
+                'end_line': node.end_lineno or node.lineno,
+                'code': (ast.get_source_segment(source, node) or '').strip(),
+                'pattern': patterns[name]
+            } for node in ordered]
+        return found
+
+
+@lru_cache(maxsize=1)
+def catalog_scanner() -> PatternScanner:
+    """Shared scanner over the full pattern catalog."""
+    return PatternScanner(load_patterns())
+
+
 def match_pattern(
     source: str,
     pattern: Pattern,
@@ -163,6 +350,8 @@ def match_pattern(
     """
     Match a pattern against source code.
 
+    To match several patterns, scan once with a PatternScanner instead.
+
     Args:
         source: Source code to search
         pattern: Pattern to match
@@ -182,37 +371,7 @@ def match_pattern(
         >>> len(matches) > 0
         True
     """
-    matches = []
-
-    if pattern.regex_pattern:
-        # Regex-based matching
-        lines = source.split('\n')
-
-        # Try multiline matching
-        for match in re.finditer(pattern.regex_pattern, source, re.MULTILINE | re.DOTALL):
-            matched_text = match.group(0)
-
-            # Find line numbers
-            start_pos = match.start()
-            end_pos = match.end()
-
-            # Count newlines before match to get start line
-            start_line = source[:start_pos].count('\n') + 1
-            end_line = source[:end_pos].count('\n') + 1
-
-            matches.append({
-                'start_line': start_line,
-                'end_line': end_line,
-                'code': matched_text.strip(),
-                'pattern': pattern
-            })
-
-    elif pattern.ast_pattern:
-        # AST-based matching (future enhancement)
-        # For now, skip AST patterns
-        pass
-
-    return matches
+    return PatternScanner([pattern]).scan(source).get(pattern.name, [])
 
 
 def detect_pattern_duplicates(
@@ -239,6 +398,9 @@ def detect_pattern_duplicates(
     """
     if patterns is None:
         patterns = load_patterns()
+        scanner = catalog_scanner()
+    else:
+        scanner = PatternScanner(patterns)
 
     # Match all patterns across all files
     pattern_matches: Dict[str, List[Dict]] = {}
@@ -247,22 +409,33 @@ def detect_pattern_duplicates(
         if language != 'python':
             continue  # Only Python patterns for now
 
-        for pattern in patterns:
-            matches = match_pattern(content, pattern, file_path)
+        for pattern_key, matches in scanner.scan(content).items():
+            # Store matches with file info, grouped by pattern name
+            for match in matches:
+                match['file'] = file_path
+            pattern_matches.setdefault(pattern_key, []).extend(matches)
 
-            if not matches:
-                continue
+    return build_pattern_duplicates(pattern_matches, patterns, min_occurrences)
 
-            # Group by pattern name
-            pattern_key = pattern.name
-            if pattern_key not in pattern_matches:
-                pattern_matches[pattern_key] = []
 
-            # Store matches with file info
-            for match in matches:
-                match['file'] = file_path
-                pattern_matches[pattern_key].append(match)
+def build_pattern_duplicates(
+    pattern_matches: Dict[str, List[Dict]],
+    patterns: List[Pattern],
+    min_occurrences: int = 3
+) -> List[DuplicateBlock]:
+    """
+    Turn matches grouped by pattern name into pattern DuplicateBlocks.
 
+    Args:
+        pattern_matches: Pattern name -> list of dicts with file,
+            start_line, end_line and code (only the first match's code is
+            used, as the code sample)
+        patterns: Patterns that were matched
+        min_occurrences: Minimum occurrences to report
+
+    Returns:
+        List of DuplicateBlock objects with type=PATTERN, highest impact first
+    """
     # Convert to DuplicateBlock objects
     duplicates = []
     duplicate_id = 1
@@ -351,20 +524,16 @@ def find_all_patterns(
         >>> isinstance(counts, dict)
         True
     """
-    patterns = load_patterns()
+    scanner = catalog_scanner()
     counts = {}
 
     for file_path, content, language in files_content:
         if language != 'python':
             continue
 
-        for pattern in patterns:
-            matches = match_pattern(content, pattern, file_path)
-
-            if pattern.name not in counts:
-                counts[pattern.name] = 0
-
-            counts[pattern.name] += len(matches)
+        found = scanner.scan(content)
+        for pattern in scanner.patterns:
+            counts[pattern.name] = counts.get(pattern.name, 0) + len(found.get(pattern.name, ()))
 
     return counts
 
@@ -372,9 +541,14 @@ def find_all_patterns(
 # Export public API
 __all__ = [
     'Pattern',
+    'PatternScanner',
     'load_patterns',
+    'catalog_scanner',
+    'line_offsets',
+    'line_at',
     'match_pattern',
     'detect_pattern_duplicates',
+    'build_pattern_duplicates',
     'find_all_patterns',
     'PATTERN_CATALOG',
 ]
@@ -3,10 +3,19 @@
 Report Generator for Code Duplication Analysis Skill
 
 Generates comprehensive markdown reports with duplicate listings,
-metrics, and refactoring suggestions.
+metrics, and refactoring suggestions, plus CSV, JSON Lines and SARIF
+exports.
+
+Reports and exports are written to a file handle one duplicate at a time,
+with code samples cut to MAX_SAMPLE_LINES / MAX_SAMPLE_CHARS, so output
+size in memory does not grow with the number of duplicates. Totals the
+report needs before or after the listings come from
+metrics_calculator.DuplicationAggregates.
 """
 
-from typing import List, Tuple, Optional, Dict
+import io
+import json
+from typing import Iterable, List, Tuple, Optional, Dict, TextIO
 from pathlib import Path
 from datetime import datetime
 
@@ -22,6 +31,50 @@ from models import (
 from heatmap_renderer import render_heatmap_text
 
 
+# Code samples longer than this are truncated in reports and exports
+MAX_SAMPLE_LINES = 15
+MAX_SAMPLE_CHARS = 2000
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+
+def truncate_sample(
+    sample: str,
+    max_lines: int = MAX_SAMPLE_LINES,
+    max_chars: int = MAX_SAMPLE_CHARS
+) -> Tuple[List[str], bool]:
+    """
+    Cut a code sample to at most max_lines lines and max_chars characters.
+
+    Args:
+        sample: Code sample
+        max_lines: Most lines to keep
+        max_chars: Most characters to keep (newlines excluded)
+
+    Returns:
+        (kept lines, whether anything was cut)
+
+    Example:
+        >>> truncate_sample("a\\nb\\nc", max_lines=2)
+        (['a', 'b'], True)
+    """
+    kept = []
+    remaining = max_chars
+    truncated = False
+    # Split no further than needed: huge samples are not split in full
+    lines = sample.split('\n', max_lines)
+    for line in lines[:max_lines]:
+        if len(line) > remaining:
+            kept.append(line[:remaining])
+            truncated = True
+            break
+        kept.append(line)
+        remaining -= len(line)
+    if len(lines) > max_lines:
+        truncated = True
+    return kept, truncated
+
+
 def format_duplicate_block(
     duplicate: DuplicateBlock,
     index: int,
@@ -76,12 +129,10 @@ def format_duplicate_block(
         lines.append("**Code Sample:**")
         lines.append("```python")
         # Truncate long samples
-        sample_lines = duplicate.code_sample.split('\n')
-        if len(sample_lines) > 15:
-            lines.extend(sample_lines[:15])
+        sample_lines, truncated = truncate_sample(duplicate.code_sample)
+        lines.extend(sample_lines)
+        if truncated:
             lines.append("... (truncated)")
-        else:
-            lines.extend(sample_lines)
         lines.append("```")
         lines.append("")
 
@@ -104,7 +155,12 @@ def format_duplicate_block(
         if duplicate.suggestion.example_code:
             lines.append("**Example Refactored Code:**")
             lines.append("```python")
-            lines.append(duplicate.suggestion.example_code)
+            example_lines, truncated = truncate_sample(
+                duplicate.suggestion.example_code, max_lines=len(duplicate.suggestion.example_code)
+            )
+            lines.extend(example_lines)
+            if truncated:
+                lines.append("... (truncated)")
             lines.append("```")
             lines.append("")
 
@@ -114,30 +170,26 @@ def format_duplicate_block(
     return '\n'.join(lines)
 
 
-def format_duplicate_listings(
-    duplicates: List[DuplicateBlock],
+def write_duplicate_listings(
+    handle: TextIO,
+    duplicates: Iterable[DuplicateBlock],
+    total: int,
     max_duplicates: Optional[int] = None
-) -> str:
+) -> None:
     """
-    Format all duplicates for report with optional limit.
+    Write the duplicate listings section, one block at a time.
+
+    Only the first max_duplicates items of duplicates are consumed.
 
     Args:
-        duplicates: List of duplicates to format
+        handle: Text stream to write to
+        duplicates: Duplicates in report order (may be a generator)
+        total: Number of duplicates in all
         max_duplicates: Maximum number to include (None = all)
-
-    Returns:
-        Formatted markdown string
-
-    Example:
-        >>> duplicates = [DuplicateBlock(...), DuplicateBlock(...)]
-        >>> report = format_duplicate_listings(duplicates, max_duplicates=10)
-        >>> "## Duplicate Blocks" in report
-        True
     """
     lines = []
 
     # Header
-    total = len(duplicates)
     showing = min(total, max_duplicates) if max_duplicates else total
 
     lines.append("## 📋 Duplicate Blocks")
@@ -148,21 +200,44 @@ def format_duplicate_listings(
         lines.append(f"Showing top **{showing}** by severity.")
 
     lines.append("")
+    handle.write('\n'.join(lines))
 
     # Format each duplicate
-    duplicates_to_show = duplicates[:max_duplicates] if max_duplicates else duplicates
-
-    for idx, duplicate in enumerate(duplicates_to_show, 1):
-        formatted = format_duplicate_block(duplicate, idx, showing)
-        lines.append(formatted)
+    for idx, duplicate in enumerate(duplicates, 1):
+        if idx > showing:
+            break
+        handle.write('\n')
+        handle.write(format_duplicate_block(duplicate, idx, showing))
 
     # Note about truncation
     if max_duplicates and total > max_duplicates:
         remaining = total - max_duplicates
-        lines.append(f"_... and {remaining} more duplicates not shown._")
-        lines.append("")
+        handle.write(f"\n_... and {remaining} more duplicates not shown._\n")
 
-    return '\n'.join(lines)
+
+def format_duplicate_listings(
+    duplicates: List[DuplicateBlock],
+    max_duplicates: Optional[int] = None
+) -> str:
+    """
+    Format all duplicates for report with optional limit.
+
+    Args:
+        duplicates: List of duplicates to format
+        max_duplicates: Maximum number to include (None = all)
+
+    Returns:
+        Formatted markdown string
+
+    Example:
+        >>> duplicates = [DuplicateBlock(...), DuplicateBlock(...)]
+        >>> report = format_duplicate_listings(duplicates, max_duplicates=10)
+        >>> "## Duplicate Blocks" in report
+        True
+    """
+    buffer = io.StringIO()
+    write_duplicate_listings(buffer, duplicates, len(duplicates), max_duplicates)
+    return buffer.getvalue()
 
 
 def create_summary_section(
@@ -361,18 +436,36 @@ def create_recommendations_section(
         >>> "## Recommendations" in recs
         True
     """
+    total_reduction = 0
+    difficulty_counts: Dict[str, int] = {}
+    for dup in duplicates:
+        if dup.suggestion:
+            total_reduction += dup.suggestion.estimated_loc_reduction
+            difficulty = dup.suggestion.difficulty
+            difficulty_counts[difficulty] = difficulty_counts.get(difficulty, 0) + 1
+
+    return format_recommendations(total_reduction, difficulty_counts)
+
+
+def format_recommendations(
+    total_reduction: int,
+    difficulty_counts: Dict[str, int]
+) -> str:
+    """
+    Format the recommendations section from precomputed totals.
+
+    Args:
+        total_reduction: Sum of the suggestions' estimated LOC reductions
+        difficulty_counts: Number of suggestions per difficulty
+
+    Returns:
+        Formatted markdown recommendations
+    """
     lines = []
 
     lines.append("## 💡 Recommendations")
     lines.append("")
 
-    # Calculate potential LOC reduction
-    total_reduction = sum(
-        dup.suggestion.estimated_loc_reduction
-        for dup in duplicates
-        if dup.suggestion
-    )
-
     if total_reduction > 0:
         lines.append(f"**Potential LOC Reduction:** ~{total_reduction:,} lines")
         lines.append("")
@@ -382,9 +475,9 @@ def create_recommendations_section(
     lines.append("")
 
     # Group by difficulty
-    easy_count = sum(1 for d in duplicates if d.suggestion and d.suggestion.difficulty == 'easy')
-    medium_count = sum(1 for d in duplicates if d.suggestion and d.suggestion.difficulty == 'medium')
-    hard_count = sum(1 for d in duplicates if d.suggestion and d.suggestion.difficulty == 'hard')
+    easy_count = difficulty_counts.get('easy', 0)
+    medium_count = difficulty_counts.get('medium', 0)
+    hard_count = difficulty_counts.get('hard', 0)
 
     if easy_count > 0:
         lines.append(f"**🟢 Quick Wins ({easy_count} easy tasks):**")
@@ -420,32 +513,33 @@ def create_recommendations_section(
     return '\n'.join(lines)
 
 
-def generate_report(
-    duplicates: List[DuplicateBlock],
+def write_report(
+    handle: TextIO,
+    duplicates: Iterable[DuplicateBlock],
     summary: AnalysisSummary,
     offenders: List[FileOffender],
     heatmap: Optional[HeatmapData] = None,
-    output_path: Optional[Path] = None,
-    max_duplicates: Optional[int] = 50
-) -> str:
+    max_duplicates: Optional[int] = 50,
+    total_reduction: Optional[int] = None,
+    difficulty_counts: Optional[Dict[str, int]] = None
+) -> None:
     """
-    Generate comprehensive markdown report.
+    Write the markdown report section by section.
+
+    Only the listed duplicates are consumed from duplicates, so it can be a
+    generator when total_reduction and difficulty_counts are given (e.g.
+    from DuplicationAggregates); otherwise it must be a list and they are
+    computed from it.
 
     Args:
-        duplicates: List of all duplicates
-        summary: Analysis summary metrics
+        handle: Text stream to write to
+        duplicates: Duplicates in report order
+        summary: Analysis summary metrics (duplicate_blocks is the total)
         offenders: Top file offenders
         heatmap: Optional heatmap data
-        output_path: Optional path to write report
         max_duplicates: Maximum duplicates to include in detail
-
-    Returns:
-        Complete markdown report string
-
-    Example:
-        >>> report = generate_report(duplicates, summary, offenders)
-        >>> "# Code Duplication Analysis Report" in report
-        True
+        total_reduction: Sum of estimated LOC reductions
+        difficulty_counts: Number of suggestions per difficulty
     """
     lines = []
 
@@ -476,49 +570,121 @@ def generate_report(
     lines.append("")
 
     # Summary section
-    summary_section = create_summary_section(summary, offenders, heatmap)
-    lines.append(summary_section)
+    lines.append(create_summary_section(summary, offenders, heatmap))
 
     # Issues section (if any)
     if summary.issues:
-        issues_section = create_issues_section(summary)
-        lines.append(issues_section)
+        lines.append(create_issues_section(summary))
+
+    handle.write('\n'.join(lines))
 
     # Duplicates section
-    duplicates_section = format_duplicate_listings(duplicates, max_duplicates)
-    lines.append(duplicates_section)
+    handle.write('\n')
+    write_duplicate_listings(handle, duplicates, summary.duplicate_blocks, max_duplicates)
 
     # Recommendations section
-    recommendations_section = create_recommendations_section(duplicates, summary)
-    lines.append(recommendations_section)
+    if total_reduction is None or difficulty_counts is None:
+        recommendations = create_recommendations_section(duplicates, summary)
+    else:
+        recommendations = format_recommendations(total_reduction, difficulty_counts)
+    handle.write('\n')
+    handle.write(recommendations)
 
     # Footer
-    lines.append("---")
-    lines.append("")
-    lines.append("*Report generated by Code Duplication Analysis Skill*")
-    lines.append("")
+    handle.write('\n---\n\n*Report generated by Code Duplication Analysis Skill*\n')
 
-    # Combine all sections
-    report = '\n'.join(lines)
+
+def _write_output(output_path: Path, kind: str, write, newline: Optional[str] = None) -> None:
+    """Open output_path for writing and call write(handle), mapping errors like the exports."""
+    try:
+        # Ensure parent directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with output_path.open('w', encoding='utf-8', newline=newline) as handle:
+            write(handle)
+    except PermissionError as e:
+        raise PermissionError(f"Cannot write to {output_path}: Permission denied")
+    except OSError as e:
+        # Re-raise OSError (includes disk full, etc.)
+        raise
+    except Exception as e:
+        raise IOError(f"Failed to write {kind} to {output_path}: {str(e)}")
+
+
+def generate_report(
+    duplicates: List[DuplicateBlock],
+    summary: AnalysisSummary,
+    offenders: List[FileOffender],
+    heatmap: Optional[HeatmapData] = None,
+    output_path: Optional[Path] = None,
+    max_duplicates: Optional[int] = 50
+) -> str:
+    """
+    Generate comprehensive markdown report.
+
+    Builds the whole report in memory; use stream_report to write large
+    reports straight to a file.
+
+    Args:
+        duplicates: List of all duplicates
+        summary: Analysis summary metrics
+        offenders: Top file offenders
+        heatmap: Optional heatmap data
+        output_path: Optional path to write report
+        max_duplicates: Maximum duplicates to include in detail
+
+    Returns:
+        Complete markdown report string
+
+    Example:
+        >>> report = generate_report(duplicates, summary, offenders)
+        >>> "# Code Duplication Analysis Report" in report
+        True
+    """
+    buffer = io.StringIO()
+    write_report(buffer, duplicates, summary, offenders, heatmap, max_duplicates)
+    report = buffer.getvalue()
 
     # Write to file if path provided
     if output_path:
-        try:
-            # Ensure parent directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            # Write report
-            output_path.write_text(report, encoding='utf-8')
-        except PermissionError as e:
-            raise PermissionError(f"Cannot write to {output_path}: Permission denied")
-        except OSError as e:
-            # Re-raise OSError (includes disk full, etc.)
-            raise
-        except Exception as e:
-            raise IOError(f"Failed to write report to {output_path}: {str(e)}")
+        _write_output(output_path, 'report', lambda handle: handle.write(report))
 
     return report
 
 
+def stream_report(
+    duplicates: Iterable[DuplicateBlock],
+    summary: AnalysisSummary,
+    offenders: List[FileOffender],
+    output_path: Path,
+    heatmap: Optional[HeatmapData] = None,
+    max_duplicates: Optional[int] = 50,
+    total_reduction: Optional[int] = None,
+    difficulty_counts: Optional[Dict[str, int]] = None
+) -> None:
+    """
+    Write the markdown report to output_path without building it in memory.
+
+    Args:
+        duplicates: Duplicates in report order (see write_report)
+        summary: Analysis summary metrics
+        offenders: Top file offenders
+        output_path: Path to write report
+        heatmap: Optional heatmap data
+        max_duplicates: Maximum duplicates to include in detail
+        total_reduction: Sum of estimated LOC reductions
+        difficulty_counts: Number of suggestions per difficulty
+
+    Raises:
+        PermissionError: If cannot write to output path
+        OSError: If disk full or other OS error
+        IOError: If other write error occurs
+    """
+    _write_output(output_path, 'report', lambda handle: write_report(
+        handle, duplicates, summary, offenders, heatmap, max_duplicates,
+        total_reduction, difficulty_counts
+    ))
+
+
 def generate_csv_export(
     duplicates: List[DuplicateBlock],
     output_path: Path
@@ -540,47 +706,190 @@ def generate_csv_export(
     """
     import csv
 
-    try:
-        # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+    def write(csvfile: TextIO) -> None:
+        writer = csv.writer(csvfile)
+
+        # Header
+        writer.writerow([
+            'duplicate_id',
+            'type',
+            'instances',
+            'similarity',
+            'file_path',
+            'start_line',
+            'end_line',
+            'line_count'
+        ])
+
+        # Data rows
+        for dup in duplicates:
+            for instance in dup.instances:
+                writer.writerow([
+                    dup.id,
+                    dup.type.value,
+                    len(dup.instances),
+                    dup.similarity_score,
+                    str(instance.file_path),
+                    instance.start_line,
+                    instance.end_line,
+                    instance.line_count
+                ])
+
+    _write_output(output_path, 'CSV', write, newline='')
+
+
+def duplicate_record(duplicate: DuplicateBlock) -> Dict:
+    """
+    JSON-serializable record of one duplicate, with a bounded code sample.
+
+    Example:
+        >>> record = duplicate_record(block)
+        >>> sorted(record)[:3]
+        ['code_sample', 'hash', 'id']
+    """
+    sample_lines, truncated = truncate_sample(duplicate.code_sample or '')
+    record = {
+        'id': duplicate.id,
+        'type': duplicate.type.value,
+        'hash': duplicate.hash,
+        'similarity': duplicate.similarity_score,
+        'instances': [
+            {
+                'file_path': str(instance.file_path),
+                'start_line': instance.start_line,
+                'end_line': instance.end_line,
+                'line_count': instance.line_count,
+            }
+            for instance in duplicate.instances
+        ],
+        'code_sample': '\n'.join(sample_lines),
+        'code_sample_truncated': truncated,
+        'suggestion': None,
+    }
+    if duplicate.suggestion:
+        record['suggestion'] = {
+            'technique': duplicate.suggestion.technique.value,
+            'description': duplicate.suggestion.description,
+            'difficulty': duplicate.suggestion.difficulty,
+            'estimated_loc_reduction': duplicate.suggestion.estimated_loc_reduction,
+        }
+    return record
 
-        # Write CSV file
-        with output_path.open('w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-
-            # Header
-            writer.writerow([
-                'duplicate_id',
-                'type',
-                'instances',
-                'similarity',
-                'file_path',
-                'start_line',
-                'end_line',
-                'line_count'
-            ])
-
-            # Data rows
-            for dup in duplicates:
-                for instance in dup.instances:
-                    writer.writerow([
-                        dup.id,
-                        dup.type.value,
-                        len(dup.instances),
-                        dup.similarity_score,
-                        str(instance.file_path),
-                        instance.start_line,
-                        instance.end_line,
-                        instance.line_count
-                    ])
 
-    except PermissionError as e:
-        raise PermissionError(f"Cannot write to {output_path}: Permission denied")
-    except OSError as e:
-        # Re-raise OSError (includes disk full, etc.)
-        raise
-    except Exception as e:
-        raise IOError(f"Failed to write CSV to {output_path}: {str(e)}")
+def generate_jsonl_export(
+    duplicates: Iterable[DuplicateBlock],
+    output_path: Path
+) -> None:
+    """
+    Export duplicates as JSON Lines, one duplicate_record per line.
+
+    Args:
+        duplicates: Duplicates to export (may be a generator)
+        output_path: Path to write the .jsonl file
+
+    Raises:
+        PermissionError: If cannot write to output path
+        OSError: If disk full or other OS error
+        IOError: If other write error occurs
+
+    Example:
+        >>> generate_jsonl_export(duplicates, Path("duplicates.jsonl"))
+    """
+    def write(handle: TextIO) -> None:
+        for dup in duplicates:
+            handle.write(json.dumps(duplicate_record(dup), ensure_ascii=False))
+            handle.write('\n')
+
+    _write_output(output_path, 'JSON Lines', write)
+
+
+def _sarif_location(file_path, start_line: int, end_line: int) -> Dict:
+    """SARIF physicalLocation for a line range."""
+    path = Path(file_path)
+    return {
+        'physicalLocation': {
+            'artifactLocation': {'uri': path.as_uri() if path.is_absolute() else path.as_posix()},
+            'region': {'startLine': start_line, 'endLine': end_line},
+        }
+    }
+
+
+def sarif_result(duplicate: DuplicateBlock) -> Dict:
+    """
+    SARIF result for one duplicate.
+
+    The first instance is the primary location and the others are related
+    locations; the rule is the duplicate type.
+    """
+    first, others = duplicate.instances[0], duplicate.instances[1:]
+    message = (
+        f"{duplicate.type.value.capitalize()} duplicate: {len(duplicate.instances)} instances "
+        f"of {first.line_count} lines ({duplicate.similarity_score * 100:.0f}% similar)"
+    )
+    if duplicate.suggestion:
+        message += f". {duplicate.suggestion.description}"
+
+    result = {
+        'ruleId': f"duplicate-{duplicate.type.value}",
+        'level': 'warning' if duplicate.type == DuplicateType.EXACT else 'note',
+        'message': {'text': message},
+        'locations': [_sarif_location(first.file_path, first.start_line, first.end_line)],
+        'partialFingerprints': {'duplicateHash': duplicate.hash},
+    }
+    if others:
+        result['relatedLocations'] = [
+            dict(_sarif_location(loc.file_path, loc.start_line, loc.end_line), id=number)
+            for number, loc in enumerate(others, 1)
+        ]
+    return result
+
+
+def generate_sarif_export(
+    duplicates: Iterable[DuplicateBlock],
+    output_path: Path
+) -> None:
+    """
+    Export duplicates as a SARIF 2.1.0 log, one result per duplicate.
+
+    Results are written as they are produced, so duplicates may be a
+    generator.
+
+    Args:
+        duplicates: Duplicates to export
+        output_path: Path to write the .sarif file
+
+    Raises:
+        PermissionError: If cannot write to output path
+        OSError: If disk full or other OS error
+        IOError: If other write error occurs
+
+    Example:
+        >>> generate_sarif_export(duplicates, Path("duplicates.sarif"))
+    """
+    driver = {
+        'name': 'code-duplication',
+        'rules': [
+            {
+                'id': f"duplicate-{dup_type.value}",
+                'shortDescription': {'text': f"{dup_type.value.capitalize()} code duplicate"},
+            }
+            for dup_type in DuplicateType
+        ],
+    }
+
+    def write(handle: TextIO) -> None:
+        handle.write('{"$schema": ' + json.dumps(SARIF_SCHEMA) + ', "version": "2.1.0", "runs": [{')
+        handle.write('"tool": ' + json.dumps({'driver': driver}) + ', "results": [')
+        separator = '\n'
+        for dup in duplicates:
+            if not dup.instances:
+                continue
+            handle.write(separator)
+            handle.write(json.dumps(sarif_result(dup), ensure_ascii=False))
+            separator = ',\n'
+        handle.write('\n]}]}\n')
+
+    _write_output(output_path, 'SARIF', write)
 
 
 # Export public API
@@ -590,6 +899,15 @@ __all__ = [
     'create_summary_section',
     'create_issues_section',
     'create_recommendations_section',
+    'format_recommendations',
+    'truncate_sample',
+    'write_duplicate_listings',
+    'write_report',
     'generate_report',
+    'stream_report',
     'generate_csv_export',
+    'duplicate_record',
+    'generate_jsonl_export',
+    'sarif_result',
+    'generate_sarif_export',
 ]
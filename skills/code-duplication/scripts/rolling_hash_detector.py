@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Rolling-Hash Exact Duplicate Detection for Code Duplication Analysis Skill
+
+Rabin-Karp engine for exact duplicates. Each file is tokenized and
+normalized once (see token_stream), then a polynomial rolling hash is
+computed over every window of min_lines units at every position, so clones
+are found wherever they start rather than on a fixed grid. Windows with
+equal hashes are verified, then extended left and right to maximal clone
+spans; each span is reported once with all of its instances.
+"""
+
+import random
+from pathlib import Path
+from typing import Dict, Hashable, List, Tuple
+
+from models import DuplicateBlock
+from token_stream import TokenStream, build_token_streams, regions_to_duplicates
+
+
+# Mersenne prime modulus and base for the polynomial hash
+HASH_MODULUS = (1 << 61) - 1
+HASH_BASE = 1_000_003
+
+# Positions are packed as (stream_index << POSITION_BITS) | unit_index
+POSITION_BITS = 32
+POSITION_MASK = (1 << POSITION_BITS) - 1
+
+
+def intern_units(streams: List[TokenStream]) -> List[List[int]]:
+    """
+    Map every distinct unit string to a small integer id.
+
+    Args:
+        streams: Token streams of the corpus
+
+    Returns:
+        One list of unit ids per stream
+    """
+    ids: Dict[Hashable, int] = {}
+    return [[ids.setdefault(unit, len(ids)) for unit in stream.units] for stream in streams]
+
+
+def find_window_groups(sequences: List[List[int]], window: int) -> List[List[int]]:
+    """
+    Group window positions whose unit sequences are identical.
+
+    Computes a rolling hash for every window of `window` units, buckets
+    positions by hash and splits buckets by actual content, so hash
+    collisions never produce false matches.
+
+    Args:
+        sequences: Unit ids per stream
+        window: Window length in units
+
+    Returns:
+        Groups of packed positions (two or more each), in corpus order
+    """
+    # Random per-id weights keep structured inputs from colliding
+    rng = random.Random(0x5EED)
+    max_id = max((max(seq) for seq in sequences if seq), default=-1)
+    weights = [rng.getrandbits(61) for _ in range(max_id + 1)]
+
+    modulus = HASH_MODULUS
+    base = HASH_BASE
+    drop = pow(base, window, modulus)
+
+    first_seen: Dict[int, int] = {}
+    buckets: Dict[int, List[int]] = {}
+
+    for index, seq in enumerate(sequences):
+        if len(seq) < window:
+            continue
+        weighted = [weights[unit] for unit in seq]
+        packed = index << POSITION_BITS
+
+        value = 0
+        for w in weighted[:window]:
+            value = (value * base + w) % modulus
+
+        for i in range(len(seq) - window + 1):
+            if i:
+                value = (value * base + weighted[i + window - 1] - weighted[i - 1] * drop) % modulus
+            position = packed | i
+            seen = first_seen.setdefault(value, position)
+            if seen != position:
+                bucket = buckets.get(value)
+                if bucket is None:
+                    buckets[value] = [seen, position]
+                else:
+                    bucket.append(position)
+
+    groups = []
+    for bucket in buckets.values():
+        by_content: Dict[Tuple[int, ...], List[int]] = {}
+        for position in bucket:
+            seq = sequences[position >> POSITION_BITS]
+            i = position & POSITION_MASK
+            by_content.setdefault(tuple(seq[i:i + window]), []).append(position)
+        groups.extend(g for g in by_content.values() if len(g) >= 2)
+
+    groups.sort(key=lambda g: g[0])
+    return groups
+
+
+def _non_overlapping(group: List[int], window: int) -> List[int]:
+    """Drop positions that overlap an earlier kept position in the same file."""
+    kept = []
+    last_stream = last_index = -1
+    for position in sorted(group):
+        stream, index = position >> POSITION_BITS, position & POSITION_MASK
+        if stream == last_stream and index < last_index + window:
+            continue
+        kept.append(position)
+        last_stream, last_index = stream, index
+    return kept
+
+
+def extend_to_maximal(
+    sequences: List[List[int]],
+    groups: List[List[int]],
+    window: int
+) -> List[Tuple[int, List[Tuple[int, int]]]]:
+    """
+    Extend matching windows to maximal clone spans.
+
+    A group whose predecessor positions form exactly one other group of the
+    same size lies inside a longer span with the same instances, so only
+    span starts are extended; each span is walked once. Instances in the
+    same file never grow into each other.
+
+    Args:
+        sequences: Unit ids per stream
+        groups: Groups of identical windows from find_window_groups
+        window: Window length in units
+
+    Returns:
+        List of (length, [(stream_index, start_unit), ...]) regions
+    """
+    groups = [g for g in (_non_overlapping(g, window) for g in groups) if len(g) >= 2]
+
+    group_of: Dict[int, int] = {}
+    for group_index, group in enumerate(groups):
+        for position in group:
+            group_of[position] = group_index
+
+    regions = []
+    seen = set()
+
+    for group in groups:
+        instances = [(p >> POSITION_BITS, p & POSITION_MASK) for p in group]
+
+        # Inside a longer span with the same instances: reported from its start
+        predecessor_groups = {group_of.get(p - 1) if p & POSITION_MASK else None for p in group}
+        if len(predecessor_groups) == 1:
+            predecessor = predecessor_groups.pop()
+            if predecessor is not None and len(groups[predecessor]) == len(group):
+                continue
+
+        # Instances in the same file may not grow into each other
+        limit = None
+        for (s1, i1), (s2, i2) in zip(instances, instances[1:]):
+            if s1 == s2:
+                limit = i2 - i1 if limit is None else min(limit, i2 - i1)
+
+        starts = [i for _, i in instances]
+        seqs = [sequences[s] for s, _ in instances]
+        length = window
+
+        while all(start > 0 for start in starts) and (limit is None or length < limit):
+            unit = seqs[0][starts[0] - 1]
+            if any(seq[start - 1] != unit for seq, start in zip(seqs, starts)):
+                break
+            starts = [start - 1 for start in starts]
+            length += 1
+
+        while limit is None or length < limit:
+            ends = [start + length for start in starts]
+            if any(end >= len(seq) for seq, end in zip(seqs, ends)):
+                break
+            unit = seqs[0][ends[0]]
+            if any(seq[end] != unit for seq, end in zip(seqs, ends)):
+                break
+            length += 1
+
+        region = (length, [(s, start) for (s, _), start in zip(instances, starts)])
+        key = (length, tuple(region[1]))
+        if key not in seen:
+            seen.add(key)
+            regions.append(region)
+
+    return regions
+
+
+def find_exact_duplicates_rolling(
+    files_content: List[Tuple[Path, str, str]],
+    min_lines: int = 5,
+    min_chars: int = 50
+) -> List[DuplicateBlock]:
+    """
+    Find exact duplicates across multiple files with rolling hashes.
+
+    Drop-in alternative to exact_detector.find_exact_duplicates: same
+    inputs and output type, but every window position is considered and
+    each clone is reported once at its maximal extent.
+
+    Args:
+        files_content: List of tuples (file_path, content, language)
+        min_lines: Minimum lines (normalized units) to consider a duplicate
+        min_chars: Minimum characters to consider a duplicate
+
+    Returns:
+        List of DuplicateBlock objects
+    """
+    return find_stream_duplicates_rolling(build_token_streams(files_content), min_lines, min_chars)
+
+
+def find_stream_duplicates_rolling(
+    streams: List[TokenStream],
+    min_lines: int = 5,
+    min_chars: int = 50
+) -> List[DuplicateBlock]:
+    """
+    Rolling-hash exact duplicates over already built token streams.
+
+    Args:
+        streams: Token streams (full or compact) of the corpus
+        min_lines: Minimum lines (normalized units) to consider a duplicate
+        min_chars: Minimum characters to consider a duplicate
+
+    Returns:
+        List of DuplicateBlock objects
+    """
+    window = max(1, min_lines)
+    sequences = intern_units(streams)
+
+    groups = find_window_groups(sequences, window)
+    regions = extend_to_maximal(sequences, groups, window)
+
+    return regions_to_duplicates(streams, regions, min_chars)
+
+
+# Export public API
+__all__ = [
+    'intern_units',
+    'find_window_groups',
+    'extend_to_maximal',
+    'find_exact_duplicates_rolling',
+    'find_stream_duplicates_rolling',
+]
@@ -8,10 +8,13 @@ may have different variable names but identical logic flow.
 
 import ast
 import hashlib
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Optional, List, Dict, Tuple, Any, Iterator
 from pathlib import Path
 
 from models import DuplicateBlock, CodeLocation, DuplicateType
+from near_miss_detector import build_near_miss_duplicates, function_signature
+from tree_distance import NODE_LIMIT, prepare_tree, tree_similarity
+from tree_distance import tree_edit_distance as ordered_tree_edit_distance
 
 
 def parse_ast(source: str, language: str) -> Optional[ast.AST]:
@@ -260,8 +263,9 @@ def calculate_similarity(tree1: ast.AST, tree2: ast.AST) -> float:
     """
     Calculate structural similarity between two ASTs.
 
-    Uses simplified tree edit distance approach. For exact matches,
-    returns 1.0. For different structures, uses node count ratio.
+    Similarity is 1 - edit distance / larger tree size, using the
+    Zhang-Shasha tree edit distance (see tree_distance). Trees above
+    tree_distance.NODE_LIMIT nodes fall back to the node count ratio.
 
     Args:
         tree1: First AST
@@ -270,10 +274,6 @@ def calculate_similarity(tree1: ast.AST, tree2: ast.AST) -> float:
     Returns:
         Similarity score between 0.0 and 1.0
 
-    Note:
-        This is a simplified implementation. Full tree edit distance
-        is expensive (O(n²)). This uses node count heuristic for speed.
-
     Example:
         >>> tree1 = parse_ast("def foo(x): return x + 1", "python")
         >>> tree2 = parse_ast("def foo(x, y): return x + y", "python")
@@ -281,34 +281,28 @@ def calculate_similarity(tree1: ast.AST, tree2: ast.AST) -> float:
         >>> 0.80 <= score <= 0.95
         True
     """
-    # Check for exact match first
-    if ast.dump(tree1) == ast.dump(tree2):
-        return 1.0
-
-    # Count nodes in each tree
-    count1 = sum(1 for _ in ast.walk(tree1))
-    count2 = sum(1 for _ in ast.walk(tree2))
-
-    # Simple similarity based on node count ratio
-    # More sophisticated: would use actual tree edit distance
-    smaller = min(count1, count2)
-    larger = max(count1, count2)
+    ordered1 = prepare_tree(tree1)
+    ordered2 = prepare_tree(tree2)
 
+    larger = max(len(ordered1), len(ordered2))
     if larger == 0:
         return 1.0
 
-    # Ratio of smaller to larger (0.0 to 1.0)
-    ratio = smaller / larger
+    if larger > NODE_LIMIT:
+        # Ratio of smaller to larger node count (0.0 to 1.0)
+        return min(len(ordered1), len(ordered2)) / larger
 
-    return ratio
+    return tree_similarity(ordered1, ordered2)
 
 
 def tree_edit_distance(tree1: ast.AST, tree2: ast.AST) -> int:
     """
     Calculate tree edit distance between two ASTs.
 
-    This is a simplified implementation that counts differing nodes.
-    Full tree edit distance is computationally expensive (O(n²)).
+    Ordered tree edit distance (Zhang-Shasha) with unit costs for node
+    insertion, deletion and relabeling. Labels ignore identifiers, so
+    renamed variables cost nothing. Identical subtrees are recognized by
+    their hashes and skipped.
 
     Args:
         tree1: First AST
@@ -317,42 +311,35 @@ def tree_edit_distance(tree1: ast.AST, tree2: ast.AST) -> int:
     Returns:
         Edit distance (number of operations to transform tree1 to tree2)
 
-    Note:
-        For production use, consider using Zhang-Shasha algorithm
-        or other optimized tree edit distance algorithms.
+    Example:
+        >>> tree1 = parse_ast("def foo(x): return x + 1", "python")
+        >>> tree2 = parse_ast("def foo(x, y): return x + y", "python")
+        >>> tree_edit_distance(tree1, tree2)
+        2
     """
-    # Convert to canonical strings
-    dump1 = ast.dump(tree1)
-    dump2 = ast.dump(tree2)
-
-    # If identical, distance is 0
-    if dump1 == dump2:
-        return 0
-
-    # Count nodes
-    count1 = sum(1 for _ in ast.walk(tree1))
-    count2 = sum(1 for _ in ast.walk(tree2))
-
-    # Simplified: distance is difference in node count
-    # Real implementation would use dynamic programming
-    return abs(count1 - count2)
+    return ordered_tree_edit_distance(prepare_tree(tree1), prepare_tree(tree2))
 
 
 def find_structural_duplicates(
     files_content: List[Tuple[Path, str, str]],
     similarity_threshold: float = 0.85,
-    min_lines: int = 5
+    min_lines: int = 5,
+    near_miss: bool = False
 ) -> List[DuplicateBlock]:
     """
     Find structurally similar code across files.
 
     Uses AST-based comparison to find code with identical logic
-    but different variable/function names.
+    but different variable/function names. With near_miss, functions
+    that differ by a few statements (Type-3 clones) are also grouped,
+    via MinHash/LSH (see near_miss_detector).
 
     Args:
         files_content: List of (file_path, content, language) tuples
-        similarity_threshold: Minimum similarity score (0.0-1.0)
+        similarity_threshold: Minimum similarity score for near-miss
+            clones (0.0-1.0)
         min_lines: Minimum lines to consider
+        near_miss: Also report near-miss clones
 
     Returns:
         List of DuplicateBlock objects with type=STRUCTURAL
@@ -366,6 +353,7 @@ def find_structural_duplicates(
     """
     # Parse and normalize all ASTs
     fingerprints: Dict[str, List[Dict]] = {}
+    functions: List[Dict] = []
 
     for file_path, content, language in files_content:
         if language != 'python':
@@ -376,41 +364,132 @@ def find_structural_duplicates(
         if tree is None:
             continue
 
-        # Extract function definitions
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                try:
-                    # Get function source lines
-                    start_line = node.lineno
-                    end_line = node.end_lineno or start_line
-                    line_count = end_line - start_line + 1
-
-                    # Skip small functions
-                    if line_count < min_lines:
-                        continue
-
-                    # Normalize function AST
-                    normalized = normalize_ast(node)
-
-                    # Get fingerprint
-                    fp = ast_fingerprint(normalized)
-
-                    # Store metadata
-                    if fp not in fingerprints:
-                        fingerprints[fp] = []
-
-                    fingerprints[fp].append({
-                        'file': file_path,
-                        'start_line': start_line,
-                        'end_line': end_line,
-                        'line_count': line_count,
-                        'tree': node,  # Original AST
-                        'code': ast.unparse(node) if hasattr(ast, 'unparse') else ast.get_source_segment(content, node)
-                    })
-                except Exception:
-                    # Skip functions that fail normalization
+        for fp, start_line, end_line, node in fingerprint_functions(tree, min_lines):
+            # Store metadata; the tree is kept only for near-miss verification
+            entry = {
+                'file': file_path,
+                'start_line': start_line,
+                'end_line': end_line,
+                'line_count': end_line - start_line + 1
+            }
+            if near_miss:
+                entry['tree'] = node  # Original AST
+
+            if fp not in fingerprints:
+                fingerprints[fp] = []
+
+            fingerprints[fp].append(entry)
+
+            if near_miss:
+                functions.append(dict(
+                    entry, fingerprint=fp, signature=function_signature(node)
+                ))
+
+    # Code samples are rebuilt for the files they come from only
+    sources = {file_path: content for file_path, content, language in files_content}
+    samples: Dict[Path, Dict[Tuple[int, int], str]] = {}
+
+    def read_code(function: Dict) -> str:
+        file_path = function['file']
+        if file_path not in samples:
+            samples[file_path] = function_samples(sources[file_path], min_lines)
+        return samples[file_path].get((function['start_line'], function['end_line']), '')
+
+    for instances in fingerprints.values():
+        if len(instances) > 1:
+            instances[0]['code'] = read_code(instances[0])
+
+    duplicates = build_structural_duplicates(fingerprints)
+    if near_miss:
+        duplicates += build_near_miss_duplicates(
+            functions, similarity_threshold, read_code=read_code,
+            first_id=len(duplicates) + 1
+        )
+    return duplicates
+
+
+def function_samples(content: str, min_lines: int = 5) -> Dict[Tuple[int, int], str]:
+    """
+    Code samples for the functions of a Python file.
+
+    Functions are fingerprinted again and each is unparsed as soon as it is
+    normalized, as a nested function normalized later changes its parent.
+
+    Args:
+        content: Python source
+        min_lines: Minimum lines to consider
+
+    Returns:
+        (start_line, end_line) -> normalized function code
+    """
+    samples: Dict[Tuple[int, int], str] = {}
+    tree = parse_ast(content, 'python')
+    if tree is None:
+        return samples
+
+    for fp, start_line, end_line, node in fingerprint_functions(tree, min_lines):
+        if hasattr(ast, 'unparse'):
+            code = ast.unparse(node)
+        else:
+            code = ast.get_source_segment(content, node)
+        samples.setdefault((start_line, end_line), code)
+    return samples
+
+
+def fingerprint_functions(
+    tree: ast.AST,
+    min_lines: int = 5
+) -> Iterator[Tuple[str, int, int, ast.AST]]:
+    """
+    Fingerprint every function in a parsed module.
+
+    Functions shorter than min_lines are skipped, as are functions that
+    fail normalization. Nodes are normalized in place.
+
+    Args:
+        tree: Parsed module
+        min_lines: Minimum lines to consider
+
+    Yields:
+        (fingerprint, start_line, end_line, normalized function node)
+    """
+    # Extract function definitions
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            try:
+                # Get function source lines
+                start_line = node.lineno
+                end_line = node.end_lineno or start_line
+                line_count = end_line - start_line + 1
+
+                # Skip small functions
+                if line_count < min_lines:
                     continue
 
+                # Normalize function AST
+                normalized = normalize_ast(node)
+
+                # Get fingerprint
+                fp = ast_fingerprint(normalized)
+            except Exception:
+                # Skip functions that fail normalization
+                continue
+
+            yield fp, start_line, end_line, node
+
+
+def build_structural_duplicates(fingerprints: Dict[str, List[Dict]]) -> List[DuplicateBlock]:
+    """
+    Turn fingerprint-grouped functions into structural DuplicateBlocks.
+
+    Args:
+        fingerprints: Fingerprint -> list of dicts with file, start_line,
+            end_line, line_count and code (only the first instance's code
+            is used, as the code sample)
+
+    Returns:
+        List of DuplicateBlock objects, most instances first
+    """
     # Find duplicates (fingerprint appears > 1 time)
     duplicates = []
     duplicate_id = 1
@@ -460,5 +539,8 @@ __all__ = [
     'calculate_similarity',
     'tree_edit_distance',
     'find_structural_duplicates',
+    'fingerprint_functions',
+    'build_structural_duplicates',
+    'function_samples',
     'ASTNormalizer',
 ]
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Normalized Token Streams for Code Duplication Analysis Skill
+
+Tokenizes and normalizes each source file exactly once, producing a stream
+of line units: one hashable string per source line that carries code, with
+comments, blank lines and whitespace differences removed. Corpus-wide clone
+finders (rolling hash, suffix array) work on these streams instead of
+re-normalizing every candidate block.
+"""
+
+import hashlib
+import io
+import re
+import tokenize
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Hashable, List, Tuple
+
+from models import DuplicateBlock, CodeLocation, DuplicateType
+from exact_detector import compute_hash
+from utils import normalize_line_endings, safe_read_file
+
+
+# Markers for Python INDENT/DEDENT tokens, so relative nesting is part of a unit
+INDENT_MARKER = '\x01'
+DEDENT_MARKER = '\x02'
+
+# Token types that carry no code
+_SKIPPED_TOKENS = {
+    tokenize.COMMENT,
+    tokenize.NL,
+    tokenize.NEWLINE,
+    tokenize.ENDMARKER,
+    tokenize.ENCODING,
+}
+
+_BLOCK_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_LINE_COMMENT = re.compile(r'//.*$')
+_WHITESPACE = re.compile(r'\s+')
+
+
+@dataclass
+class TokenStream:
+    """Normalized line units of one file, with their source positions."""
+
+    file_path: Path
+    language: str
+    source: str = ''  # empty for compact streams; samples are re-read from disk
+    units: List[Hashable] = field(default_factory=list)  # unit text, or its digest
+    start_lines: List[int] = field(default_factory=list)
+    end_lines: List[int] = field(default_factory=list)
+    char_counts: List[int] = field(default_factory=list)  # raw characters per unit
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def span_chars(self, start: int, end: int) -> int:
+        """Raw characters in units[start:end], newlines included."""
+        return sum(self.char_counts[start:end]) + max(0, end - start - 1)
+
+
+def _python_units(source: str) -> List[Tuple[int, int, str]]:
+    """
+    Group Python tokens into line units with a single tokenize pass.
+
+    Tokens are attached to the physical line they start on; a multi-line
+    token (triple-quoted string, bracketed continuation) extends that unit
+    instead of starting new ones.
+
+    Raises:
+        tokenize.TokenError, SyntaxError: If the source cannot be tokenized
+    """
+    units = []
+    parts: List[str] = []
+    unit_start = unit_end = 0
+
+    for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+        if tok.type in _SKIPPED_TOKENS:
+            continue
+
+        if tok.type == tokenize.INDENT:
+            text = INDENT_MARKER
+        elif tok.type == tokenize.DEDENT:
+            text = DEDENT_MARKER
+        else:
+            text = tok.string
+
+        row = tok.start[0]
+        if parts and row > unit_end:
+            units.append((unit_start, unit_end, ' '.join(parts)))
+            parts = []
+        if not parts:
+            unit_start = row
+        unit_end = max(unit_end, tok.end[0], row)
+        parts.append(text)
+
+    if parts:
+        units.append((unit_start, unit_end, ' '.join(parts)))
+
+    # A unit made only of DEDENT markers has no code of its own
+    return [u for u in units if u[2].strip(DEDENT_MARKER + ' ')]
+
+
+def _generic_units(source: str, language: str) -> List[Tuple[int, int, str]]:
+    """
+    Line units for C-family languages (and Python that fails to tokenize).
+
+    Block comments are blanked with their newlines kept so line numbers stay
+    valid; lines starting with '#' or '//' are skipped as in
+    extract_code_blocks.
+    """
+    if language != 'python':
+        source = _BLOCK_COMMENT.sub(lambda m: '\n' * m.group().count('\n'), source)
+
+    units = []
+    for line_no, line in enumerate(source.split('\n'), start=1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#') or stripped.startswith('//'):
+            continue
+        if language != 'python':
+            stripped = _LINE_COMMENT.sub('', stripped).strip()
+            if not stripped:
+                continue
+        units.append((line_no, line_no, _WHITESPACE.sub(' ', stripped)))
+
+    return units
+
+
+def build_token_stream(file_path: Path, source: str, language: str) -> TokenStream:
+    """
+    Tokenize and normalize one file into a TokenStream.
+
+    Args:
+        file_path: Path to source file
+        source: Source code content
+        language: Programming language identifier
+
+    Returns:
+        TokenStream with one unit per code-bearing source line
+    """
+    source = normalize_line_endings(source)
+    lines = source.split('\n')
+
+    units = None
+    if language == 'python':
+        try:
+            units = _python_units(source)
+        except (tokenize.TokenError, SyntaxError):
+            units = None
+    if units is None:
+        units = _generic_units(source, language)
+
+    stream = TokenStream(file_path=file_path, language=language, source=source)
+    for start_line, end_line, text in units:
+        stream.units.append(text)
+        stream.start_lines.append(start_line)
+        stream.end_lines.append(end_line)
+        stream.char_counts.append(
+            sum(len(lines[i].strip()) for i in range(start_line - 1, min(end_line, len(lines))))
+        )
+
+    return stream
+
+
+def unit_digest(unit: str) -> int:
+    """64-bit digest of a unit's text, as stored in compact streams."""
+    return int.from_bytes(hashlib.blake2b(unit.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def region_hash(units: List[Hashable]) -> str:
+    """
+    Block hash of a run of units.
+
+    Hashes the units' digests, so a region gets the same hash from a full
+    stream and from its compact counterpart (--jobs N).
+    """
+    return compute_hash('\n'.join(
+        str(unit if isinstance(unit, int) else unit_digest(unit)) for unit in units
+    ))
+
+
+def _stream_source(stream: TokenStream) -> str:
+    """Source text of a stream, re-read from disk for compact streams."""
+    if stream.source:
+        return stream.source
+    try:
+        return normalize_line_endings(safe_read_file(stream.file_path))
+    except IOError:
+        return ''
+
+
+def regions_to_duplicates(
+    streams: List[TokenStream],
+    regions: List[Tuple[int, List[Tuple[int, int]]]],
+    min_chars: int = 50
+) -> List[DuplicateBlock]:
+    """
+    Convert repeated unit regions into exact DuplicateBlocks.
+
+    Args:
+        streams: Token streams the regions index into
+        regions: List of (length, [(stream_index, start_unit), ...])
+        min_chars: Minimum raw characters per instance
+
+    Returns:
+        List of DuplicateBlock objects, most instances first
+    """
+    duplicates = []
+    source_lines = {}
+
+    for length, starts in regions:
+        kept = [
+            (s, i) for s, i in starts
+            if streams[s].span_chars(i, i + length) >= min_chars
+        ]
+        if len(kept) < 2:
+            continue
+
+        locations = []
+        for s, i in kept:
+            stream = streams[s]
+            start_line = stream.start_lines[i]
+            end_line = stream.end_lines[i + length - 1]
+            locations.append(CodeLocation(
+                file_path=stream.file_path,
+                start_line=start_line,
+                end_line=end_line,
+                line_count=end_line - start_line + 1
+            ))
+
+        first, offset = kept[0]
+        if first not in source_lines:
+            source_lines[first] = _stream_source(streams[first]).split('\n')
+        sample = source_lines[first][locations[0].start_line - 1:locations[0].end_line]
+
+        duplicates.append(DuplicateBlock(
+            id=len(duplicates) + 1,
+            type=DuplicateType.EXACT,
+            hash=region_hash(streams[first].units[offset:offset + length]),
+            instances=locations,
+            code_sample='\n'.join(sample),
+            similarity_score=1.0,
+            suggestion=None
+        ))
+
+    # Sort by number of instances (descending)
+    duplicates.sort(key=lambda d: len(d.instances), reverse=True)
+
+    return duplicates
+
+
+def compact_token_stream(stream: TokenStream) -> TokenStream:
+    """
+    Replace unit text with 64-bit digests and drop the source.
+
+    Compact streams are what process-pool workers send back: their size
+    depends on the number of units, not on the bytes of source.
+
+    Args:
+        stream: Full token stream
+
+    Returns:
+        Equivalent stream whose units are integer digests
+    """
+    return TokenStream(
+        file_path=stream.file_path,
+        language=stream.language,
+        units=[unit_digest(unit) for unit in stream.units],
+        start_lines=stream.start_lines,
+        end_lines=stream.end_lines,
+        char_counts=stream.char_counts
+    )
+
+
+def build_token_streams(files_content: List[Tuple[Path, str, str]]) -> List[TokenStream]:
+    """
+    Build token streams for a corpus.
+
+    Args:
+        files_content: List of tuples (file_path, content, language)
+
+    Returns:
+        One TokenStream per input file, in input order
+    """
+    return [
+        build_token_stream(file_path, content, language)
+        for file_path, content, language in files_content
+    ]
+
+
+# Export public API
+__all__ = [
+    'TokenStream',
+    'build_token_stream',
+    'build_token_streams',
+    'compact_token_stream',
+    'region_hash',
+    'regions_to_duplicates',
+    'unit_digest',
+]
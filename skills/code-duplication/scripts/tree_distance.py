@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Tree Edit Distance for Code Duplication Analysis Skill
+
+Zhang-Shasha ordered tree edit distance (unit insert/delete/rename costs)
+over Python ASTs. Trees are flattened once into postorder arrays with a
+memoized hash per subtree, so identical subtrees compare in O(1): a
+keyroot pair whose subtrees hash equal needs no forest-distance table at
+all. Node labels carry no identifiers, so distances are the same for raw
+and ASTNormalizer-normalized trees.
+
+Verification helpers bound the distance from below (size difference,
+label multisets, postorder label sequences) before running the quadratic algorithm and refuse trees
+above a size cutoff, which keeps LSH candidate verification affordable.
+"""
+
+import ast
+import hashlib
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+# Trees larger than this are not compared exactly (the DP is O(n^2) memory)
+NODE_LIMIT = 800
+
+# Expression contexts (Load/Store/Del) add no structure worth comparing
+_SKIPPED_NODES = (ast.expr_context,)
+
+
+def node_label(node: ast.AST) -> str:
+    """
+    Identifier-free label of an AST node.
+
+    The type name, plus the attribute name for attribute access and the
+    literal kind for constants (numbers and booleans share one kind, as
+    ASTNormalizer folds them to 0).
+
+    Example:
+        >>> node_label(ast.parse("x.append").body[0].value)
+        'Attribute.append'
+    """
+    name = type(node).__name__
+    if isinstance(node, ast.Attribute):
+        return f"{name}.{node.attr}"
+    if isinstance(node, ast.Constant):
+        kind = 'num' if isinstance(node.value, (bool, int, float)) else type(node.value).__name__
+        return f"{name}:{kind}"
+    return name
+
+
+def node_children(node: ast.AST) -> List[ast.AST]:
+    """Child nodes that take part in comparison, in source order."""
+    return [child for child in ast.iter_child_nodes(node) if not isinstance(child, _SKIPPED_NODES)]
+
+
+@dataclass
+class OrderedTree:
+    """
+    An AST flattened into postorder arrays for Zhang-Shasha.
+
+    Attributes:
+        labels: Node labels in postorder
+        leftmost: Postorder index of each node's leftmost leaf
+        sizes: Subtree size of each node
+        hashes: Subtree hash of each node (equal hashes = identical subtrees)
+        keyroots: Highest node of each leftmost path (the root and every
+            node with a left sibling), ascending
+    """
+
+    labels: List[str] = field(default_factory=list)
+    leftmost: List[int] = field(default_factory=list)
+    sizes: List[int] = field(default_factory=list)
+    hashes: List[bytes] = field(default_factory=list)
+    keyroots: List[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+
+def prepare_tree(node: ast.AST) -> OrderedTree:
+    """
+    Flatten an AST into an OrderedTree, hashing every subtree once.
+
+    Args:
+        node: Root node (typically a function definition)
+
+    Returns:
+        OrderedTree for the subtree rooted at node
+
+    Example:
+        >>> tree = prepare_tree(ast.parse("x = 1").body[0])
+        >>> tree.labels
+        ['Name', 'Constant:num', 'Assign']
+    """
+    tree = OrderedTree()
+    # (node, remaining children, postorder indexes of finished children)
+    stack = [(node, iter(node_children(node)), [])]
+
+    while stack:
+        current, remaining, children = stack[-1]
+        child = next(remaining, None)
+        if child is not None:
+            stack.append((child, iter(node_children(child)), []))
+            continue
+
+        stack.pop()
+        index = len(tree.labels)
+        label = node_label(current)
+        digest = hashlib.blake2b(label.encode('utf-8'), digest_size=8)
+        for c in children:
+            digest.update(tree.hashes[c])
+
+        tree.labels.append(label)
+        tree.leftmost.append(tree.leftmost[children[0]] if children else index)
+        tree.sizes.append(1 + sum(tree.sizes[c] for c in children))
+        tree.hashes.append(digest.digest())
+        if stack:
+            stack[-1][2].append(index)
+
+    # A keyroot is the highest node of each leftmost path
+    highest = {}
+    for index, leaf in enumerate(tree.leftmost):
+        highest[leaf] = index
+    tree.keyroots = sorted(highest.values())
+    return tree
+
+
+def distance_lower_bound(tree1: OrderedTree, tree2: OrderedTree) -> int:
+    """
+    Cheap lower bound on the edit distance.
+
+    Each insert or delete changes the size by one, and each operation
+    fixes at most two entries of the label multisets' symmetric difference.
+    """
+    counts1, counts2 = Counter(tree1.labels), Counter(tree2.labels)
+    mismatched = sum(((counts1 - counts2) + (counts2 - counts1)).values())
+    return max(abs(len(tree1) - len(tree2)), (mismatched + 1) // 2)
+
+
+def sequence_distance_bound(tree1: OrderedTree, tree2: OrderedTree, limit: int) -> int:
+    """
+    String edit distance of the postorder label sequences, capped at limit + 1.
+
+    Every tree edit changes the postorder sequence by one symbol, so this
+    bounds the tree edit distance from below. Only the diagonal band of
+    width limit is filled, which keeps the cost at O(n * limit).
+    """
+    labels1, labels2 = tree1.labels, tree2.labels
+    n1, n2 = len(labels1), len(labels2)
+    if abs(n1 - n2) > limit:
+        return limit + 1
+
+    over = limit + 1
+    previous = [y if y <= limit else over for y in range(n2 + 1)]
+    for x in range(1, n1 + 1):
+        label = labels1[x - 1]
+        low, high = max(1, x - limit), min(n2, x + limit)
+        current = [over] * (n2 + 1)
+        if x <= limit:
+            current[0] = x
+        row_best = current[0]
+        for y in range(low, high + 1):
+            best = previous[y - 1] + (label != labels2[y - 1])
+            if previous[y] + 1 < best:
+                best = previous[y] + 1
+            if current[y - 1] + 1 < best:
+                best = current[y - 1] + 1
+            if best > over:
+                best = over
+            current[y] = best
+            if best < row_best:
+                row_best = best
+        if row_best > limit:
+            return over
+        previous = current
+    return previous[n2]
+
+
+def _leftmost_path(tree: OrderedTree, root: int) -> List[int]:
+    """Nodes on the leftmost path below (and including) root."""
+    leaf = tree.leftmost[root]
+    return [x for x in range(leaf, root + 1) if tree.leftmost[x] == leaf]
+
+
+def tree_edit_distance(
+    tree1: OrderedTree,
+    tree2: OrderedTree,
+    max_distance: Optional[int] = None
+) -> int:
+    """
+    Zhang-Shasha ordered tree edit distance with unit costs.
+
+    Args:
+        tree1: First tree
+        tree2: Second tree
+        max_distance: When the lower bound already exceeds this, return
+            the bound without running the DP
+
+    Returns:
+        Edit distance, or a value above max_distance when pruned
+
+    Example:
+        >>> t1 = prepare_tree(ast.parse("def f(x): return x + 1").body[0])
+        >>> t2 = prepare_tree(ast.parse("def g(a, b): return a + b").body[0])
+        >>> tree_edit_distance(t1, t2)
+        2
+    """
+    n1, n2 = len(tree1), len(tree2)
+    if n1 == 0 or n2 == 0:
+        return n1 + n2
+    if tree1.hashes[-1] == tree2.hashes[-1]:
+        return 0
+    if max_distance is not None:
+        bound = distance_lower_bound(tree1, tree2)
+        if bound > max_distance:
+            return bound
+        bound = sequence_distance_bound(tree1, tree2, max_distance)
+        if bound > max_distance:
+            return bound
+
+    labels1, labels2 = tree1.labels, tree2.labels
+    left1, left2 = tree1.leftmost, tree2.leftmost
+    hashes1, hashes2 = tree1.hashes, tree2.hashes
+    sizes1, sizes2 = tree1.sizes, tree2.sizes
+    treedist = [[0] * n2 for _ in range(n1)]
+
+    for i in tree1.keyroots:
+        li = left1[i]
+        path1 = None
+        for j in tree2.keyroots:
+            lj = left2[j]
+
+            if hashes1[i] == hashes2[j]:
+                # Identical subtrees: nodes on the two leftmost paths are nested
+                # copies of each other, so their distance is the size difference
+                if path1 is None:
+                    path1 = _leftmost_path(tree1, i)
+                for y in _leftmost_path(tree2, j):
+                    row_size = sizes2[y]
+                    for x in path1:
+                        treedist[x][y] = abs(sizes1[x] - row_size)
+                continue
+
+            rows, cols = i - li + 2, j - lj + 2
+            forest = [[0] * cols for _ in range(rows)]
+            for y in range(1, cols):
+                forest[0][y] = y
+            for x in range(1, rows):
+                xi = li + x - 1
+                prev, row = forest[x - 1], forest[x]
+                row[0] = x
+                lx = left1[xi]
+                label_x, hash_x = labels1[xi], hashes1[xi]
+                tree_row = treedist[xi]
+                for y in range(1, cols):
+                    yj = lj + y - 1
+                    best = prev[y] + 1
+                    insert = row[y - 1] + 1
+                    if insert < best:
+                        best = insert
+                    if lx == li and left2[yj] == lj:
+                        rename = prev[y - 1] + (label_x != labels2[yj])
+                        if rename < best:
+                            best = rename
+                        tree_row[yj] = best
+                    else:
+                        subtree = 0 if hash_x == hashes2[yj] else tree_row[yj]
+                        match = forest[lx - li][left2[yj] - lj] + subtree
+                        if match < best:
+                            best = match
+                    row[y] = best
+
+    return treedist[n1 - 1][n2 - 1]
+
+
+def tree_similarity(tree1: OrderedTree, tree2: OrderedTree) -> float:
+    """
+    Similarity from edit distance: 1 - distance / larger tree size.
+
+    Example:
+        >>> t1 = prepare_tree(ast.parse("def f(x): return x + 1").body[0])
+        >>> tree_similarity(t1, t1)
+        1.0
+    """
+    larger = max(len(tree1), len(tree2))
+    if larger == 0:
+        return 1.0
+    return 1.0 - tree_edit_distance(tree1, tree2) / larger
+
+
+def verified_similarity(
+    tree1: OrderedTree,
+    tree2: OrderedTree,
+    threshold: float,
+    node_limit: int = NODE_LIMIT
+) -> Optional[float]:
+    """
+    Edit-distance similarity for candidate verification.
+
+    Pairs that the lower bound already places below the threshold are
+    rejected without running the DP.
+
+    Args:
+        tree1: First tree
+        tree2: Second tree
+        threshold: Similarity the caller is testing for
+        node_limit: Largest tree compared exactly
+
+    Returns:
+        Similarity (exact when at least threshold, otherwise an upper
+        bound below it), or None when a tree exceeds node_limit
+    """
+    larger = max(len(tree1), len(tree2))
+    if larger == 0:
+        return 1.0
+    if larger > node_limit:
+        return None
+    max_distance = int((1.0 - threshold) * larger)
+    distance = tree_edit_distance(tree1, tree2, max_distance=max_distance)
+    return 1.0 - distance / larger
+
+
+# Export public API
+__all__ = [
+    'NODE_LIMIT',
+    'OrderedTree',
+    'node_label',
+    'node_children',
+    'prepare_tree',
+    'distance_lower_bound',
+    'sequence_distance_bound',
+    'tree_edit_distance',
+    'tree_similarity',
+    'verified_similarity',
+]
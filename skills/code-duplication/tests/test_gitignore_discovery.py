@@ -0,0 +1,125 @@
+"""Regression tests for .gitignore handling in file discovery.
+
+Builds a scratch git repository with nested .gitignore files, negations
+and ** patterns, and checks that discover_files keeps exactly the files
+git itself reports as untracked and not ignored.
+
+Run with: python -m pytest tests/test_gitignore_discovery.py -v
+"""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import pytest
+from models import Config
+from file_discovery import discover_files
+from gitignore_parser import GitignoreParser
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git required")
+
+
+GITIGNORES = {
+    ".gitignore": [
+        "*.log.py",
+        "nested/**/tmp_*.py",
+        "**/gen_out/",
+        "docs/**",
+        "src/gen/*",
+        "!src/gen/keep.py",
+        "/top_only.py",
+    ],
+    "nested/.gitignore": [
+        "local_*.py",
+        "!local_keep.py",
+        "sub/",
+    ],
+    "lib/.gitignore": [
+        "*.py",
+        "!api/*.py",
+        "!api/",
+    ],
+}
+
+FILES = [
+    "main.py",
+    "top_only.py",
+    "run.log.py",
+    "nested/tmp_2.py",
+    "nested/deep/tmp_1.py",
+    "nested/deep/keep_1.py",
+    "nested/local_a.py",
+    "nested/local_keep.py",
+    "nested/deep/local_b.py",
+    "nested/sub/inner.py",
+    "nested/deep/sub/inner.py",
+    "gen_out/a.py",
+    "pkg/gen_out/b.py",
+    "pkg/top_only.py",
+    "docs/conf.py",
+    "docs/api/index.py",
+    "src/gen/a.py",
+    "src/gen/keep.py",
+    "src/gen/deeper/b.py",
+    "lib/src/gen/a.py",
+    "lib/api/client.py",
+    "lib/api/v2/server.py",
+]
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Scratch git repository with the fixture tree (nothing committed)."""
+    for rel_path, lines in GITIGNORES.items():
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("\n".join(lines) + "\n")
+    for index, rel_path in enumerate(FILES):
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"def f_{index}():\n    return {index}\n")
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    return tmp_path
+
+
+def git_visible(root: Path) -> set:
+    """Python files git reports as untracked and not ignored."""
+    result = subprocess.run(
+        ["git", "-c", "core.excludesFile=/dev/null", "ls-files", "--others", "--exclude-standard"],
+        cwd=root, capture_output=True, text=True, check=True
+    )
+    return {line for line in result.stdout.splitlines() if line.endswith(".py")}
+
+
+def test_discover_files_matches_git(repo):
+    """discover_files keeps exactly what git ls-files --others --exclude-standard lists"""
+    discovered = {
+        path.relative_to(repo).as_posix()
+        for path in discover_files(Config(languages=["python"]), repo)
+    }
+
+    assert discovered == git_visible(repo)
+    # Guard against a fixture that ignores nothing (or everything)
+    assert "nested/deep/keep_1.py" in discovered
+    assert "nested/deep/tmp_1.py" not in discovered
+
+
+@pytest.mark.parametrize("pattern,path,expected", [
+    ("nested/**/tmp_*.py", "nested/tmp_2.py", True),
+    ("nested/**/tmp_*.py", "nested/deep/tmp_1.py", True),
+    ("**/gen_out", "pkg/gen_out", True),
+    ("docs/**", "docs/api/index.py", True),
+    ("docs/**", "docs", False),
+    ("src/gen/*", "src/gen/a.py", True),
+    ("src/gen/*", "lib/src/gen/a.py", False),
+    ("*.py", "a/b/c.py", True),
+    ("a?c.py", "a/c.py", False),
+])
+def test_pattern_matches(pattern, path, expected):
+    """** spans directories; a middle / anchors to the .gitignore directory"""
+    assert GitignoreParser().parse_line(pattern).matches(path) is expected
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Event Archival for PM-DB
+
+Moves old task_updates, agent_file_reads, agent_invocations and
+execution_logs rows out of projects.db into per-month archive databases
+(archive/projects-YYYY-MM.db next to it), keeping monthly rollups in the
+main database. Date-ranged reads (list_agent_invocations, get_task_updates,
+get_agent_file_reads, get_agent_metrics) still see archived rows.
+
+Requires migration 010 (archive_partitions, archive_rollups).
+
+Usage:
+    python3 skills/pm-db/scripts/archive_db.py archive
+    python3 skills/pm-db/scripts/archive_db.py archive --older-than-days 180 --dry-run
+    python3 skills/pm-db/scripts/archive_db.py archive --tables task_updates --vacuum
+    python3 skills/pm-db/scripts/archive_db.py list
+    python3 skills/pm-db/scripts/archive_db.py purge --before 2025-01
+"""
+
+import sys
+from pathlib import Path
+
+# Add lib to path
+lib_path = Path(__file__).parent.parent.parent.parent / "lib"
+sys.path.insert(0, str(lib_path))
+
+from project_database import ProjectDatabase
+
+
+def run_archive(db: ProjectDatabase, older_than_days: int, tables, dry_run: bool, vacuum: bool):
+    """Archive old rows and print what moved."""
+    archived = db.archive_events(older_than_days=older_than_days, tables=tables, dry_run=dry_run)
+
+    verb = "Would archive" if dry_run else "Archived"
+    if not archived:
+        print(f"✅ Nothing older than {older_than_days} days to archive")
+        return
+
+    for table, periods in archived.items():
+        for period, rows in periods.items():
+            print(f"   {verb} {rows:>8,} {table} rows from {period}")
+    total = sum(sum(periods.values()) for periods in archived.values())
+    print(f"✅ {verb} {total:,} rows")
+
+    if vacuum and not dry_run:
+        print("Vacuuming main database...")
+        db.conn.execute("VACUUM")
+        print(f"✅ Size: {Path(db.db_path).stat().st_size:,} bytes")
+
+
+def run_list(db: ProjectDatabase):
+    """Print the archive catalog."""
+    archives = db.list_archives()
+    if not archives:
+        print("No archives")
+        return
+
+    print(f"{'period':<9} {'table':<20} {'rows':>10}  archive")
+    for archive in archives:
+        missing = "" if archive['exists'] else "  (missing)"
+        print(f"{archive['period']:<9} {archive['source_table']:<20} "
+              f"{archive['row_count']:>10,}  {archive['archive_path']}{missing}")
+
+
+def run_purge(db: ProjectDatabase, before: str):
+    """Delete archives older than a month."""
+    deleted = db.purge_archives(before)
+    print(f"✅ Deleted {deleted} archive file(s) before {before} (rollups kept)")
+
+
+def main():
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Archive old PM-DB event rows into per-month databases"
+    )
+    parser.add_argument(
+        "--db-path",
+        default=str(Path.home() / ".claude" / "projects.db"),
+        help="Path to database file (default: ~/.claude/projects.db)"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    archive_parser = subparsers.add_parser("archive", help="Move old rows into archives")
+    archive_parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=90,
+        help="Archive rows older than this (default: 90)"
+    )
+    archive_parser.add_argument(
+        "--tables",
+        nargs="+",
+        choices=list(ProjectDatabase.ARCHIVE_TABLES),
+        help="Tables to archive (default: all)"
+    )
+    archive_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be archived without moving anything"
+    )
+    archive_parser.add_argument(
+        "--vacuum",
+        action="store_true",
+        help="VACUUM the main database afterwards to reclaim space"
+    )
+
+    subparsers.add_parser("list", help="List archived months")
+
+    purge_parser = subparsers.add_parser("purge", help="Delete old archive files")
+    purge_parser.add_argument(
+        "--before",
+        required=True,
+        help="Delete archives for months before this one (YYYY-MM)"
+    )
+
+    args = parser.parse_args()
+
+    db_path = Path(args.db_path)
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        with ProjectDatabase(db_path=str(db_path)) as db:
+            has_catalog = db.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'archive_partitions'"
+            ).fetchone()
+            if not has_catalog:
+                print("❌ Archival requires migration 010; run migrate.py first", file=sys.stderr)
+                sys.exit(1)
+
+            if args.command == "archive":
+                run_archive(db, args.older_than_days, args.tables, args.dry_run, args.vacuum)
+            elif args.command == "list":
+                run_list(db)
+            else:
+                run_purge(db, args.before)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
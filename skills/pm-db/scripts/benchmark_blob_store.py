@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Cached File Storage Benchmark for PM-DB
+
+Compares inline cached_files content (schema before migration 006) with
+the content-addressed, compressed blob store (migration 006) on a
+memory-bank corpus: database and WAL size, cache_file throughput, and
+get_cached_file latency with the in-process LRU disabled.
+
+The corpus models several projects caching their memory-bank files
+(built from the memory-bank-initialize templates and filled in with this
+repository's own markdown) plus shared reference docs that every project
+caches verbatim. Runs against scratch databases; the real
+~/.claude/projects.db is never touched.
+
+Usage:
+    python3 skills/pm-db/scripts/benchmark_blob_store.py
+    python3 skills/pm-db/scripts/benchmark_blob_store.py --projects 50
+    python3 skills/pm-db/scripts/benchmark_blob_store.py --format json
+"""
+
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add lib to path
+repo_root = Path(__file__).parent.parent.parent.parent
+lib_path = repo_root / "lib"
+sys.path.insert(0, str(lib_path))
+
+from project_database import ProjectDatabase
+
+TEMPLATES_DIR = repo_root / "skills" / "memory-bank-initialize" / "references" / "templates"
+BLOB_STORE_MIGRATION = 6
+
+
+def load_corpus(projects: int, seed: int = 42) -> List[Tuple[str, str]]:
+    """
+    Build (file_path, content) pairs for the benchmark.
+
+    Each project gets the six memory-bank files. About a third are left as
+    the unedited template (as after memory-bank-initialize); the rest are
+    the template followed by project-specific sections drawn from the
+    repository's markdown. Every project also caches the same shared
+    reference docs.
+    """
+    rng = random.Random(seed)
+    templates = {p.name: p.read_text(encoding='utf-8') for p in sorted(TEMPLATES_DIR.glob("*.md"))}
+
+    docs = [
+        p for p in sorted(repo_root.rglob("*.md"))
+        if ".git" not in p.parts and TEMPLATES_DIR not in p.parents
+    ]
+    sections = []
+    for doc in docs:
+        text = doc.read_text(encoding='utf-8', errors='replace')
+        sections.extend(s for s in text.split("\n## ") if len(s) > 200)
+    shared_docs = [(str(p.relative_to(repo_root)), p.read_text(encoding='utf-8', errors='replace'))
+                   for p in docs if p.name == "SKILL.md"][:12]
+
+    corpus = []
+    for index in range(projects):
+        project = f"project-{index:03d}"
+        for name, template in templates.items():
+            if rng.random() < 0.33:
+                content = template
+            else:
+                picked = rng.sample(sections, k=min(len(sections), rng.randint(2, 8)))
+                content = template + "\n## " + "\n## ".join(picked) + f"\n\n_Last updated for {project}_\n"
+            corpus.append((f"{project}/memory-bank/{name}", content))
+        for path, content in shared_docs:
+            corpus.append((f"{project}/.claude/{path}", content))
+    return corpus
+
+
+def build_database(db_path: str, migrations_dir: Path, blob_store: bool):
+    """Apply migrations, stopping before the blob store for the inline baseline."""
+    with ProjectDatabase(db_path) as db:
+        for migration_file in sorted(migrations_dir.glob("*.sql")):
+            version = int(migration_file.stem.split("_")[0])
+            if not blob_store and version >= BLOB_STORE_MIGRATION:
+                continue
+            db.conn.executescript(migration_file.read_text(encoding='utf-8'))
+
+
+def file_sizes(db_path: str) -> Dict[str, int]:
+    """Sizes of the database file and its WAL."""
+    wal = Path(db_path + "-wal")
+    return {
+        'db_bytes': os.path.getsize(db_path),
+        'wal_bytes': wal.stat().st_size if wal.exists() else 0,
+    }
+
+
+def run_mode(corpus: List[Tuple[str, str]], migrations_dir: Path, blob_store: bool,
+             lookups: int) -> Dict[str, float]:
+    """Load the corpus into a fresh database and measure it."""
+    tmp = tempfile.mkdtemp()
+    try:
+        db_path = str(Path(tmp) / "projects.db")
+        build_database(db_path, migrations_dir, blob_store)
+
+        db = ProjectDatabase(db_path, file_cache_entries=0)
+        # Keep the WAL from being folded back mid-load so its growth is visible
+        db.conn.execute("PRAGMA wal_autocheckpoint=0")
+
+        start = time.perf_counter()
+        for file_path, content in corpus:
+            db.cache_file(file_path, content)
+        load_seconds = time.perf_counter() - start
+        after_load = file_sizes(db_path)
+
+        rng = random.Random(7)
+        samples = []
+        for file_path, _ in rng.choices(corpus, k=lookups):
+            start = time.perf_counter()
+            db.get_cached_file(file_path)
+            samples.append((time.perf_counter() - start) * 1000)
+
+        blob_stats = db.get_blob_store_stats()
+        db.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        db.conn.execute("VACUUM")
+        db.close()
+        compacted = file_sizes(db_path)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    ordered = sorted(samples)
+    return {
+        'files': len(corpus),
+        'logical_bytes': sum(len(c.encode('utf-8')) for _, c in corpus),
+        'wal_bytes_after_load': after_load['wal_bytes'],
+        'db_bytes_vacuumed': compacted['db_bytes'],
+        'cache_file_per_sec': round(len(corpus) / load_seconds, 1),
+        'get_p50_ms': round(statistics.median(ordered), 4),
+        'get_p95_ms': round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)], 4),
+        'blobs': blob_stats.get('blobs', 0),
+    }
+
+
+def main():
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Compare inline and blob-store cached file content"
+    )
+    parser.add_argument(
+        "--projects",
+        type=int,
+        default=25,
+        help="Projects in the synthetic corpus (default: 25)"
+    )
+    parser.add_argument(
+        "--lookups",
+        type=int,
+        default=2000,
+        help="get_cached_file calls per mode (default: 2000)"
+    )
+    parser.add_argument(
+        "--migrations-dir",
+        default=str(repo_root / "migrations"),
+        help="Path to migrations directory (default: ~/.claude/migrations)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=['text', 'json'],
+        default='text',
+        help="Output format (default: text)"
+    )
+
+    args = parser.parse_args()
+
+    migrations_dir = Path(args.migrations_dir)
+    corpus = load_corpus(args.projects)
+    results = {
+        'inline': run_mode(corpus, migrations_dir, False, args.lookups),
+        'blob': run_mode(corpus, migrations_dir, True, args.lookups),
+    }
+
+    if args.format == 'json':
+        print(json.dumps(results, indent=2))
+        return
+
+    inline, blob = results['inline'], results['blob']
+    print(f"\nCorpus: {inline['files']} files, {inline['logical_bytes'] / 1024:.0f} KiB "
+          f"({args.projects} projects, {blob['blobs']} distinct contents)")
+    print(f"{'metric':<24} {'inline':>12} {'blob':>12}")
+    for key, label in (
+        ('db_bytes_vacuumed', 'db size (KiB)'),
+        ('wal_bytes_after_load', 'wal after load (KiB)'),
+    ):
+        print(f"{label:<24} {inline[key] / 1024:>12.0f} {blob[key] / 1024:>12.0f}")
+    for key, label in (
+        ('cache_file_per_sec', 'cache_file / sec'),
+        ('get_p50_ms', 'get p50 (ms)'),
+        ('get_p95_ms', 'get p95 (ms)'),
+    ):
+        print(f"{label:<24} {inline[key]:>12} {blob[key]:>12}")
+
+    print(f"\nDatabase size reduction: {inline['db_bytes_vacuumed'] / blob['db_bytes_vacuumed']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Hook Latency Benchmark for the PM-DB Daemon
+
+Measures end-to-end latency of a PM-DB hook (process start, database
+access, JSON output) with direct ProjectDatabase access versus the
+Unix-socket daemon, plus the in-process cost of opening a connection and
+making one call on each path.
+
+Runs against a scratch database built from the migrations directory; the
+real ~/.claude/projects.db is never touched.
+
+Usage:
+    python3 skills/pm-db/scripts/benchmark_hooks.py
+    python3 skills/pm-db/scripts/benchmark_hooks.py --iterations 200
+    python3 skills/pm-db/scripts/benchmark_hooks.py --format json
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add lib and scripts to path
+repo_root = Path(__file__).parent.parent.parent.parent
+lib_path = repo_root / "lib"
+sys.path.insert(0, str(lib_path))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from project_database import ProjectDatabase
+from pm_db_client import connect
+import migrate
+
+HOOK_PATH = repo_root / "hooks" / "pm-db" / "on-task-run-complete.py"
+DAEMON_PATH = lib_path / "pm_db_daemon.py"
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    """Summarize latency samples in milliseconds."""
+    ordered = sorted(samples_ms)
+    p95_index = min(int(len(ordered) * 0.95), len(ordered) - 1)
+    return {
+        'mean_ms': round(statistics.mean(ordered), 3),
+        'p50_ms': round(statistics.median(ordered), 3),
+        'p95_ms': round(ordered[p95_index], 3),
+        'min_ms': round(ordered[0], 3),
+    }
+
+
+def seed_database(db_path: str, task_run_count: int) -> List[int]:
+    """
+    Create one phase run with task_run_count pending task runs.
+
+    Returns:
+        Task run IDs for the hook to complete
+    """
+    with ProjectDatabase(db_path) as db:
+        project_id = db.create_project("benchmark", "/tmp/benchmark")
+        phase_id = db.create_phase(project_id, "benchmark-phase")
+        plan_id = db.create_phase_plan(phase_id, "Benchmark plan")
+        task_id = db.create_task(plan_id, "1.0", "Benchmark task", "", 1)
+        db.approve_phase_plan(plan_id, "benchmark")
+        run_id = db.create_phase_run(phase_id, plan_id, "benchmark-agent")
+        db.start_phase_run(run_id)
+        return [db.create_task_run(run_id, task_id) for _ in range(task_run_count)]
+
+
+def time_hook(task_run_ids: List[int], env: Dict[str, str]) -> List[float]:
+    """Run the hook once per task run and return latencies."""
+    samples = []
+    for task_run_id in task_run_ids:
+        payload = json.dumps({"task_run_id": task_run_id, "exit_code": 0})
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, str(HOOK_PATH)],
+            input=payload,
+            capture_output=True,
+            text=True,
+            env=env
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0 or '"completed"' not in result.stdout:
+            raise RuntimeError(f"Hook failed: {result.stderr.strip() or result.stdout.strip()}")
+    return samples
+
+
+def time_in_process(db_path: str, socket_path: str, iterations: int) -> Dict[str, List[float]]:
+    """Time open + one read + close on each path without process startup."""
+    direct, daemon = [], []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        db = ProjectDatabase(db_path)
+        db.list_projects()
+        db.close()
+        direct.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        client = connect(socket_path)
+        client.list_projects()
+        client.close()
+        daemon.append((time.perf_counter() - start) * 1000)
+    return {'direct': direct, 'daemon': daemon}
+
+
+def wait_for_daemon(socket_path: str, timeout: float = 10.0):
+    """Block until the daemon accepts connections."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        client = connect(socket_path)
+        if client is not None:
+            client.close()
+            return
+        time.sleep(0.05)
+    raise RuntimeError("Daemon did not start")
+
+
+def run_benchmark(iterations: int, migrations_dir: str) -> Dict[str, Dict[str, float]]:
+    """Run all benchmark modes and return summaries."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "projects.db")
+        socket_path = str(Path(tmp) / "pm-db.sock")
+
+        if not migrate.run_migrations(db_path=db_path, migrations_dir=migrations_dir):
+            raise RuntimeError(f"Migrations failed from {migrations_dir}")
+
+        task_run_ids = seed_database(db_path, iterations * 2)
+
+        env = {
+            **os.environ,
+            'PYTHONPATH': str(lib_path),
+            'CLAUDE_DB_PATH': db_path,
+            'PM_DB_SOCKET': socket_path,
+        }
+
+        direct_env = {**env, 'PM_DB_DAEMON': '0'}
+        hook_direct = time_hook(task_run_ids[:iterations], direct_env)
+
+        daemon = subprocess.Popen(
+            [sys.executable, str(DAEMON_PATH), "serve",
+             "--socket", socket_path, "--db-path", db_path],
+            stderr=subprocess.DEVNULL
+        )
+        try:
+            wait_for_daemon(socket_path)
+            hook_daemon = time_hook(task_run_ids[iterations:], env)
+            in_process = time_in_process(db_path, socket_path, iterations)
+        finally:
+            daemon.terminate()
+            daemon.wait(timeout=10)
+
+    return {
+        'hook_direct': summarize(hook_direct),
+        'hook_daemon': summarize(hook_daemon),
+        'open_call_close_direct': summarize(in_process['direct']),
+        'open_call_close_daemon': summarize(in_process['daemon']),
+    }
+
+
+def main():
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark PM-DB hook latency with and without the daemon"
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=50,
+        help="Hook invocations per mode (default: 50)"
+    )
+    parser.add_argument(
+        "--migrations-dir",
+        default=str(repo_root / "migrations"),
+        help="Path to migrations directory (default: ~/.claude/migrations)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=['text', 'json'],
+        default='text',
+        help="Output format (default: text)"
+    )
+
+    args = parser.parse_args()
+
+    results = run_benchmark(args.iterations, args.migrations_dir)
+
+    if args.format == 'json':
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"\nPM-DB hook latency ({args.iterations} iterations per mode)")
+    print(f"{'mode':<26} {'mean':>9} {'p50':>9} {'p95':>9} {'min':>9}")
+    for mode, stats in results.items():
+        print(f"{mode:<26} {stats['mean_ms']:>7.2f}ms {stats['p50_ms']:>7.2f}ms "
+              f"{stats['p95_ms']:>7.2f}ms {stats['min_ms']:>7.2f}ms")
+
+    speedup = results['hook_direct']['p50_ms'] / results['hook_daemon']['p50_ms']
+    print(f"\nHook p50 speedup with daemon: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Event Archival Tests for PM-DB System
+
+Tests archive_events() and archive-aware reads (migration 010):
+- Old rows move to per-month archive databases with rollups and a catalog
+- Invocations still referenced by checklists or active children stay put
+- Date-ranged reads combine the main database with attached archives
+- Agent metrics are unchanged by archiving (rollups or archives)
+- Re-running archive_events is idempotent; purge_archives keeps rollups
+
+Usage:
+    python3 skills/pm-db/tests/test_archival.py
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add lib to path
+lib_path = Path(__file__).parent.parent.parent.parent / "lib"
+sys.path.insert(0, str(lib_path))
+
+from project_database import ProjectDatabase
+
+
+class TestEventArchival(unittest.TestCase):
+    """Test archive_events and reads across archives"""
+
+    def setUp(self):
+        """Set up a database with invocations, file reads and task updates across months"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = str(Path(self.temp_dir) / "projects.db")
+
+        self.db = ProjectDatabase(db_path=self.db_path)
+        migrations_dir = Path(__file__).parent.parent.parent.parent / "migrations"
+        for migration_file in sorted(migrations_dir.glob("*.sql")):
+            with open(migration_file, 'r') as f:
+                self.db.conn.executescript(f.read())
+
+        project_id = self.db.create_project("archive-test", "/tmp/archive-test")
+        phase_id = self.db.create_phase(project_id, "feature-archive")
+        plan_id = self.db.create_phase_plan(phase_id, "Archive plan")
+        task_id = self.db.create_task(plan_id, "1.0", "Task", "", 1)
+        run_id = self.db.create_phase_run(phase_id, plan_id)
+        self.task_run_id = self.db.create_task_run(run_id, task_id)
+
+        # Two old months and one recent invocation per agent
+        self.invocations = {}
+        for started, agent in [
+            ("2025-01-10 09:00:00", "backend-agent"),
+            ("2025-01-20 09:00:00", "qa-agent"),
+            ("2025-02-05 09:00:00", "backend-agent"),
+            (None, "backend-agent"),
+        ]:
+            invocation_id = self.db.create_agent_invocation(agent, "testing")
+            self.db.log_file_read(invocation_id, "a.md", "hit", 400)
+            self.db.log_file_read(invocation_id, "b.md", "miss", 800)
+            self.db.complete_agent_invocation(invocation_id, "completed")
+            if started:
+                self.db.conn.execute(
+                    "UPDATE agent_invocations SET started_at = ?, completed_at = datetime(?, '+90 seconds') WHERE id = ?",
+                    (started, started, invocation_id)
+                )
+                self.db.conn.execute(
+                    "UPDATE agent_file_reads SET read_at = ? WHERE invocation_id = ?",
+                    (started, invocation_id)
+                )
+            self.invocations[started or "recent"] = invocation_id
+
+        for created in ("2025-01-11 10:00:00", "2025-02-06 10:00:00", None):
+            update_id = self.db.add_task_update(self.task_run_id, "progress", f"at {created}")
+            if created:
+                self.db.conn.execute(
+                    "UPDATE task_updates SET created_at = ? WHERE id = ?", (created, update_id)
+                )
+        self.db.conn.commit()
+
+    def tearDown(self):
+        """Clean up"""
+        self.db.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def count(self, table: str) -> int:
+        """Rows left in the main database"""
+        return self.db.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def test_dry_run_changes_nothing(self):
+        """dry_run reports per-month counts without moving rows"""
+        result = self.db.archive_events(older_than_days=30, dry_run=True)
+
+        self.assertEqual(result['agent_invocations'], {'2025-01': 2, '2025-02': 1})
+        self.assertEqual(result['agent_file_reads'], {'2025-01': 4, '2025-02': 2})
+        self.assertEqual(result['task_updates'], {'2025-01': 1, '2025-02': 1})
+        self.assertEqual(self.count('agent_invocations'), 4)
+        self.assertEqual(self.db.list_archives(), [])
+        self.assertFalse((Path(self.temp_dir) / "archive").exists())
+
+    def test_archive_moves_rows_by_month(self):
+        """Old rows land in per-month archives with catalog entries and rollups"""
+        result = self.db.archive_events(older_than_days=30)
+
+        self.assertEqual(result['agent_invocations'], {'2025-01': 2, '2025-02': 1})
+        self.assertEqual(self.count('agent_invocations'), 1)
+        self.assertEqual(self.count('agent_file_reads'), 2)
+        self.assertEqual(self.count('task_updates'), 1)
+
+        archive_dir = Path(self.temp_dir) / "archive"
+        self.assertEqual(
+            sorted(p.name for p in archive_dir.glob("*.db")),
+            ["projects-2025-01.db", "projects-2025-02.db"]
+        )
+        catalog = {(a['source_table'], a['period']): a['row_count'] for a in self.db.list_archives()}
+        self.assertEqual(catalog[('agent_file_reads', '2025-01')], 4)
+        self.assertEqual(catalog[('task_updates', '2025-02')], 1)
+
+        rollups = self.db.get_archive_rollups('agent_invocations', '2025-01', '2025-01')
+        self.assertEqual(
+            [(r['group_key'], r['row_count'], r['cache_hits'], r['timed_count']) for r in rollups],
+            [('backend-agent', 1, 1, 1), ('qa-agent', 1, 1, 1)]
+        )
+        reads = self.db.get_archive_rollups('agent_file_reads', '2025-02')
+        self.assertEqual({r['group_key']: r['total_bytes'] for r in reads}, {'hit': 400, 'miss': 800})
+
+    def test_archive_execution_logs(self):
+        """Old execution_logs rows are archived by executed_at with exit code rollups"""
+        for executed, exit_code in [
+            ("2020-03-01 12:00:00", 0),
+            ("2020-03-02 12:00:00", 1),
+            (None, 0),
+        ]:
+            self.db.conn.execute(
+                "INSERT INTO execution_logs (task_run_id, command, exit_code, duration_ms, executed_at) "
+                "VALUES (?, 'pytest', ?, 1500, COALESCE(?, datetime('now')))",
+                (self.task_run_id, exit_code, executed)
+            )
+        self.db.conn.commit()
+
+        result = self.db.archive_events(older_than_days=30, tables=['execution_logs'])
+
+        self.assertEqual(result, {'execution_logs': {'2020-03': 2}})
+        self.assertEqual(self.count('execution_logs'), 1)
+        archive = Path(self.temp_dir) / "archive" / "projects-2020-03.db"
+        self.db.conn.execute("ATTACH DATABASE ? AS copy", (str(archive),))
+        archived = self.db.conn.execute("SELECT COUNT(*) FROM copy.execution_logs").fetchone()[0]
+        self.db.conn.execute("DETACH DATABASE copy")
+        self.assertEqual(archived, 2)
+
+        rollups = self.db.get_archive_rollups('execution_logs')
+        self.assertEqual(
+            [(r['period'], r['row_count'], r['completed'], r['failed'], r['total_duration_seconds'])
+             for r in rollups],
+            [('2020-03', 2, 1, 1, 3.0)]
+        )
+
+    def test_referenced_invocations_stay(self):
+        """Invocations with checklists or active children are not archived"""
+        with_checklist = self.invocations["2025-01-10 09:00:00"]
+        self.db.create_checklist(with_checklist, "Review", 1)
+        parent = self.invocations["2025-01-20 09:00:00"]
+        self.db.conn.execute(
+            "UPDATE agent_invocations SET parent_invocation_id = ? WHERE id = ?",
+            (parent, self.invocations["recent"])
+        )
+        self.db.conn.commit()
+
+        result = self.db.archive_events(older_than_days=30, tables=['agent_invocations'])
+
+        self.assertEqual(result['agent_invocations'], {'2025-02': 1})
+        self.assertEqual(result['agent_file_reads'], {'2025-02': 2})
+        self.assertNotIn('task_updates', result)
+        self.assertIsNotNone(self.db.get_agent_invocation(with_checklist))
+        self.assertEqual(len(self.db.get_agent_file_reads(parent)), 2)
+
+    def test_reads_span_archives(self):
+        """Date-ranged reads include archived rows; unranged reads do not"""
+        recent = self.invocations["recent"]
+        before = self.db.list_agent_invocations(agent_name='backend-agent', start_date='2025-01-01', end_date='2025-12-31')
+        self.db.archive_events(older_than_days=30)
+
+        self.assertEqual(len(self.db.list_agent_invocations()), 1)
+        after = self.db.list_agent_invocations(agent_name='backend-agent', start_date='2025-01-01', end_date='2025-12-31')
+        self.assertEqual(after, before)
+        self.assertEqual([r['started_at'][:10] for r in after], ['2025-02-05', '2025-01-10'])
+
+        old = self.invocations["2025-02-05 09:00:00"]
+        self.assertEqual(self.db.get_agent_file_reads(old), [])
+        self.assertEqual(len(self.db.get_agent_file_reads(old, start_date='2025-02-01')), 2)
+        self.assertEqual(len(self.db.get_agent_file_reads(recent, start_date='2025-02-01')), 2)
+
+        updates = self.db.get_task_updates(self.task_run_id, start_date='2025-01-01')
+        self.assertEqual(len(updates), 3)
+        self.assertEqual(updates, sorted(updates, key=lambda u: u['created_at']))
+        self.assertEqual(len(self.db.get_task_updates(self.task_run_id, end_date='2025-01-31')), 1)
+
+    def test_metrics_unchanged_by_archiving(self):
+        """All-time metrics use rollups, ranged metrics use archives"""
+        all_time = self.db.get_agent_metrics()
+        ranged = self.db.get_agent_metrics('backend-agent', '2025-01-01', '2025-02-28')
+
+        self.db.archive_events(older_than_days=30)
+
+        self.assertEqual(self.db.get_agent_metrics(), all_time)
+        self.assertEqual(self.db.get_agent_metrics('backend-agent', '2025-01-01', '2025-02-28'), ranged)
+        self.assertEqual(ranged['total_invocations'], 2)
+
+    def test_rerun_is_idempotent(self):
+        """A second run finds nothing; rows re-staged after a partial run are not duplicated"""
+        self.db.archive_events(older_than_days=30)
+        self.assertEqual(self.db.archive_events(older_than_days=30), {})
+
+        # Simulate a run that wrote the archive but not the main delete
+        invocation_id = self.db.create_agent_invocation("docs-agent", "testing")
+        self.db.complete_agent_invocation(invocation_id, "completed")
+        self.db.conn.execute(
+            "UPDATE agent_invocations SET started_at = '2025-01-15 08:00:00', completed_at = '2025-01-15 08:01:00' WHERE id = ?",
+            (invocation_id,)
+        )
+        self.db.conn.commit()
+        archive = Path(self.temp_dir) / "archive" / "projects-2025-01.db"
+        self.db.conn.execute("ATTACH DATABASE ? AS copy", (str(archive),))
+        self.db.conn.execute("INSERT INTO copy.agent_invocations SELECT * FROM main.agent_invocations WHERE id = ?", (invocation_id,))
+        self.db.conn.commit()
+        self.db.conn.execute("DETACH DATABASE copy")
+
+        self.db.archive_events(older_than_days=30)
+
+        archived = self.db.list_agent_invocations(agent_name='docs-agent', start_date='2025-01-01')
+        self.assertEqual(len(archived), 1)
+
+    def test_purge_keeps_rollups(self):
+        """purge_archives deletes old files and catalog rows but keeps rollups"""
+        all_time = self.db.get_agent_metrics()
+        self.db.archive_events(older_than_days=30)
+
+        self.assertEqual(self.db.purge_archives('2025-02'), 1)
+
+        self.assertEqual({a['period'] for a in self.db.list_archives()}, {'2025-02'})
+        self.assertFalse((Path(self.temp_dir) / "archive" / "projects-2025-01.db").exists())
+        self.assertEqual(self.db.get_agent_metrics(), all_time)
+        self.assertEqual(len(self.db.list_agent_invocations(start_date='2025-01-01')), 2)
+
+        with self.assertRaises(ValueError):
+            self.db.purge_archives('2025')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Blob Store Tests for PM-DB System
+
+Tests content-addressed storage of cached file content (migration 006):
+- Identical content under different paths is stored once
+- Large content is compressed and round-trips unchanged
+- Reference counts follow inserts, updates and deletes
+- Orphaned blobs are garbage collected after a grace period, never while
+  cache_file is about to reference them
+- Inline rows from before the migration stay readable and can be converted
+
+Usage:
+    python3 skills/pm-db/tests/test_blob_store.py
+"""
+
+import unittest
+import sqlite3
+import tempfile
+from pathlib import Path
+import sys
+
+# Add lib to path
+lib_path = Path(__file__).parent.parent.parent.parent / "lib"
+sys.path.insert(0, str(lib_path))
+
+from project_database import ProjectDatabase
+
+MIGRATIONS_DIR = Path(__file__).parent.parent.parent.parent / "migrations"
+
+LARGE_DOC = "# Tech Context\n\n" + "- Uses SQLite in WAL mode for the project database\n" * 200
+
+
+class TestBlobStore(unittest.TestCase):
+    """Test blob-backed cache_file / get_cached_file"""
+
+    def setUp(self):
+        """Set up test database"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+
+        self.db = ProjectDatabase(db_path=self.db_path, file_cache_entries=0)
+        for migration_file in sorted(MIGRATIONS_DIR.glob("*.sql")):
+            with open(migration_file, 'r') as f:
+                self.db.conn.executescript(f.read())
+
+    def tearDown(self):
+        """Clean up"""
+        self.db.close()
+        for suffix in ('', '-wal', '-shm'):
+            Path(self.db_path + suffix).unlink(missing_ok=True)
+
+    def ref_count(self, content: str) -> int:
+        row = self.db.conn.execute(
+            "SELECT ref_count FROM content_blobs WHERE content_hash = ?",
+            (self.db.calculate_file_hash(content),)
+        ).fetchone()
+        return row['ref_count'] if row else None
+
+    def test_round_trip_compressed(self):
+        """Large content is compressed and returned unchanged"""
+        self.db.cache_file("project-a/memory-bank/techContext.md", LARGE_DOC)
+
+        row = self.db.get_cached_file("project-a/memory-bank/techContext.md")
+        self.assertEqual(row['content'], LARGE_DOC)
+        self.assertEqual(row['storage'], 'blob')
+        self.assertNotIn('blob_data', row)
+
+        blob = self.db.conn.execute("SELECT compression, stored_size_bytes, raw_size_bytes FROM content_blobs").fetchone()
+        self.assertEqual(blob['compression'], 'zlib')
+        self.assertLess(blob['stored_size_bytes'], blob['raw_size_bytes'])
+
+        inline = self.db.conn.execute("SELECT content FROM cached_files").fetchone()
+        self.assertEqual(inline['content'], '')
+
+    def test_small_content_uncompressed(self):
+        """Content below the threshold is stored as-is"""
+        self.db.cache_file("notes.md", "short")
+        blob = self.db.conn.execute("SELECT compression FROM content_blobs").fetchone()
+        self.assertEqual(blob['compression'], 'none')
+        self.assertEqual(self.db.get_cached_file("notes.md")['content'], "short")
+
+    def test_identical_content_deduplicated(self):
+        """The same document under two paths shares one blob"""
+        self.db.cache_file("project-a/memory-bank/techContext.md", LARGE_DOC)
+        self.db.cache_file("project-b/memory-bank/techContext.md", LARGE_DOC)
+
+        stats = self.db.get_blob_store_stats()
+        self.assertEqual(stats['blobs'], 1)
+        self.assertEqual(stats['files'], 2)
+        self.assertEqual(self.ref_count(LARGE_DOC), 2)
+        self.assertEqual(stats['dedup_ratio'], 2.0)
+
+    def test_ref_counts_follow_changes(self):
+        """Updates and deletes move references between blobs"""
+        self.db.cache_file("a.md", LARGE_DOC)
+        self.db.cache_file("b.md", LARGE_DOC)
+
+        self.db.cache_file("a.md", "# Changed\n")
+        self.assertEqual(self.ref_count(LARGE_DOC), 1)
+        self.assertEqual(self.ref_count("# Changed\n"), 1)
+
+        self.db.invalidate_cache("b.md")
+        self.assertEqual(self.ref_count(LARGE_DOC), 0)
+
+        # Re-caching an orphaned blob's content reuses it
+        self.db.cache_file("c.md", LARGE_DOC)
+        self.assertEqual(self.ref_count(LARGE_DOC), 1)
+        self.assertEqual(self.db.get_blob_store_stats()['blobs'], 2)
+
+    def test_gc_removes_only_orphans(self):
+        """Garbage collection keeps referenced and recently released blobs"""
+        self.db.cache_file("a.md", LARGE_DOC)
+        self.db.cache_file("b.md", "# Other\n")
+        self.db.invalidate_cache("a.md")
+
+        self.assertEqual(self.db.gc_content_blobs(grace_seconds=3600), 0)
+        self.assertEqual(self.db.gc_content_blobs(), 0)
+        self.assertEqual(self.db.gc_content_blobs(grace_seconds=0), 1)
+        self.assertIsNone(self.ref_count(LARGE_DOC))
+        self.assertEqual(self.db.get_cached_file("b.md")['content'], "# Other\n")
+
+    def test_gc_cannot_drop_blob_being_referenced(self):
+        """A blob reused by cache_file is locked against GC until referenced"""
+        self.db.cache_file("a.md", LARGE_DOC)
+        self.db.invalidate_cache("a.md")
+        self.assertEqual(self.ref_count(LARGE_DOC), 0)
+
+        other = ProjectDatabase(db_path=self.db_path)
+        other.conn.execute("PRAGMA busy_timeout = 0")
+        gc_errors = []
+        store_blob = self.db._store_blob
+
+        def store_blob_racing_gc(content_hash, content):
+            # Another process collects orphans between the check and the insert
+            try:
+                other.gc_content_blobs(grace_seconds=0)
+            except sqlite3.OperationalError as e:
+                other.conn.rollback()
+                gc_errors.append(e)
+            store_blob(content_hash, content)
+
+        self.db._store_blob = store_blob_racing_gc
+        try:
+            self.db.cache_file("b.md", LARGE_DOC)
+        finally:
+            other.close()
+
+        self.assertEqual(len(gc_errors), 1)
+        self.assertEqual(self.ref_count(LARGE_DOC), 1)
+        self.assertEqual(self.db.get_cached_file("b.md")['content'], LARGE_DOC)
+
+    def test_unchanged_inline_row_stays_inline(self):
+        """Re-caching unchanged inline content writes no orphan blob"""
+        self.db.conn.execute(
+            """
+            INSERT INTO cached_files (file_path, content_hash, content, file_size_bytes)
+            VALUES (?, ?, ?, ?)
+            """,
+            ("legacy.md", self.db.calculate_file_hash(LARGE_DOC), LARGE_DOC, len(LARGE_DOC))
+        )
+        self.db.conn.commit()
+
+        self.db.cache_file("legacy.md", LARGE_DOC)
+
+        self.assertEqual(self.db.get_blob_store_stats()['blobs'], 0)
+        self.assertEqual(self.db.get_cached_file("legacy.md")['content'], LARGE_DOC)
+
+    def test_inline_rows_readable_and_convertible(self):
+        """Pre-migration inline rows are served and migrated to blobs"""
+        self.db.conn.execute(
+            """
+            INSERT INTO cached_files (file_path, content_hash, content, file_size_bytes)
+            VALUES (?, ?, ?, ?)
+            """,
+            ("legacy.md", self.db.calculate_file_hash(LARGE_DOC), LARGE_DOC, len(LARGE_DOC))
+        )
+        self.db.conn.commit()
+
+        self.assertEqual(self.db.get_cached_file("legacy.md")['content'], LARGE_DOC)
+
+        self.assertEqual(self.db.migrate_cached_content_to_blobs(), 1)
+        self.assertEqual(self.db.get_blob_store_stats()['inline_files'], 0)
+        self.assertEqual(self.ref_count(LARGE_DOC), 1)
+        self.assertEqual(self.db.get_cached_file("legacy.md")['content'], LARGE_DOC)
+
+
+class TestWithoutBlobStore(unittest.TestCase):
+    """Test that databases without migration 006 keep inline storage"""
+
+    def setUp(self):
+        """Set up test database with migrations before 006 only"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+
+        self.db = ProjectDatabase(db_path=self.db_path)
+        for migration_file in sorted(MIGRATIONS_DIR.glob("*.sql")):
+            if int(migration_file.stem.split("_")[0]) >= 6:
+                continue
+            with open(migration_file, 'r') as f:
+                self.db.conn.executescript(f.read())
+
+    def tearDown(self):
+        """Clean up"""
+        self.db.close()
+        for suffix in ('', '-wal', '-shm'):
+            Path(self.db_path + suffix).unlink(missing_ok=True)
+
+    def test_inline_storage(self):
+        """Content is stored in cached_files when content_blobs is absent"""
+        self.db.cache_file("a.md", LARGE_DOC)
+
+        row = self.db.conn.execute("SELECT content FROM cached_files").fetchone()
+        self.assertEqual(row['content'], LARGE_DOC)
+        self.assertEqual(self.db.get_cached_file("a.md")['content'], LARGE_DOC)
+        self.assertEqual(self.db.get_blob_store_stats(), {'enabled': False})
+        self.assertEqual(self.db.gc_content_blobs(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
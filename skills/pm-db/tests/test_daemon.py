@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Daemon Tests for PM-DB System
+
+Tests the Unix-socket daemon and its thin client:
+- Method calls are forwarded and results returned as plain JSON values
+- Errors keep their type (ValueError) or surface as DaemonError
+- open_database() falls back to direct access when no daemon is running
+  or the daemon serves a different database than CLAUDE_DB_PATH
+- Hooks produce the same output through the daemon
+
+Usage:
+    python3 skills/pm-db/tests/test_daemon.py
+"""
+
+import unittest
+import json
+import os
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+import sys
+
+# Add lib to path
+lib_path = Path(__file__).parent.parent.parent.parent / "lib"
+sys.path.insert(0, str(lib_path))
+
+from project_database import ProjectDatabase
+from pm_db_client import DaemonClient, DaemonError, connect, open_database
+from pm_db_daemon import PMDBServer, remove_stale_socket
+
+
+@unittest.skipUnless(hasattr(__import__('socket'), 'AF_UNIX'), "Unix sockets required")
+class TestDaemon(unittest.TestCase):
+    """Test daemon request handling"""
+
+    def setUp(self):
+        """Start a daemon on a scratch database and socket"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.temp_dir.name) / "projects.db")
+        self.socket_path = str(Path(self.temp_dir.name) / "pm-db.sock")
+
+        db = ProjectDatabase(db_path=self.db_path)
+        migrations_dir = Path(__file__).parent.parent.parent.parent / "migrations"
+        for migration_file in sorted(migrations_dir.glob("*.sql")):
+            with open(migration_file, 'r') as f:
+                db.conn.executescript(f.read())
+        db.close()
+
+        self.server = PMDBServer(self.socket_path, ProjectDatabase(db_path=self.db_path))
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True
+        )
+        self.thread.start()
+
+    def tearDown(self):
+        """Stop daemon and clean up"""
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join(timeout=5)
+        self.temp_dir.cleanup()
+
+    def test_forwards_calls(self):
+        """Writes and reads go through the daemon's connection"""
+        with connect(self.socket_path) as client:
+            self.assertIsInstance(client, DaemonClient)
+            project_id = client.create_project("daemon-test", "/tmp/daemon-test")
+            project = client.get_project(project_id)
+            self.assertEqual(project['name'], "daemon-test")
+
+        # Visible to a direct connection
+        with ProjectDatabase(db_path=self.db_path) as db:
+            self.assertEqual(db.get_project(project_id)['name'], "daemon-test")
+
+    def test_value_error_preserved(self):
+        """Validation errors raise ValueError on the client"""
+        with connect(self.socket_path) as client:
+            with self.assertRaises(ValueError):
+                client.create_project("", "/tmp/x")
+
+    def test_unknown_and_private_methods_rejected(self):
+        """Only public ProjectDatabase methods are callable"""
+        with connect(self.socket_path) as client:
+            with self.assertRaises(DaemonError):
+                client.call("drop_everything")
+            with self.assertRaises(DaemonError):
+                client.call("close")
+            with self.assertRaises(DaemonError):
+                client.call("_write_event")
+
+    def test_ping_and_stats(self):
+        """Daemon reports identity and counters"""
+        with connect(self.socket_path) as client:
+            self.assertEqual(client.ping()['db_path'], self.db_path)
+            client.list_projects()
+            stats = client.daemon_stats()
+            self.assertGreaterEqual(stats['requests_served'], 2)
+
+    def test_claude_db_path_bypasses_other_daemon(self):
+        """open_database() uses the daemon only if it serves CLAUDE_DB_PATH"""
+        scratch_path = str(Path(self.temp_dir.name) / "scratch.db")
+        os.environ['PM_DB_SOCKET'] = self.socket_path
+        try:
+            os.environ['CLAUDE_DB_PATH'] = scratch_path
+            db = open_database()
+            self.assertIsInstance(db, ProjectDatabase)
+            self.assertEqual(db.db_path, scratch_path)
+            db.close()
+
+            os.environ['CLAUDE_DB_PATH'] = self.db_path
+            with open_database() as client:
+                self.assertIsInstance(client, DaemonClient)
+
+            del os.environ['CLAUDE_DB_PATH']
+            with open_database() as client:
+                self.assertIsInstance(client, DaemonClient)
+        finally:
+            del os.environ['PM_DB_SOCKET']
+            os.environ.pop('CLAUDE_DB_PATH', None)
+
+    def test_live_socket_not_removed(self):
+        """Starting a second daemon on a live socket is refused"""
+        self.assertFalse(remove_stale_socket(self.socket_path))
+        self.assertTrue(os.path.exists(self.socket_path))
+
+    def test_hook_through_daemon(self):
+        """A hook run with the daemon up writes through it"""
+        with ProjectDatabase(db_path=self.db_path) as db:
+            project_id = db.create_project("hook-test", "/tmp/hook-test")
+            phase_id = db.create_phase(project_id, "phase")
+            plan_id = db.create_phase_plan(phase_id, "plan")
+            task_id = db.create_task(plan_id, "1.0", "Task", "", 1)
+            run_id = db.create_phase_run(phase_id, plan_id)
+            task_run_id = db.create_task_run(run_id, task_id)
+
+        hook_path = Path(__file__).parent.parent.parent.parent / "hooks/pm-db/on-task-run-complete.py"
+        result = subprocess.run(
+            [sys.executable, str(hook_path)],
+            input=json.dumps({"task_run_id": task_run_id, "exit_code": 0}),
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": str(lib_path), "PM_DB_SOCKET": self.socket_path}
+        )
+        self.assertEqual(json.loads(result.stdout)['status'], 'completed')
+
+        with connect(self.socket_path) as client:
+            self.assertGreaterEqual(client.daemon_stats()['requests_served'], 1)
+            self.assertEqual(client.get_task_run(task_run_id)['status'], 'completed')
+
+
+class TestClientFallback(unittest.TestCase):
+    """Test fallback to direct database access"""
+
+    def test_no_daemon_returns_none(self):
+        """connect() returns None when nothing is listening"""
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(connect(str(Path(tmp) / "missing.sock")))
+
+    def test_open_database_falls_back(self):
+        """open_database() returns a ProjectDatabase without a daemon"""
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ['PM_DB_SOCKET'] = str(Path(tmp) / "missing.sock")
+            os.environ['CLAUDE_DB_PATH'] = str(Path(tmp) / "projects.db")
+            try:
+                db = open_database()
+                self.assertIsInstance(db, ProjectDatabase)
+                self.assertEqual(db.db_path, os.environ['CLAUDE_DB_PATH'])
+                db.close()
+            finally:
+                del os.environ['PM_DB_SOCKET']
+                del os.environ['CLAUDE_DB_PATH']
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
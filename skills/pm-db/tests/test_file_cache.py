@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+File Cache Tests for PM-DB System
+
+Tests the read-through cache in front of get_cached_file:
+- LRU and priority eviction policies, entry and byte limits
+- Lookups keyed by content_hash
+- No database writes on the read path
+- Batched flush of hit/miss counters to cached_files and cache_statistics
+- Stat-signature lookups that skip re-hashing unchanged files
+
+Usage:
+    python3 skills/pm-db/tests/test_file_cache.py
+"""
+
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add lib to path
+lib_path = Path(__file__).parent.parent.parent.parent / "lib"
+sys.path.insert(0, str(lib_path))
+
+from project_database import ProjectDatabase, FileContentCache
+
+
+def make_row(file_path: str, priority: str = 'normal', size: int = 10, content_hash: str = 'h') -> dict:
+    """Build a minimal cached_files row"""
+    return {
+        'file_path': file_path,
+        'content_hash': content_hash,
+        'content': 'x' * size,
+        'file_size_bytes': size,
+        'cache_priority': priority,
+    }
+
+
+class TestFileContentCache(unittest.TestCase):
+    """Test the cache in isolation"""
+
+    def test_lru_eviction(self):
+        """Least recently used entry is evicted first"""
+        cache = FileContentCache(max_entries=2, policy='lru')
+        cache.put(make_row('a.md'))
+        cache.put(make_row('b.md'))
+        cache.get('a.md')
+        cache.put(make_row('c.md'))
+
+        self.assertIsNotNone(cache.get('a.md'))
+        self.assertIsNone(cache.get('b.md'))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_priority_eviction(self):
+        """Low priority entries go before recently unused high priority ones"""
+        cache = FileContentCache(max_entries=2, policy='priority')
+        cache.put(make_row('high.md', 'high'))
+        cache.put(make_row('low.md', 'low'))
+        cache.get('low.md')
+        cache.put(make_row('normal.md', 'normal'))
+
+        self.assertIsNotNone(cache.get('high.md'))
+        self.assertIsNone(cache.get('low.md'))
+        self.assertIsNotNone(cache.get('normal.md'))
+
+    def test_byte_limit(self):
+        """Total content size stays within max_bytes"""
+        cache = FileContentCache(max_entries=100, max_bytes=25)
+        cache.put(make_row('a.md', size=10))
+        cache.put(make_row('b.md', size=10))
+        cache.put(make_row('c.md', size=10))
+
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.stats()['bytes'], 25)
+
+        # Oversized entries are not cached at all
+        cache.put(make_row('huge.md', size=100))
+        self.assertIsNone(cache.get('huge.md'))
+
+    def test_content_hash_mismatch_is_miss(self):
+        """A lookup with a different hash does not return the entry"""
+        cache = FileContentCache()
+        cache.put(make_row('a.md', content_hash='old'))
+
+        self.assertIsNone(cache.get('a.md', 'new'))
+        self.assertIsNotNone(cache.get('a.md', 'old'))
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_invalid_policy(self):
+        """Unknown policies are rejected"""
+        with self.assertRaises(ValueError):
+            FileContentCache(policy='fifo')
+
+
+class TestGetCachedFile(unittest.TestCase):
+    """Test get_cached_file through ProjectDatabase"""
+
+    def setUp(self):
+        """Set up test database"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+
+        self.db = ProjectDatabase(db_path=self.db_path)
+        migrations_dir = Path(__file__).parent.parent.parent.parent / "migrations"
+        for migration_file in sorted(migrations_dir.glob("*.sql")):
+            with open(migration_file, 'r') as f:
+                self.db.conn.executescript(f.read())
+
+        self.db.cache_file("memory-bank/activeContext.md", "# Active context\n" * 20)
+        self.content_hash = self.db.calculate_file_hash("# Active context\n" * 20)
+
+    def tearDown(self):
+        """Clean up"""
+        self.db.close()
+        for suffix in ('', '-wal', '-shm'):
+            Path(self.db_path + suffix).unlink(missing_ok=True)
+
+    def test_read_path_does_not_write(self):
+        """Repeated hits issue no writes until flushed"""
+        changes_before = self.db.conn.total_changes
+
+        for _ in range(5):
+            row = self.db.get_cached_file("memory-bank/activeContext.md", self.content_hash)
+            self.assertEqual(row['content_hash'], self.content_hash)
+
+        self.assertEqual(self.db.conn.total_changes, changes_before)
+        self.assertEqual(row['hit_count'], 5)
+        self.assertEqual(self.db.get_file_cache_stats()['pending_lookups'], 5)
+
+    def test_flush_writes_counters(self):
+        """Flushed counters land in cached_files and cache_statistics"""
+        for _ in range(3):
+            self.db.get_cached_file("memory-bank/activeContext.md", self.content_hash)
+        self.db.get_cached_file("memory-bank/activeContext.md", "stale-hash")
+        self.db.get_cached_file("memory-bank/missing.md")
+
+        self.assertEqual(self.db.flush_cache_stats(), 5)
+
+        row = self.db.conn.execute(
+            "SELECT hit_count, access_count FROM cached_files WHERE file_path = ?",
+            ("memory-bank/activeContext.md",)
+        ).fetchone()
+        self.assertEqual(row['hit_count'], 3)
+        self.assertEqual(row['access_count'], 3)
+
+        overall = self.db.get_cache_stats()
+        self.assertEqual(overall['total_reads'], 5)
+        self.assertEqual(overall['cache_hits'], 3)
+        self.assertEqual(overall['cache_misses'], 2)
+
+        per_file = self.db.get_cache_stats(file_path="memory-bank/activeContext.md")
+        self.assertEqual(per_file['total_reads'], 4)
+
+        # A second flush adds to the existing rows
+        self.db.get_cached_file("memory-bank/activeContext.md", self.content_hash)
+        self.db.flush_cache_stats()
+        self.assertEqual(self.db.get_cache_stats()['total_reads'], 6)
+
+    def test_cache_file_refreshes_entry(self):
+        """Updating a cached file is visible on the next lookup"""
+        self.db.get_cached_file("memory-bank/activeContext.md")
+        self.db.cache_file("memory-bank/activeContext.md", "# Changed\n")
+
+        row = self.db.get_cached_file("memory-bank/activeContext.md")
+        self.assertEqual(row['content'], "# Changed\n")
+
+    def test_invalidate_removes_entry(self):
+        """Invalidated files are no longer served from memory"""
+        self.db.get_cached_file("memory-bank/activeContext.md")
+        self.db.invalidate_cache("memory-bank/activeContext.md")
+
+        self.assertIsNone(self.db.get_cached_file("memory-bank/activeContext.md"))
+
+
+class TestGetCachedFileByStat(unittest.TestCase):
+    """Test (size, mtime_ns, inode) lookups"""
+
+    def setUp(self):
+        """Set up test database"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+
+        self.db = ProjectDatabase(db_path=self.db_path)
+        migrations_dir = Path(__file__).parent.parent.parent.parent / "migrations"
+        for migration_file in sorted(migrations_dir.glob("*.sql")):
+            with open(migration_file, 'r') as f:
+                self.db.conn.executescript(f.read())
+
+        self.signature = (340, 1700000000123456789, 42)
+        self.db.cache_file("memory-bank/progress.md", "# Progress\n", file_stat=self.signature)
+
+    def tearDown(self):
+        """Clean up"""
+        self.db.close()
+        for suffix in ('', '-wal', '-shm'):
+            Path(self.db_path + suffix).unlink(missing_ok=True)
+
+    def test_matching_signature_is_hit(self):
+        """A matching signature returns the content and counts a hit"""
+        row = self.db.get_cached_file_by_stat("memory-bank/progress.md", self.signature)
+        self.assertEqual(row['content'], "# Progress\n")
+        self.assertEqual(row['hit_count'], 1)
+        self.assertEqual(self.db.get_file_cache_stats()['pending_lookups'], 1)
+
+    def test_mismatch_records_nothing(self):
+        """A changed signature returns None without counting a lookup"""
+        changed = (340, 1700000000999999999, 42)
+        self.assertIsNone(self.db.get_cached_file_by_stat("memory-bank/progress.md", changed))
+        self.assertIsNone(self.db.get_cached_file_by_stat("memory-bank/missing.md", changed))
+        self.assertEqual(self.db.get_file_cache_stats()['pending_lookups'], 0)
+
+    def test_content_change_clears_signature(self):
+        """Re-caching changed content without a signature drops the old one"""
+        self.db.cache_file("memory-bank/progress.md", "# Progress\n- done\n")
+        self.assertIsNone(self.db.get_cached_file_by_stat("memory-bank/progress.md", self.signature))
+
+    def test_unchanged_content_refreshes_signature(self):
+        """A touched but unchanged file gets its new signature recorded"""
+        touched = (340, 1700000005000000000, 42)
+        self.db.cache_file("memory-bank/progress.md", "# Progress\n", file_stat=touched)
+
+        self.assertIsNone(self.db.get_cached_file_by_stat("memory-bank/progress.md", self.signature))
+        self.assertIsNotNone(self.db.get_cached_file_by_stat("memory-bank/progress.md", touched))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Incremental Backup Tests for PM-DB System
+
+Tests page-level incremental backups (scripts/backup_db.py --incremental):
+- The first run writes a base image; later runs write only changed pages
+- Snapshots include committed WAL frames that are not yet checkpointed
+- Checkpoints between runs are detected; otherwise only WAL pages are compared
+- A chain replays to its head or to any earlier point in time
+- Compaction folds the chain into a new base with the same contents
+- A page index that does not match the chain head forces a new base
+- restore_db.py restores from a chain directory
+
+Usage:
+    python3 skills/pm-db/tests/test_incremental_backup.py
+"""
+
+import unittest
+import tempfile
+import subprocess
+import shutil
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+import sys
+
+# Add scripts to path
+scripts_path = Path(__file__).parent.parent.parent.parent / "scripts"
+sys.path.insert(0, str(scripts_path))
+
+# Add lib to path
+lib_path = Path(__file__).parent.parent.parent.parent / "lib"
+sys.path.insert(0, str(lib_path))
+
+from project_database import ProjectDatabase
+from backup_db import (
+    PAGE_INDEX, compact_chain, create_incremental_backup, load_chain, materialize_chain
+)
+
+
+def dump(path: Path) -> list:
+    """Logical contents of a database, for comparing images"""
+    conn = sqlite3.connect(f"file:{path}?immutable=1", uri=True)
+    try:
+        return list(conn.iterdump())
+    finally:
+        conn.close()
+
+
+class TestIncrementalBackup(unittest.TestCase):
+    """Test incremental chains, point-in-time replay and compaction"""
+
+    def setUp(self):
+        """Create a populated database whose writes stay in the WAL"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        self.db_path = self.temp_path / "projects.db"
+        self.chain_dir = self.temp_path / "backups" / "chain"
+
+        self.db = ProjectDatabase(db_path=str(self.db_path))
+        migrations_dir = Path(__file__).parent.parent.parent.parent / "migrations"
+        for migration_file in sorted(migrations_dir.glob("*.sql")):
+            with open(migration_file, 'r') as f:
+                self.db.conn.executescript(f.read())
+        # Keep committed pages in the WAL so snapshots must read frames
+        self.db.conn.execute("PRAGMA wal_autocheckpoint=0")
+
+        project_id = self.db.create_project("backup-test", "/tmp/backup-test")
+        phase_id = self.db.create_phase(project_id, "feature-backup")
+        plan_id = self.db.create_phase_plan(phase_id, "Backup plan")
+        task_id = self.db.create_task(plan_id, "1.0", "Task", "", 1)
+        run_id = self.db.create_phase_run(phase_id, plan_id)
+        self.task_run_id = self.db.create_task_run(run_id, task_id)
+        self.add_updates(300)
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        self.db.close()
+        shutil.rmtree(self.temp_dir)
+
+    def add_updates(self, count: int, label: str = "update"):
+        for i in range(count):
+            self.db.add_task_update(self.task_run_id, "progress", f"{label} {i} " + "x" * 200)
+
+    def live_dump(self) -> list:
+        return list(self.db.conn.iterdump())
+
+    def restored_dump(self, until=None) -> list:
+        image = self.temp_path / "restored.db"
+        materialize_chain(self.chain_dir, image, until)
+        return dump(image)
+
+    def test_base_then_delta(self):
+        """Later runs write only the changed pages"""
+        base = create_incremental_backup(self.db_path, self.chain_dir)
+        self.assertTrue(base['file'].startswith('base-'))
+        self.assertGreater(Path(str(self.db_path) + "-wal").stat().st_size, 0)
+
+        self.db.add_task_update(self.task_run_id, "note", "small change")
+        delta = create_incremental_backup(self.db_path, self.chain_dir)
+
+        self.assertTrue(delta['file'].startswith('delta-'))
+        self.assertLess(delta['pages'], base['pages'] // 4)
+        self.assertLess(delta['bytes'], base['bytes'] // 4)
+        self.assertEqual(self.restored_dump(), self.live_dump())
+
+    def test_checkpoint_between_runs(self):
+        """Pages moved from the WAL into the database file are still compared"""
+        create_incremental_backup(self.db_path, self.chain_dir)
+        self.add_updates(40, "before checkpoint")
+        self.db.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.add_updates(3, "after checkpoint")
+        create_incremental_backup(self.db_path, self.chain_dir)
+        self.assertEqual(self.restored_dump(), self.live_dump())
+
+        # WAL-only changes on an untouched database file
+        self.db.conn.execute("UPDATE task_updates SET content = 'edited' WHERE id % 7 = 0")
+        self.db.conn.commit()
+        create_incremental_backup(self.db_path, self.chain_dir)
+        self.assertEqual(self.restored_dump(), self.live_dump())
+
+    def test_no_change_writes_nothing(self):
+        """A run with no changed pages adds no delta"""
+        create_incremental_backup(self.db_path, self.chain_dir)
+
+        self.assertIsNone(create_incremental_backup(self.db_path, self.chain_dir))
+        self.assertEqual(load_chain(self.chain_dir)['deltas'], [])
+
+    def test_point_in_time_replay(self):
+        """Replaying up to a time restores the state of that backup"""
+        create_incremental_backup(self.db_path, self.chain_dir)
+        states = []
+        for batch in range(3):
+            self.add_updates(50, f"batch {batch}")
+            create_incremental_backup(self.db_path, self.chain_dir)
+            states.append(self.live_dump())
+            time.sleep(0.01)
+
+        # Shrink the database so a later delta truncates the image
+        self.db.conn.execute("DELETE FROM task_updates")
+        self.db.conn.commit()
+        self.db.conn.execute("VACUUM")
+        create_incremental_backup(self.db_path, self.chain_dir)
+
+        deltas = load_chain(self.chain_dir)['deltas']
+        self.assertEqual(len(deltas), 4)
+        second = datetime.fromisoformat(deltas[1]['created_at'])
+        self.assertEqual(self.restored_dump(second), states[1])
+        self.assertEqual(self.restored_dump(), self.live_dump())
+
+        with self.assertRaises(ValueError):
+            self.restored_dump(datetime(2000, 1, 1))
+
+    def test_compaction(self):
+        """Compaction leaves one base with the head's contents"""
+        create_incremental_backup(self.db_path, self.chain_dir)
+        for batch in range(3):
+            self.add_updates(20, f"batch {batch}")
+            create_incremental_backup(self.db_path, self.chain_dir, max_deltas=2)
+
+        manifest = load_chain(self.chain_dir)
+        self.assertEqual(manifest['deltas'], [])
+        self.assertEqual(
+            sorted(p.name for p in self.chain_dir.iterdir()),
+            sorted([manifest['base']['file'], 'chain.json', PAGE_INDEX])
+        )
+        self.assertEqual(self.restored_dump(), self.live_dump())
+
+        # The chain continues from the compacted base
+        self.add_updates(5, "after")
+        delta = create_incremental_backup(self.db_path, self.chain_dir)
+        self.assertTrue(delta['file'].startswith('delta-'))
+        self.assertEqual(self.restored_dump(), self.live_dump())
+        self.assertIsNone(compact_chain(self.temp_path / "missing"))
+
+    def test_stale_index_forces_base(self):
+        """If the page index is not the chain head's, the next run starts a new base"""
+        create_incremental_backup(self.db_path, self.chain_dir)
+        (self.chain_dir / PAGE_INDEX).unlink()
+
+        self.add_updates(5, "after")
+        entry = create_incremental_backup(self.db_path, self.chain_dir)
+
+        self.assertTrue(entry['file'].startswith('base-'))
+        self.assertEqual(len(list(self.chain_dir.glob("base-*.db"))), 1)
+        self.assertEqual(self.restored_dump(), self.live_dump())
+
+    def test_restore_script_from_chain(self):
+        """restore_db.py accepts a chain directory and --at"""
+        create_incremental_backup(self.db_path, self.chain_dir)
+        expected = self.live_dump()
+        time.sleep(0.01)
+        cutoff = datetime.now()
+        self.add_updates(10, "later")
+        create_incremental_backup(self.db_path, self.chain_dir)
+
+        target = self.temp_path / "restored" / "projects.db"
+        target.parent.mkdir()
+        result = subprocess.run(
+            [
+                sys.executable, str(scripts_path / "restore_db.py"),
+                str(self.chain_dir), "--db-path", str(target),
+                "--at", cutoff.isoformat(sep=" "), "--force"
+            ],
+            capture_output=True, text=True
+        )
+
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertEqual(dump(target), expected)
+        self.assertEqual(sorted(p.name for p in self.chain_dir.glob("pmdb-restore-*")), [])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -7,6 +7,7 @@ Tests performance targets:
 - Dashboard generation: <2 seconds
 - 100 spec import: <5 seconds
 - Handles 10,000+ jobs without degradation
+- Agent metrics aggregate in SQL using the invocation indexes
 
 Usage:
     python3 skills/pm-db/tests/test_performance.py
@@ -15,6 +16,7 @@ Usage:
 import unittest
 import tempfile
 import time
+from datetime import datetime, timedelta
 from pathlib import Path
 import sys
 
@@ -152,6 +154,113 @@ class TestPerformance(unittest.TestCase):
         self.assertEqual(len(jobs), 50)
 
 
+class TestAgentMetricsPerformance(unittest.TestCase):
+    """Test get_agent_metrics aggregation and query plan"""
+
+    AGENTS = ['backend-agent', 'frontend-agent', 'qa-agent', 'docs-agent']
+
+    def setUp(self):
+        """Set up test database with 20,000 invocations over 100 days"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+
+        self.db = ProjectDatabase(db_path=self.db_path)
+
+        # Run migrations
+        migrations_dir = Path(__file__).parent.parent.parent.parent / "migrations"
+        for migration_file in sorted(migrations_dir.glob("*.sql")):
+            with open(migration_file, 'r') as f:
+                self.db.conn.executescript(f.read())
+
+        base = datetime(2026, 4, 10, 12, 0, 0)
+        rows = []
+        for i in range(20000):
+            started = base - timedelta(days=i % 100, minutes=i % 600)
+            status = ['completed', 'failed', 'in-progress'][i % 3]
+            completed = started + timedelta(seconds=i % 600) if status != 'in-progress' else None
+            rows.append((
+                self.AGENTS[i % len(self.AGENTS)],
+                started.strftime('%Y-%m-%d %H:%M:%S'),
+                completed.strftime('%Y-%m-%d %H:%M:%S') if completed else None,
+                status, i % 7, i % 5, i % 3, i * 10
+            ))
+        self.db.conn.executemany(
+            """
+            INSERT INTO agent_invocations (
+                agent_name, purpose, started_at, completed_at, status,
+                total_files_read, cache_hits, cache_misses, estimated_tokens_used
+            )
+            VALUES (?, 'testing', ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows
+        )
+        self.db.conn.commit()
+
+    def tearDown(self):
+        """Clean up"""
+        self.db.close()
+        for suffix in ('', '-wal', '-shm'):
+            Path(self.db_path + suffix).unlink(missing_ok=True)
+
+    def query_plan(self, **kwargs) -> str:
+        """Run get_agent_metrics and return the plan of the SQL it executed"""
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        try:
+            self.db.get_agent_metrics(**kwargs)
+        finally:
+            self.db.conn.set_trace_callback(None)
+
+        aggregate = [sql for sql in statements if 'FROM agent_invocations' in sql]
+        self.assertEqual(len(aggregate), 1, "Expected one aggregate statement")
+        plan = self.db.conn.execute("EXPLAIN QUERY PLAN " + aggregate[0]).fetchall()
+        return " | ".join(row['detail'] for row in plan)
+
+    def test_matches_python_aggregation(self):
+        """SQL aggregation matches a row-by-row computation"""
+        rows = [dict(r) for r in self.db.conn.execute(
+            """
+            SELECT * FROM agent_invocations
+            WHERE agent_name = 'qa-agent'
+              AND DATE(started_at) >= '2026-02-01' AND DATE(started_at) <= '2026-02-28'
+            """
+        )]
+        durations = [r['duration_seconds'] for r in rows if r['duration_seconds'] is not None]
+
+        metrics = self.db.get_agent_metrics('qa-agent', '2026-02-01', '2026-02-28')
+
+        self.assertEqual(metrics['total_invocations'], len(rows))
+        self.assertEqual(metrics['completed'], sum(1 for r in rows if r['status'] == 'completed'))
+        self.assertEqual(metrics['failed'], sum(1 for r in rows if r['status'] == 'failed'))
+        self.assertEqual(metrics['total_tokens_used'], sum(r['estimated_tokens_used'] for r in rows))
+        self.assertAlmostEqual(metrics['avg_files_read'], sum(r['total_files_read'] for r in rows) / len(rows))
+        self.assertAlmostEqual(metrics['avg_duration_seconds'], sum(durations) / len(durations))
+
+    def test_query_plan_uses_agent_index(self):
+        """Agent and date filters seek idx_agent_invocations_agent_started"""
+        plan = self.query_plan(agent_name='qa-agent', start_date='2026-02-01', end_date='2026-02-28')
+
+        self.assertIn("idx_agent_invocations_agent_started (agent_name=? AND started_at>? AND started_at<?)", plan)
+        self.assertNotIn("SCAN", plan)
+
+    def test_query_plan_uses_date_index(self):
+        """Date-only filters seek idx_agent_invocations_started"""
+        plan = self.query_plan(start_date='2026-02-01')
+
+        self.assertIn("idx_agent_invocations_started (started_at>?)", plan)
+        self.assertNotIn("SCAN", plan)
+
+    def test_agent_metrics_performance(self):
+        """Test agent metrics over a 20,000-row history <100ms"""
+        start = time.time()
+        self.db.get_agent_metrics('backend-agent', '2026-01-01', '2026-03-31')
+        elapsed = (time.time() - start) * 1000
+
+        print(f"\n  Agent metrics: {elapsed:.2f}ms")
+        self.assertLess(elapsed, 100, f"Agent metrics {elapsed:.2f}ms exceeds 100ms target")
+
+
 class TestMemoryUsage(unittest.TestCase):
     """Test memory efficiency"""
 
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Phase Metrics Tests for PM-DB System
+
+Tests trigger-maintained phase_metrics (migration 008):
+- Runs, tasks and quality gates update metrics as they change
+- get_phase_metrics() is a read with no writes
+- Incremental rows match a full rebuild_metrics() after mixed changes
+- Cascaded deletes are subtracted exactly once
+- rebuild_metrics() repairs drifted rows
+
+Usage:
+    python3 skills/pm-db/tests/test_phase_metrics.py
+"""
+
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add lib to path
+lib_path = Path(__file__).parent.parent.parent.parent / "lib"
+sys.path.insert(0, str(lib_path))
+
+from project_database import ProjectDatabase
+
+
+class TestPhaseMetrics(unittest.TestCase):
+    """Test incremental phase metrics"""
+
+    def setUp(self):
+        """Set up test database with one phase, plan, tasks and runs"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+
+        self.db = ProjectDatabase(db_path=self.db_path)
+        migrations_dir = Path(__file__).parent.parent.parent.parent / "migrations"
+        for migration_file in sorted(migrations_dir.glob("*.sql")):
+            with open(migration_file, 'r') as f:
+                self.db.conn.executescript(f.read())
+
+        project_id = self.db.create_project("metrics-test", "/tmp/metrics-test")
+        self.phase_id = self.db.create_phase(project_id, "feature-metrics")
+        self.plan_id = self.db.create_phase_plan(self.phase_id, "Metrics plan")
+        self.task_ids = [
+            self.db.create_task(self.plan_id, f"{i}.0", f"Task {i}", "", i)
+            for i in range(1, 5)
+        ]
+
+    def tearDown(self):
+        """Clean up"""
+        self.db.close()
+        for suffix in ('', '-wal', '-shm'):
+            Path(self.db_path + suffix).unlink(missing_ok=True)
+
+    def rebuilt_metrics(self) -> dict:
+        """Metrics after a full rebuild, for comparison"""
+        self.db.rebuild_metrics(self.phase_id)
+        return self.db.get_phase_metrics(self.phase_id)
+
+    def test_metrics_follow_changes(self):
+        """Runs, task statuses and gates are reflected without recomputation"""
+        run_id = self.db.create_phase_run(self.phase_id, self.plan_id)
+        self.db.start_phase_run(run_id)
+        self.db.update_task_status(self.task_ids[0], 'completed')
+        self.db.update_task_status(self.task_ids[1], 'blocked')
+        gate_id = self.db.add_quality_gate(run_id, 'testing')
+        self.db.update_quality_gate(gate_id, 'passed')
+        self.db.complete_phase_run(run_id, 0)
+
+        metrics = self.db.get_phase_metrics(self.phase_id)
+        self.assertEqual(metrics['total_runs'], 1)
+        self.assertEqual(metrics['successful_runs'], 1)
+        self.assertEqual(metrics['failed_runs'], 0)
+        self.assertIsNotNone(metrics['avg_duration'])
+        self.assertEqual(metrics['total_tasks'], 4)
+        self.assertEqual(metrics['completed_tasks'], 1)
+        self.assertEqual(metrics['blocked_tasks'], 1)
+        self.assertEqual(metrics['total_gates'], 1)
+        self.assertEqual(metrics['passed_gates'], 1)
+
+    def test_read_does_not_write(self):
+        """get_phase_metrics and the dashboard issue no writes"""
+        self.db.create_phase_run(self.phase_id, self.plan_id)
+        changes_before = self.db.conn.total_changes
+
+        self.db.get_phase_metrics(self.phase_id)
+        self.db.generate_phase_dashboard(self.phase_id)
+
+        self.assertEqual(self.db.conn.total_changes, changes_before)
+
+    def test_matches_rebuild_after_mixed_changes(self):
+        """Incremental metrics equal a full recompute"""
+        for exit_code in (0, 1, 0):
+            run_id = self.db.create_phase_run(self.phase_id, self.plan_id)
+            self.db.start_phase_run(run_id)
+            self.db.conn.execute(
+                "UPDATE phase_runs SET started_at = datetime('now', ?) WHERE id = ?",
+                (f"-{60 * run_id} seconds", run_id)
+            )
+            self.db.conn.commit()
+            gate_id = self.db.add_quality_gate(run_id, 'build', 'failed')
+            self.db.update_quality_gate(gate_id, 'passed' if exit_code == 0 else 'failed')
+            self.db.complete_phase_run(run_id, exit_code)
+
+        self.db.update_phase_run_status(run_id, 'cancelled')
+        self.db.update_task_status(self.task_ids[2], 'completed')
+        self.db.update_task_status(self.task_ids[2], 'in-progress')
+        self.db.conn.execute("DELETE FROM tasks WHERE id = ?", (self.task_ids[3],))
+        self.db.conn.commit()
+
+        incremental = self.db.get_phase_metrics(self.phase_id)
+        self.assertEqual(incremental['total_runs'], 3)
+        self.assertEqual(incremental['successful_runs'], 1)
+        self.assertEqual(incremental['total_tasks'], 3)
+        self.assertEqual(incremental, self.rebuilt_metrics())
+
+    def test_cascaded_deletes_counted_once(self):
+        """Deleting a run or plan removes its gates or tasks exactly once"""
+        run_id = self.db.create_phase_run(self.phase_id, self.plan_id)
+        self.db.add_quality_gate(run_id, 'testing', 'passed')
+        self.db.add_quality_gate(run_id, 'linting', 'failed')
+        other_plan = self.db.create_phase_plan(self.phase_id, "Second plan")
+        self.db.create_task(other_plan, "9.0", "Extra", "", 9)
+
+        self.db.conn.execute("DELETE FROM phase_runs WHERE id = ?", (run_id,))
+        self.db.conn.execute("DELETE FROM phase_plans WHERE id = ?", (other_plan,))
+        self.db.conn.commit()
+
+        metrics = self.db.get_phase_metrics(self.phase_id)
+        self.assertEqual(metrics['total_runs'], 0)
+        self.assertEqual(metrics['total_gates'], 0)
+        self.assertEqual(metrics['total_tasks'], 4)
+        self.assertEqual(metrics, self.rebuilt_metrics())
+
+    def test_rebuild_repairs_drift(self):
+        """rebuild_metrics restores corrupted rows and returns the row count"""
+        self.db.conn.execute(
+            "UPDATE phase_metrics SET total_tasks = 99 WHERE phase_id = ?",
+            (self.phase_id,)
+        )
+        self.db.conn.commit()
+        self.assertEqual(self.db.get_phase_metrics(self.phase_id)['total_tasks'], 99)
+
+        self.assertEqual(self.db.rebuild_metrics(), 1)
+        self.assertEqual(self.db.get_phase_metrics(self.phase_id)['total_tasks'], 4)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Phase Timeline and Dashboard Tests for PM-DB System
+
+Tests the SQL-side timeline and dashboard aggregation:
+- Timeline events come back ordered with the same dict shape
+- Keyset pagination (after_ts, limit) visits every event exactly once,
+  including events that share a timestamp
+- Dashboard task progress counts by status
+
+Usage:
+    python3 skills/pm-db/tests/test_phase_timeline.py
+"""
+
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add lib to path
+lib_path = Path(__file__).parent.parent.parent.parent / "lib"
+sys.path.insert(0, str(lib_path))
+
+from project_database import ProjectDatabase
+
+
+class TestPhaseTimeline(unittest.TestCase):
+    """Test get_phase_timeline and generate_phase_dashboard"""
+
+    def setUp(self):
+        """Set up a phase with two plans and several runs"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+
+        self.db = ProjectDatabase(db_path=self.db_path)
+        migrations_dir = Path(__file__).parent.parent.parent.parent / "migrations"
+        for migration_file in sorted(migrations_dir.glob("*.sql")):
+            with open(migration_file, 'r') as f:
+                self.db.conn.executescript(f.read())
+
+        project_id = self.db.create_project("timeline-test", "/tmp/timeline-test")
+        self.phase_id = self.db.create_phase(project_id, "feature-timeline")
+        self.plan_id = self.db.create_phase_plan(self.phase_id, "Timeline plan")
+        self.db.approve_phase_plan(self.plan_id, "tech-lead")
+
+        statuses = ['pending', 'pending', 'in-progress', 'completed', 'completed', 'blocked', 'skipped']
+        for i, status in enumerate(statuses):
+            task_id = self.db.create_task(self.plan_id, f"{i}.0", f"Task {i}", "", i)
+            if status != 'pending':
+                self.db.update_task_status(task_id, status)
+
+        # Spread runs over distinct minutes, with shared timestamps inside each run
+        self.run_ids = []
+        for i in range(6):
+            run_id = self.db.create_phase_run(self.phase_id, self.plan_id)
+            ts = f"2026-01-0{i + 1} 10:00:00"
+            self.db.conn.execute(
+                "UPDATE phase_runs SET created_at = ?, started_at = ?, completed_at = ?, status = 'completed' WHERE id = ?",
+                (ts, ts, f"2026-01-0{i + 1} 11:00:00", run_id)
+            )
+            self.run_ids.append(run_id)
+        self.db.conn.execute("UPDATE phases SET created_at = '2025-12-31 09:00:00'")
+        self.db.conn.execute(
+            "UPDATE phase_plans SET created_at = '2025-12-31 09:30:00', approved_at = '2025-12-31 09:45:00'"
+        )
+        self.db.conn.commit()
+
+    def tearDown(self):
+        """Clean up"""
+        self.db.close()
+        for suffix in ('', '-wal', '-shm'):
+            Path(self.db_path + suffix).unlink(missing_ok=True)
+
+    def test_timeline_order_and_shape(self):
+        """Events are ordered by timestamp and carry their source rows"""
+        timeline = self.db.get_phase_timeline(self.phase_id)
+
+        self.assertEqual(len(timeline), 3 + 3 * len(self.run_ids))
+        self.assertEqual(
+            [e['type'] for e in timeline[:5]],
+            ['phase_created', 'plan_created', 'plan_approved', 'run_created', 'run_started']
+        )
+        self.assertEqual([e['timestamp'] for e in timeline], sorted(e['timestamp'] for e in timeline))
+        for event in timeline:
+            self.assertEqual(set(event), {'type', 'timestamp', 'data'})
+        self.assertEqual(timeline[0]['data']['id'], self.phase_id)
+        self.assertEqual(timeline[3]['data']['id'], self.run_ids[0])
+
+    def test_keyset_pagination(self):
+        """Paging with after_ts returns every event once, never splitting ties"""
+        full = self.db.get_phase_timeline(self.phase_id)
+
+        pages = []
+        after_ts = None
+        while True:
+            page = self.db.get_phase_timeline(self.phase_id, after_ts=after_ts, limit=4)
+            if not page:
+                break
+            pages.append(page)
+            after_ts = page[-1]['timestamp']
+
+        flattened = [(e['type'], e['timestamp']) for page in pages for e in page]
+        self.assertEqual(flattened, [(e['type'], e['timestamp']) for e in full])
+        # Runs create and start in the same second, so some pages grow past the limit
+        self.assertTrue(any(len(page) > 4 for page in pages))
+
+    def test_dashboard_task_progress(self):
+        """Task progress counts come from the approved plan's tasks"""
+        dashboard = self.db.generate_phase_dashboard(self.phase_id)
+
+        self.assertEqual(dashboard['task_progress'], {
+            'total': 7, 'pending': 2, 'in_progress': 1, 'completed': 2, 'blocked': 1
+        })
+        self.assertEqual(len(dashboard['recent_runs']), 5)
+        self.assertEqual(dashboard['recent_runs'][0]['id'], self.run_ids[-1])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
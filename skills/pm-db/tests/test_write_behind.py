@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Write-Behind Queue Tests for PM-DB System
+
+Tests batched event writes:
+- Events are queued and committed once per batch
+- Time-based flushing of overdue batches
+- Backpressure when the queue is full and the database is locked
+- Constraint failures drop only the offending event
+- Partial flushes and open transactions never duplicate or clobber writes
+- ProjectDatabase integration (flush on close, metrics)
+
+Usage:
+    python3 skills/pm-db/tests/test_write_behind.py
+"""
+
+import unittest
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+import sys
+
+# Add lib to path
+lib_path = Path(__file__).parent.parent.parent.parent / "lib"
+sys.path.insert(0, str(lib_path))
+
+from project_database import ProjectDatabase, WriteBehindQueue
+
+
+INSERT_EVENT = "INSERT INTO events (value) VALUES (?)"
+
+
+class TestWriteBehindQueue(unittest.TestCase):
+    """Test the queue in isolation against a scratch table"""
+
+    def setUp(self):
+        """Set up scratch database"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, value TEXT NOT NULL)")
+        self.conn.commit()
+
+    def tearDown(self):
+        """Clean up"""
+        self.conn.close()
+        for suffix in ('', '-wal', '-shm'):
+            Path(self.db_path + suffix).unlink(missing_ok=True)
+
+    def count_committed(self) -> int:
+        """Count rows visible to an independent connection"""
+        other = sqlite3.connect(self.db_path)
+        try:
+            return other.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        finally:
+            other.close()
+
+    def test_flushes_once_per_batch(self):
+        """Events stay queued until the batch size is reached"""
+        queue = WriteBehindQueue(self.conn, max_batch=10, max_delay_ms=60000)
+
+        for i in range(9):
+            queue.enqueue(((INSERT_EVENT, (f"e{i}",)),))
+        self.assertEqual(self.count_committed(), 0)
+        self.assertEqual(len(queue), 9)
+
+        queue.enqueue(((INSERT_EVENT, ("e9",)),))
+        self.assertEqual(self.count_committed(), 10)
+
+        metrics = queue.metrics()
+        self.assertEqual(metrics['flushes'], 1)
+        self.assertEqual(metrics['flushed'], 10)
+        self.assertEqual(metrics['pending'], 0)
+        self.assertEqual(metrics['avg_batch_size'], 10.0)
+
+    def test_flushes_overdue_batch(self):
+        """An old pending event triggers a flush on the next enqueue"""
+        queue = WriteBehindQueue(self.conn, max_batch=1000, max_delay_ms=20)
+
+        queue.enqueue(((INSERT_EVENT, ("first",)),))
+        self.assertFalse(queue.is_due())
+        time.sleep(0.03)
+        self.assertTrue(queue.is_due())
+
+        queue.enqueue(((INSERT_EVENT, ("second",)),))
+        self.assertEqual(self.count_committed(), 2)
+
+    def test_backpressure_when_locked(self):
+        """A full queue that cannot flush raises instead of growing"""
+        conn = sqlite3.connect(self.db_path, timeout=0)
+        queue = WriteBehindQueue(conn, max_batch=2, max_delay_ms=60000, max_pending=4)
+
+        locker = sqlite3.connect(self.db_path)
+        locker.execute("BEGIN IMMEDIATE")
+        try:
+            for i in range(4):
+                queue.enqueue(((INSERT_EVENT, (f"e{i}",)),))
+            self.assertEqual(len(queue), 4)
+
+            with self.assertRaises(sqlite3.OperationalError):
+                queue.enqueue(((INSERT_EVENT, ("overflow",)),))
+
+            metrics = queue.metrics()
+            self.assertEqual(metrics['backpressure_flushes'], 1)
+            self.assertGreater(metrics['failed_flushes'], 0)
+            self.assertEqual(metrics['high_water_mark'], 4)
+        finally:
+            locker.rollback()
+            locker.close()
+
+        # Nothing was lost while the database was locked
+        self.assertEqual(queue.flush(), 4)
+        self.assertEqual(self.count_committed(), 4)
+        conn.close()
+
+    def test_constraint_failure_drops_only_bad_event(self):
+        """One invalid event does not discard the rest of the batch"""
+        queue = WriteBehindQueue(self.conn, max_batch=100, max_delay_ms=60000)
+
+        queue.enqueue(((INSERT_EVENT, ("ok-1",)),))
+        queue.enqueue(((INSERT_EVENT, (None,)),))  # violates NOT NULL
+        queue.enqueue(((INSERT_EVENT, ("ok-2",)),))
+
+        self.assertEqual(queue.flush(), 2)
+        self.assertEqual(self.count_committed(), 2)
+        self.assertEqual(queue.metrics()['dropped'], 1)
+
+    def test_partial_failure_keeps_only_unwritten_events(self):
+        """Events committed before a lock error are not written again on retry"""
+        queue = WriteBehindQueue(self.conn, max_batch=100, max_delay_ms=60000)
+
+        queue.enqueue(((INSERT_EVENT, ("ok-1",)),))
+        queue.enqueue(((INSERT_EVENT, (None,)),))  # violates NOT NULL
+        queue.enqueue(((INSERT_EVENT, ("ok-2",)),))
+        queue.enqueue((("INSERT INTO later (value) VALUES (?)", ("late",)),))  # no such table yet
+
+        with self.assertRaises(sqlite3.OperationalError):
+            queue.flush()
+        self.assertEqual(self.count_committed(), 2)
+        self.assertEqual(len(queue), 1)
+
+        self.conn.execute("CREATE TABLE later (value TEXT)")
+        self.conn.commit()
+        self.assertEqual(queue.flush(), 1)
+        self.assertEqual(self.count_committed(), 2)
+        self.assertEqual(queue.metrics()['flushed'], 3)
+
+    def test_flush_deferred_inside_transaction(self):
+        """A flush never commits or rolls back the caller's open transaction"""
+        queue = WriteBehindQueue(self.conn, max_batch=1, max_delay_ms=60000, max_pending=1)
+
+        self.conn.execute(INSERT_EVENT, ("caller",))
+        queue.enqueue(((INSERT_EVENT, ("queued",)),))
+        self.assertEqual(queue.flush(), 0)
+        self.assertEqual(self.count_committed(), 0)
+
+        with self.assertRaises(sqlite3.OperationalError):
+            queue.enqueue(((INSERT_EVENT, ("overflow",)),))
+
+        self.conn.rollback()
+        self.assertEqual(queue.flush(), 1)
+        values = [row[0] for row in self.conn.execute("SELECT value FROM events")]
+        self.assertEqual(values, ["queued"])
+
+    def test_invalid_limits_rejected(self):
+        """Queue limits are validated"""
+        with self.assertRaises(ValueError):
+            WriteBehindQueue(self.conn, max_batch=0)
+        with self.assertRaises(ValueError):
+            WriteBehindQueue(self.conn, max_batch=100, max_pending=10)
+
+
+class TestProjectDatabaseWriteBehind(unittest.TestCase):
+    """Test write-behind mode through the ProjectDatabase API"""
+
+    def setUp(self):
+        """Set up test database"""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+
+        db = ProjectDatabase(db_path=self.db_path)
+        migrations_dir = Path(__file__).parent.parent.parent.parent / "migrations"
+        for migration_file in sorted(migrations_dir.glob("*.sql")):
+            with open(migration_file, 'r') as f:
+                db.conn.executescript(f.read())
+
+        project_id = db.create_project("test", "/tmp/test")
+        phase_id = db.create_phase(project_id, "feature-test")
+        plan_id = db.create_phase_plan(phase_id, "Test plan")
+        task_id = db.create_task(plan_id, "1.0", "Task", "Description", 1)
+        phase_run_id = db.create_phase_run(phase_id, plan_id)
+        self.task_run_id = db.create_task_run(phase_run_id, task_id)
+        self.invocation_id = db.create_agent_invocation("test-agent", "testing")
+        db.close()
+
+    def tearDown(self):
+        """Clean up"""
+        for suffix in ('', '-wal', '-shm'):
+            Path(self.db_path + suffix).unlink(missing_ok=True)
+
+    def test_events_queued_until_flush(self):
+        """Queued task updates are invisible until flushed"""
+        db = ProjectDatabase(db_path=self.db_path, write_behind=True,
+                             flush_batch_size=50, flush_interval_ms=60000)
+        try:
+            for i in range(5):
+                self.assertIsNone(db.add_task_update(self.task_run_id, 'progress', f"step {i}"))
+            self.assertEqual(db.get_task_updates(self.task_run_id), [])
+
+            self.assertEqual(db.flush(), 5)
+            self.assertEqual(len(db.get_task_updates(self.task_run_id)), 5)
+            self.assertEqual(db.get_write_metrics()['flushes'], 1)
+        finally:
+            db.close()
+
+    def test_close_flushes_pending_events(self):
+        """close() commits file-read events and their invocation counters"""
+        db = ProjectDatabase(db_path=self.db_path, write_behind=True,
+                             flush_batch_size=50, flush_interval_ms=60000)
+        db.log_file_read(self.invocation_id, "memory-bank/a.md", 'hit', 400)
+        db.log_file_read(self.invocation_id, "memory-bank/b.md", 'miss', 800)
+        db.close()
+
+        with ProjectDatabase(db_path=self.db_path) as db:
+            self.assertEqual(len(db.get_agent_file_reads(self.invocation_id)), 2)
+            invocation = db.get_agent_invocation(self.invocation_id)
+            self.assertEqual(invocation['cache_hits'], 1)
+            self.assertEqual(invocation['cache_misses'], 1)
+            self.assertEqual(invocation['estimated_tokens_used'], 300)
+
+    def test_disabled_by_default(self):
+        """Without write-behind, event writes commit immediately"""
+        with ProjectDatabase(db_path=self.db_path) as db:
+            update_id = db.add_task_update(self.task_run_id, 'note', "immediate")
+            self.assertIsInstance(update_id, int)
+            self.assertEqual(db.get_write_metrics(), {'enabled': False})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -71,7 +71,7 @@ References:
 
 import logging
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from lib.models.finding import Finding, OWASPCategory, Severity
 from lib.models.parse_result import ParseResult
@@ -300,6 +300,10 @@ class AdvancedAnalyzer:
 
     Attributes:
         VERSION: Analyzer version string for AssessmentResult tracking.
+        RULE_KEYWORDS: Lower-case keywords per rule, one of which every
+            finding of the rule contains. A rule is skipped for files that
+            contain none of them (see ``ParseResult.may_contain``); rules
+            without keywords run on every file.
 
     Usage::
 
@@ -323,6 +327,24 @@ class AdvancedAnalyzer:
 
     VERSION: str = "1.0.0"
 
+    RULE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+        "unsafe_deserialization": ("marshal.load", "shelve.open"),
+        "js_extended_command_injection": ("spawn", "execfile"),
+        "extended_weak_crypto_python": ("des3.new",),
+        "extended_weak_crypto_js": (".createcipher",),
+        "path_traversal": ("open", "os.path.join"),
+        "unsafe_permissions": ("os.chmod",),
+        "prototype_pollution": (
+            "object.assign",
+            "req.body",
+            "req.params",
+            "req.query",
+        ),
+        "js_http_credential_transmission": ("http://",),
+        "python_nosql_injection": ("request.",),
+        "minidom_xxe": ("minidom.parse",),
+    }
+
     def analyze(
         self,
         parsed_files: List[ParseResult],
@@ -356,6 +378,7 @@ class AdvancedAnalyzer:
         skip_http_cred = config.get("skip_advanced_http_cred", False)
         skip_nosql = config.get("skip_advanced_nosql", False)
         skip_xxe = config.get("skip_advanced_xxe", False)
+        keywords = self.RULE_KEYWORDS
 
         for parsed_file in parsed_files:
             # Skip lockfiles -- they do not contain executable code.
@@ -364,62 +387,82 @@ class AdvancedAnalyzer:
 
             # --- Python-specific detections ---
             if parsed_file.language == "python":
-                if not skip_deser:
+                if not skip_deser and parsed_file.may_contain(
+                    keywords["unsafe_deserialization"]
+                ):
                     findings.extend(
                         self._detect_unsafe_deserialization(parsed_file, id_gen)
                     )
 
-                if not skip_crypto:
+                if not skip_crypto and parsed_file.may_contain(
+                    keywords["extended_weak_crypto_python"]
+                ):
                     findings.extend(
                         self._detect_extended_weak_crypto_python(
                             parsed_file, id_gen
                         )
                     )
 
-                if not skip_path:
+                if not skip_path and parsed_file.may_contain(
+                    keywords["path_traversal"]
+                ):
                     findings.extend(
                         self._detect_path_traversal(parsed_file, id_gen)
                     )
 
-                if not skip_perms:
+                if not skip_perms and parsed_file.may_contain(
+                    keywords["unsafe_permissions"]
+                ):
                     findings.extend(
                         self._detect_unsafe_permissions(parsed_file, id_gen)
                     )
 
-                if not skip_nosql:
+                if not skip_nosql and parsed_file.may_contain(
+                    keywords["python_nosql_injection"]
+                ):
                     findings.extend(
                         self._detect_python_nosql_injection(
                             parsed_file, id_gen
                         )
                     )
 
-                if not skip_xxe:
+                if not skip_xxe and parsed_file.may_contain(
+                    keywords["minidom_xxe"]
+                ):
                     findings.extend(
                         self._detect_minidom_xxe(parsed_file, id_gen)
                     )
 
             # --- JavaScript-specific detections ---
             if parsed_file.language == "javascript":
-                if not skip_js_cmd:
+                if not skip_js_cmd and parsed_file.may_contain(
+                    keywords["js_extended_command_injection"]
+                ):
                     findings.extend(
                         self._detect_js_extended_command_injection(
                             parsed_file, id_gen
                         )
                     )
 
-                if not skip_crypto:
+                if not skip_crypto and parsed_file.may_contain(
+                    keywords["extended_weak_crypto_js"]
+                ):
                     findings.extend(
                         self._detect_extended_weak_crypto_js(
                             parsed_file, id_gen
                         )
                     )
 
-                if not skip_proto:
+                if not skip_proto and parsed_file.may_contain(
+                    keywords["prototype_pollution"]
+                ):
                     findings.extend(
                         self._detect_prototype_pollution(parsed_file, id_gen)
                     )
 
-                if not skip_http_cred:
+                if not skip_http_cred and parsed_file.may_contain(
+                    keywords["js_http_credential_transmission"]
+                ):
                     findings.extend(
                         self._detect_js_http_credential_transmission(
                             parsed_file, id_gen
@@ -463,8 +506,8 @@ class AdvancedAnalyzer:
 
         # --- marshal.loads() detection ---
         if "marshal" in raw:
-            for match in _UNSAFE_MARSHAL_LOADS.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(_UNSAFE_MARSHAL_LOADS):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -478,7 +521,7 @@ class AdvancedAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -521,8 +564,8 @@ class AdvancedAnalyzer:
 
         # --- shelve.open() detection ---
         if "shelve" in raw:
-            for match in _UNSAFE_SHELVE_OPEN.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(_UNSAFE_SHELVE_OPEN):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -536,7 +579,7 @@ class AdvancedAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -612,8 +655,8 @@ class AdvancedAnalyzer:
 
         # --- spawn() with shell: true ---
         if "spawn" in raw and "shell" in raw:
-            for match in _JS_SPAWN_SHELL_TRUE.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(_JS_SPAWN_SHELL_TRUE):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -627,7 +670,7 @@ class AdvancedAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -672,8 +715,8 @@ class AdvancedAnalyzer:
 
         # --- execFile() / execFileSync() ---
         if "execFile" in raw:
-            for match in _JS_EXEC_FILE.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(_JS_EXEC_FILE):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -687,7 +730,7 @@ class AdvancedAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -765,8 +808,8 @@ class AdvancedAnalyzer:
 
         # --- DES3.new() (Triple DES) ---
         if "DES3" in raw:
-            for match in _WEAK_CRYPTO_DES3.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(_WEAK_CRYPTO_DES3):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -780,7 +823,7 @@ class AdvancedAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -857,8 +900,8 @@ class AdvancedAnalyzer:
 
         # --- Deprecated createCipher() (no IV) ---
         if "createCipher" in raw:
-            for match in _JS_CREATE_CIPHER_DEPRECATED.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(_JS_CREATE_CIPHER_DEPRECATED):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -876,7 +919,7 @@ class AdvancedAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -921,8 +964,8 @@ class AdvancedAnalyzer:
 
         # --- createCipheriv with blowfish ---
         if "blowfish" in raw.lower() or "bf" in raw.lower():
-            for match in _JS_CIPHERIV_BLOWFISH.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(_JS_CIPHERIV_BLOWFISH):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -936,7 +979,7 @@ class AdvancedAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1010,8 +1053,8 @@ class AdvancedAnalyzer:
 
         # --- open() with f-string ---
         if "open" in raw:
-            for match in _PY_OPEN_FSTRING.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(_PY_OPEN_FSTRING):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -1023,7 +1066,7 @@ class AdvancedAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1068,8 +1111,8 @@ class AdvancedAnalyzer:
                 )
 
             # --- open() with .format() ---
-            for match in _PY_OPEN_FORMAT.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(_PY_OPEN_FORMAT):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -1081,7 +1124,7 @@ class AdvancedAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1123,8 +1166,8 @@ class AdvancedAnalyzer:
 
         # --- os.path.join() with user input ---
         if "os.path.join" in raw:
-            for match in _PY_PATH_JOIN_USER_INPUT.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(_PY_PATH_JOIN_USER_INPUT):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -1136,7 +1179,7 @@ class AdvancedAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1182,14 +1225,14 @@ class AdvancedAnalyzer:
         # --- open() with variable from user input (proximity check) ---
         if "open" in raw and "request" in raw:
             user_input_vars: Dict[str, int] = {}
-            for var_match in _PY_USER_INPUT_VAR.finditer(raw):
+            for var_match in parsed_file.finditer(_PY_USER_INPUT_VAR):
                 var_name = var_match.group(1)
-                line_num = raw[: var_match.start()].count("\n") + 1
+                line_num = parsed_file.line_of(var_match.start())
                 user_input_vars[var_name] = line_num
 
             if user_input_vars:
-                for open_match in _PY_OPEN_VARIABLE.finditer(raw):
-                    line_number = raw[: open_match.start()].count("\n") + 1
+                for open_match in parsed_file.finditer(_PY_OPEN_VARIABLE):
+                    line_number = parsed_file.line_of(open_match.start())
 
                     if line_number in seen_lines:
                         continue
@@ -1213,7 +1256,7 @@ class AdvancedAnalyzer:
                             seen_lines.add(line_number)
 
                             code_sample = self._build_code_sample(
-                                source_lines, line_number
+                                parsed_file, line_number
                             )
 
                             findings.append(
@@ -1294,8 +1337,8 @@ class AdvancedAnalyzer:
 
         seen_lines: set[int] = set()
 
-        for match in _UNSAFE_CHMOD.finditer(raw):
-            line_number = raw[: match.start()].count("\n") + 1
+        for match in parsed_file.finditer(_UNSAFE_CHMOD):
+            line_number = parsed_file.line_of(match.start())
 
             if line_number in seen_lines:
                 continue
@@ -1309,7 +1352,7 @@ class AdvancedAnalyzer:
             seen_lines.add(line_number)
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, line_number
+                parsed_file, line_number
             )
 
             # Determine which mode was used.
@@ -1389,7 +1432,6 @@ class AdvancedAnalyzer:
         if not parsed_file.raw_source:
             return findings
 
-        raw = parsed_file.raw_source
         seen_lines: set[int] = set()
 
         proto_patterns = [
@@ -1431,8 +1473,8 @@ class AdvancedAnalyzer:
         ]
 
         for pattern, detail, description, confidence in proto_patterns:
-            for match in pattern.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(pattern):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -1446,7 +1488,7 @@ class AdvancedAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1537,8 +1579,8 @@ class AdvancedAnalyzer:
         ]
 
         for pattern, detail, confidence in http_patterns:
-            for match in pattern.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(pattern):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -1552,7 +1594,7 @@ class AdvancedAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1637,8 +1679,8 @@ class AdvancedAnalyzer:
 
         seen_lines: set[int] = set()
 
-        for match in _PY_PYMONGO_METHODS.finditer(raw):
-            line_number = raw[: match.start()].count("\n") + 1
+        for match in parsed_file.finditer(_PY_PYMONGO_METHODS):
+            line_number = parsed_file.line_of(match.start())
 
             if line_number in seen_lines:
                 continue
@@ -1657,7 +1699,7 @@ class AdvancedAnalyzer:
 
             seen_lines.add(line_number)
 
-            code_sample = self._build_code_sample(source_lines, line_number)
+            code_sample = self._build_code_sample(parsed_file, line_number)
 
             findings.append(
                 Finding(
@@ -1745,8 +1787,8 @@ class AdvancedAnalyzer:
 
         seen_lines: set[int] = set()
 
-        for match in _XXE_MINIDOM.finditer(raw):
-            line_number = raw[: match.start()].count("\n") + 1
+        for match in parsed_file.finditer(_XXE_MINIDOM):
+            line_number = parsed_file.line_of(match.start())
 
             if line_number in seen_lines:
                 continue
@@ -1760,7 +1802,7 @@ class AdvancedAnalyzer:
             seen_lines.add(line_number)
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, line_number
+                parsed_file, line_number
             )
 
             findings.append(
@@ -1808,7 +1850,7 @@ class AdvancedAnalyzer:
     # -----------------------------------------------------------------
 
     @staticmethod
-    def _build_code_sample(source_lines: List[str], line_number: int) -> str:
+    def _build_code_sample(parsed_file: ParseResult, line_number: int) -> str:
         """Build a 3-line code sample centered on the given line number.
 
         Returns up to 3 lines of source code (the target line plus one
@@ -1816,7 +1858,7 @@ class AdvancedAnalyzer:
         code_sample field.
 
         Args:
-            source_lines: The source file split into lines.
+            parsed_file: The parsed file the finding belongs to.
             line_number: 1-based line number of the finding.
 
         Returns:
@@ -1824,17 +1866,11 @@ class AdvancedAnalyzer:
             newlines. Returns "<source unavailable>" if source lines
             are empty or the line number is out of range.
         """
-        if not source_lines or line_number < 1:
-            return "<source unavailable>"
-
-        idx = line_number - 1
-        start = max(0, idx - 1)
-        end = min(len(source_lines), idx + 2)
-
-        if start >= len(source_lines):
+        lines = parsed_file.context(line_number, 1)
+        if not lines:
             return "<source unavailable>"
 
-        return "\n".join(source_lines[start:end])
+        return "\n".join(lines)
 
     @staticmethod
     def _get_source_line(source_lines: List[str], line_number: int) -> str:
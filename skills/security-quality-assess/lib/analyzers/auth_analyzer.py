@@ -379,6 +379,10 @@ class AuthAnalyzer:
         MIN_JWT_SECRET_LENGTH: Minimum acceptable length for JWT signing
             secrets. Secrets shorter than this are flagged. Default: 32.
         VERSION: Analyzer version string for AssessmentResult tracking.
+        RULE_KEYWORDS: Lower-case keywords per rule, one of which every
+            finding of the rule contains. A rule is skipped for files that
+            contain none of them (see ``ParseResult.may_contain``); rules
+            without keywords run on every file.
 
     Usage::
 
@@ -403,6 +407,28 @@ class AuthAnalyzer:
     MIN_JWT_SECRET_LENGTH: int = 32
     VERSION: str = "1.0.0"
 
+    # Credential URLs are matched in decoded string literals and Python
+    # routes come from parsed decorators, so those rules run everywhere.
+    RULE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+        "hardcoded_passwords": (),
+        "weak_jwt": (
+            "jwt",
+            "secret",
+            "signing",
+            "payload",
+            "token_data",
+            "claims",
+        ),
+        "insecure_sessions": (
+            "secure",
+            "httponly",
+            "http_only",
+            "http-only",
+            "session_cookie_samesite",
+        ),
+        "missing_authentication": (),
+    }
+
     def analyze(
         self,
         parsed_files: List[ParseResult],
@@ -441,6 +467,7 @@ class AuthAnalyzer:
         min_jwt_length = config.get(
             "min_jwt_secret_length", self.MIN_JWT_SECRET_LENGTH
         )
+        keywords = self.RULE_KEYWORDS
 
         for parsed_file in parsed_files:
             # Skip lockfiles -- they do not contain executable code.
@@ -454,7 +481,7 @@ class AuthAnalyzer:
                 )
 
             # 2. Weak JWT detection
-            if not skip_jwt:
+            if not skip_jwt and parsed_file.may_contain(keywords["weak_jwt"]):
                 findings.extend(
                     self._detect_weak_jwt(
                         parsed_file, id_gen, min_jwt_length
@@ -462,7 +489,9 @@ class AuthAnalyzer:
                 )
 
             # 3. Insecure session configuration
-            if not skip_sessions:
+            if not skip_sessions and parsed_file.may_contain(
+                keywords["insecure_sessions"]
+            ):
                 findings.extend(
                     self._detect_insecure_sessions(parsed_file, id_gen)
                 )
@@ -511,14 +540,12 @@ class AuthAnalyzer:
         seen_lines: Set[int] = set()
 
         # Strategy A: Scan raw source for password variable assignments.
-        for match in _PASSWORD_ASSIGN_PATTERN.finditer(parsed_file.raw_source):
+        for match in parsed_file.finditer(_PASSWORD_ASSIGN_PATTERN):
             var_name = match.group(1)
             value = match.group(3)
 
             # Determine line number from match offset.
-            line_number = (
-                parsed_file.raw_source[: match.start()].count("\n") + 1
-            )
+            line_number = parsed_file.line_of(match.start())
 
             if line_number in seen_lines:
                 continue
@@ -548,7 +575,7 @@ class AuthAnalyzer:
             seen_lines.add(line_number)
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, line_number
+                parsed_file, line_number
             )
 
             # Higher confidence for longer, more realistic password values.
@@ -655,7 +682,7 @@ class AuthAnalyzer:
                 continue
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, line_number
+                parsed_file, line_number
             )
 
             findings.append(
@@ -742,11 +769,9 @@ class AuthAnalyzer:
         ]
 
         for pattern in jwt_patterns:
-            for match in pattern.finditer(parsed_file.raw_source):
+            for match in parsed_file.finditer(pattern):
                 secret_value = match.group(2)
-                line_number = (
-                    parsed_file.raw_source[: match.start()].count("\n") + 1
-                )
+                line_number = parsed_file.line_of(match.start())
 
                 key = ("weak-jwt-secret", line_number)
                 if key in seen:
@@ -759,7 +784,7 @@ class AuthAnalyzer:
                 seen.add(key)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -807,13 +832,9 @@ class AuthAnalyzer:
                 )
 
         # --- Detect short JWT secrets in variable assignments ---
-        for match in _JWT_SECRET_ASSIGN_PATTERN.finditer(
-            parsed_file.raw_source
-        ):
+        for match in parsed_file.finditer(_JWT_SECRET_ASSIGN_PATTERN):
             secret_value = match.group(1)
-            line_number = (
-                parsed_file.raw_source[: match.start()].count("\n") + 1
-            )
+            line_number = parsed_file.line_of(match.start())
 
             key = ("weak-jwt-secret", line_number)
             if key in seen:
@@ -833,7 +854,7 @@ class AuthAnalyzer:
             seen.add(key)
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, line_number
+                parsed_file, line_number
             )
 
             findings.append(
@@ -906,18 +927,14 @@ class AuthAnalyzer:
         if not parsed_file.raw_source:
             return findings
 
-        for match in _JWT_PAYLOAD_NO_EXP_PATTERN.finditer(
-            parsed_file.raw_source
-        ):
+        for match in parsed_file.finditer(_JWT_PAYLOAD_NO_EXP_PATTERN):
             matched_text = match.group(0)
 
             # Verify that 'exp' is indeed missing from the payload dict.
             if re.search(r"""['"]exp['"]""", matched_text):
                 continue
 
-            line_number = (
-                parsed_file.raw_source[: match.start()].count("\n") + 1
-            )
+            line_number = parsed_file.line_of(match.start())
 
             key = ("missing-jwt-expiration", line_number)
             if key in seen:
@@ -925,7 +942,7 @@ class AuthAnalyzer:
             seen.add(key)
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, line_number
+                parsed_file, line_number
             )
 
             findings.append(
@@ -1009,10 +1026,8 @@ class AuthAnalyzer:
         ]
 
         for pattern, detection_type in secure_false_patterns:
-            for match in pattern.finditer(parsed_file.raw_source):
-                line_number = (
-                    parsed_file.raw_source[: match.start()].count("\n") + 1
-                )
+            for match in parsed_file.finditer(pattern):
+                line_number = parsed_file.line_of(match.start())
 
                 key = ("insecure-session-cookie", line_number)
                 if key in seen:
@@ -1020,7 +1035,7 @@ class AuthAnalyzer:
                 seen.add(key)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1068,10 +1083,8 @@ class AuthAnalyzer:
         ]
 
         for pattern, detection_type in httponly_false_patterns:
-            for match in pattern.finditer(parsed_file.raw_source):
-                line_number = (
-                    parsed_file.raw_source[: match.start()].count("\n") + 1
-                )
+            for match in parsed_file.finditer(pattern):
+                line_number = parsed_file.line_of(match.start())
 
                 key = ("insecure-session-cookie", line_number)
                 if key in seen:
@@ -1079,7 +1092,7 @@ class AuthAnalyzer:
                 seen.add(key)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1125,10 +1138,8 @@ class AuthAnalyzer:
         ]
 
         for pattern, detection_type in samesite_patterns:
-            for match in pattern.finditer(parsed_file.raw_source):
-                line_number = (
-                    parsed_file.raw_source[: match.start()].count("\n") + 1
-                )
+            for match in parsed_file.finditer(pattern):
+                line_number = parsed_file.line_of(match.start())
 
                 key = ("insecure-session-cookie", line_number)
                 if key in seen:
@@ -1136,7 +1147,7 @@ class AuthAnalyzer:
                 seen.add(key)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1178,12 +1189,8 @@ class AuthAnalyzer:
                 )
 
         # --- Detect Express insecure session patterns ---
-        for match in _EXPRESS_SESSION_INSECURE_PATTERN.finditer(
-            parsed_file.raw_source
-        ):
-            line_number = (
-                parsed_file.raw_source[: match.start()].count("\n") + 1
-            )
+        for match in parsed_file.finditer(_EXPRESS_SESSION_INSECURE_PATTERN):
+            line_number = parsed_file.line_of(match.start())
 
             key = ("insecure-session-cookie", line_number)
             if key in seen:
@@ -1191,7 +1198,7 @@ class AuthAnalyzer:
             seen.add(key)
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, line_number
+                parsed_file, line_number
             )
 
             findings.append(
@@ -1332,7 +1339,7 @@ class AuthAnalyzer:
             seen_lines.add(line_number)
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, line_number
+                parsed_file, line_number
             )
 
             findings.append(
@@ -1416,10 +1423,8 @@ class AuthAnalyzer:
             re.IGNORECASE,
         )
 
-        for match in _JS_ROUTE_PATTERN.finditer(parsed_file.raw_source):
-            line_number = (
-                parsed_file.raw_source[: match.start()].count("\n") + 1
-            )
+        for match in parsed_file.finditer(_JS_ROUTE_PATTERN):
+            line_number = parsed_file.line_of(match.start())
 
             if line_number in seen_lines:
                 continue
@@ -1455,7 +1460,7 @@ class AuthAnalyzer:
             seen_lines.add(line_number)
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, line_number
+                parsed_file, line_number
             )
 
             findings.append(
@@ -1527,7 +1532,7 @@ class AuthAnalyzer:
         return entries
 
     @staticmethod
-    def _build_code_sample(source_lines: List[str], line_number: int) -> str:
+    def _build_code_sample(parsed_file: ParseResult, line_number: int) -> str:
         """Build a 3-line code sample centered on the given line number.
 
         Returns up to 3 lines of source code (the target line plus one
@@ -1535,7 +1540,7 @@ class AuthAnalyzer:
         code_sample field.
 
         Args:
-            source_lines: The source file split into lines.
+            parsed_file: The parsed file the finding belongs to.
             line_number: 1-based line number of the finding.
 
         Returns:
@@ -1543,17 +1548,11 @@ class AuthAnalyzer:
             newlines. Returns "<source unavailable>" if source lines
             are empty or the line number is out of range.
         """
-        if not source_lines or line_number < 1:
-            return "<source unavailable>"
-
-        idx = line_number - 1
-        start = max(0, idx - 1)
-        end = min(len(source_lines), idx + 2)
-
-        if start >= len(source_lines):
+        lines = parsed_file.context(line_number, 1)
+        if not lines:
             return "<source unavailable>"
 
-        return "\n".join(source_lines[start:end])
+        return "\n".join(lines)
 
     @staticmethod
     def _get_source_line(source_lines: List[str], line_number: int) -> str:
@@ -514,6 +514,10 @@ class ConfigAnalyzer:
 
     Attributes:
         VERSION: Analyzer version string for AssessmentResult tracking.
+        RULE_KEYWORDS: Lower-case keywords per rule, one of which every
+            finding of the rule contains. A rule is skipped for files that
+            contain none of them (see ``ParseResult.may_contain``); rules
+            without keywords run on every file.
 
     Usage::
 
@@ -535,6 +539,44 @@ class ConfigAnalyzer:
 
     VERSION: str = "1.0.0"
 
+    RULE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+        "cors_misconfiguration": ("cors", "access-control-allow-origin"),
+        "debug_mode": ("debug", "development"),
+        "missing_security_headers": (
+            "header",
+            ".set",
+            "helmet",
+            "middleware",
+            "response[",
+            "secure_",
+        ),
+        "verbose_errors": (
+            "propagate_exceptions",
+            "trap_http_exceptions",
+            "traceback.",
+            "return",
+            "response",
+            "jsonify",
+            "show_error_details",
+            "display_errors",
+            "detailed_errors",
+            "err.stack",
+            "err.message",
+            "error.stack",
+            "error.message",
+        ),
+        "path_traversal": ("open",),
+        "unsafe_permissions": ("os.chmod",),
+        "prototype_pollution": (
+            "object.assign",
+            "updates",
+            "input",
+            "data",
+            "body",
+        ),
+        "excessive_privileges": ("subprocess.", "os.setuid"),
+    }
+
     def analyze(
         self,
         parsed_files: List[ParseResult],
@@ -572,6 +614,7 @@ class ConfigAnalyzer:
         skip_headers = config.get("skip_missing_headers", False)
         skip_errors = config.get("skip_verbose_errors", False)
         skip_access = config.get("skip_access_control", False)
+        keywords = self.RULE_KEYWORDS
 
         for parsed_file in parsed_files:
             # Skip lockfiles -- they do not contain app configuration.
@@ -579,19 +622,25 @@ class ConfigAnalyzer:
                 continue
 
             # 1. CORS misconfiguration detection
-            if not skip_cors:
+            if not skip_cors and parsed_file.may_contain(
+                keywords["cors_misconfiguration"]
+            ):
                 findings.extend(
                     self._detect_cors_misconfiguration(parsed_file, id_gen)
                 )
 
             # 2. Debug mode detection
-            if not skip_debug:
+            if not skip_debug and parsed_file.may_contain(
+                keywords["debug_mode"]
+            ):
                 findings.extend(
                     self._detect_debug_mode(parsed_file, id_gen)
                 )
 
             # 3. Missing security headers detection
-            if not skip_headers:
+            if not skip_headers and parsed_file.may_contain(
+                keywords["missing_security_headers"]
+            ):
                 findings.extend(
                     self._detect_missing_security_headers(
                         parsed_file, id_gen
@@ -599,31 +648,41 @@ class ConfigAnalyzer:
                 )
 
             # 4. Verbose error disclosure detection
-            if not skip_errors:
+            if not skip_errors and parsed_file.may_contain(
+                keywords["verbose_errors"]
+            ):
                 findings.extend(
                     self._detect_verbose_errors(parsed_file, id_gen)
                 )
 
             # 5. Path traversal detection
-            if not skip_access:
+            if not skip_access and parsed_file.may_contain(
+                keywords["path_traversal"]
+            ):
                 findings.extend(
                     self._detect_path_traversal(parsed_file, id_gen)
                 )
 
             # 6. Unsafe file permissions detection
-            if not skip_access:
+            if not skip_access and parsed_file.may_contain(
+                keywords["unsafe_permissions"]
+            ):
                 findings.extend(
                     self._detect_unsafe_permissions(parsed_file, id_gen)
                 )
 
             # 7. Prototype pollution detection (JavaScript only)
-            if not skip_access:
+            if not skip_access and parsed_file.may_contain(
+                keywords["prototype_pollution"]
+            ):
                 findings.extend(
                     self._detect_prototype_pollution(parsed_file, id_gen)
                 )
 
             # 8. Excessive privileges detection
-            if not skip_access:
+            if not skip_access and parsed_file.may_contain(
+                keywords["excessive_privileges"]
+            ):
                 findings.extend(
                     self._detect_excessive_privileges(parsed_file, id_gen)
                 )
@@ -672,10 +731,8 @@ class ConfigAnalyzer:
         ]
 
         for pattern, detection_type in cors_patterns:
-            for match in pattern.finditer(parsed_file.raw_source):
-                line_number = (
-                    parsed_file.raw_source[: match.start()].count("\n") + 1
-                )
+            for match in parsed_file.finditer(pattern):
+                line_number = parsed_file.line_of(match.start())
 
                 key = ("cors-wildcard", line_number)
                 if key in seen:
@@ -691,7 +748,7 @@ class ConfigAnalyzer:
                 seen.add(key)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 # Higher confidence if credentials are also enabled.
@@ -837,10 +894,8 @@ class ConfigAnalyzer:
             ))
 
         for pattern, detection_type, title in debug_patterns:
-            for match in pattern.finditer(parsed_file.raw_source):
-                line_number = (
-                    parsed_file.raw_source[: match.start()].count("\n") + 1
-                )
+            for match in parsed_file.finditer(pattern):
+                line_number = parsed_file.line_of(match.start())
 
                 key = ("debug-mode-enabled", line_number)
                 if key in seen:
@@ -860,7 +915,7 @@ class ConfigAnalyzer:
                 seen.add(key)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 # Lower confidence for development-path files.
@@ -977,13 +1032,10 @@ class ConfigAnalyzer:
             )
             line_number = 1
             if anchor_match:
-                line_number = (
-                    parsed_file.raw_source[: anchor_match.start()].count("\n")
-                    + 1
-                )
+                line_number = parsed_file.line_of(anchor_match.start())
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, line_number
+                parsed_file, line_number
             )
 
             rule_id = (
@@ -1120,10 +1172,8 @@ class ConfigAnalyzer:
             patterns_to_check = python_patterns + javascript_patterns
 
         for pattern, detection_type, specific_description in patterns_to_check:
-            for match in pattern.finditer(parsed_file.raw_source):
-                line_number = (
-                    parsed_file.raw_source[: match.start()].count("\n") + 1
-                )
+            for match in parsed_file.finditer(pattern):
+                line_number = parsed_file.line_of(match.start())
 
                 key = ("verbose-error-messages", line_number)
                 if key in seen:
@@ -1138,7 +1188,7 @@ class ConfigAnalyzer:
                 seen.add(key)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1228,10 +1278,8 @@ class ConfigAnalyzer:
         ]
 
         for pattern, detection_type in traversal_patterns:
-            for match in pattern.finditer(parsed_file.raw_source):
-                line_number = (
-                    parsed_file.raw_source[: match.start()].count("\n") + 1
-                )
+            for match in parsed_file.finditer(pattern):
+                line_number = parsed_file.line_of(match.start())
 
                 key = ("path-traversal", line_number)
                 if key in seen:
@@ -1246,7 +1294,7 @@ class ConfigAnalyzer:
                 seen.add(key)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1327,10 +1375,8 @@ class ConfigAnalyzer:
         # Track (rule_id, line_number) to avoid duplicates.
         seen: Set[Tuple[str, int]] = set()
 
-        for match in _UNSAFE_CHMOD_PATTERN.finditer(parsed_file.raw_source):
-            line_number = (
-                parsed_file.raw_source[: match.start()].count("\n") + 1
-            )
+        for match in parsed_file.finditer(_UNSAFE_CHMOD_PATTERN):
+            line_number = parsed_file.line_of(match.start())
 
             key = ("unsafe-file-permissions", line_number)
             if key in seen:
@@ -1345,7 +1391,7 @@ class ConfigAnalyzer:
             seen.add(key)
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, line_number
+                parsed_file, line_number
             )
 
             # Determine which mode was used for the description.
@@ -1446,10 +1492,8 @@ class ConfigAnalyzer:
         ]
 
         for pattern, detection_type, severity in pollution_patterns:
-            for match in pattern.finditer(parsed_file.raw_source):
-                line_number = (
-                    parsed_file.raw_source[: match.start()].count("\n") + 1
-                )
+            for match in parsed_file.finditer(pattern):
+                line_number = parsed_file.line_of(match.start())
 
                 key = ("prototype-pollution", line_number)
                 if key in seen:
@@ -1464,7 +1508,7 @@ class ConfigAnalyzer:
                 seen.add(key)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1578,10 +1622,8 @@ class ConfigAnalyzer:
         ]
 
         for pattern, detection_type, severity, specific_description in privilege_patterns:
-            for match in pattern.finditer(parsed_file.raw_source):
-                line_number = (
-                    parsed_file.raw_source[: match.start()].count("\n") + 1
-                )
+            for match in parsed_file.finditer(pattern):
+                line_number = parsed_file.line_of(match.start())
 
                 key = ("excessive-privileges", line_number)
                 if key in seen:
@@ -1596,7 +1638,7 @@ class ConfigAnalyzer:
                 seen.add(key)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1638,7 +1680,7 @@ class ConfigAnalyzer:
     # -----------------------------------------------------------------
 
     @staticmethod
-    def _build_code_sample(source_lines: List[str], line_number: int) -> str:
+    def _build_code_sample(parsed_file: ParseResult, line_number: int) -> str:
         """Build a 3-line code sample centered on the given line number.
 
         Returns up to 3 lines of source code (the target line plus one
@@ -1646,7 +1688,7 @@ class ConfigAnalyzer:
         code_sample field.
 
         Args:
-            source_lines: The source file split into lines.
+            parsed_file: The parsed file the finding belongs to.
             line_number: 1-based line number of the finding.
 
         Returns:
@@ -1654,17 +1696,11 @@ class ConfigAnalyzer:
             newlines. Returns "<source unavailable>" if source lines
             are empty or the line number is out of range.
         """
-        if not source_lines or line_number < 1:
-            return "<source unavailable>"
-
-        idx = line_number - 1
-        start = max(0, idx - 1)
-        end = min(len(source_lines), idx + 2)
-
-        if start >= len(source_lines):
+        lines = parsed_file.context(line_number, 1)
+        if not lines:
             return "<source unavailable>"
 
-        return "\n".join(source_lines[start:end])
+        return "\n".join(lines)
 
     @staticmethod
     def _get_source_line(source_lines: List[str], line_number: int) -> str:
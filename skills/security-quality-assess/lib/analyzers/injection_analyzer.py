@@ -311,6 +311,10 @@ class InjectionAnalyzer:
 
     Attributes:
         VERSION: Analyzer version string for AssessmentResult tracking.
+        RULE_KEYWORDS: Lower-case keywords per rule, one of which every
+            finding of the rule contains. A rule is skipped for files that
+            contain none of them (see ``ParseResult.may_contain``); rules
+            without keywords run on every file.
 
     Usage::
 
@@ -328,6 +332,25 @@ class InjectionAnalyzer:
 
     VERSION: str = "1.0.0"
 
+    # SQL, command and code injection read parser extractions, which hold
+    # decoded values, so they declare no keywords.
+    RULE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+        "sql_injection": (),
+        "command_injection": (),
+        "code_injection": (),
+        "js_command_injection": ("exec",),
+        "nosql_injection": (
+            "json.parse",
+            ".find",
+            ".update",
+            ".delete",
+            ".countdocuments",
+            ".aggregate",
+        ),
+        "unsafe_yaml": ("yaml.load",),
+        "xxe": ("resolve_entities", "et.fromstring", "et.parse", "xml.sax."),
+    }
+
     def analyze(
         self,
         parsed_files: List[ParseResult],
@@ -363,6 +386,7 @@ class InjectionAnalyzer:
         skip_nosql = config.get("skip_nosql_injection", False)
         skip_yaml = config.get("skip_yaml_injection", False)
         skip_xxe = config.get("skip_xxe", False)
+        keywords = self.RULE_KEYWORDS
 
         for parsed_file in parsed_files:
             # Skip lockfiles -- they do not contain executable code.
@@ -388,25 +412,41 @@ class InjectionAnalyzer:
                 )
 
             # 4. JavaScript child_process command injection
-            if not skip_command and parsed_file.language == "javascript":
+            if (
+                not skip_command
+                and parsed_file.language == "javascript"
+                and parsed_file.may_contain(keywords["js_command_injection"])
+            ):
                 findings.extend(
                     self._detect_js_command_injection(parsed_file, id_gen)
                 )
 
             # 5. NoSQL injection (MongoDB/Mongoose)
-            if not skip_nosql and parsed_file.language == "javascript":
+            if (
+                not skip_nosql
+                and parsed_file.language == "javascript"
+                and parsed_file.may_contain(keywords["nosql_injection"])
+            ):
                 findings.extend(
                     self._detect_nosql_injection(parsed_file, id_gen)
                 )
 
             # 6. Unsafe YAML loading (Python)
-            if not skip_yaml and parsed_file.language == "python":
+            if (
+                not skip_yaml
+                and parsed_file.language == "python"
+                and parsed_file.may_contain(keywords["unsafe_yaml"])
+            ):
                 findings.extend(
                     self._detect_unsafe_yaml(parsed_file, id_gen)
                 )
 
             # 7. XXE (XML External Entity) detection (Python)
-            if not skip_xxe and parsed_file.language == "python":
+            if (
+                not skip_xxe
+                and parsed_file.language == "python"
+                and parsed_file.may_contain(keywords["xxe"])
+            ):
                 findings.extend(
                     self._detect_xxe(parsed_file, id_gen)
                 )
@@ -464,7 +504,7 @@ class InjectionAnalyzer:
             seen_lines.add(query.line_number)
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, query.line_number
+                parsed_file, query.line_number
             )
 
             # Determine confidence based on query pattern clarity.
@@ -521,7 +561,7 @@ class InjectionAnalyzer:
             seen_lines.add(js_query.line_number)
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, js_query.line_number
+                parsed_file, js_query.line_number
             )
 
             confidence = self._sql_confidence(js_query.query_pattern)
@@ -621,7 +661,7 @@ class InjectionAnalyzer:
             seen_lines.add(call.line_number)
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, call.line_number
+                parsed_file, call.line_number
             )
 
             # Determine severity based on shell usage.
@@ -918,10 +958,8 @@ class InjectionAnalyzer:
         ]
 
         for pattern, detail, confidence in js_cmd_patterns:
-            for match in pattern.finditer(parsed_file.raw_source):
-                line_number = (
-                    parsed_file.raw_source[: match.start()].count("\n") + 1
-                )
+            for match in parsed_file.finditer(pattern):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -936,7 +974,7 @@ class InjectionAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1015,10 +1053,8 @@ class InjectionAnalyzer:
         source_lines = parsed_file.source_lines
 
         # Strategy A: JSON.parse(req.query/body/params) used near DB queries.
-        for match in _NOSQL_JSON_PARSE_REQ.finditer(parsed_file.raw_source):
-            line_number = (
-                parsed_file.raw_source[: match.start()].count("\n") + 1
-            )
+        for match in parsed_file.finditer(_NOSQL_JSON_PARSE_REQ):
+            line_number = parsed_file.line_of(match.start())
 
             if line_number in seen_lines:
                 continue
@@ -1032,7 +1068,7 @@ class InjectionAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1078,12 +1114,8 @@ class InjectionAnalyzer:
 
         # Strategy B: Mongoose query methods with direct req.body/req.query
         # usage in the surrounding context.
-        for match in _NOSQL_MONGOOSE_DIRECT_INPUT.finditer(
-            parsed_file.raw_source
-        ):
-            line_number = (
-                parsed_file.raw_source[: match.start()].count("\n") + 1
-            )
+        for match in parsed_file.finditer(_NOSQL_MONGOOSE_DIRECT_INPUT):
+            line_number = parsed_file.line_of(match.start())
 
             if line_number in seen_lines:
                 continue
@@ -1100,7 +1132,7 @@ class InjectionAnalyzer:
             seen_lines.add(line_number)
 
             code_sample = self._build_code_sample(
-                source_lines, line_number
+                parsed_file, line_number
             )
 
             findings.append(
@@ -1187,10 +1219,8 @@ class InjectionAnalyzer:
 
         seen_lines: set[int] = set()
 
-        for match in _UNSAFE_YAML_LOAD.finditer(parsed_file.raw_source):
-            line_number = (
-                parsed_file.raw_source[: match.start()].count("\n") + 1
-            )
+        for match in parsed_file.finditer(_UNSAFE_YAML_LOAD):
+            line_number = parsed_file.line_of(match.start())
 
             if line_number in seen_lines:
                 continue
@@ -1222,7 +1252,7 @@ class InjectionAnalyzer:
             seen_lines.add(line_number)
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, line_number
+                parsed_file, line_number
             )
 
             findings.append(
@@ -1321,8 +1351,8 @@ class InjectionAnalyzer:
 
         # --- Strategy A: lxml etree with resolve_entities=True (HIGH) ---
         if "resolve_entities" in raw:
-            for match in _XXE_LXML_RESOLVE_ENTITIES.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(_XXE_LXML_RESOLVE_ENTITIES):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -1336,7 +1366,7 @@ class InjectionAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1382,8 +1412,8 @@ class InjectionAnalyzer:
 
         # --- Strategy B: stdlib ET.fromstring/ET.parse (MEDIUM) ---
         if "ET." in raw:
-            for match in _XXE_ET_FROMSTRING.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(_XXE_ET_FROMSTRING):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -1397,7 +1427,7 @@ class InjectionAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1440,8 +1470,8 @@ class InjectionAnalyzer:
 
         # --- Strategy C: xml.sax without feature disabling (MEDIUM) ---
         if "xml.sax" in raw:
-            for match in _XXE_XML_SAX.finditer(raw):
-                line_number = raw[: match.start()].count("\n") + 1
+            for match in parsed_file.finditer(_XXE_XML_SAX):
+                line_number = parsed_file.line_of(match.start())
 
                 if line_number in seen_lines:
                     continue
@@ -1455,7 +1485,7 @@ class InjectionAnalyzer:
                 seen_lines.add(line_number)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1520,7 +1550,7 @@ class InjectionAnalyzer:
             A Finding object with code-injection classification.
         """
         code_sample = self._build_code_sample(
-            parsed_file.source_lines, call.line_number
+            parsed_file, call.line_number
         )
 
         func = call.function_name
@@ -1608,7 +1638,7 @@ class InjectionAnalyzer:
             A Finding object with code-injection classification.
         """
         code_sample = self._build_code_sample(
-            parsed_file.source_lines, call.line_number
+            parsed_file, call.line_number
         )
 
         return Finding(
@@ -1667,7 +1697,7 @@ class InjectionAnalyzer:
             A Finding object with code-injection classification.
         """
         code_sample = self._build_code_sample(
-            parsed_file.source_lines, pattern.line_number
+            parsed_file, pattern.line_number
         )
 
         if pattern.pattern_type == "eval":
@@ -1745,7 +1775,7 @@ class InjectionAnalyzer:
             A Finding object with XSS (CWE-79) classification.
         """
         code_sample = self._build_code_sample(
-            parsed_file.source_lines, pattern.line_number
+            parsed_file, pattern.line_number
         )
 
         # Build pattern-specific title and description.
@@ -1779,7 +1809,7 @@ class InjectionAnalyzer:
     # -----------------------------------------------------------------
 
     @staticmethod
-    def _build_code_sample(source_lines: List[str], line_number: int) -> str:
+    def _build_code_sample(parsed_file: ParseResult, line_number: int) -> str:
         """Build a 3-line code sample centered on the given line number.
 
         Returns up to 3 lines of source code (the target line plus one
@@ -1787,7 +1817,7 @@ class InjectionAnalyzer:
         code_sample field.
 
         Args:
-            source_lines: The source file split into lines.
+            parsed_file: The parsed file the finding belongs to.
             line_number: 1-based line number of the finding.
 
         Returns:
@@ -1795,17 +1825,11 @@ class InjectionAnalyzer:
             newlines. Returns "<source unavailable>" if source lines
             are empty or the line number is out of range.
         """
-        if not source_lines or line_number < 1:
-            return "<source unavailable>"
-
-        idx = line_number - 1
-        start = max(0, idx - 1)
-        end = min(len(source_lines), idx + 2)
-
-        if start >= len(source_lines):
+        lines = parsed_file.context(line_number, 1)
+        if not lines:
             return "<source unavailable>"
 
-        return "\n".join(source_lines[start:end])
+        return "\n".join(lines)
 
     @staticmethod
     def _get_source_line(source_lines: List[str], line_number: int) -> str:
@@ -48,6 +48,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from lib.models.finding import Finding, OWASPCategory, Severity
 from lib.models.parse_result import ParseResult
+from lib.utils.source_scanner import fold_case
 
 logger = logging.getLogger(__name__)
 
@@ -748,6 +749,11 @@ class SecretsAnalyzer:
             Shorter strings are skipped as they rarely contain meaningful
             secrets and produce many false positives. Default: 20.
         VERSION: Analyzer version string for AssessmentResult tracking.
+        RULE_KEYWORDS: Lower-case keywords per rule, and per secret pattern
+            rule ID, one of which every finding of the rule contains. A
+            rule is skipped for files that contain none of them (see
+            ``ParseResult.may_contain``); rules without keywords run on
+            every file.
 
     Usage::
 
@@ -770,6 +776,34 @@ class SecretsAnalyzer:
     MIN_STRING_LENGTH: int = 20
     VERSION: str = "1.0.0"
 
+    # Pattern and entropy detection read decoded string literals, so they
+    # declare no keywords themselves; each secret pattern is gated inside
+    # _detect_patterns instead.
+    RULE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+        "patterns": (),
+        "high_entropy": (),
+        "weak_crypto": (
+            "hashlib.md5",
+            "hashlib.sha1",
+            "crypto.hash.md5",
+            "crypto.hash.sha1",
+            "des.new",
+            "arc4.new",
+            "blowfish.new",
+            "mode_ecb",
+            ".createhash",
+            ".createcipheriv",
+        ),
+        "cleartext_credentials": ("requests.",),
+        "hardcoded-aws-key": ("akia",),
+        "hardcoded-github-token": ("ghp_",),
+        "hardcoded-github-oauth-token": ("gho_",),
+        "hardcoded-api-key": ("api",),
+        "hardcoded-slack-token": ("xox",),
+        "hardcoded-jwt-token": ("eyj",),
+        "hardcoded-private-key": ("private key",),
+    }
+
     def analyze(
         self,
         parsed_files: List[ParseResult],
@@ -806,6 +840,7 @@ class SecretsAnalyzer:
         )
         skip_entropy = config.get("skip_entropy", False)
         skip_weak_crypto = config.get("skip_weak_crypto", False)
+        keywords = self.RULE_KEYWORDS
 
         for parsed_file in parsed_files:
             # Skip lockfiles -- they contain version strings, not secrets
@@ -827,13 +862,17 @@ class SecretsAnalyzer:
                 )
 
             # 3. Weak cryptography in raw source
-            if not skip_weak_crypto:
+            if not skip_weak_crypto and parsed_file.may_contain(
+                keywords["weak_crypto"]
+            ):
                 findings.extend(
                     self._detect_weak_crypto(parsed_file, id_gen)
                 )
 
             # 4. Cleartext credential transmission
-            if not skip_weak_crypto:
+            if not skip_weak_crypto and parsed_file.may_contain(
+                keywords["cleartext_credentials"]
+            ):
                 findings.extend(
                     self._detect_cleartext_credentials(parsed_file, id_gen)
                 )
@@ -880,6 +919,22 @@ class SecretsAnalyzer:
         # and raw source scanning.
         seen: set[Tuple[str, int]] = set()
 
+        # Skip patterns whose keywords occur neither in the raw source nor
+        # in a decoded string value (escapes and implicit concatenation can
+        # assemble a keyword the raw source does not contain).
+        secret_patterns = []
+        values_text: Optional[str] = None
+        for entry in _SECRET_PATTERNS:
+            rule_keywords = self.RULE_KEYWORDS[entry[1]]
+            if not parsed_file.may_contain(rule_keywords):
+                if values_text is None:
+                    values_text = fold_case(
+                        "\n".join(value for value, _, _ in string_entries)
+                    )
+                if not any(keyword in values_text for keyword in rule_keywords):
+                    continue
+            secret_patterns.append(entry)
+
         for value, line_number, context in string_entries + raw_entries:
             for (
                 pattern,
@@ -890,7 +945,7 @@ class SecretsAnalyzer:
                 confidence,
                 cwe_id,
                 remediation,
-            ) in _SECRET_PATTERNS:
+            ) in secret_patterns:
                 if pattern.search(value):
                     key = (rule_id, line_number)
                     if key in seen:
@@ -900,7 +955,7 @@ class SecretsAnalyzer:
                     # Build a sanitized code sample (mask the middle of
                     # the matched secret)
                     code_sample = self._build_code_sample(
-                        parsed_file.source_lines, line_number
+                        parsed_file, line_number
                     )
 
                     findings.append(
@@ -988,7 +1043,7 @@ class SecretsAnalyzer:
                 continue
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, line_number
+                parsed_file, line_number
             )
 
             # Determine confidence based on entropy level
@@ -1081,11 +1136,9 @@ class SecretsAnalyzer:
             ):
                 continue
 
-            for match in pattern.finditer(parsed_file.raw_source):
+            for match in parsed_file.finditer(pattern):
                 # Determine the line number from the match offset
-                line_number = (
-                    parsed_file.raw_source[: match.start()].count("\n") + 1
-                )
+                line_number = parsed_file.line_of(match.start())
 
                 key = (rule_id, line_number)
                 if key in seen:
@@ -1093,7 +1146,7 @@ class SecretsAnalyzer:
                 seen.add(key)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 findings.append(
@@ -1162,10 +1215,8 @@ class SecretsAnalyzer:
 
         # Strategy 1: Single regex match across raw source (handles
         # single-line and multi-line requests.post("http://...", json={...password...})
-        for match in _CLEARTEXT_CRED_PATTERN.finditer(parsed_file.raw_source):
-            line_number = (
-                parsed_file.raw_source[: match.start()].count("\n") + 1
-            )
+        for match in parsed_file.finditer(_CLEARTEXT_CRED_PATTERN):
+            line_number = parsed_file.line_of(match.start())
 
             key = ("cleartext-credential-transmission", line_number)
             if key in seen:
@@ -1173,7 +1224,7 @@ class SecretsAnalyzer:
             seen.add(key)
 
             code_sample = self._build_code_sample(
-                parsed_file.source_lines, line_number
+                parsed_file, line_number
             )
 
             findings.append(
@@ -1225,7 +1276,7 @@ class SecretsAnalyzer:
                             continue
                         seen.add(key)
 
-                        code_sample = self._build_code_sample(lines, line_number)
+                        code_sample = self._build_code_sample(parsed_file, line_number)
 
                         findings.append(
                             Finding(
@@ -1334,7 +1385,7 @@ class SecretsAnalyzer:
         return entries
 
     @staticmethod
-    def _build_code_sample(source_lines: List[str], line_number: int) -> str:
+    def _build_code_sample(parsed_file: ParseResult, line_number: int) -> str:
         """Build a 3-line code sample centered on the given line number.
 
         Returns up to 3 lines of source code (the target line plus one
@@ -1342,7 +1393,7 @@ class SecretsAnalyzer:
         code_sample field.
 
         Args:
-            source_lines: The source file split into lines.
+            parsed_file: The parsed file the finding belongs to.
             line_number: 1-based line number of the finding.
 
         Returns:
@@ -1350,17 +1401,11 @@ class SecretsAnalyzer:
             newlines. Returns "<source unavailable>" if source lines
             are empty or the line number is out of range.
         """
-        if not source_lines or line_number < 1:
-            return "<source unavailable>"
-
-        idx = line_number - 1
-        start = max(0, idx - 1)
-        end = min(len(source_lines), idx + 2)
-
-        if start >= len(source_lines):
+        lines = parsed_file.context(line_number, 1)
+        if not lines:
             return "<source unavailable>"
 
-        return "\n".join(source_lines[start:end])
+        return "\n".join(lines)
 
     @staticmethod
     def _matches_known_pattern(value: str) -> bool:
@@ -381,6 +381,10 @@ class SensitiveDataAnalyzer:
 
     Attributes:
         VERSION: Analyzer version string for AssessmentResult tracking.
+        RULE_KEYWORDS: Lower-case keywords per rule, one of which every
+            finding of the rule contains. A rule is skipped for files that
+            contain none of them (see ``ParseResult.may_contain``); rules
+            without keywords run on every file.
 
     Usage::
 
@@ -399,6 +403,20 @@ class SensitiveDataAnalyzer:
 
     VERSION: str = "1.0.0"
 
+    RULE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+        "pii_exposure": ("log", "print", "console"),
+        "unencrypted_storage": (
+            "password",
+            "localstorage.setitem",
+            "sessionstorage.setitem",
+            "document.cookie",
+            "res.cookie",
+            "response.set_cookie",
+            ".write",
+        ),
+        "secret_logging": ("log", "print", "console"),
+    }
+
     def analyze(
         self,
         parsed_files: List[ParseResult],
@@ -430,6 +448,7 @@ class SensitiveDataAnalyzer:
         skip_pii = config.get("skip_pii", False)
         skip_unencrypted = config.get("skip_unencrypted_storage", False)
         skip_secret_log = config.get("skip_secret_logging", False)
+        keywords = self.RULE_KEYWORDS
 
         for parsed_file in parsed_files:
             # Skip lockfiles -- they do not contain application code.
@@ -437,19 +456,25 @@ class SensitiveDataAnalyzer:
                 continue
 
             # 1. PII exposure detection
-            if not skip_pii:
+            if not skip_pii and parsed_file.may_contain(
+                keywords["pii_exposure"]
+            ):
                 findings.extend(
                     self._detect_pii_exposure(parsed_file, id_gen)
                 )
 
             # 2. Unencrypted storage detection
-            if not skip_unencrypted:
+            if not skip_unencrypted and parsed_file.may_contain(
+                keywords["unencrypted_storage"]
+            ):
                 findings.extend(
                     self._detect_unencrypted_storage(parsed_file, id_gen)
                 )
 
             # 3. Secret logging detection
-            if not skip_secret_log:
+            if not skip_secret_log and parsed_file.may_contain(
+                keywords["secret_logging"]
+            ):
                 findings.extend(
                     self._detect_secret_logging(parsed_file, id_gen)
                 )
@@ -536,11 +561,8 @@ class SensitiveDataAnalyzer:
 
         for patterns, pii_type, description_detail in pii_groups:
             for pattern in patterns:
-                for match in pattern.finditer(parsed_file.raw_source):
-                    line_number = (
-                        parsed_file.raw_source[: match.start()].count("\n")
-                        + 1
-                    )
+                for match in parsed_file.finditer(pattern):
+                    line_number = parsed_file.line_of(match.start())
 
                     key = ("pii-in-logs", line_number)
                     if key in seen:
@@ -565,7 +587,7 @@ class SensitiveDataAnalyzer:
                     seen.add(key)
 
                     code_sample = self._build_code_sample(
-                        parsed_file.source_lines, line_number
+                        parsed_file, line_number
                     )
 
                     # Confidence varies by PII type and detection method.
@@ -726,10 +748,8 @@ class SensitiveDataAnalyzer:
         ]
 
         for pattern, detection_type, title, description in storage_patterns:
-            for match in pattern.finditer(parsed_file.raw_source):
-                line_number = (
-                    parsed_file.raw_source[: match.start()].count("\n") + 1
-                )
+            for match in parsed_file.finditer(pattern):
+                line_number = parsed_file.line_of(match.start())
 
                 key = ("unencrypted-storage", line_number)
                 if key in seen:
@@ -757,7 +777,7 @@ class SensitiveDataAnalyzer:
                 seen.add(key)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 # Determine confidence based on detection type.
@@ -848,10 +868,8 @@ class SensitiveDataAnalyzer:
         ]
 
         for pattern, detection_type in secret_log_patterns:
-            for match in pattern.finditer(parsed_file.raw_source):
-                line_number = (
-                    parsed_file.raw_source[: match.start()].count("\n") + 1
-                )
+            for match in parsed_file.finditer(pattern):
+                line_number = parsed_file.line_of(match.start())
 
                 key = ("secret-logging", line_number)
                 if key in seen:
@@ -882,7 +900,7 @@ class SensitiveDataAnalyzer:
                 seen.add(key)
 
                 code_sample = self._build_code_sample(
-                    parsed_file.source_lines, line_number
+                    parsed_file, line_number
                 )
 
                 # Determine the type of secret from the match.
@@ -946,7 +964,7 @@ class SensitiveDataAnalyzer:
     # -----------------------------------------------------------------
 
     @staticmethod
-    def _build_code_sample(source_lines: List[str], line_number: int) -> str:
+    def _build_code_sample(parsed_file: ParseResult, line_number: int) -> str:
         """Build a 3-line code sample centered on the given line number.
 
         Returns up to 3 lines of source code (the target line plus one
@@ -954,7 +972,7 @@ class SensitiveDataAnalyzer:
         code_sample field.
 
         Args:
-            source_lines: The source file split into lines.
+            parsed_file: The parsed file the finding belongs to.
             line_number: 1-based line number of the finding.
 
         Returns:
@@ -962,17 +980,11 @@ class SensitiveDataAnalyzer:
             newlines. Returns "<source unavailable>" if source lines
             are empty or the line number is out of range.
         """
-        if not source_lines or line_number < 1:
-            return "<source unavailable>"
-
-        idx = line_number - 1
-        start = max(0, idx - 1)
-        end = min(len(source_lines), idx + 2)
-
-        if start >= len(source_lines):
+        lines = parsed_file.context(line_number, 1)
+        if not lines:
             return "<source unavailable>"
 
-        return "\n".join(source_lines[start:end])
+        return "\n".join(lines)
 
     @staticmethod
     def _get_source_line(source_lines: List[str], line_number: int) -> str:
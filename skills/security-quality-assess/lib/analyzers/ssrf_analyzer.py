@@ -159,6 +159,9 @@ class SSRFAnalyzer:
 
     Attributes:
         VERSION: Analyzer version string for AssessmentResult tracking.
+        RULE_KEYWORDS: Lower-case keywords per rule, one of which every
+            finding of the rule contains. A rule is skipped for files that
+            contain none of them (see ``ParseResult.may_contain``).
 
     Usage::
 
@@ -174,6 +177,13 @@ class SSRFAnalyzer:
 
     VERSION: str = "1.0.0"
 
+    # A finding needs user input on the call line or in a variable
+    # assigned from it, and either way the request object is named.
+    RULE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+        "python_ssrf": ("request.",),
+        "js_ssrf": ("req.body", "req.params", "req.query"),
+    }
+
     def analyze(
         self,
         parsed_files: List[ParseResult],
@@ -198,15 +208,23 @@ class SSRFAnalyzer:
         if config.get("skip_ssrf", False):
             return findings
 
+        keywords = self.RULE_KEYWORDS
+
         for parsed_file in parsed_files:
             if parsed_file.language == "lockfile":
                 continue
 
-            if parsed_file.language == "python":
+            if (
+                parsed_file.language == "python"
+                and parsed_file.may_contain(keywords["python_ssrf"])
+            ):
                 findings.extend(
                     self._detect_python_ssrf(parsed_file, id_gen)
                 )
-            elif parsed_file.language == "javascript":
+            elif (
+                parsed_file.language == "javascript"
+                and parsed_file.may_contain(keywords["js_ssrf"])
+            ):
                 findings.extend(
                     self._detect_js_ssrf(parsed_file, id_gen)
                 )
@@ -240,20 +258,19 @@ class SSRFAnalyzer:
         if not parsed_file.raw_source:
             return findings
 
-        raw = parsed_file.raw_source
         source_lines = parsed_file.source_lines
         seen_lines: set[int] = set()
 
         # Collect variable names assigned from user input and their lines.
         user_input_vars: Dict[str, int] = {}
-        for match in _PY_VAR_ASSIGNMENT.finditer(raw):
+        for match in parsed_file.finditer(_PY_VAR_ASSIGNMENT):
             var_name = match.group(1)
-            line_num = raw[: match.start()].count("\n") + 1
+            line_num = parsed_file.line_of(match.start())
             user_input_vars[var_name] = line_num
 
         # Scan for HTTP request function calls.
-        for match in _PY_HTTP_REQUEST_FUNCTIONS.finditer(raw):
-            call_line = raw[: match.start()].count("\n") + 1
+        for match in parsed_file.finditer(_PY_HTTP_REQUEST_FUNCTIONS):
+            call_line = parsed_file.line_of(match.start())
 
             if call_line in seen_lines:
                 continue
@@ -287,7 +304,7 @@ class SSRFAnalyzer:
 
             seen_lines.add(call_line)
 
-            code_sample = self._build_code_sample(source_lines, call_line)
+            code_sample = self._build_code_sample(parsed_file, call_line)
 
             func_match = re.search(
                 r"((?:urllib\.request\.urlopen|requests\.\w+|"
@@ -375,7 +392,6 @@ class SSRFAnalyzer:
         if not parsed_file.raw_source:
             return findings
 
-        raw = parsed_file.raw_source
         source_lines = parsed_file.source_lines
         seen_lines: set[int] = set()
 
@@ -383,15 +399,15 @@ class SSRFAnalyzer:
         user_input_vars: Dict[str, int] = {}
 
         # Simple assignments: const url = req.query.url
-        for match in _JS_SIMPLE_VAR_ASSIGNMENT.finditer(raw):
+        for match in parsed_file.finditer(_JS_SIMPLE_VAR_ASSIGNMENT):
             var_name = match.group(1)
-            line_num = raw[: match.start()].count("\n") + 1
+            line_num = parsed_file.line_of(match.start())
             user_input_vars[var_name] = line_num
 
         # Destructuring assignments: const { url, callback_url } = req.body
-        for match in _JS_DESTRUCTURE_ASSIGNMENT.finditer(raw):
+        for match in parsed_file.finditer(_JS_DESTRUCTURE_ASSIGNMENT):
             destructured = match.group(1)
-            line_num = raw[: match.start()].count("\n") + 1
+            line_num = parsed_file.line_of(match.start())
             # Parse out individual variable names from destructuring.
             for var_part in destructured.split(","):
                 var_part = var_part.strip()
@@ -405,8 +421,8 @@ class SSRFAnalyzer:
                     user_input_vars[var_part] = line_num
 
         # Scan for HTTP request function calls.
-        for match in _JS_HTTP_REQUEST_FUNCTIONS.finditer(raw):
-            call_line = raw[: match.start()].count("\n") + 1
+        for match in parsed_file.finditer(_JS_HTTP_REQUEST_FUNCTIONS):
+            call_line = parsed_file.line_of(match.start())
 
             if call_line in seen_lines:
                 continue
@@ -438,7 +454,7 @@ class SSRFAnalyzer:
 
             seen_lines.add(call_line)
 
-            code_sample = self._build_code_sample(source_lines, call_line)
+            code_sample = self._build_code_sample(parsed_file, call_line)
 
             func_match = re.search(
                 r"(fetch|axios\.\w+|https?\.\w+|got(?:\.\w+)?|"
@@ -504,7 +520,7 @@ class SSRFAnalyzer:
     # -----------------------------------------------------------------
 
     @staticmethod
-    def _build_code_sample(source_lines: List[str], line_number: int) -> str:
+    def _build_code_sample(parsed_file: ParseResult, line_number: int) -> str:
         """Build a 3-line code sample centered on the given line number.
 
         Returns up to 3 lines of source code (the target line plus one
@@ -512,7 +528,7 @@ class SSRFAnalyzer:
         code_sample field.
 
         Args:
-            source_lines: The source file split into lines.
+            parsed_file: The parsed file the finding belongs to.
             line_number: 1-based line number of the finding.
 
         Returns:
@@ -520,17 +536,11 @@ class SSRFAnalyzer:
             newlines. Returns "<source unavailable>" if source lines
             are empty or the line number is out of range.
         """
-        if not source_lines or line_number < 1:
-            return "<source unavailable>"
-
-        idx = line_number - 1
-        start = max(0, idx - 1)
-        end = min(len(source_lines), idx + 2)
-
-        if start >= len(source_lines):
+        lines = parsed_file.context(line_number, 1)
+        if not lines:
             return "<source unavailable>"
 
-        return "\n".join(source_lines[start:end])
+        return "\n".join(lines)
 
     @staticmethod
     def _get_source_line(source_lines: List[str], line_number: int) -> str:
@@ -9,10 +9,24 @@ vulnerabilities without needing to know which parser produced the data.
 
 Classes:
     ParseResult: Unified container for parsed file data.
+
+ParseResult objects are pickled when ``assess.py --jobs`` parses files on
+worker processes; ``source_lines`` is left out of the pickle whenever it can
+be rebuilt from ``raw_source``, so each file's text crosses the process
+boundary once.  The same goes for the lazily built line index behind
+:meth:`ParseResult.line_of`.
+
+During analysis ``assess.py`` attaches a
+:class:`~lib.utils.source_scanner.SourceMatches` to every result, and
+analyzers read regex matches over ``raw_source`` through
+:meth:`ParseResult.finditer`, so each file is scanned once per pattern
+across all analyzers.  Before evaluating a rule, analyzers ask
+:meth:`ParseResult.may_contain` whether the file holds any of the rule's
+keywords.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Pattern, Sequence
 
 from lib.parsers.python_parser import DangerousCall, SQLQuery, StringLiteral
 from lib.parsers.javascript_parser import (
@@ -21,6 +35,12 @@ from lib.parsers.javascript_parser import (
     JSStringLiteral,
 )
 from lib.parsers.dependency_parser import Dependency
+from lib.parsers.line_index import LineIndex
+
+if TYPE_CHECKING:
+    import re
+
+    from lib.utils.source_scanner import SourceMatches
 
 
 @dataclass
@@ -67,6 +87,9 @@ class ParseResult:
             Retained for analyzers that need to perform their own regex
             scanning (e.g., weak crypto detection). Empty string for
             lockfiles.
+        source_matches: Shared scan of ``raw_source`` used by
+            :meth:`finditer`, attached for the duration of analysis.
+            ``None`` outside it.
     """
 
     file_path: str
@@ -89,3 +112,99 @@ class ParseResult:
 
     # Optional: function decorators for auth analysis
     function_decorators: Optional[List] = field(default_factory=list)
+
+    # Shared regex scan of raw_source (see lib.utils.source_scanner)
+    source_matches: Optional["SourceMatches"] = field(
+        default=None, repr=False, compare=False
+    )
+
+    # Line-start offsets of raw_source, built on first line_of() call
+    _line_index: Optional[LineIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def line_of(self, offset: int) -> int:
+        """Return the 1-based line number of an offset into ``raw_source``.
+
+        Equivalent to ``raw_source[:offset].count("\\n") + 1``, but the
+        newline offsets are indexed once per file and each lookup is a
+        bisection.
+
+        Args:
+            offset: 0-based character offset, e.g. ``match.start()``.
+
+        Returns:
+            The line number containing *offset*.
+        """
+        if self._line_index is None:
+            self._line_index = LineIndex(self.raw_source)
+        return self._line_index.line_of(offset)
+
+    def context(self, line: int, radius: int = 1) -> List[str]:
+        """Return the source lines around a 1-based line number.
+
+        Args:
+            line: 1-based line number.
+            radius: Number of lines to include on each side.
+
+        Returns:
+            ``source_lines`` from ``line - radius`` to ``line + radius``,
+            clipped to the file.  Empty when *line* is below 1 or the
+            window starts past the end of the file.
+        """
+        if line < 1:
+            return []
+        start = max(0, line - 1 - radius)
+        if start >= len(self.source_lines):
+            return []
+        return self.source_lines[start : line + radius]
+
+    def finditer(self, pattern: Pattern[str]) -> List["re.Match[str]"]:
+        """Return the matches of *pattern* over ``raw_source``.
+
+        Equivalent to ``list(pattern.finditer(self.raw_source))``.  When a
+        shared scan is attached, the result comes from it and is computed
+        at most once per pattern.
+
+        Args:
+            pattern: A compiled ``str`` regex.
+
+        Returns:
+            The matches in source order.
+        """
+        if self.source_matches is not None:
+            return self.source_matches.finditer(pattern)
+        return list(pattern.finditer(self.raw_source))
+
+    def may_contain(self, keywords: Sequence[str]) -> bool:
+        """Whether a rule keyed on *keywords* can match this file.
+
+        Analyzers call this before evaluating a rule, with the lower-case
+        keywords one of which every finding of the rule requires.  Without
+        a shared scan attached, or for a rule with no keywords, every rule
+        is evaluated.
+
+        Args:
+            keywords: Lower-case keywords, matched ignoring case.
+
+        Returns:
+            ``False`` only when the shared scan found none of *keywords*.
+        """
+        if self.source_matches is None or not keywords:
+            return True
+        return self.source_matches.contains_any(keywords)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the pickled state, without derivable ``source_lines``."""
+        state = self.__dict__.copy()
+        state["source_matches"] = None
+        state["_line_index"] = None
+        if self.source_lines and self.source_lines == self.raw_source.splitlines():
+            state["source_lines"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore from :meth:`__getstate__`, re-splitting ``raw_source``."""
+        if state.get("source_lines") is None:
+            state["source_lines"] = state["raw_source"].splitlines()
+        self.__dict__.update(state)
@@ -32,6 +32,8 @@ import re
 from dataclasses import dataclass
 from typing import List, Tuple
 
+from lib.parsers.line_index import LineIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -225,19 +227,6 @@ def _strip_comments(content: str) -> str:
     return result
 
 
-def _line_number_at_offset(content: str, offset: int) -> int:
-    """Calculate the 1-based line number for a character offset.
-
-    Args:
-        content: The full source string.
-        offset: 0-based character offset within *content*.
-
-    Returns:
-        1-based line number corresponding to the offset.
-    """
-    return content[:offset].count("\n") + 1
-
-
 def _unescape_js_string(value: str) -> str:
     """Unescape common JavaScript string escape sequences.
 
@@ -354,6 +343,7 @@ class JavaScriptSecurityParser:
             return []
 
         cleaned = _strip_comments(content)
+        line_index = LineIndex(cleaned)
         literals: List[JSStringLiteral] = []
 
         # Process each quote type with its corresponding pattern and label.
@@ -374,7 +364,7 @@ class JavaScriptSecurityParser:
                 if not value.strip():
                     continue
 
-                line_num = _line_number_at_offset(cleaned, match.start())
+                line_num = line_index.line_of(match.start())
                 literals.append(
                     JSStringLiteral(
                         value=value,
@@ -426,6 +416,7 @@ class JavaScriptSecurityParser:
             return []
 
         cleaned = _strip_comments(content)
+        line_index = LineIndex(cleaned)
         lines = cleaned.splitlines()
         results: List[DangerousPattern] = []
 
@@ -441,7 +432,7 @@ class JavaScriptSecurityParser:
 
         for pattern, pattern_type in detectors:
             for match in pattern.finditer(cleaned):
-                line_num = _line_number_at_offset(cleaned, match.start())
+                line_num = line_index.line_of(match.start())
                 ctx = _context_for_line(lines, line_num)
                 results.append(
                     DangerousPattern(
@@ -502,6 +493,7 @@ class JavaScriptSecurityParser:
             return []
 
         cleaned = _strip_comments(content)
+        line_index = LineIndex(cleaned)
         # Collect findings keyed by line number. When multiple detectors
         # match the same line, keep the longest pattern text (most context)
         # and preserve the is_parametrized flag if any detector marks it safe.
@@ -518,7 +510,7 @@ class JavaScriptSecurityParser:
             with the longest pattern text is kept. If any detector marks
             the line as parameterized, that flag is preserved.
             """
-            line_num = _line_number_at_offset(cleaned, offset)
+            line_num = line_index.line_of(offset)
             # Truncate long patterns.
             pattern_text = match_text.strip()
             if len(pattern_text) > 300:
@@ -0,0 +1,57 @@
+"""Newline offset index for character-offset to line-number lookups.
+
+Regex-based detection reports character offsets, and findings need 1-based
+line numbers.  Counting the newlines before every match
+(``source[:offset].count("\\n") + 1``) costs O(n) per match, which is
+quadratic on minified bundles and generated files with thousands of
+matches.  :class:`LineIndex` records every line-start offset once, in an
+``array('I')``, and answers each lookup by bisection.
+
+Classes:
+    LineIndex: Line-start offsets of a text with a bisecting ``line_of``.
+
+Example:
+    >>> index = LineIndex("a = 1\\nb = 2\\n")
+    >>> index.line_of(6)
+    2
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+
+_NEWLINE = re.compile("\n")
+
+
+class LineIndex:
+    """Line-start offsets of a text.
+
+    Lines are delimited by ``"\\n"`` only, so :meth:`line_of` agrees
+    exactly with ``text[:offset].count("\\n") + 1``.
+
+    Attributes:
+        starts: Offset of the first character of every line; ``starts[0]``
+            is always ``0``.
+    """
+
+    __slots__ = ("starts",)
+
+    def __init__(self, text: str) -> None:
+        """Record the line starts of *text*.
+
+        Args:
+            text: The source text to index.
+        """
+        self.starts: "array[int]" = array("I", [0])
+        self.starts.extend(match.end() for match in _NEWLINE.finditer(text))
+
+    def line_of(self, offset: int) -> int:
+        """Return the 1-based line number of a character offset.
+
+        Args:
+            offset: 0-based character offset into the indexed text.
+
+        Returns:
+            The number of the line containing *offset*.
+        """
+        return bisect_right(self.starts, offset)
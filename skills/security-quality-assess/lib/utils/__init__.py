@@ -3,6 +3,10 @@
 Exports:
     OSVClient: HTTP client for the OSV (Open Source Vulnerabilities) API
         with local 24-hour filesystem caching.
+    ParseCache: Persistent, content-addressed cache of per-file parser
+        extractions.
+    SourceScanner: Shared per-file regex scanning stage with a
+        required-literal prefilter and memoized matches.
     SecurityPatterns: Centralized regex pattern library for security
         detection, organized by category (secrets, PII, injection,
         JavaScript, weak cryptography, configuration, auth).
@@ -22,7 +26,9 @@ Exports:
 
 from lib.utils.entropy import calculate_shannon_entropy, is_likely_secret
 from lib.utils.osv_client import OSVClient
+from lib.utils.parse_cache import ParseCache
 from lib.utils.patterns import SecurityPatterns
+from lib.utils.source_scanner import SourceScanner
 from lib.utils.suppression_loader import (
     apply_suppressions,
     check_expired_suppressions,
@@ -32,7 +38,9 @@ from lib.utils.suppression_loader import (
 
 __all__ = [
     "OSVClient",
+    "ParseCache",
     "SecurityPatterns",
+    "SourceScanner",
     "apply_suppressions",
     "calculate_shannon_entropy",
     "check_expired_suppressions",
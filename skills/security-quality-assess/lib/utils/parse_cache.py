@@ -0,0 +1,210 @@
+"""Persistent, content-addressed cache of parser extractions.
+
+Stores the security-relevant data extracted from a source file (string
+literals, dangerous calls, SQL queries, decorators, JS patterns) so that a
+re-scan of an unchanged file skips parsing.  Entries are keyed on the
+SHA-256 of the decoded source together with the language, the parser
+version and the cache format, so editing a file, upgrading a parser, or
+changing the entry layout never serves stale data.  There is no TTL:
+content-addressed entries do not go stale.
+
+Only clean parses are stored.  Files with syntax or extraction errors are
+parsed on every run, so their (path-specific) error messages are
+reproduced exactly.
+
+Classes:
+    ParseCache: Filesystem cache of per-file extractions with hit and miss
+        counters.
+
+Example:
+    >>> cache = ParseCache({"python": "1.0", "javascript": "1.0"})
+    >>> fields = cache.get("python", source)
+    >>> if fields is None:
+    ...     result = parse(source)
+    ...     cache.put("python", source, result)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from lib.models.parse_result import ParseResult
+from lib.parsers.javascript_parser import (
+    DangerousPattern,
+    JSDBQuery,
+    JSStringLiteral,
+)
+from lib.parsers.python_parser import DangerousCall, SQLQuery, StringLiteral
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of a cache entry changes.
+_CACHE_FORMAT_VERSION: str = "1"
+
+# ParseResult fields cached per language, with the dataclass each list
+# holds.  ``function_decorators`` holds (name, line, decorators) tuples.
+_CACHED_FIELDS: Dict[str, Dict[str, Any]] = {
+    "python": {
+        "string_literals": StringLiteral,
+        "dangerous_calls": DangerousCall,
+        "sql_queries": SQLQuery,
+        "function_decorators": tuple,
+    },
+    "javascript": {
+        "js_string_literals": JSStringLiteral,
+        "dangerous_patterns": DangerousPattern,
+        "js_db_queries": JSDBQuery,
+    },
+}
+
+
+class ParseCache:
+    """Filesystem cache of per-file parser extractions.
+
+    Each entry is one JSON file under ``cache_dir``, sharded by the first
+    two hex digits of its key.  Reads and writes are best-effort: a corrupt
+    or unreadable entry counts as a miss, and write failures are logged and
+    ignored.
+
+    Attributes:
+        CACHE_DIR: Default cache directory.
+        cache_dir: Directory entries are read from and written to.
+        parser_versions: Parser version per language; part of every key.
+        hits: Lookups answered from the cache.
+        misses: Lookups that found no usable entry.
+    """
+
+    CACHE_DIR: Path = Path.home() / ".cache" / "security-quality-assess" / "parse"
+
+    def __init__(
+        self,
+        parser_versions: Dict[str, str],
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        """Initialize the cache, creating its directory if needed.
+
+        Args:
+            parser_versions: Version string per language (``"python"``,
+                ``"javascript"``).  Bump a version whenever that parser's
+                extraction output changes.
+            cache_dir: Directory for entries.  Defaults to
+                :attr:`CACHE_DIR`.
+        """
+        self.cache_dir: Path = cache_dir if cache_dir is not None else self.CACHE_DIR
+        self.parser_versions: Dict[str, str] = dict(parser_versions)
+        self.hits: int = 0
+        self.misses: int = 0
+        self.enabled: bool = True
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            logger.warning(
+                "Failed to create parse cache directory %s: %s",
+                self.cache_dir,
+                exc,
+            )
+            self.enabled = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, language: str, content: str) -> Optional[Dict[str, List[Any]]]:
+        """Look up the cached extractions for a source text.
+
+        Args:
+            language: ``"python"`` or ``"javascript"``.
+            content: The decoded source text.
+
+        Returns:
+            ParseResult keyword arguments for the extraction fields of
+            *language*, or ``None`` on a miss.
+        """
+        fields = _CACHED_FIELDS.get(language)
+        if not self.enabled or fields is None:
+            return None
+
+        entry_file = self._entry_path(self._get_cache_key(language, content))
+        try:
+            data = json.loads(entry_file.read_text(encoding="utf-8"))
+            restored = {
+                name: [
+                    (item[0], item[1], list(item[2])) if cls is tuple else cls(**item)
+                    for item in data[name]
+                ]
+                for name, cls in fields.items()
+            }
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, TypeError, IndexError) as exc:
+            logger.debug("Ignoring unreadable parse cache entry %s: %s", entry_file, exc)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return restored
+
+    def put(self, language: str, content: str, result: ParseResult) -> None:
+        """Store the extractions of a cleanly parsed file.
+
+        Args:
+            language: ``"python"`` or ``"javascript"``.
+            content: The decoded source text *result* was parsed from.
+            result: The ``ParseResult`` whose extraction fields to store.
+        """
+        fields = _CACHED_FIELDS.get(language)
+        if not self.enabled or fields is None:
+            return
+
+        data = {
+            name: [
+                list(item) if cls is tuple else asdict(item)
+                for item in getattr(result, name) or []
+            ]
+            for name, cls in fields.items()
+        }
+
+        entry_file = self._entry_path(self._get_cache_key(language, content))
+        try:
+            entry_file.parent.mkdir(exist_ok=True)
+            # Write then rename, so concurrent --jobs workers and readers
+            # never see a partial entry.
+            fd, tmp_name = tempfile.mkstemp(dir=entry_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(data, handle, separators=(",", ":"))
+            os.replace(tmp_name, entry_file)
+        except OSError as exc:
+            logger.warning("Failed to write parse cache entry %s: %s", entry_file, exc)
+
+    # ------------------------------------------------------------------
+    # Cache helpers
+    # ------------------------------------------------------------------
+
+    def _get_cache_key(self, language: str, content: str) -> str:
+        """Generate the cache key for a source text.
+
+        Args:
+            language: Language of the source.
+            content: The decoded source text.
+
+        Returns:
+            A 64-character hex SHA-256 digest over the language, parser
+            version, cache format and content.
+        """
+        digest = hashlib.sha256()
+        digest.update(
+            f"{language}:{self.parser_versions.get(language, '')}:"
+            f"{_CACHE_FORMAT_VERSION}:".encode("utf-8")
+        )
+        digest.update(content.encode("utf-8", errors="surrogatepass"))
+        return digest.hexdigest()
+
+    def _entry_path(self, cache_key: str) -> Path:
+        """Return the file holding the entry for *cache_key*."""
+        return self.cache_dir / cache_key[:2] / f"{cache_key}.json"
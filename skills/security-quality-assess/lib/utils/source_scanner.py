@@ -0,0 +1,330 @@
+"""Shared per-file regex scanning stage for the security analyzers.
+
+The analyzers run dozens of ``pattern.finditer(raw_source)`` scans over
+every file, and most of those regexes cannot match a given file at all.
+For each pattern, :class:`SourceScanner` derives from the parsed regex the
+literal text every match must contain (for example, one of ``log.debug``,
+``log.info``, ... for a logging-call pattern).  A file is scanned with a
+pattern only when one of those literals occurs in it; otherwise the
+pattern has no matches and is never run.
+
+Literal checks and match lists are memoized per file, so a regex used by
+several analyzers (or by several rules of one analyzer) scans each file at
+most once, and a literal shared by several regexes is looked up once.  The
+matches are the ordinary ``re.Match`` objects ``finditer`` yields, so
+analyzers see exactly the match events they saw before and produce
+identical findings.
+
+Analyzers also gate whole rules on the file: each declares, per rule, the
+lower-case keywords one of which any finding of the rule requires, and
+skips the rule when :meth:`SourceMatches.contains_any` finds none of them.
+Keywords share the memoized literal checks, so a keyword declared by
+several rules, or also derived from a pattern, is searched for once.
+
+Classes:
+    SourceScanner: Per-pattern literal prefilter shared across files.
+    SourceMatches: Memoized ``finditer`` results for one file.
+
+Functions:
+    required_literals: Derive the literals every match of a regex contains.
+    fold_case: Lower-case text for case-insensitive literal checks.
+
+Example:
+    >>> scanner = SourceScanner()
+    >>> matches = scanner.scan(raw_source)
+    >>> for match in matches.finditer(_UNSAFE_YAML_LOAD):
+    ...     print(match.start())
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple
+
+try:  # Python 3.11+
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse  # type: ignore[no-redef]
+
+# Literals shorter than this occur in nearly every file, so checking them
+# costs more than it saves.
+_MIN_LITERAL_LENGTH: int = 3
+
+# Upper bound on the alternatives a literal set may expand to when
+# adjacent alternations are concatenated (``(?:a|b)(?:c|d)``).
+_MAX_ALTERNATIVES: int = 64
+
+# Largest character class expanded into single-character alternatives.
+_MAX_CLASS_SIZE: int = 4
+
+# Inline flag groups that turn on IGNORECASE, e.g. ``(?i:...)``.
+_LOCAL_IGNORECASE = re.compile(r"\(\?[aLmsux-]*i")
+
+_REPEAT_OPS = tuple(
+    op
+    for op in (
+        sre_parse.MAX_REPEAT,
+        sre_parse.MIN_REPEAT,
+        getattr(sre_parse, "POSSESSIVE_REPEAT", None),
+    )
+    if op is not None
+)
+_ZERO_WIDTH_OPS = (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT)
+
+
+def _best(candidates: List[FrozenSet[str]]) -> Optional[FrozenSet[str]]:
+    """Pick the most selective literal set: longest shortest alternative."""
+    best: Optional[FrozenSet[str]] = None
+    best_key: Tuple[int, int] = (0, 0)
+    for candidate in candidates:
+        if not candidate:
+            continue
+        key = (min(len(s) for s in candidate), -len(candidate))
+        if key > best_key:
+            best, best_key = candidate, key
+    return best
+
+
+def _class_chars(items: List[Tuple[object, object]]) -> Optional[FrozenSet[str]]:
+    """Expand a small character class of plain literals, else ``None``."""
+    chars: Set[str] = set()
+    for op, av in items:
+        if op is not sre_parse.LITERAL:
+            return None
+        chars.add(chr(av))  # type: ignore[arg-type]
+    if len(chars) > _MAX_CLASS_SIZE:
+        return None
+    return frozenset(chars)
+
+
+def _analyze(
+    subpattern: "sre_parse.SubPattern",
+) -> Tuple[Optional[FrozenSet[str]], Optional[FrozenSet[str]]]:
+    """Analyze a parsed (sub)pattern.
+
+    Returns:
+        ``(exact, required)``: *exact* is the set of strings the
+        subpattern matches when it matches only fixed text, else ``None``;
+        *required* is the best literal set one of which every match
+        contains, else ``None``.
+    """
+    candidates: List[FrozenSet[str]] = []
+    run: Optional[FrozenSet[str]] = frozenset([""])
+    all_exact = True
+
+    def close_run() -> None:
+        nonlocal run
+        if run is not None:
+            candidates.append(run)
+        run = None
+
+    for op, av in subpattern.data:
+        exact: Optional[FrozenSet[str]] = None
+        required: Optional[FrozenSet[str]] = None
+
+        if op is sre_parse.LITERAL:
+            exact = frozenset([chr(av)])
+        elif op is sre_parse.IN:
+            exact = _class_chars(av)
+        elif op is sre_parse.SUBPATTERN:
+            exact, required = _analyze(av[-1])
+        elif op is sre_parse.BRANCH:
+            branches = [_analyze(branch) for branch in av[1]]
+            if all(e is not None for e, _ in branches):
+                exact = frozenset().union(*(e for e, _ in branches))
+            elif all((e or r) for e, r in branches):
+                required = frozenset().union(*((e or r) for e, r in branches))
+        elif op in _REPEAT_OPS:
+            low, high, item = av
+            inner_exact, inner_required = _analyze(item)
+            if low == high == 1:
+                exact, required = inner_exact, inner_required
+            elif low >= 1:
+                required = inner_exact or inner_required
+        elif op in _ZERO_WIDTH_OPS:
+            # Consumes nothing, so the literals around it stay adjacent.
+            continue
+
+        if exact is not None:
+            if run is not None and len(run) * len(exact) <= _MAX_ALTERNATIVES:
+                run = frozenset(a + b for a in run for b in exact)
+                continue
+            # Too many alternatives: keep the literals seen so far as one
+            # candidate and start a new run.
+            all_exact = False
+            close_run()
+            run = exact
+            continue
+
+        all_exact = False
+        close_run()
+        if required is not None:
+            candidates.append(required)
+
+    if all_exact and run is not None:
+        return run, _best([run])
+    close_run()
+    return None, _best(candidates)
+
+
+def required_literals(pattern: Pattern[str]) -> Optional[FrozenSet[str]]:
+    """Derive the literals every match of *pattern* contains.
+
+    Args:
+        pattern: A compiled ``str`` regex.
+
+    Returns:
+        A set of strings such that every match of *pattern* contains at
+        least one of them, or ``None`` when no set with alternatives of
+        at least three characters can be derived.
+    """
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except (re.error, TypeError, RecursionError):
+        return None
+    _, literals = _analyze(parsed)
+    if literals is None or min(len(s) for s in literals) < _MIN_LITERAL_LENGTH:
+        return None
+    return literals
+
+
+# Characters that IGNORECASE matching folds to an ASCII letter although
+# str.lower() does not map them to it.
+_CASE_FIXES = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+
+def fold_case(text: str) -> str:
+    """Lower-case *text* for case-insensitive literal checks.
+
+    Every match of a regex, with or without ``re.IGNORECASE``, of a
+    lower-case ASCII literal occurs in the folded text.
+
+    Args:
+        text: Text to fold.
+
+    Returns:
+        The folded text.
+    """
+    if not text.isascii():
+        text = text.translate(_CASE_FIXES)
+    return text.lower()
+
+
+class SourceMatches:
+    """Memoized ``finditer`` results of one file.
+
+    Created by :meth:`SourceScanner.scan`.  Literal checks and match lists
+    are computed on first use and kept for the file's other patterns.
+    """
+
+    __slots__ = ("_text", "_folded", "_scanner", "_present", "_cache")
+
+    def __init__(self, text: str, scanner: "SourceScanner") -> None:
+        self._text = text
+        self._folded: Optional[str] = None
+        self._scanner = scanner
+        self._present: Dict[Tuple[str, bool], bool] = {}
+        self._cache: Dict[Tuple[str, int], List["re.Match[str]"]] = {}
+
+    def finditer(self, pattern: Pattern[str]) -> List["re.Match[str]"]:
+        """Return ``list(pattern.finditer(text))``, scanning at most once.
+
+        Args:
+            pattern: A compiled ``str`` regex.
+
+        Returns:
+            The matches in source order; empty without scanning when none
+            of the pattern's required literals occurs in the file.
+        """
+        key = (pattern.pattern, pattern.flags)
+        matches = self._cache.get(key)
+        if matches is None:
+            literals, ignore_case = self._scanner.prefilter(pattern)
+            if literals is None or any(
+                self._contains(literal, ignore_case) for literal in literals
+            ):
+                matches = list(pattern.finditer(self._text))
+            else:
+                matches = []
+            self._cache[key] = matches
+        return matches
+
+    def contains_any(self, keywords: Iterable[str]) -> bool:
+        """Whether any of *keywords* occurs in the file, ignoring case.
+
+        Args:
+            keywords: Lower-case ASCII keywords.
+
+        Returns:
+            ``True`` as soon as one keyword is found.
+        """
+        return any(self._contains(keyword, True) for keyword in keywords)
+
+    def _contains(self, literal: str, ignore_case: bool) -> bool:
+        """Whether *literal* occurs in the file (memoized)."""
+        key = (literal, ignore_case)
+        found = self._present.get(key)
+        if found is None:
+            if ignore_case:
+                if self._folded is None:
+                    self._folded = fold_case(self._text)
+                found = literal in self._folded
+            else:
+                found = literal in self._text
+            self._present[key] = found
+        return found
+
+
+class SourceScanner:
+    """Literal prefilter shared by every analyzer's raw-source patterns.
+
+    The required literals of a pattern are derived the first time any file
+    asks for it, then reused for every file.  :meth:`scan` wraps one file;
+    the analyzers then call :meth:`SourceMatches.finditer` (usually through
+    :meth:`ParseResult.finditer`) instead of ``pattern.finditer``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty prefilter table."""
+        self._prefilters: Dict[
+            Tuple[str, int], Tuple[Optional[Tuple[str, ...]], bool]
+        ] = {}
+
+    def scan(self, text: str) -> SourceMatches:
+        """Start the shared scan of one file.
+
+        Args:
+            text: The file's raw source.
+
+        Returns:
+            The file's :class:`SourceMatches`.
+        """
+        return SourceMatches(text, self)
+
+    def prefilter(
+        self, pattern: Pattern[str]
+    ) -> Tuple[Optional[Tuple[str, ...]], bool]:
+        """Return the literals to check before running *pattern*.
+
+        Returns:
+            ``(literals, ignore_case)``: *literals* (longest first, and
+            lower-cased when *ignore_case*) of which every match contains
+            one, or ``None`` when the pattern must always run.
+        """
+        key = (pattern.pattern, pattern.flags)
+        entry = self._prefilters.get(key)
+        if entry is None:
+            literals = required_literals(pattern)
+            # Local (?i) groups fold case too; checking case-insensitively
+            # is always safe, only less selective.
+            ignore_case = bool(
+                pattern.flags & re.IGNORECASE
+                or _LOCAL_IGNORECASE.search(pattern.pattern)
+            )
+            ordered: Optional[Tuple[str, ...]] = None
+            if literals is not None and (
+                not ignore_case or all(s.isascii() for s in literals)
+            ):
+                folded = {s.lower() if ignore_case else s for s in literals}
+                ordered = tuple(sorted(folded, key=lambda s: (-len(s), s)))
+            entry = (ordered, ignore_case)
+            self._prefilters[key] = entry
+        return entry
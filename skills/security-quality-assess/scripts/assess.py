@@ -14,6 +14,7 @@ Usage:
     python scripts/assess.py /path/to/project
     python scripts/assess.py /path/to/project --output report.md
     python scripts/assess.py /path/to/project --skip-osv --verbose
+    python scripts/assess.py /path/to/project --jobs 0
 
 All dependencies are from the Python standard library; no pip packages
 are required.
@@ -23,10 +24,13 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 # ---------------------------------------------------------------------------
 # Ensure the project root is on sys.path so that ``lib`` can be imported
@@ -75,6 +79,8 @@ from lib.analyzers import (
 
 # Utilities
 from lib.utils.osv_client import OSVClient
+from lib.utils.parse_cache import ParseCache
+from lib.utils.source_scanner import SourceScanner
 from lib.utils.suppression_loader import (
     apply_suppressions,
     load_suppression_config,
@@ -134,6 +140,13 @@ ANALYZER_VERSIONS: Dict[str, str] = {
 }
 """Version strings for each analyzer, included in the assessment report."""
 
+PARSER_VERSIONS: Dict[str, str] = {
+    "python": "1.0",
+    "javascript": "1.0",
+}
+"""Version strings for each source parser.  Part of every parse cache key:
+bump a parser's version whenever its extraction output changes."""
+
 
 # ---------------------------------------------------------------------------
 # CLI argument parsing
@@ -167,6 +180,14 @@ def build_argument_parser() -> argparse.ArgumentParser:
             analysis.  Useful when offline, behind a firewall, or when
             faster scan times are preferred.
 
+        --jobs / -j (optional)
+            Number of worker processes for the parsing phase.  ``1`` (the
+            default) parses in-process; ``0`` uses one worker per CPU.
+
+        --no-cache (flag)
+            Parse every file instead of reusing cached extractions for
+            files whose content is unchanged since an earlier run.
+
         --verbose / -v (flag)
             Enable DEBUG-level logging to stderr.  Shows per-file parse
             progress, individual analyzer timings, suppression match
@@ -208,6 +229,9 @@ def build_argument_parser() -> argparse.ArgumentParser:
             "  %(prog)s . --config team-suppressions.json -o report.md\n"
             "      Scan with a custom suppression configuration.\n"
             "\n"
+            "  %(prog)s /path/to/monorepo --jobs 0 -o report.md\n"
+            "      Parse files on one worker process per CPU.\n"
+            "\n"
             "documentation:\n"
             "  Full docs and suppression schema are in the project README.md\n"
             "  and SKILL.md files located alongside this script."
@@ -258,6 +282,30 @@ def build_argument_parser() -> argparse.ArgumentParser:
         ),
     )
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Parse source files on N worker processes (0 = one per CPU, "
+            "default: 1).  Results are identical to a serial run and keep "
+            "the discovery order."
+        ),
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help=(
+            "Do not use the parse cache in "
+            "~/.cache/security-quality-assess/parse/.  By default files whose "
+            "content is unchanged since an earlier run are not parsed again."
+        ),
+    )
+
     parser.add_argument(
         "--verbose",
         "-v",
@@ -330,6 +378,7 @@ def parse_source_file(
     py_parser: PythonSecurityParser,
     js_parser: JavaScriptSecurityParser,
     errors: Optional[List[str]] = None,
+    cache: Optional[ParseCache] = None,
 ) -> Optional[ParseResult]:
     """Parse a single source file into a ``ParseResult``.
 
@@ -351,6 +400,9 @@ def parse_source_file(
         errors: Optional mutable list for collecting non-fatal error
             messages.  When provided, error descriptions are appended
             instead of only being logged.
+        cache: Optional parse cache.  The file is still read (analyzers
+            need its source), but extractions cached for identical content
+            are reused, and clean parses are stored.
 
     Returns:
         A ``ParseResult`` for the file, or ``None`` if the file could not
@@ -393,7 +445,18 @@ def parse_source_file(
     suffix = file_path.suffix.lower()
 
     if suffix == ".py":
+        cached = cache.get("python", content) if cache is not None else None
+        if cached is not None:
+            return ParseResult(
+                file_path=rel_path,
+                language="python",
+                source_lines=source_lines,
+                raw_source=content,
+                **cached,
+            )
+
         tree, _ = py_parser.parse(content, filename=rel_path)
+        clean = tree is not None
 
         string_literals: list = []
         dangerous_calls: list = []
@@ -413,12 +476,13 @@ def parse_source_file(
                 msg = f"AST extraction error in {rel_path}: {exc}"
                 logger.warning(msg)
                 errors.append(msg)
+                clean = False
                 # Continue with whatever was extracted before the error.
         else:
             msg = f"Syntax error in {rel_path} -- parsed with limited analysis"
             errors.append(msg)
 
-        return ParseResult(
+        result = ParseResult(
             file_path=rel_path,
             language="python",
             source_lines=source_lines,
@@ -428,8 +492,22 @@ def parse_source_file(
             sql_queries=sql_queries,
             function_decorators=function_decorators,
         )
+        if cache is not None and clean:
+            cache.put("python", content, result)
+        return result
 
     if suffix in (".js", ".ts", ".jsx", ".tsx"):
+        cached = cache.get("javascript", content) if cache is not None else None
+        if cached is not None:
+            return ParseResult(
+                file_path=rel_path,
+                language="javascript",
+                source_lines=source_lines,
+                raw_source=content,
+                **cached,
+            )
+
+        clean = True
         try:
             js_string_literals = js_parser.extract_string_literals(content)
             dangerous_patterns = js_parser.extract_dangerous_patterns(content)
@@ -438,11 +516,12 @@ def parse_source_file(
             msg = f"Parse error in {rel_path}: {exc}"
             logger.warning(msg)
             errors.append(msg)
+            clean = False
             js_string_literals = []
             dangerous_patterns = []
             js_db_queries = []
 
-        return ParseResult(
+        result = ParseResult(
             file_path=rel_path,
             language="javascript",
             source_lines=source_lines,
@@ -451,6 +530,9 @@ def parse_source_file(
             dangerous_patterns=dangerous_patterns,
             js_db_queries=js_db_queries,
         )
+        if cache is not None and clean:
+            cache.put("javascript", content, result)
+        return result
 
     logger.debug("Skipping unrecognized file extension: %s", file_path)
     return None
@@ -518,17 +600,132 @@ def parse_lockfile(
     )
 
 
+# Parsers (and parse cache) of a ``--jobs`` worker process, created once
+# per process by :func:`_init_parse_worker`.
+_worker_state: Optional[
+    Tuple[PythonSecurityParser, JavaScriptSecurityParser, Optional[ParseCache]]
+] = None
+
+
+def _init_parse_worker(cache_dir: Optional[Path]) -> None:
+    """Instantiate the language parsers in a freshly started worker.
+
+    Args:
+        cache_dir: Directory of the parent's parse cache, or ``None`` when
+            caching is disabled.
+    """
+    global _worker_state
+    cache = ParseCache(PARSER_VERSIONS, cache_dir) if cache_dir is not None else None
+    _worker_state = (PythonSecurityParser(), JavaScriptSecurityParser(), cache)
+
+
+def _parse_counted(
+    file_path: Path,
+    project_path: Path,
+    py_parser: PythonSecurityParser,
+    js_parser: JavaScriptSecurityParser,
+    cache: Optional[ParseCache],
+) -> Tuple[Optional[ParseResult], List[str], Optional[bool]]:
+    """Parse one source file, reporting its errors and cache outcome.
+
+    Returns:
+        The ``ParseResult`` (or ``None``), the non-fatal error messages
+        recorded while parsing, and ``True``/``False`` for a cache
+        hit/miss (``None`` when the cache was not consulted).
+    """
+    errors: List[str] = []
+    hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+    result = parse_source_file(
+        file_path, project_path, py_parser, js_parser, errors=errors, cache=cache
+    )
+    cache_hit: Optional[bool] = None
+    if cache is not None and cache.hits > hits:
+        cache_hit = True
+    elif cache is not None and cache.misses > misses:
+        cache_hit = False
+    return result, errors, cache_hit
+
+
+def _parse_in_worker(
+    project_path: Path, file_path: Path
+) -> Tuple[Optional[ParseResult], List[str], Optional[bool]]:
+    """Parse one source file in a worker process (see :func:`_parse_counted`)."""
+    py_parser, js_parser, cache = _worker_state
+    return _parse_counted(file_path, project_path, py_parser, js_parser, cache)
+
+
+def iter_parsed_sources(
+    source_files: List[Path],
+    project_path: Path,
+    jobs: int = 1,
+    cache: Optional[ParseCache] = None,
+) -> Iterator[Tuple[Optional[ParseResult], List[str], Optional[bool]]]:
+    """Parse source files, yielding results in ``source_files`` order.
+
+    With ``jobs`` other than 1 the files are sharded across a process
+    pool.  Each worker receives chunks of paths (not contents), parses them
+    with its own parser instances, and sends back pickled ``ParseResult``
+    objects chunk by chunk; the parent consumes them as they arrive, in
+    submission order, so the output is identical to a serial run.
+
+    Args:
+        source_files: Source file paths from :func:`discover_source_files`.
+        project_path: Project root used for relative path computation.
+        jobs: Worker processes; ``1`` parses in-process and ``0`` uses one
+            worker per CPU.
+        cache: Optional parse cache.  Workers open the same directory, and
+            their hits and misses are added to this object's counters.
+
+    Yields:
+        ``(result, errors, cache_hit)`` per source file, where *result* is
+        ``None`` for skipped files, *errors* lists that file's non-fatal
+        errors and *cache_hit* is ``True``/``False`` for a cache hit/miss
+        (``None`` when the cache was not consulted).
+    """
+    jobs = jobs or os.cpu_count() or 1
+
+    if jobs == 1 or len(source_files) < 2:
+        py_parser = PythonSecurityParser()
+        js_parser = JavaScriptSecurityParser()
+        for file_path in source_files:
+            yield _parse_counted(file_path, project_path, py_parser, js_parser, cache)
+        return
+
+    # Several chunks per worker keeps the pool balanced when file sizes vary.
+    chunksize = max(1, len(source_files) // (jobs * 8))
+    cache_dir = cache.cache_dir if cache is not None and cache.enabled else None
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_parse_worker, initargs=(cache_dir,)
+    ) as executor:
+        for outcome in executor.map(
+            partial(_parse_in_worker, project_path),
+            source_files,
+            chunksize=chunksize,
+        ):
+            # Workers count into their own cache objects; mirror them here.
+            cache_hit = outcome[2]
+            if cache is not None and cache_hit is not None:
+                if cache_hit:
+                    cache.hits += 1
+                else:
+                    cache.misses += 1
+            yield outcome
+
+
 def parse_all_files(
     source_files: List[Path],
     lockfiles: Dict[str, Path],
     project_path: Path,
     errors: Optional[List[str]] = None,
+    jobs: int = 1,
+    cache: Optional[ParseCache] = None,
 ) -> List[ParseResult]:
     """Parse all discovered files into ``ParseResult`` objects.
 
-    Instantiates the language-specific parsers, iterates through source
-    files and lockfiles, and returns a flat list of results.  Files that
-    fail to parse are logged, their errors recorded, and silently skipped.
+    Parses source files through :func:`iter_parsed_sources` (serially or
+    on ``jobs`` worker processes), then lockfiles in-process, and returns a
+    flat list of results.  Files that fail to parse are logged, their
+    errors recorded, and silently skipped.
 
     Args:
         source_files: Source file paths from :func:`discover_source_files`.
@@ -536,6 +733,9 @@ def parse_all_files(
         project_path: Project root used for relative path computation.
         errors: Optional mutable list for collecting non-fatal error
             messages encountered during parsing.
+        jobs: Worker processes for source files (``0`` = one per CPU).
+        cache: Optional parse cache for source files.  Its ``hits`` and
+            ``misses`` counters include lookups made by worker processes.
 
     Returns:
         A list of ``ParseResult`` objects.  May be empty if no files could
@@ -544,8 +744,6 @@ def parse_all_files(
     if errors is None:
         errors = []
 
-    py_parser = PythonSecurityParser()
-    js_parser = JavaScriptSecurityParser()
     dep_parser = DependencyParser()
 
     parsed_files: List[ParseResult] = []
@@ -559,7 +757,9 @@ def parse_all_files(
     parse_start = time.monotonic()
 
     # Parse source files.
-    for idx, file_path in enumerate(source_files, start=1):
+    parsed_sources = iter_parsed_sources(source_files, project_path, jobs, cache)
+    for idx, (result, file_errors, _) in enumerate(parsed_sources, start=1):
+        errors.extend(file_errors)
         if idx % progress_interval == 0:
             elapsed = time.monotonic() - parse_start
             rate = idx / elapsed if elapsed > 0 else 0
@@ -570,9 +770,6 @@ def parse_all_files(
                 rate,
             )
 
-        result = parse_source_file(
-            file_path, project_path, py_parser, js_parser, errors=errors
-        )
         if result is not None:
             parsed_files.append(result)
 
@@ -656,6 +853,14 @@ def run_analyzers(
         ("Advanced", AdvancedAnalyzer),
     ]
 
+    # Shared regex scan: every analyzer reads matches over raw_source
+    # through ParseResult.finditer, so each file is scanned at most once
+    # per pattern, and not at all when the pattern's literals are absent.
+    scanner = SourceScanner()
+    for parsed_file in parsed_files:
+        if parsed_file.raw_source:
+            parsed_file.source_matches = scanner.scan(parsed_file.raw_source)
+
     for name, analyzer_cls in analyzer_classes:
         logger.info("Running %s analyzer...", name)
         try:
@@ -675,6 +880,10 @@ def run_analyzers(
             logger.error("  %s", msg)
             errors.append(msg)
 
+    # Release the match lists.
+    for parsed_file in parsed_files:
+        parsed_file.source_matches = None
+
     # ---- Dependency analyzer (optional network) ---------------------------
 
     logger.info("Running Dependency analyzer...")
@@ -957,6 +1166,10 @@ def main(argv: Optional[List[str]] = None) -> int:
     logger.info("Output:  %s", args.output or "(stdout)")
     logger.info("OSV:     %s", "disabled" if args.skip_osv else "enabled")
 
+    if args.jobs < 0:
+        logger.error("--jobs must be 0 (one per CPU) or a positive number")
+        return 2
+
     # Start the performance timer.
     start_time = time.monotonic()
 
@@ -1011,8 +1224,15 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     phase_start = time.monotonic()
 
+    parse_cache = None if args.no_cache else ParseCache(PARSER_VERSIONS)
+
     parsed_files = parse_all_files(
-        source_files, lockfiles, project_path, errors=assessment_errors
+        source_files,
+        lockfiles,
+        project_path,
+        errors=assessment_errors,
+        jobs=args.jobs,
+        cache=parse_cache,
     )
 
     phase_timings["parsing"] = time.monotonic() - phase_start
@@ -1022,6 +1242,12 @@ def main(argv: Optional[List[str]] = None) -> int:
         len(parsed_files),
         phase_timings["parsing"],
     )
+    if parse_cache is not None:
+        logger.info(
+            "Parse cache: %d hit(s), %d miss(es)",
+            parse_cache.hits,
+            parse_cache.misses,
+        )
 
     # ------------------------------------------------------------------
     # Step 6: Run all security analyzers
@@ -1142,6 +1368,13 @@ def main(argv: Optional[List[str]] = None) -> int:
         logger.info(
             "  %-15s: %.3fs (%4.1f%%)", phase_name, phase_duration, pct
         )
+        if phase_name == "parsing" and parse_cache is not None:
+            logger.info(
+                "  %-15s: %d hit(s), %d miss(es)",
+                "  parse cache",
+                parse_cache.hits,
+                parse_cache.misses,
+            )
     logger.info("  %-15s: %.3fs", "total", scan_duration)
 
     if result.errors:
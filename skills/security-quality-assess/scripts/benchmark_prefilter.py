@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Rule prefilter benchmark for the security analyzers.
+
+Parses a source tree once, then runs the static analyzers over it twice:
+without a shared scan (every rule runs and every regex scans every file)
+and with the shared scan ``assess.py`` attaches (rules whose keywords are
+absent are skipped, and regexes whose literals are absent do not run).
+Reports both times, how many rule evaluations the keywords skipped, and
+whether the two runs produced the same findings.
+
+The default corpus is the running interpreter's standard library: a large
+tree with few real findings.
+
+Usage:
+    python scripts/benchmark_prefilter.py
+    python scripts/benchmark_prefilter.py /path/to/project
+    python scripts/benchmark_prefilter.py --repeat 3 --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import sysconfig
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_PROJECT_ROOT = _SCRIPT_DIR.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from assess import parse_all_files  # noqa: E402
+from lib.analyzers import (  # noqa: E402
+    AdvancedAnalyzer,
+    AuthAnalyzer,
+    ConfigAnalyzer,
+    InjectionAnalyzer,
+    SecretsAnalyzer,
+    SensitiveDataAnalyzer,
+    SSRFAnalyzer,
+)
+from lib.discovery import discover_source_files, parse_gitignore  # noqa: E402
+from lib.models.finding import Finding  # noqa: E402
+from lib.models.parse_result import ParseResult  # noqa: E402
+from lib.utils.source_scanner import SourceScanner  # noqa: E402
+
+ANALYZERS = [
+    SecretsAnalyzer,
+    InjectionAnalyzer,
+    AuthAnalyzer,
+    ConfigAnalyzer,
+    SensitiveDataAnalyzer,
+    SSRFAnalyzer,
+    AdvancedAnalyzer,
+]
+
+FindingKey = Tuple[str, str, int, str, str]
+
+
+def attach_scans(parsed_files: List[ParseResult]) -> None:
+    """Attach a fresh shared scan to every file, as ``run_analyzers`` does."""
+    scanner = SourceScanner()
+    for parsed_file in parsed_files:
+        if parsed_file.raw_source:
+            parsed_file.source_matches = scanner.scan(parsed_file.raw_source)
+
+
+def detach_scans(parsed_files: List[ParseResult]) -> None:
+    """Remove the shared scans."""
+    for parsed_file in parsed_files:
+        parsed_file.source_matches = None
+
+
+def run_static(parsed_files: List[ParseResult], prefiltered: bool
+               ) -> Tuple[float, List[FindingKey]]:
+    """Run every static analyzer once, with or without the shared scan."""
+    start = time.perf_counter()
+    if prefiltered:
+        attach_scans(parsed_files)
+    findings: List[Finding] = []
+    for analyzer_cls in ANALYZERS:
+        findings.extend(analyzer_cls().analyze(parsed_files, {}))
+    detach_scans(parsed_files)
+    seconds = time.perf_counter() - start
+    keys = [
+        (f.rule_id, f.file_path, f.line_number, f.title, f.code_sample)
+        for f in findings
+    ]
+    return seconds, keys
+
+
+def rule_skips(parsed_files: List[ParseResult]) -> Dict[str, Any]:
+    """Count the (rule, file) pairs whose keywords are absent from the file."""
+    rules = [
+        keywords
+        for analyzer_cls in ANALYZERS
+        for keywords in analyzer_cls.RULE_KEYWORDS.values()
+        if keywords
+    ]
+    attach_scans(parsed_files)
+    source_files = [f for f in parsed_files if f.raw_source]
+    skipped = 0
+    clean_files = 0
+    for parsed_file in source_files:
+        file_skipped = sum(
+            1 for keywords in rules if not parsed_file.may_contain(keywords)
+        )
+        skipped += file_skipped
+        if file_skipped == len(rules):
+            clean_files += 1
+    detach_scans(parsed_files)
+    pairs = len(rules) * len(source_files)
+    return {
+        'keyed_rules': len(rules),
+        'rule_file_pairs': pairs,
+        'pairs_skipped': skipped,
+        'skip_fraction': round(skipped / pairs, 3) if pairs else 0.0,
+        'files_skipping_every_keyed_rule': clean_files,
+    }
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the security analyzers' rule prefilter"
+    )
+    parser.add_argument('path', nargs='?', default=sysconfig.get_paths()['stdlib'],
+                        help='Tree to analyze (default: the Python standard library)')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Runs per mode; the fastest is reported (default: 1)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                        help='Output format (default: text)')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    root = Path(args.path).resolve()
+    source_files = discover_source_files(root, parse_gitignore(root))
+    parse_start = time.perf_counter()
+    parsed_files = parse_all_files(source_files, {}, root)
+    parse_seconds = time.perf_counter() - parse_start
+
+    timings: Dict[str, float] = {}
+    findings: Dict[str, List[FindingKey]] = {}
+    for mode in ('unfiltered', 'prefiltered'):
+        runs = [run_static(parsed_files, mode == 'prefiltered')
+                for _ in range(max(1, args.repeat))]
+        timings[mode] = min(seconds for seconds, _ in runs)
+        findings[mode] = runs[0][1]
+
+    result = {
+        'path': str(root),
+        'files': len(parsed_files),
+        'bytes': sum(len(f.raw_source) for f in parsed_files),
+        'parse_seconds': round(parse_seconds, 2),
+        'unfiltered_seconds': round(timings['unfiltered'], 2),
+        'prefiltered_seconds': round(timings['prefiltered'], 2),
+        'speedup': round(timings['unfiltered'] / timings['prefiltered'], 2)
+        if timings['prefiltered'] else 0.0,
+        'findings': len(findings['prefiltered']),
+        'findings_identical': findings['unfiltered'] == findings['prefiltered'],
+        **rule_skips(parsed_files),
+    }
+
+    if args.format == 'json':
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"\nCorpus: {result['path']}")
+        print(f"  {result['files']} files, {result['bytes']:,} characters "
+              f"(parsed in {result['parse_seconds']}s)")
+        print(f"  Analysis without prefilter: {result['unfiltered_seconds']:>7.2f}s")
+        print(f"  Analysis with prefilter:    {result['prefiltered_seconds']:>7.2f}s "
+              f"({result['speedup']}x)")
+        print(f"  Rule/file pairs skipped by keywords: {result['pairs_skipped']:,} "
+              f"of {result['rule_file_pairs']:,} ({result['skip_fraction']:.1%}); "
+              f"{result['files_skipping_every_keyed_rule']} files skip every "
+              f"keyed rule")
+        print(f"  Findings: {result['findings']} "
+              f"({'identical' if result['findings_identical'] else 'DIFFERENT'})")
+
+    return 0 if result['findings_identical'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
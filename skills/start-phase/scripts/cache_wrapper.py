@@ -14,6 +14,12 @@ Usage:
         --invocation-id 123 \
         --file-path "/path/to/file.md"
 
+    # Batch read (one process, file reads logged in one transaction)
+    python cache_wrapper.py read \
+        --invocation-id 123 \
+        --file-path memory-bank/projectbrief.md \
+        --file-path memory-bank/activeContext.md
+
     # Complete invocation
     python cache_wrapper.py complete \
         --invocation-id 123
@@ -25,10 +31,11 @@ Usage:
 
 import sys
 import json
+import time
 import hashlib
 import warnings
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 # Suppress all warnings (including locale warnings) to prevent contaminating JSON output
 warnings.filterwarnings('ignore')
@@ -37,6 +44,11 @@ warnings.filterwarnings('ignore')
 sys.path.insert(0, str(Path.home() / '.claude' / 'lib'))
 from project_database import ProjectDatabase
 
+# A file modified this recently could be rewritten again within the same
+# mtime tick without its (size, mtime_ns, inode) changing, so its stat
+# signature is not recorded until it has been quiet for this long.
+RACY_WINDOW_NS = 2_000_000_000
+
 def calculate_file_hash(content: str) -> str:
     """Calculate SHA-256 hash of file content."""
     return hashlib.sha256(content.encode('utf-8')).hexdigest()
@@ -64,11 +76,16 @@ def init_invocation(
 
 def read_file_with_cache(
     invocation_id: int,
-    file_path: str
+    file_path: str,
+    db: Optional[ProjectDatabase] = None
 ) -> Dict[str, Any]:
     """
     Read file with cache tracking.
 
+    When the file's (size, mtime_ns, inode) matches the signature recorded
+    with its cache entry, the cached content is returned without reading
+    or hashing the file. Otherwise the file is read and hashed as before.
+
     Returns:
         {
             "content": "file content",
@@ -78,7 +95,10 @@ def read_file_with_cache(
             "from_cache": true
         }
     """
-    db = ProjectDatabase()
+    if db is None:
+        with ProjectDatabase() as db:
+            return read_file_with_cache(invocation_id, file_path, db)
+
     path = Path(file_path).resolve()
 
     # Read actual file content
@@ -88,31 +108,51 @@ def read_file_with_cache(
             "cache_status": "error"
         }
 
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    content_hash = calculate_file_hash(content)
-    file_size_bytes = len(content.encode('utf-8'))
-
-    # Check cache
-    cached = db.get_cached_file(str(path))
+    stat = path.stat()
+    signature = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+    trusted_signature = signature if time.time_ns() - stat.st_mtime_ns > RACY_WINDOW_NS else None
 
-    if cached and cached['content_hash'] == content_hash:
-        # Cache HIT
+    # Fast path: unchanged since last cached, no read or hash needed
+    cached = db.get_cached_file_by_stat(str(path), signature)
+    if cached:
+        content = cached['content']
+        file_size_bytes = cached['file_size_bytes']
         cache_status = "hit"
         from_cache = True
-    elif cached:
-        # Cache MISS (stale)
-        cache_status = "miss"
-        from_cache = False
-        # Update cache
-        db.cache_file(str(path), content, file_type='markdown')
     else:
-        # Cache NEW
-        cache_status = "new"
-        from_cache = False
-        # Create cache entry
-        db.cache_file(str(path), content, file_type='markdown')
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        content_hash = calculate_file_hash(content)
+        file_size_bytes = len(content.encode('utf-8'))
+
+        # Check cache
+        cached = db.get_cached_file(str(path), content_hash)
+
+        if cached and cached['content_hash'] == content_hash:
+            # Cache HIT
+            cache_status = "hit"
+            from_cache = True
+            # Record the signature (touched file, or cached before it was tracked)
+            if trusted_signature and 'source_mtime_ns' in cached:
+                db.cache_file(
+                    str(path), content,
+                    file_type=cached.get('file_type') or 'markdown',
+                    cache_priority=cached.get('cache_priority') or 'normal',
+                    file_stat=trusted_signature
+                )
+        elif cached:
+            # Cache MISS (stale)
+            cache_status = "miss"
+            from_cache = False
+            # Update cache
+            db.cache_file(str(path), content, file_type='markdown', file_stat=trusted_signature)
+        else:
+            # Cache NEW
+            cache_status = "new"
+            from_cache = False
+            # Create cache entry
+            db.cache_file(str(path), content, file_type='markdown', file_stat=trusted_signature)
 
     # Log file read
     db.log_file_read(
@@ -130,6 +170,32 @@ def read_file_with_cache(
         "from_cache": from_cache
     }
 
+def read_files_with_cache(
+    invocation_id: int,
+    file_paths: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Read several files with cache tracking in one database session.
+
+    File read logs are queued and committed together when the session
+    closes, instead of one transaction per file; only new or changed files
+    are written to the cache as they are read.
+
+    Returns:
+        One read_file_with_cache() result per path, in order, each with
+        its "file_path"
+    """
+    results = []
+    with ProjectDatabase(
+        write_behind=True,
+        flush_batch_size=max(len(file_paths), 1),
+        flush_interval_ms=60000
+    ) as db:
+        for file_path in file_paths:
+            result = read_file_with_cache(invocation_id, file_path, db)
+            results.append({"file_path": file_path, **result})
+    return results
+
 def complete_invocation(invocation_id: int) -> Dict[str, Any]:
     """Mark invocation complete and return summary stats."""
     db = ProjectDatabase()
@@ -188,7 +254,8 @@ def main():
     # read command
     read_parser = subparsers.add_parser('read', help='Read file with cache tracking')
     read_parser.add_argument('--invocation-id', type=int, required=True)
-    read_parser.add_argument('--file-path', required=True)
+    read_parser.add_argument('--file-path', required=True, action='append',
+                             help='File to read (repeat to read several in one call)')
 
     # complete command
     complete_parser = subparsers.add_parser('complete', help='Complete invocation')
@@ -210,12 +277,19 @@ def main():
         print(json.dumps(result, indent=2))
 
     elif args.command == 'read':
-        result = read_file_with_cache(
-            invocation_id=args.invocation_id,
-            file_path=args.file_path
-        )
-        # Print only metadata (not full content)
-        metadata = {k: v for k, v in result.items() if k != 'content'}
+        if len(args.file_path) == 1:
+            result = read_file_with_cache(
+                invocation_id=args.invocation_id,
+                file_path=args.file_path[0]
+            )
+            # Print only metadata (not full content)
+            metadata = {k: v for k, v in result.items() if k != 'content'}
+        else:
+            results = read_files_with_cache(
+                invocation_id=args.invocation_id,
+                file_paths=args.file_path
+            )
+            metadata = [{k: v for k, v in r.items() if k != 'content'} for r in results]
         print(json.dumps(metadata, indent=2))
 
     elif args.command == 'complete':